@@ -0,0 +1,44 @@
+"""Compara os backends de decodificação JSON nas fixtures de cada endpoint.
+
+Uso: python -m benchmarks.bench_json [--repeat N]
+"""
+
+import argparse
+import json
+import time
+
+from benchmarks import fixtures
+from src.components.core import available_backends, decode_json
+
+
+def _best_of(fn, content, repeat: int) -> float:
+    tempos = []
+    for _ in range(repeat):
+        inicio = time.perf_counter()
+        fn(content)
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    # Caminho antigo: `response.json()` decodifica o corpo para `str` antes do parse.
+    decodificadores = {'response.json()': lambda content: json.loads(content.decode('utf-8'))}
+    for backend in available_backends():
+        decodificadores[backend] = lambda content, backend=backend: decode_json(content, backend)
+
+    print(f"{'endpoint':<22}{'origem':<10}{'decoder':<18}{'ms':>10}{'MB/s':>10}")
+    for nome in fixtures.ENDPOINTS:
+        content, gravado = fixtures.load(nome)
+        megabytes = len(content) / 1e6
+        for decoder, fn in decodificadores.items():
+            segundos = _best_of(fn, content, args.repeat)
+            origem = 'gravado' if gravado else 'sintético'
+            print(f'{nome:<22}{origem:<10}{decoder:<18}{segundos * 1e3:>10.1f}{megabytes / segundos:>10.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+"""Compara a decodificação em um processo com o `ParsePool` para payloads grandes.
+
+Uso: python -m benchmarks.bench_parallel [--linhas N] [--processos 1 2 4 ...]
+"""
+
+import argparse
+import os
+import time
+
+from benchmarks import fixtures
+from src.components.core import ParsePool, decode_csv, decode_json
+
+
+def _tempo(fn) -> float:
+    inicio = time.perf_counter()
+    fn()
+    return time.perf_counter() - inicio
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--linhas', type=int, default=400_000)
+    parser.add_argument('--processos', type=int, nargs='+', default=sorted({2, os.cpu_count() or 1}))
+    args = parser.parse_args()
+
+    print(f"{'payload':<22}{'MB':>8}{'modo':>14}{'ms':>10}{'ganho':>8}")
+    for formato in ('json', 'csv'):
+        content, _ = fixtures.load('despesas_ceaps', formato, args.linhas)
+        decodificar = decode_json if formato == 'json' else decode_csv
+        base = _tempo(lambda: decodificar(content))
+        nome = f'despesas_ceaps.{formato}'
+        print(f'{nome:<22}{len(content) / 1e6:>8.1f}{"1 processo":>14}{base * 1e3:>10.0f}{1:>8.1f}')
+        for processos in args.processos:
+            with ParsePool(processos, min_bytes=1) as pool:
+                metodo = pool.decode_json if formato == 'json' else pool.decode_csv
+                metodo(content)  # inicia os processos fora da medição
+                segundos = _tempo(lambda: metodo(content))
+            print(f'{nome:<22}{len(content) / 1e6:>8.1f}{f"pool {processos}":>14}{segundos * 1e3:>10.0f}{base / segundos:>8.1f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+"""Compara memória e tempo de acesso entre dicionários, registros compactos e visões preguiçosas.
+
+Uso: python -m benchmarks.bench_records
+"""
+
+import gc
+import time
+import tracemalloc
+
+from benchmarks import fixtures
+from src.components.core import decode_json
+from src.components.core.lazy import LazyRows
+from src.components.core.records import decode_json_records
+from src.components.senado.models import record_factory
+
+ENDPOINTS = {
+    'remuneracoes': ('servidores/remuneracoes', 'remuneracaoLiquida'),
+    'despesas_ceaps': ('senadores/despesas_ceaps', 'valorReembolsado'),
+    'contratos': ('contratacoes/contratos', 'valorGlobal'),
+}
+
+
+def _medir(fn):
+    gc.collect()
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = fn()
+    segundos = time.perf_counter() - inicio
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return resultado, memoria, segundos
+
+
+def main() -> None:
+    print(f"{'endpoint':<18}{'modo':<12}{'MB':>10}{'decode ms':>12}{'soma ms':>10}")
+    for nome, (endpoint, campo) in ENDPOINTS.items():
+        content, _ = fixtures.load(nome)
+        linhas, memoria, segundos = _medir(lambda: decode_json(content))
+        inicio = time.perf_counter()
+        sum(linha[campo] for linha in linhas)
+        soma = time.perf_counter() - inicio
+        print(f'{nome:<18}{"dict":<12}{memoria / 1e6:>10.1f}{segundos * 1e3:>12.0f}{soma * 1e3:>10.1f}')
+        del linhas
+
+        factory = record_factory(endpoint)
+        registros, memoria, segundos = _medir(lambda: decode_json_records(content, factory))
+        inicio = time.perf_counter()
+        sum(getattr(registro, campo) for registro in registros)
+        soma = time.perf_counter() - inicio
+        print(f'{nome:<18}{"registros":<12}{memoria / 1e6:>10.1f}{segundos * 1e3:>12.0f}{soma * 1e3:>10.1f}')
+        del registros
+
+        visoes, memoria, segundos = _medir(lambda: LazyRows(content))
+        inicio = time.perf_counter()
+        sum(visoes.column(campo))
+        soma = time.perf_counter() - inicio
+        print(f'{nome:<18}{"visoes":<12}{memoria / 1e6:>10.1f}{segundos * 1e3:>12.0f}{soma * 1e3:>10.1f}')
+        del visoes
+
+
+if __name__ == '__main__':
+    main()
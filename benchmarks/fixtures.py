@@ -0,0 +1,194 @@
+"""Fixtures de payloads para os benchmarks.
+
+Os payloads gravados ficam em `benchmarks/fixtures/<nome>.json` (e `.csv`).
+Use `python -m benchmarks.fixtures --record` para gravá-los a partir das APIs;
+quando um arquivo não existe, um payload sintético com o mesmo formato é gerado.
+"""
+
+import argparse
+import json
+import random
+from pathlib import Path
+
+FIXTURES_DIR = Path(__file__).parent / 'fixtures'
+
+SENADO_API = 'https://adm.senado.gov.br/adm-dadosabertos/api/v1'
+OLINDA_EXPECTATIVAS = 'https://olinda.bcb.gov.br/olinda/servico/Expectativas/versao/v1/odata'
+
+# nome -> (url JSON, url CSV ou None, parâmetros)
+ENDPOINTS = {
+    'remuneracoes': (f'{SENADO_API}/servidores/remuneracoes/2024/1', f'{SENADO_API}/servidores/remuneracoes/2024/1/csv', None),
+    'despesas_ceaps': (f'{SENADO_API}/senadores/despesas_ceaps/2024', f'{SENADO_API}/senadores/despesas_ceaps/2024/csv', None),
+    'contratos': (f'{SENADO_API}/contratacoes/contratos', f'{SENADO_API}/contratacoes/contratos/csv', None),
+    'expectativas_anuais': (
+        f'{OLINDA_EXPECTATIVAS}/ExpectativasMercadoAnuais', None, {'$top': 20000, '$format': 'json'}
+    ),
+}
+
+_LOTACOES = ['SECRETARIA DE GESTAO', 'GABINETE SENADOR', 'CONSULTORIA LEGISLATIVA', 'POLICIA DO SENADO']
+_CARGOS = ['ANALISTA LEGISLATIVO', 'TECNICO LEGISLATIVO', 'ASSESSOR PARLAMENTAR', 'SECRETARIO PARLAMENTAR']
+_UFS = ['SP', 'RJ', 'MG', 'BA', 'RS', 'PE', 'DF']
+
+
+def _remuneracoes(n: int, rnd: random.Random) -> list[dict]:
+    return [
+        {
+            'sequencial': i,
+            'nome': f'SERVIDOR {i}',
+            'vinculo': rnd.choice(['EFETIVO', 'COMISSIONADO', 'REQUISITADO']),
+            'situacao': 'ATIVO',
+            'cargo': rnd.choice(_CARGOS),
+            'lotacao': rnd.choice(_LOTACOES),
+            'remuneracaoBasica': round(rnd.uniform(3000, 30000), 2),
+            'vantagensPessoais': round(rnd.uniform(0, 5000), 2),
+            'funcaoComissionada': round(rnd.uniform(0, 9000), 2),
+            'gratificacaoNatalina': 0.0,
+            'horasExtras': round(rnd.uniform(0, 2000), 2),
+            'outrasEventuais': 0.0,
+            'abonoPermanencia': 0.0,
+            'reversaoTetoConstitucional': 0.0,
+            'impostoRenda': round(rnd.uniform(0, 7000), 2),
+            'previdencia': round(rnd.uniform(0, 3000), 2),
+            'faltas': 0.0,
+            'remuneracaoLiquida': round(rnd.uniform(2500, 25000), 2),
+            'diarias': 0.0,
+            'auxilios': round(rnd.uniform(0, 1500), 2),
+            'vantagensIndenizatorias': 0.0,
+        }
+        for i in range(n)
+    ]
+
+
+def _despesas_ceaps(n: int, rnd: random.Random) -> list[dict]:
+    return [
+        {
+            'id': 2_000_000 + i,
+            'tipoDocumento': rnd.choice(['NOTA_FISCAL', 'RECIBO']),
+            'ano': 2024,
+            'mes': rnd.randint(1, 12),
+            'codSenador': rnd.randint(1, 81),
+            'nomeSenador': f'SENADOR {rnd.randint(1, 81)}',
+            'tipoDespesa': rnd.choice(['Passagens aéreas', 'Locomoção, hospedagem e alimentação', 'Aluguel de imóveis']),
+            'cpfCnpj': f'{rnd.randint(0, 99_999_999_999_999):014d}',
+            'fornecedor': f'FORNECEDOR {rnd.randint(1, 2000)} LTDA',
+            'documento': str(rnd.randint(1, 999999)),
+            'data': f'2024-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}',
+            'detalhamento': 'Despesa com deslocamento do parlamentar',
+            'valorReembolsado': round(rnd.uniform(10, 20000), 2),
+        }
+        for i in range(n)
+    ]
+
+
+def _contratos(n: int, rnd: random.Random) -> list[dict]:
+    return [
+        {
+            'id': 3000 + i,
+            'numero': f'{i:04d}/2023',
+            'ano': rnd.randint(2015, 2024),
+            'objetoDescricao': 'Prestação de serviços continuados de manutenção predial e limpeza',
+            'nomeFornecedor': f'EMPRESA {rnd.randint(1, 800)} S.A.',
+            'cnpjCpf': f'{rnd.randint(0, 99_999_999_999_999):014d}',
+            'status': rnd.choice(['VIGENTE', 'ENCERRADO', 'EM_RENOVACAO']),
+            'maoDeObra': rnd.random() < 0.3,
+            'obraEngenharia': rnd.random() < 0.1,
+            'valorGlobal': round(rnd.uniform(1e4, 5e7), 2),
+            'inicioVigencia': f'{rnd.randint(2015, 2024)}-01-01',
+            'fimVigencia': f'{rnd.randint(2024, 2028)}-12-31',
+        }
+        for i in range(n)
+    ]
+
+
+def _expectativas_anuais(n: int, rnd: random.Random) -> dict:
+    indicadores = ['IPCA', 'PIB Total', 'Selic', 'Câmbio', 'IGP-M']
+    return {
+        '@odata.context': 'https://olinda.bcb.gov.br/olinda/servico/Expectativas/versao/v1/odata$metadata',
+        'value': [
+            {
+                'Indicador': rnd.choice(indicadores),
+                'IndicadorDetalhe': None,
+                'Data': f'2024-{rnd.randint(1, 12):02d}-{rnd.randint(1, 28):02d}',
+                'DataReferencia': str(rnd.randint(2024, 2028)),
+                'Media': round(rnd.uniform(0, 15), 4),
+                'Mediana': round(rnd.uniform(0, 15), 4),
+                'DesvioPadrao': round(rnd.uniform(0, 2), 4),
+                'Minimo': round(rnd.uniform(0, 5), 4),
+                'Maximo': round(rnd.uniform(5, 20), 4),
+                'numeroRespondentes': rnd.randint(10, 150),
+                'baseCalculo': rnd.choice([0, 1]),
+            }
+            for _ in range(n)
+        ],
+    }
+
+
+_SINTETICOS = {
+    'remuneracoes': _remuneracoes,
+    'despesas_ceaps': _despesas_ceaps,
+    'contratos': _contratos,
+    'expectativas_anuais': _expectativas_anuais,
+}
+
+
+def _to_csv(registros: list[dict]) -> bytes:
+    """Serializa no formato dos CSVs do Senado: `;`, decimais com vírgula e datas dd/mm/aaaa."""
+    def celula(valor) -> str:
+        if valor is None:
+            return ''
+        if isinstance(valor, bool):
+            return 'S' if valor else 'N'
+        if isinstance(valor, float):
+            return f'{valor:,.2f}'.replace(',', '_').replace('.', ',').replace('_', '.')
+        valor = str(valor)
+        if len(valor) == 10 and valor[4] == '-' and valor[7] == '-':
+            return f'{valor[8:]}/{valor[5:7]}/{valor[:4]}'
+        return valor
+
+    cabecalho = list(registros[0])
+    linhas = [';'.join(cabecalho)]
+    linhas += [';'.join(celula(r[c]) for c in cabecalho) for r in registros]
+    return ('\n'.join(linhas) + '\n').encode()
+
+
+def load(nome: str, formato: str = 'json', linhas: int = 50_000) -> tuple[bytes, bool]:
+    """Carrega a fixture gravada ou gera uma sintética.
+
+    Argumentos:
+        nome (str): Nome do endpoint (ver ENDPOINTS).
+        formato (str, optional): 'json' ou 'csv'. Padrão:  'json'.
+        linhas (int, optional): Número de linhas do payload sintético. Padrão:  50000.
+
+    Retorno:
+        tuple[bytes, bool]: O payload e se ele foi gravado da API.
+    """
+    caminho = FIXTURES_DIR / f'{nome}.{formato}'
+    if caminho.exists():
+        return caminho.read_bytes(), True
+    documento = _SINTETICOS[nome](linhas, random.Random(42))
+    if formato == 'csv':
+        registros = documento['value'] if isinstance(documento, dict) else documento
+        return _to_csv(registros), False
+    return json.dumps(documento, ensure_ascii=False).encode(), False
+
+
+def record() -> None:
+    """Grava as fixtures a partir das APIs públicas."""
+    from src.components.core import default_transport
+
+    FIXTURES_DIR.mkdir(exist_ok=True)
+    for nome, (url_json, url_csv, params) in ENDPOINTS.items():
+        for formato, url in (('json', url_json), ('csv', url_csv)):
+            if url is None:
+                continue
+            response = default_transport.get(url, params=params, timeout=120)
+            response.raise_for_status()
+            (FIXTURES_DIR / f'{nome}.{formato}').write_bytes(response.content)
+            print(f'{nome}.{formato}: {len(response.content):,} bytes')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--record', action='store_true', help='Grava as fixtures a partir das APIs.')
+    if parser.parse_args().record:
+        record()
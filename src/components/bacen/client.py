@@ -1,21 +1,52 @@
 import requests
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from datetime import date
-from typing import Optional, Literal, Unpack
+from typing import TYPE_CHECKING, Any, Callable, Optional, Literal, Unpack
+from ..core.columnar import Table
+from ..core.csv_decoder import decode_csv
+from ..core.json_decoders import decode_json
+from ..core.rawstore import response_body
+from ..core.transport import Transport, default_transport
 from .exceptions import BacenAPIError
-from .models import ODataParametros, SGSCodigoSerie, ExpectativasMercadoRelatorio, PTAXRecursos
+from .models import ODataParametros, SGSCodigoSerie, ExpectativasMercadoRelatorio, PTAXRecursos, SGS_CSV_SCHEMA
+
+if TYPE_CHECKING:
+    from ..core.parallel import ParsePool
+
+ODATA_HOST = 'olinda.bcb.gov.br'
 
 class BacenClient:
     """Cliente para acessar a API do Banco Central do Brasil (Bacen)."""
 
+    _transport: Transport = default_transport
+    json_backend: str | None = None  # None usa o backend JSON padrão global
+    parse_pool: 'ParsePool | None' = None  # decodifica payloads grandes em vários processos
+
+    def _get(self, url: str, params: dict) -> requests.Response:
+        """Faz uma requisição GET para a API do Bacen pelo transporte compartilhado.
+
+        Args:
+            url (str): URL do recurso.
+            params (dict): Parâmetros da consulta.
+        """
+        return self._transport.get(url, params=params)
+
+    def _json(self, response: requests.Response):
+        """Decodifica o corpo JSON da resposta com o backend configurado (e o `parse_pool`, se houver)."""
+        if self.parse_pool is not None:
+            return self.parse_pool.decode_json(response_body(response), self.json_backend)
+        return decode_json(response_body(response), self.json_backend)
+
     def sgs(
         self, 
         codigo_serie: SGSCodigoSerie, 
         data_inicial: Optional[date] = None, 
         data_final: Optional[date] = None, 
         ultimos: int | None = None, 
-        formato: Literal['json', 'csv'] = 'json'
-        
-    ) -> dict | str:
+        formato: Literal['json', 'csv'] = 'json',
+        tipado: bool = False,
+        colunar: bool = False,
+    ) -> dict | str | Table:
         """Consulta séries temporais do SGS (Sistema Gerenciador de Séries Temporais) do Banco Central do Brasil.
         Args:
             codigo_serie (SGSCodigoSerie): Código da série temporal a ser consultada.
@@ -23,8 +54,12 @@ class BacenClient:
             data_final (Optional[date], opcional): Data final para o filtro. Defaults to None.
             ultimos (int | None, opcional): Número de registros mais recentes a serem retornados. Defaults to None.
             formato (Literal['json', 'csv'], opcional): Formato de retorno dos dados. Pode ser 'json' ou 'csv'. Defaults to 'json'.
+            tipado (bool, opcional): Com formato 'csv', decodifica o CSV em colunas tipadas ('data' como date, 'valor' como Decimal). Defaults to False.
+            colunar (bool, opcional): Retorna uma `Table` com as colunas tipadas. Transfere sempre em CSV. Defaults to False.
         """
         BASE_URL = 'https://api.bcb.gov.br/dados/serie/'
+        if colunar:
+            formato = 'csv'
 
         params = {
             'formato': formato,
@@ -37,19 +72,24 @@ class BacenClient:
         suffix = f'/ultimos/{ultimos}' if ultimos else ''
 
         url = f'{BASE_URL}bcdata.sgs.{codigo_serie}/dados{suffix}'
-        response = requests.get(url, params=params)
+        response = self._get(url, params=params)
         if not response.ok:
             raise BacenAPIError(f'Erro ao acessar API Bacen: {response.status_code}: {response.text}')
         if formato == 'csv':
+            if colunar:
+                return Table(decode_csv(response.text, SGS_CSV_SCHEMA, sep=';'))
+            if tipado:
+                return decode_csv(response.text, SGS_CSV_SCHEMA, sep=';')
             return response.text
-        return response.json()
+        return self._json(response)
 
-    def expectativas(self, relatorio: ExpectativasMercadoRelatorio, formato: Literal['json', 'xml', 'atom'] =  None, **odata_params: Unpack[ODataParametros]) -> dict | str:
+    def expectativas(self, relatorio: ExpectativasMercadoRelatorio, formato: Literal['json', 'xml', 'atom'] =  None, colunar: bool = False, **odata_params: Unpack[ODataParametros]) -> dict | str | Table:
         """Consulta dados de expectativas de mercado do Banco Central do Brasil.
 
         Args:
             relatorio (ExpectativasMercadoRelatorio): Tipo de relatório de expectativas de mercado a ser consultado.
             formato (Literal['json', 'xml', 'atom'], opcional): Formato de retorno dos dados. Pode ser 'json', 'xml' ou 'atom'.
+            colunar (bool, opcional): Retorna o array `value` como uma `Table` colunar. Defaults to False.
         """
         BASE_URL = f'https://olinda.bcb.gov.br/olinda/servico/Expectativas/versao/v1/odata/{relatorio}'
         params = {
@@ -57,17 +97,20 @@ class BacenClient:
             **{'$' + k: v for (k, v) in odata_params.items()}
         }
 
-        response = requests.get(BASE_URL, params=params)
+        response = self._get(BASE_URL, params=params)
         if not response.ok:
             raise BacenAPIError(f'Erro ao acessar API Bacen: {response.status_code}: {response.text}')
         if formato in ['xml', 'atom']:
             return response.text
-        return response.json()
+        if colunar:
+            return Table.from_records(self._json(response)['value'])
+        return self._json(response)
 
-    def emissao_moedas_anual(self, **odata_params: Unpack[ODataParametros]) -> dict:
+    def emissao_moedas_anual(self, colunar: bool = False, **odata_params: Unpack[ODataParametros]) -> dict | Table:
         """Consulta dados de emissão anual de moedas do Banco Central do Brasil.
 
         Args:
+            colunar (bool, opcional): Retorna o array `value` como uma `Table` colunar. Defaults to False.
             odata_params: Parâmetros OData adicionais para a consulta.
         """
         BASE_URL = 'https://olinda.bcb.gov.br/olinda/servico/mecir_prog_anual_producao/versao/v1/odata/TodosDadosProducao'
@@ -75,16 +118,19 @@ class BacenClient:
             **{'$' + k: v for (k, v) in odata_params.items()}
         }
 
-        response = requests.get(BASE_URL, params=params)
+        response = self._get(BASE_URL, params=params)
         if not response.ok:
             raise BacenAPIError(f'Erro ao acessar API Bacen: {response.status_code}: {response.text}')
-        return response.json()
+        if colunar:
+            return Table.from_records(self._json(response)['value'])
+        return self._json(response)
 
-    def ptax(self, recurso: PTAXRecursos | str, formato: Literal['json', 'xml', 'text/csv', 'text/html'] = 'json', **odata_params: Unpack[ODataParametros]) -> dict:
+    def ptax(self, recurso: PTAXRecursos | str, formato: Literal['json', 'xml', 'text/csv', 'text/html'] = 'json', colunar: bool = False, **odata_params: Unpack[ODataParametros]) -> dict | Table:
         """Consulta dados do Ptax do Banco Central do Brasil.
         Args:
             recurso (PTAXRecusos | str): Recurso PTAX a ser consultado.
             formato (Literal['json', 'xml', 'text/csv', 'text/html'], opcional): Formato de retorno dos dados. Pode ser 'json', 'xml', 'text/csv' ou 'text/html'.
+            colunar (bool, opcional): Retorna o array `value` como uma `Table` colunar. Defaults to False.
             odata_params: Parâmetros OData adicionais para a consulta.
         """
         BASE_URL = f'https://olinda.bcb.gov.br/olinda/servico/PTAX/versao/v1/odata/{recurso}'
@@ -93,9 +139,64 @@ class BacenClient:
             **{'$' + k: v for (k, v) in odata_params.items()},
         }
 
-        response = requests.get(BASE_URL, params=params)
+        response = self._get(BASE_URL, params=params)
         if not response.ok:
             raise BacenAPIError(f'Erro ao acessar API Bacen: {response.url} {response.status_code}: {response.text}')
         elif formato in ['xml', 'text/csv', 'text/html']:
             return response.text
-        return response.json()['value']
\ No newline at end of file
+        if colunar:
+            return Table.from_records(self._json(response)['value'])
+        return self._json(response)['value']
+
+    def odata_pages(
+        self,
+        metodo: Callable[..., Any],
+        *args: Any,
+        top: int = 1000,
+        workers: int = 4,
+        **odata_params: Unpack[ODataParametros],
+    ) -> list[dict]:
+        """Busca todas as páginas (`$top`/`$skip`) de uma consulta OData, várias ao mesmo tempo.
+
+        As páginas são pedidas em uma janela deslizante: a cada página
+        recebida, a seguinte é pedida, e nenhuma página nova sai depois da
+        primeira incompleta. Com um transporte `adaptive`, a janela tem o
+        tamanho do limite de concorrência atual do host, que sobe e desce com
+        a latência.
+
+        Args:
+            metodo (Callable[..., Any]): Consulta OData em JSON (ex.: `cliente.expectativas`, `cliente.ptax`).
+            *args: Argumentos posicionais da consulta (ex.: o relatório ou o recurso).
+            top (int, opcional): Registros por página. Defaults to 1000.
+            workers (int, opcional): Páginas simultâneas sem transporte `adaptive`. Defaults to 4.
+            odata_params: Demais parâmetros OData; `skip` define o início.
+        """
+        inicio = odata_params.pop('skip', 0)
+        registros: list[dict] = []
+
+        def pagina(skip: int) -> list[dict]:
+            resultado = metodo(*args, top=top, skip=skip, **odata_params)
+            return resultado['value'] if isinstance(resultado, dict) else resultado
+
+        limitador = self._transport.limiter(ODATA_HOST)
+        paginas: dict[int, list[dict]] = {}
+        pendentes: dict[Future, int] = {}
+        fim = None  # `skip` da primeira página incompleta
+        proxima = inicio
+        with ThreadPoolExecutor(max_workers=limitador.maximo if limitador is not None else workers) as executor:
+            while True:
+                janela = limitador.limit if limitador is not None else workers
+                while fim is None and len(pendentes) < janela:
+                    pendentes[executor.submit(pagina, proxima)] = proxima
+                    proxima += top
+                if not pendentes:
+                    break
+                concluidas, _ = wait(pendentes, return_when=FIRST_COMPLETED)
+                for future in concluidas:
+                    skip = pendentes.pop(future)
+                    paginas[skip] = future.result()
+                    if len(paginas[skip]) < top and (fim is None or skip < fim):
+                        fim = skip
+        for skip in range(inicio, fim + 1, top):
+            registros.extend(paginas[skip])
+        return registros
@@ -2,6 +2,8 @@ from __future__ import annotations
 from enum import IntEnum, StrEnum
 from typing import Any, TypedDict
 
+from ..core.csv_decoder import Schema, TipoColuna
+
 
 class ODataParametros(TypedDict, total=False):
     select: str
@@ -13,6 +15,9 @@ class ODataParametros(TypedDict, total=False):
     orderby: str
 
 
+SGS_CSV_SCHEMA: Schema = {'data': TipoColuna.DATA, 'valor': TipoColuna.DECIMAL}
+
+
 class SGSCodigoSerie(IntEnum):
     TAXA_CAMBIO_LIVRE_DOLAR_AMERICANO_VENDA_DIARIO = 1
     TAXA_CAMBIO_LIVRE_DOLAR_AMERICANO_VENDA_FIM_PERIODO_ANUAL = 33692
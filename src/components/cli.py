@@ -0,0 +1,403 @@
+"""Linha de comando `pybr-dados`: sincronização, exportação e benchmark das cargas em lote.
+
+    python -m src.components sync senado remuneracoes despesas_ceaps --since 2022 --workers 8 --rate 10
+    python -m src.components sync bacen --archive historico --sgs 433 432 --ptax --since 2024-01-01
+    python -m src.components export remuneracoes --out lake/remuneracoes --since 2023 --workers 4 --resume
+    python -m src.components bench servidores/servidores/ativos --repeat 5
+    python -m src.components sync senado remuneracoes --since 2019 --adaptive
+
+Durante a execução, uma linha de progresso em stderr mostra as unidades
+concluídas, a vazão e a estimativa de término; ao final, um resumo com
+bytes, requisições, acertos de cache e novas tentativas.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Callable, TextIO
+
+import requests
+
+from .bacen import BacenClient
+from .bacen.models import PTAXRecursos
+from .core.archive import SnapshotArchive
+from .core.concurrency import AdaptiveLimiter
+from .core.export import ShardedExporter
+from .core.json_decoders import available_backends, decode_json
+from .core.lazy import LazyRows
+from .core.metrics import TransportMetrics
+from .core.rawstore import RawStore, response_body
+from .core.transport import Transport
+from .senado.clients.dados_abertos.dados_abertos import SenadoDadosAbertosClient
+from .senado.warehouse import DATASETS, Warehouse, _caminho, periodos
+
+
+def _bytes(n: float) -> str:
+    if n < 1024:
+        return f'{int(n)} B'
+    for unidade in ('KB', 'MB', 'GB'):
+        n /= 1024
+        if n < 1024 or unidade == 'GB':
+            return f'{n:.1f} {unidade}'
+
+
+def _duracao(segundos: float) -> str:
+    segundos = int(segundos)
+    return f'{segundos // 3600}:{segundos // 60 % 60:02d}:{segundos % 60:02d}'
+
+
+def _totais(metrics: TransportMetrics) -> dict[str, int]:
+    totais: dict[str, int] = {}
+    for host in metrics.snapshot().values():
+        for nome, valor in host.items():
+            if isinstance(valor, int):
+                totais[nome] = totais.get(nome, 0) + valor
+    return totais
+
+
+class Progress:
+    """Linha de progresso em stderr, atualizada por uma thread a cada `intervalo` segundos."""
+
+    def __init__(
+        self,
+        descricao: str,
+        total: int,
+        metrics: TransportMetrics,
+        stream: TextIO | None = None,
+        intervalo: float = 1.0,
+    ):
+        self.descricao = descricao
+        self.total = total
+        self.metrics = metrics
+        self.stream = stream or sys.stderr
+        self.intervalo = intervalo
+        self.feitos = 0
+        self._lock = threading.Lock()
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._inicio = time.monotonic()
+        self._interativo = getattr(self.stream, 'isatty', lambda: False)()
+
+    def advance(self, n: int = 1) -> None:
+        """Conta `n` unidades concluídas."""
+        with self._lock:
+            self.feitos += n
+
+    def line(self) -> str:
+        """Texto da linha de progresso."""
+        decorrido = max(time.monotonic() - self._inicio, 1e-9)
+        totais = _totais(self.metrics)
+        eta = '--:--:--'
+        if self.feitos and self.total:
+            eta = _duracao(decorrido / self.feitos * (self.total - self.feitos))
+        return (
+            f'[{self.descricao}] {self.feitos}/{self.total}'
+            f' | {_bytes(totais.get("wire_bytes", 0) / decorrido)}/s'
+            f' | {totais.get("requests", 0) / decorrido:.1f} req/s'
+            f' | ETA {eta}'
+        )
+
+    def _escrever(self, final: bool = False) -> None:
+        if self._interativo:
+            self.stream.write('\r\x1b[K' + self.line() + ('\n' if final else ''))
+        else:
+            self.stream.write(self.line() + '\n')
+        self.stream.flush()
+
+    def _run(self) -> None:
+        while not self._parar.wait(self.intervalo):
+            self._escrever()
+
+    def __enter__(self) -> 'Progress':
+        self._inicio = time.monotonic()
+        self._thread = threading.Thread(target=self._run, name='pybr-dados-progress', daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._parar.set()
+        self._thread.join()
+        self._escrever(final=True)
+
+
+def summary(metrics: TransportMetrics, segundos: float) -> str:
+    """Resumo final: tempo, bytes, requisições, acertos de cache, novas tentativas e erros."""
+    t = _totais(metrics)
+    linhas = (
+        ('tempo', _duracao(segundos)),
+        ('bytes (rede)', _bytes(t.get('wire_bytes', 0))),
+        ('bytes (decodificados)', _bytes(t.get('decoded_bytes', 0))),
+        ('requisições', t.get('requests', 0)),
+        ('  enviadas', t.get('upstream_requests', 0)),
+        ('  cache hits', t.get('cache_hits', 0)),
+        ('  revalidadas', t.get('revalidations', 0)),
+        ('  coalescidas', t.get('coalesced_requests', 0)),
+        ('novas tentativas', t.get('retries', 0)),
+        ('hedges', f"{t.get('hedged_requests', 0)} ({t.get('hedge_wins', 0)} venceram)"),
+        ('erros', t.get('errors', 0)),
+    )
+    limites = {host: m['concurrency_limit'] for host, m in metrics.snapshot().items() if m['concurrency_limit']}
+    if limites:
+        linhas += (('concorrência', ', '.join(f'{host}={n}' for host, n in limites.items())),)
+    return '\n'.join(f'{nome + ":":<23}{valor}' for nome, valor in linhas)
+
+
+def _transporte(args: argparse.Namespace, coalesce: bool = True) -> Transport:
+    store = RawStore(args.cache, ttl=args.cache_ttl) if args.cache else None
+    adaptive = (lambda: AdaptiveLimiter(maximo=args.workers)) if args.adaptive else False
+    return Transport(
+        coalesce, store, rate=args.rate, retries=args.retries, timeout=args.timeout, hedge=args.hedge, adaptive=adaptive,
+    )
+
+
+def _senado(transporte: Transport) -> SenadoDadosAbertosClient:
+    cliente = SenadoDadosAbertosClient()
+    cliente._transport = transporte
+    cliente.timeout = None  # o do transporte (--timeout)
+    return cliente
+
+
+def _ano(valor: str | None) -> int | None:
+    return int(valor[:4]) if valor else None
+
+
+def _sync_senado(args: argparse.Namespace, transporte: Transport, saida: TextIO) -> int:
+    datasets = args.datasets or list(DATASETS)
+    desconhecidos = [d for d in datasets if d not in DATASETS]
+    if desconhecidos:
+        raise SystemExit(f'Conjuntos desconhecidos: {", ".join(desconhecidos)}')
+    with Warehouse(args.db, client=_senado(transporte)) as warehouse:
+        desde = _ano(args.since)
+        total = sum(len(warehouse.pending(d, desde=desde, force=args.force)) for d in datasets)
+        with Progress('sync senado', total, transporte.metrics, intervalo=args.progress) as progresso:
+            resultados = warehouse.sync(
+                datasets, desde=desde, force=args.force, workers=args.workers,
+                callback=lambda dataset, periodo, situacao: progresso.advance(),
+            )
+    erros = 0
+    for nome, resultado in resultados.items():
+        erros += len(resultado.erros)
+        saida.write(
+            f'{nome}: {len(resultado.baixadas)} baixadas, {len(resultado.inalteradas)} inalteradas,'
+            f' {len(resultado.erros)} com erro, {resultado.linhas} linhas\n'
+        )
+        for periodo, mensagem in resultado.erros.items():
+            saida.write(f'  {periodo or "-"}: {mensagem}\n')
+    return 1 if erros else 0
+
+
+class _BacenCaptura(BacenClient):
+    """Cliente do Bacen que guarda a última resposta, para arquivar o corpo como veio do servidor."""
+
+    resposta: requests.Response | None = None
+
+    def _get(self, url: str, params: dict) -> requests.Response:
+        self.resposta = super()._get(url, params)
+        return self.resposta
+
+
+def _sync_bacen(args: argparse.Namespace, transporte: Transport, saida: TextIO) -> int:
+    desde = datetime.strptime(args.since, '%Y-%m-%d').date() if args.since else None
+    hoje = date.today()
+    tarefas: list[tuple[str, dict, Callable[[BacenClient], object]]] = []
+    for codigo in args.sgs:
+        tarefas.append((
+            f'sgs/{codigo}', {'dataInicial': desde},
+            lambda cliente, codigo=codigo: cliente.sgs(codigo, data_inicial=desde, data_final=hoje if desde else None),
+        ))
+    if args.ptax:
+        inicio = desde or hoje.replace(day=1)
+        recurso = PTAXRecursos.cotacao_dolar_periodo(inicio.strftime('%m-%d-%Y'), hoje.strftime('%m-%d-%Y'))
+        tarefas.append(('ptax/CotacaoDolarPeriodo', {'dataInicial': inicio}, lambda cliente: cliente.ptax(recurso)))
+    if not tarefas:
+        raise SystemExit('Nada a sincronizar: informe --sgs e/ou --ptax.')
+
+    with SnapshotArchive(args.archive) as arquivo:
+        if args.resume:
+            # Retoma: séries já capturadas hoje não são baixadas de novo.
+            meia_noite = datetime.combine(hoje, datetime.min.time()).timestamp()
+            tarefas = [t for t in tarefas if not arquivo.captures(t[0], t[1], desde=meia_noite)]
+        falhas = []
+
+        def capturar(tarefa: tuple[str, dict, Callable[[BacenClient], object]]) -> None:
+            endpoint, params, obter = tarefa
+            cliente = _BacenCaptura()
+            cliente._transport = transporte
+            try:
+                # A decodificação valida a resposta; o arquivo guarda os bytes recebidos.
+                obter(cliente)
+                corpo = bytes(response_body(cliente.resposta))
+            except Exception as e:
+                falhas.append(endpoint)
+                saida.write(f'{endpoint}: {e}\n')
+            else:
+                captura = arquivo.put(endpoint, params, corpo)
+                saida.write(f'{endpoint}: {_bytes(captura.tamanho)} -> {_bytes(captura.compactado)}\n')
+            progresso.advance()
+
+        with Progress('sync bacen', len(tarefas), transporte.metrics, intervalo=args.progress) as progresso:
+            with ThreadPoolExecutor(max_workers=args.workers) as executor:
+                list(executor.map(capturar, tarefas))
+    return 1 if falhas else 0
+
+
+def _export(args: argparse.Namespace, transporte: Transport, saida: TextIO) -> int:
+    spec = DATASETS.get(args.dataset)
+    if spec is None:
+        raise SystemExit(f'Conjunto desconhecido: {args.dataset}')
+    cliente = _senado(transporte)
+    partes = periodos(spec, _ano(args.since))
+    if args.until:
+        partes = [p for p in partes if p[:len(args.until)] <= args.until]
+
+    def pasta(periodo: str) -> str:
+        return os.path.join(args.out, f'periodo={periodo}') if periodo else args.out
+
+    if args.resume:
+        # Retoma: períodos com manifesto já foram exportados por completo.
+        partes = [p for p in partes if not os.path.exists(os.path.join(pasta(p), 'manifest.json'))]
+    falhas = []
+
+    def exportar(periodo: str) -> None:
+        exportador = ShardedExporter(pasta(periodo), formato=args.format, shards=args.shards)
+        try:
+            manifesto = exportador.export_method(cliente._get, _caminho(spec, periodo))
+        except Exception as e:
+            falhas.append(periodo)
+            saida.write(f'{periodo or spec.nome}: {e}\n')
+        else:
+            saida.write(f'{periodo or spec.nome}: {manifesto.linhas} linhas em {len(manifesto.arquivos)} arquivos\n')
+        progresso.advance()
+
+    with Progress(f'export {spec.nome}', len(partes), transporte.metrics, intervalo=args.progress) as progresso:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(exportar, partes))
+    return 1 if falhas else 0
+
+
+def _bench(args: argparse.Namespace, transporte: Transport, saida: TextIO) -> int:
+    cliente = _senado(transporte)
+    latencias: list[float] = []
+    corpos: list[bytes] = []
+
+    def baixar(_: int) -> None:
+        inicio = time.perf_counter()
+        response = cliente._request(args.endpoint)
+        latencias.append(time.perf_counter() - inicio)
+        corpos.append(response.content)
+        progresso.advance()
+
+    with Progress('bench', args.repeat, transporte.metrics, intervalo=args.progress) as progresso:
+        with ThreadPoolExecutor(max_workers=args.workers) as executor:
+            list(executor.map(baixar, range(args.repeat)))
+
+    latencias.sort()
+    corpo = corpos[0]
+    saida.write(f'{args.endpoint}: {_bytes(len(corpo))} por resposta\n')
+    saida.write(
+        f'latência: p50 {statistics.median(latencias) * 1000:.0f} ms,'
+        f' p95 {latencias[min(int(len(latencias) * 0.95), len(latencias) - 1)] * 1000:.0f} ms,'
+        f' máx {latencias[-1] * 1000:.0f} ms\n'
+    )
+    for backend in available_backends():
+        tempos = []
+        for _ in range(3):
+            inicio = time.perf_counter()
+            decode_json(corpo, backend)
+            tempos.append(time.perf_counter() - inicio)
+        saida.write(f'decode_json[{backend}]: {min(tempos) * 1000:.1f} ms\n')
+    inicio = time.perf_counter()
+    LazyRows(corpo)
+    saida.write(f'LazyRows (índice): {(time.perf_counter() - inicio) * 1000:.1f} ms\n')
+    return 0
+
+
+# Threads dos fan-outs com --adaptive: quem decide quantas requisições saem é o limitador.
+_WORKERS_ADAPTATIVO = 32
+
+
+def _parser() -> argparse.ArgumentParser:
+    comum = argparse.ArgumentParser(add_help=False)
+    comum.add_argument(
+        '--workers', type=int, default=None,
+        help=f'requisições simultâneas (padrão: 4; com --adaptive, até {_WORKERS_ADAPTATIVO})',
+    )
+    comum.add_argument(
+        '--adaptive', action='store_true',
+        help='ajusta a concorrência de cada host pela latência e pelos erros; --workers vira o teto',
+    )
+    comum.add_argument('--rate', type=float, default=None, help='máximo de requisições por segundo')
+    comum.add_argument('--retries', type=int, default=3, help='novas tentativas após falhas transitórias (padrão: 3)')
+    comum.add_argument('--timeout', type=float, default=10, help='timeout de cada requisição, em segundos (padrão: 10)')
+    comum.add_argument('--hedge', type=float, default=None, help='repete em paralelo requisições mais lentas que este percentil (ex.: 0.95)')
+    comum.add_argument('--cache', default=None, help='pasta do armazenamento de respostas brutas (RawStore)')
+    comum.add_argument(
+        '--cache-ttl', type=float, default=3600,
+        help='segundos em que uma resposta do --cache é servida sem revalidação (padrão: 3600; 0 revalida sempre)',
+    )
+    comum.add_argument('--progress', type=float, default=1.0, help='segundos entre atualizações do progresso')
+
+    parser = argparse.ArgumentParser(prog='pybr-dados', description='Cargas em lote dos dados do Senado e do Bacen.')
+    comandos = parser.add_subparsers(dest='comando', required=True)
+
+    sync = comandos.add_parser('sync', help='espelha os dados localmente')
+    fontes = sync.add_subparsers(dest='fonte', required=True)
+    senado = fontes.add_parser('senado', parents=[comum], help='conjuntos do Senado em um banco SQLite/DuckDB')
+    senado.add_argument('datasets', nargs='*', help='conjuntos (padrão: todos)')
+    senado.add_argument('--db', default='senado.db', help='arquivo do banco (padrão: senado.db)')
+    senado.add_argument('--since', default=None, help='primeiro ano dos conjuntos periódicos')
+    senado.add_argument(
+        '--force', action='store_true',
+        help='verifica todas as partições; sem ela, a sincronização retoma de onde parou',
+    )
+    senado.set_defaults(executar=_sync_senado)
+    bacen = fontes.add_parser('bacen', parents=[comum], help='séries SGS e PTAX em um arquivo de capturas')
+    bacen.add_argument('--archive', default='bacen-archive', help='pasta do arquivo de capturas')
+    bacen.add_argument('--sgs', nargs='*', default=[], help='códigos de séries SGS')
+    bacen.add_argument('--ptax', action='store_true', help='cotações PTAX do dólar no período')
+    bacen.add_argument('--since', default=None, help='data inicial (AAAA-MM-DD)')
+    bacen.add_argument('--resume', action='store_true', help='pula o que já foi capturado hoje')
+    bacen.set_defaults(executar=_sync_bacen)
+
+    export = comandos.add_parser('export', parents=[comum], help='exporta um conjunto do Senado para arquivos')
+    export.add_argument('dataset', help='conjunto de dados')
+    export.add_argument('--out', required=True, help='pasta de destino (um subdiretório por período)')
+    export.add_argument('--format', choices=('ndjson', 'parquet'), default=None, help='formato (padrão: parquet se disponível)')
+    export.add_argument('--shards', type=int, default=4, help='arquivos gravados em paralelo por período (padrão: 4)')
+    export.add_argument('--since', default=None, help='primeiro ano')
+    export.add_argument('--until', default=None, help='último período (AAAA ou AAAA-MM)')
+    export.add_argument('--resume', action='store_true', help='pula períodos já exportados')
+    export.set_defaults(executar=_export)
+
+    bench = comandos.add_parser('bench', parents=[comum], help='mede latência, vazão e decodificação de um endpoint')
+    bench.add_argument('endpoint', nargs='?', default='servidores/servidores/ativos', help='caminho relativo a /api/v1')
+    bench.add_argument('--repeat', type=int, default=5, help='requisições (padrão: 5)')
+    bench.set_defaults(executar=_bench)
+    return parser
+
+
+def main(argv: list[str] | None = None, saida: TextIO | None = None) -> int:
+    """Executa a linha de comando.
+
+    Argumentos:
+        argv (list[str] | None, optional): Argumentos. Padrão:  None (`sys.argv[1:]`).
+        saida (TextIO | None, optional): Destino dos resultados e do resumo. Padrão:  None (stdout).
+
+    Retorno:
+        int: Código de saída (1 se alguma unidade falhou).
+    """
+    args = _parser().parse_args(argv)
+    if args.workers is None:
+        args.workers = _WORKERS_ADAPTATIVO if args.adaptive else 4
+    saida = saida or sys.stdout
+    # O bench mede cada requisição: nada de coalescer chamadas iguais.
+    with _transporte(args, coalesce=args.executar is not _bench) as transporte:
+        inicio = time.monotonic()
+        codigo = args.executar(args, transporte, saida)
+        saida.write(summary(transporte.metrics, time.monotonic() - inicio) + '\n')
+    return codigo
@@ -0,0 +1,99 @@
+from .aggregate import GroupBy
+from .archive import Capture, SnapshotArchive, train_zlib_dictionary
+from .columnar import Table
+from .concurrency import AdaptiveLimiter
+from .compression import accept_encoding, available_encodings, iter_decoded
+from .csv_decoder import Schema, TipoColuna, decode_csv, infer_type, to_records
+from .deadlines import DeadlineExceeded, deadline, remaining
+from .export import ExportManifest, ShardFile, ShardedExporter, iter_rows, periods
+from .format_selector import FormatSelector, default_format_selector
+from .hedging import HedgeBudget, Hedger, LatencyTracker, route_key
+from .joins import build_hash_table, hash_join, key_function
+from .json_decoders import (
+    available_backends,
+    decode_json,
+    get_default_backend,
+    set_default_backend,
+)
+from .lazy import LazyRow, LazyRows
+from .metrics import HostMetrics, TransportMetrics
+from .normalize import fold_text, normalize_csv_columns, normalize_json_records, normalize_key, parse_decimal
+from .parallel import ParsePool
+from .rawstore import RawStore, StoredResponse, response_body
+from .records import RecordFactory, decode_json_records, records_from_columns
+from .sketches import CountMinSketch, HyperLogLog, SpaceSaving, TDigest, feed_sketches, load_sketch
+from .singleflight import SingleFlight
+from .transport import RateLimiter, Transport, default_transport, request_key
+from .workqueue import RedisQueue, SQLiteQueue, Task, Worker, WorkQueue, method_handler, task_key
+
+__all__ = [
+    "GroupBy",
+    "Capture",
+    "SnapshotArchive",
+    "train_zlib_dictionary",
+    "Table",
+    "AdaptiveLimiter",
+    "accept_encoding",
+    "available_encodings",
+    "iter_decoded",
+    "Schema",
+    "TipoColuna",
+    "decode_csv",
+    "infer_type",
+    "to_records",
+    "DeadlineExceeded",
+    "deadline",
+    "remaining",
+    "ExportManifest",
+    "ShardFile",
+    "ShardedExporter",
+    "iter_rows",
+    "periods",
+    "FormatSelector",
+    "default_format_selector",
+    "HedgeBudget",
+    "Hedger",
+    "LatencyTracker",
+    "route_key",
+    "build_hash_table",
+    "hash_join",
+    "key_function",
+    "available_backends",
+    "decode_json",
+    "get_default_backend",
+    "set_default_backend",
+    "LazyRow",
+    "LazyRows",
+    "HostMetrics",
+    "TransportMetrics",
+    "fold_text",
+    "normalize_csv_columns",
+    "normalize_json_records",
+    "normalize_key",
+    "parse_decimal",
+    "ParsePool",
+    "RawStore",
+    "StoredResponse",
+    "response_body",
+    "RecordFactory",
+    "decode_json_records",
+    "records_from_columns",
+    "CountMinSketch",
+    "HyperLogLog",
+    "SpaceSaving",
+    "TDigest",
+    "feed_sketches",
+    "load_sketch",
+    "SingleFlight",
+    "RateLimiter",
+    "Transport",
+    "default_transport",
+    "request_key",
+    "RedisQueue",
+    "SQLiteQueue",
+    "Task",
+    "Worker",
+    "WorkQueue",
+    "method_handler",
+    "task_key",
+]
@@ -0,0 +1,271 @@
+"""Agregação por grupos em fluxo (soma, contagem, média, mínimo, máximo e quantis exatos).
+
+As linhas são consumidas uma a uma e apenas um acumulador por grupo e por
+agregação fica na memória; as linhas em si são descartadas. Resultados
+parciais (de processos, máquinas ou períodos diferentes) são combinados com
+`merge` e podem ser enviados entre processos com `pickle`.
+
+    folha = GroupBy(('lotacao', 'cargo'), {
+        'basica': ('sum', 'remuneracaoBasica'),
+        'servidores': ('count',),
+        'liquida_media': ('mean', 'remuneracaoLiquida'),
+        'liquida_p90': ('quantile', 'remuneracaoLiquida', 0.9),
+    })
+    for mes in range(1, 13):
+        folha.consume(servidores.remuneracoes(2024, mes))
+    folha.result()
+"""
+
+from array import array
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any, Callable, Iterable
+
+from .normalize import parse_decimal
+
+Numero = int | float | Decimal
+
+
+def _numero(valor: Any) -> Numero | None:
+    if isinstance(valor, (int, float, Decimal)) and not isinstance(valor, bool):
+        return valor
+    return parse_decimal(valor)
+
+
+def _somar(a: Numero, b: Numero) -> Numero:
+    if isinstance(a, Decimal) != isinstance(b, Decimal) and (isinstance(a, float) or isinstance(b, float)):
+        return float(a) + float(b)
+    return a + b
+
+
+class _Contagem:
+    __slots__ = ('n',)
+
+    def __init__(self):
+        self.n = 0
+
+    def add(self, valor: Any) -> None:
+        self.n += 1
+
+    def merge(self, outro: '_Contagem') -> None:
+        self.n += outro.n
+
+    def result(self) -> int:
+        return self.n
+
+
+class _ContagemValores(_Contagem):
+    __slots__ = ()
+
+    def add(self, valor: Any) -> None:
+        if valor is not None and valor != '':
+            self.n += 1
+
+
+class _Soma:
+    __slots__ = ('total',)
+
+    def __init__(self):
+        self.total: Numero = 0
+
+    def add(self, valor: Any) -> None:
+        valor = _numero(valor)
+        if valor is not None:
+            self.total = _somar(self.total, valor)
+
+    def merge(self, outro: '_Soma') -> None:
+        self.total = _somar(self.total, outro.total)
+
+    def result(self) -> Numero:
+        return self.total
+
+
+class _Media:
+    __slots__ = ('total', 'n')
+
+    def __init__(self):
+        self.total: Numero = 0
+        self.n = 0
+
+    def add(self, valor: Any) -> None:
+        valor = _numero(valor)
+        if valor is not None:
+            self.total = _somar(self.total, valor)
+            self.n += 1
+
+    def merge(self, outro: '_Media') -> None:
+        self.total = _somar(self.total, outro.total)
+        self.n += outro.n
+
+    def result(self) -> Numero | None:
+        return self.total / self.n if self.n else None
+
+
+class _Extremo:
+    __slots__ = ('valor', 'maior')
+
+    def __init__(self, maior: bool):
+        self.valor = None
+        self.maior = maior
+
+    def add(self, valor: Any) -> None:
+        valor = _numero(valor)
+        if valor is not None and (self.valor is None or (valor > self.valor if self.maior else valor < self.valor)):
+            self.valor = valor
+
+    def merge(self, outro: '_Extremo') -> None:
+        if outro.valor is not None:
+            self.add(outro.valor)
+
+    def result(self) -> Numero | None:
+        return self.valor
+
+
+class _Quantis:
+    """Guarda os valores do grupo como `double` (8 bytes cada) para quantis exatos."""
+
+    __slots__ = ('valores', 'qs')
+
+    def __init__(self, qs: tuple[float, ...]):
+        self.valores = array('d')
+        self.qs = qs
+
+    def add(self, valor: Any) -> None:
+        valor = _numero(valor)
+        if valor is not None:
+            self.valores.append(float(valor))
+
+    def merge(self, outro: '_Quantis') -> None:
+        self.valores.extend(outro.valores)
+
+    def result(self) -> float | list[float] | None:
+        if not self.valores:
+            return None
+        ordenados = sorted(self.valores)
+        resultado = [_interpolar(ordenados, q) for q in self.qs]
+        return resultado[0] if len(resultado) == 1 else resultado
+
+
+def _interpolar(ordenados: list[float], q: float) -> float:
+    # Interpolação linear entre as posições vizinhas, como `numpy.quantile`.
+    posicao = q * (len(ordenados) - 1)
+    inferior = int(posicao)
+    superior = min(inferior + 1, len(ordenados) - 1)
+    return ordenados[inferior] + (ordenados[superior] - ordenados[inferior]) * (posicao - inferior)
+
+
+OPERACOES = ('count', 'sum', 'mean', 'min', 'max', 'quantile')
+
+
+def _extrator(campo: str | Callable[[Any], Any]) -> Callable[[Any], Any]:
+    if callable(campo):
+        return campo
+
+    def extrair(linha: Any) -> Any:
+        if isinstance(linha, Mapping):
+            return linha.get(campo)
+        return getattr(linha, campo, None)  # registros de `TipoRetorno.REGISTROS`
+
+    return extrair
+
+
+class GroupBy:
+    """Agregação por grupos, alimentada em fluxo e combinável."""
+
+    def __init__(self, chaves: str | Iterable[str], agregacoes: dict[str, tuple]):
+        """Define os grupos e as agregações.
+
+        Cada agregação é `(operação, campo[, parâmetro])`:
+
+        - `('count',)`: número de linhas; `('count', campo)` conta valores não vazios;
+        - `('sum', campo)`, `('mean', campo)`, `('min', campo)`, `('max', campo)`;
+        - `('quantile', campo, q)`: quantil exato; `q` pode ser uma lista de quantis.
+
+        Valores vazios são ignorados; textos numéricos (`'1.234,56'`, `'1.500'`) viram `Decimal` (ver `parse_decimal`).
+
+        Argumentos:
+            chaves (str | Iterable[str]): Campo ou campos que definem o grupo.
+            agregacoes (dict[str, tuple]): Nome do resultado -> agregação.
+        """
+        self.chaves = (chaves,) if isinstance(chaves, str) else tuple(chaves)
+        self.agregacoes = dict(agregacoes)
+        for nome, (operacao, *_) in self.agregacoes.items():
+            if operacao not in OPERACOES:
+                raise ValueError(f'Operação desconhecida em {nome!r}: {operacao!r}')
+        self.grupos: dict[tuple, list] = {}
+        self.linhas = 0
+
+    def _acumuladores(self) -> list:
+        acumuladores = []
+        for operacao, *args in self.agregacoes.values():
+            if operacao == 'count':
+                acumuladores.append(_ContagemValores() if args and args[0] is not None else _Contagem())
+            elif operacao == 'sum':
+                acumuladores.append(_Soma())
+            elif operacao == 'mean':
+                acumuladores.append(_Media())
+            elif operacao in ('min', 'max'):
+                acumuladores.append(_Extremo(operacao == 'max'))
+            else:
+                q = args[1] if len(args) > 1 else 0.5
+                acumuladores.append(_Quantis(tuple(q) if isinstance(q, (list, tuple)) else (q,)))
+        return acumuladores
+
+    def consume(self, linhas: Iterable[Any]) -> 'GroupBy':
+        """Acumula as linhas (dicts, `LazyRow` ou registros).
+
+        Argumentos:
+            linhas (Iterable[Any]): As linhas; podem vir de um gerador.
+
+        Retorno:
+            GroupBy: O próprio agregador.
+        """
+        chaves = [_extrator(c) for c in self.chaves]
+        campos = [_extrator(args[0]) if args and args[0] is not None else None for _, *args in self.agregacoes.values()]
+        grupos = self.grupos
+        n = 0
+        for linha in linhas:
+            n += 1
+            grupo = tuple(chave(linha) for chave in chaves)
+            acumuladores = grupos.get(grupo)
+            if acumuladores is None:
+                acumuladores = grupos[grupo] = self._acumuladores()
+            for acumulador, campo in zip(acumuladores, campos):
+                acumulador.add(None if campo is None else campo(linha))
+        self.linhas += n
+        return self
+
+    def merge(self, outro: 'GroupBy') -> 'GroupBy':
+        """Incorpora o resultado parcial de outro agregador com as mesmas definições."""
+        if (outro.chaves, outro.agregacoes) != (self.chaves, self.agregacoes):
+            raise ValueError('Só é possível combinar agregadores com os mesmos grupos e agregações.')
+        for grupo, acumuladores in outro.grupos.items():
+            atuais = self.grupos.get(grupo)
+            if atuais is None:
+                # Acumuladores novos: os do outro agregador não são compartilhados, e ele continua utilizável.
+                atuais = self.grupos[grupo] = self._acumuladores()
+            for atual, acumulador in zip(atuais, acumuladores):
+                atual.merge(acumulador)
+        self.linhas += outro.linhas
+        return self
+
+    def result(self, ordenar: bool = False) -> list[dict]:
+        """Uma linha por grupo, com os campos das chaves e os resultados das agregações.
+
+        Argumentos:
+            ordenar (bool, optional): Ordena os grupos pelas chaves (None primeiro). Padrão:  False (ordem de chegada).
+
+        Retorno:
+            list[dict]: Os resultados.
+        """
+        grupos = self.grupos.items()
+        if ordenar:
+            grupos = sorted(grupos, key=lambda item: tuple((v is not None, str(v)) for v in item[0]))
+        nomes = list(self.agregacoes)
+        return [
+            {**dict(zip(self.chaves, grupo)), **{nome: acc.result() for nome, acc in zip(nomes, acumuladores)}}
+            for grupo, acumuladores in grupos
+        ]
+
+    def __len__(self) -> int:
+        return len(self.grupos)
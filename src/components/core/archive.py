@@ -0,0 +1,445 @@
+"""Arquivo compactado de capturas de respostas, com dicionários por endpoint.
+
+Retratos diários (servidores, terceirizados, contratos, PTAX, Expectativas)
+repetem quase todo o conteúdo de um dia para o outro, e cada resposta
+isolada repete os mesmos nomes de campos e valores. O `SnapshotArchive`
+compacta cada captura com um dicionário treinado nas capturas anteriores do
+mesmo endpoint: com `zstandard` instalado, um dicionário zstd; sem ele, um
+dicionário de até 32 KiB para o `zlib` (`zdict`), montado com os trechos mais
+frequentes das amostras.
+
+Cada captura é dividida em blocos compactados de forma independente, de modo
+que um intervalo de bytes pode ser lido sem descompactar a captura inteira,
+e a leitura em fluxo descompacta um bloco por vez. Um índice SQLite guarda,
+por captura, o endpoint, os parâmetros, o momento da captura e a posição de
+cada bloco no arquivo de dados do endpoint.
+
+    arquivo = SnapshotArchive('historico')
+    arquivo.put('servidores/servidores/ativos', None, response.content)
+    captura = arquivo.at('servidores/servidores/ativos', momento=datetime(2024, 3, 1).timestamp())
+    registros = decode_json(arquivo.read(captura))
+"""
+
+import hashlib
+import io
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import Counter
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_DDL = '''
+CREATE TABLE IF NOT EXISTS dicionarios (
+    id INTEGER PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    dados BLOB NOT NULL,
+    criado_em DOUBLE NOT NULL
+);
+CREATE TABLE IF NOT EXISTS capturas (
+    id INTEGER PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    capturado_em DOUBLE NOT NULL,
+    codec TEXT NOT NULL,
+    dicionario INTEGER REFERENCES dicionarios (id),
+    tamanho INTEGER NOT NULL,
+    compactado INTEGER NOT NULL,
+    sha1 TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS capturas_endpoint ON capturas (endpoint, params, capturado_em);
+CREATE TABLE IF NOT EXISTS blocos (
+    captura INTEGER NOT NULL REFERENCES capturas (id),
+    seq INTEGER NOT NULL,
+    inicio INTEGER NOT NULL,  -- posição do bloco descompactado na captura
+    posicao INTEGER NOT NULL,  -- posição do bloco compactado no arquivo de dados
+    compactado INTEGER NOT NULL,
+    tamanho INTEGER NOT NULL,
+    PRIMARY KEY (captura, seq)
+) WITHOUT ROWID;
+'''
+
+# Trechos usados pelo treinamento do dicionário `zlib`: pares "campo":valor e
+# valores soltos, cortados nos separadores do JSON e do CSV.
+_TRECHOS = re.compile(rb'[^,;\n\[\]{}]{4,256}')
+_ZLIB_DICIONARIO = 32 * 1024  # janela máxima do deflate
+_ZSTD_DICIONARIO = 112 * 1024
+
+
+@dataclass(frozen=True)
+class Capture:
+    """Captura guardada no arquivo."""
+
+    id: int
+    endpoint: str
+    params: dict
+    capturado_em: float  # timestamp Unix
+    codec: str
+    tamanho: int
+    compactado: int
+    sha1: str
+
+    @property
+    def ratio(self) -> float:
+        """Razão entre o tamanho original e o compactado."""
+        return self.tamanho / self.compactado if self.compactado else 1.0
+
+
+def _params(params: dict | None) -> str:
+    """Parâmetros normalizados como na chave de requisição do transporte."""
+    return json.dumps(
+        {str(k): str(v) for k, v in sorted((params or {}).items()) if v is not None},
+        ensure_ascii=False, sort_keys=True,
+    )
+
+
+def train_zlib_dictionary(amostras: Iterable[bytes], tamanho: int = _ZLIB_DICIONARIO) -> bytes:
+    """Monta um dicionário `zdict` com os trechos que mais se repetem nas amostras.
+
+    Cada trecho vale o número de ocorrências nas amostras vezes seu tamanho.
+    Os mais valiosos ficam no fim do dicionário, mais perto dos dados e
+    portanto com referências mais curtas.
+
+    Argumentos:
+        amostras (Iterable[bytes]): Corpos de capturas do endpoint.
+        tamanho (int, optional): Tamanho máximo do dicionário. Padrão:  32768.
+
+    Retorno:
+        bytes: O dicionário.
+    """
+    contagem = Counter()
+    for amostra in amostras:
+        contagem.update(_TRECHOS.findall(amostra))
+    escolhidos, total = [], 0
+    for trecho, n in sorted(contagem.items(), key=lambda item: item[1] * len(item[0]), reverse=True):
+        if n < 2 and escolhidos:
+            break
+        if total + len(trecho) + 1 > tamanho:
+            continue
+        escolhidos.append(trecho)
+        total += len(trecho) + 1
+    return b','.join(reversed(escolhidos))
+
+
+class _Codec:
+    """Compacta e descompacta blocos com um dicionário opcional."""
+
+    def __init__(self, nome: str, dicionario: bytes | None, nivel: int):
+        if nome == 'zstd' and zstandard is None:
+            raise ImportError('Capturas em zstd requerem o zstandard. Instale com: pip install zstandard')
+        self.nome = nome
+        self.dicionario = dicionario
+        self.nivel = nivel
+        if nome == 'zstd':
+            dados = zstandard.ZstdCompressionDict(dicionario) if dicionario else None
+            self._compressor = zstandard.ZstdCompressor(level=nivel, dict_data=dados)
+            self._descompressor = zstandard.ZstdDecompressor(dict_data=dados)
+
+    def compress(self, bloco: bytes) -> bytes:
+        if self.nome == 'zstd':
+            return self._compressor.compress(bloco)
+        compressor = zlib.compressobj(self.nivel, zdict=self.dicionario) if self.dicionario else zlib.compressobj(self.nivel)
+        return compressor.compress(bloco) + compressor.flush()
+
+    def decompress(self, bloco: bytes, tamanho: int) -> bytes:
+        if self.nome == 'zstd':
+            return self._descompressor.decompress(bloco, max_output_size=tamanho)
+        descompressor = zlib.decompressobj(zdict=self.dicionario) if self.dicionario else zlib.decompressobj()
+        return descompressor.decompress(bloco) + descompressor.flush()
+
+
+class _Leitor(io.RawIOBase):
+    """Arquivo somente leitura que descompacta os blocos de uma captura sob demanda."""
+
+    def __init__(self, blocos: Iterator[bytes]):
+        self._blocos = blocos
+        self._resto = memoryview(b'')
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, destino) -> int:
+        while not self._resto:
+            bloco = next(self._blocos, None)
+            if bloco is None:
+                return 0
+            self._resto = memoryview(bloco)
+        n = min(len(destino), len(self._resto))
+        destino[:n] = self._resto[:n]
+        self._resto = self._resto[n:]
+        return n
+
+
+class SnapshotArchive:
+    """Arquivo de capturas compactadas, indexado por endpoint, parâmetros e momento da captura."""
+
+    def __init__(
+        self,
+        pasta: str,
+        *,
+        codec: str | None = None,
+        nivel: int | None = None,
+        bloco: int = 1 << 20,
+        treinar_com: int | None = 8,
+    ):
+        """Abre (ou cria) o arquivo.
+
+        Argumentos:
+            pasta (str): Diretório do índice e dos arquivos de dados.
+            codec (str | None, optional): 'zstd' ou 'zlib'. Padrão:  None ('zstd' se o zstandard estiver instalado).
+            nivel (int | None, optional): Nível de compressão. Padrão:  None (19 no zstd, 9 no zlib).
+            bloco (int, optional): Tamanho, em bytes descompactados, de cada bloco de acesso aleatório. Padrão:  1 MiB.
+            treinar_com (int | None, optional): Treina o dicionário de um endpoint quando ele acumula esse número
+                de capturas sem dicionário. Padrão:  8 (None desativa; use `train`).
+        """
+        self.pasta = os.path.expanduser(pasta)
+        self.codec = codec or ('zstd' if zstandard is not None else 'zlib')
+        if self.codec not in ('zstd', 'zlib'):
+            raise ValueError(f'Codec desconhecido: {self.codec!r}')
+        self.nivel = nivel if nivel is not None else (19 if self.codec == 'zstd' else 9)
+        self.bloco = bloco
+        self.treinar_com = treinar_com
+        os.makedirs(self.pasta, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(os.path.join(self.pasta, 'index.db'), isolation_level=None, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_DDL)
+        self._codecs: dict[tuple[int | None, str], _Codec] = {}
+
+    def close(self) -> None:
+        """Fecha o índice."""
+        self._conn.close()
+
+    def __enter__(self) -> 'SnapshotArchive':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _arquivo_dados(self, endpoint: str) -> str:
+        nome = re.sub(r'[^\w.-]+', '_', endpoint).strip('_') or 'raiz'
+        return os.path.join(self.pasta, f'{nome}.dat')
+
+    def _codec(self, dicionario: int | None, nome: str | None = None) -> _Codec:
+        # Capturas antigas podem ter outro codec que o do arquivo: a chave inclui o nome.
+        nome = nome or self.codec
+        codec = self._codecs.get((dicionario, nome))
+        if codec is None:
+            dados = None
+            if dicionario is not None:
+                (dados,) = self._conn.execute('SELECT dados FROM dicionarios WHERE id = ?', (dicionario,)).fetchone()
+            nivel = self.nivel if nome == self.codec else (19 if nome == 'zstd' else 9)
+            codec = self._codecs[(dicionario, nome)] = _Codec(nome, dados, nivel)
+        return codec
+
+    def _dicionario_atual(self, endpoint: str) -> int | None:
+        linha = self._conn.execute(
+            'SELECT id FROM dicionarios WHERE endpoint = ? AND codec = ? ORDER BY id DESC LIMIT 1',
+            (endpoint, self.codec),
+        ).fetchone()
+        return linha[0] if linha else None
+
+    def train(self, endpoint: str, amostras: Iterable[bytes] | None = None, tamanho: int | None = None) -> int:
+        """Treina um novo dicionário para o endpoint, usado pelas capturas seguintes.
+
+        Capturas já gravadas continuam com o dicionário com que foram compactadas.
+
+        Argumentos:
+            endpoint (str): Endpoint.
+            amostras (Iterable[bytes] | None, optional): Corpos de exemplo. Padrão:  None (até 32 capturas recentes).
+            tamanho (int | None, optional): Tamanho do dicionário. Padrão:  None (112 KiB no zstd, 32 KiB no zlib).
+
+        Retorno:
+            int: Identificador do dicionário.
+        """
+        with self._lock:
+            if amostras is None:
+                amostras = [self.read(c) for c in self.captures(endpoint)[-32:]]
+            # Os dicionários são treinados com blocos, a unidade compactada.
+            blocos = [bytes(a[i:i + self.bloco]) for a in amostras for i in range(0, len(a), self.bloco)]
+            if not blocos:
+                raise ValueError(f'Sem amostras para treinar o dicionário de {endpoint!r}.')
+            if self.codec == 'zstd':
+                try:
+                    dados = zstandard.train_dictionary(tamanho or _ZSTD_DICIONARIO, blocos).as_bytes()
+                except zstandard.ZstdError:  # poucas amostras: dicionário de conteúdo bruto
+                    dados = train_zlib_dictionary(blocos, tamanho or _ZSTD_DICIONARIO)
+            else:
+                dados = train_zlib_dictionary(blocos, min(tamanho or _ZLIB_DICIONARIO, _ZLIB_DICIONARIO))
+            cursor = self._conn.execute(
+                'INSERT INTO dicionarios (endpoint, codec, dados, criado_em) VALUES (?, ?, ?, ?)',
+                (endpoint, self.codec, dados, time.time()),
+            )
+            return cursor.lastrowid
+
+    def put(self, endpoint: str, params: dict | None, content: bytes | memoryview, capturado_em: float | None = None) -> Capture:
+        """Compacta e guarda uma captura.
+
+        Argumentos:
+            endpoint (str): Endpoint (ex.: 'servidores/servidores/ativos' ou a URL do recurso do Bacen).
+            params (dict | None): Parâmetros da requisição.
+            content (bytes | memoryview): Corpo da resposta, descomprimido.
+            capturado_em (float | None, optional): Momento da captura (timestamp Unix). Padrão:  None (agora).
+
+        Retorno:
+            Capture: A captura gravada.
+        """
+        content = memoryview(content)
+        capturado_em = time.time() if capturado_em is None else capturado_em
+        with self._lock:
+            dicionario = self._dicionario_atual(endpoint)
+            if dicionario is None and self.treinar_com:
+                (sem_dicionario,) = self._conn.execute(
+                    'SELECT count(*) FROM capturas WHERE endpoint = ? AND dicionario IS NULL', (endpoint,)
+                ).fetchone()
+                if sem_dicionario >= self.treinar_com:
+                    dicionario = self.train(endpoint)
+            codec = self._codec(dicionario)
+
+            caminho = self._arquivo_dados(endpoint)
+            blocos = []
+            with open(caminho, 'ab') as arquivo:
+                posicao = arquivo.seek(0, os.SEEK_END)
+                for inicio in range(0, len(content), self.bloco) or (0,):
+                    trecho = content[inicio:inicio + self.bloco]
+                    compactado = codec.compress(trecho)
+                    arquivo.write(compactado)
+                    blocos.append((inicio, posicao, len(compactado), len(trecho)))
+                    posicao += len(compactado)
+                arquivo.flush()
+                os.fsync(arquivo.fileno())
+
+            total = sum(b[2] for b in blocos)
+            sha1 = hashlib.sha1(content).hexdigest()
+            self._conn.execute('BEGIN')
+            try:
+                cursor = self._conn.execute(
+                    'INSERT INTO capturas (endpoint, params, capturado_em, codec, dicionario, tamanho, compactado, sha1)'
+                    ' VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                    (endpoint, _params(params), capturado_em, codec.nome, dicionario, len(content), total, sha1),
+                )
+                self._conn.executemany(
+                    'INSERT INTO blocos (captura, seq, inicio, posicao, compactado, tamanho) VALUES (?, ?, ?, ?, ?, ?)',
+                    [(cursor.lastrowid, seq, *bloco) for seq, bloco in enumerate(blocos)],
+                )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return Capture(cursor.lastrowid, endpoint, json.loads(_params(params)), capturado_em, codec.nome, len(content), total, sha1)
+
+    def _capturas(self, where: str, args: tuple) -> list[Capture]:
+        with self._lock:
+            linhas = self._conn.execute(
+                'SELECT id, endpoint, params, capturado_em, codec, tamanho, compactado, sha1 FROM capturas'
+                f' WHERE {where} ORDER BY capturado_em, id',
+                args,
+            ).fetchall()
+        return [Capture(i, e, json.loads(p), *resto) for i, e, p, *resto in linhas]
+
+    def captures(
+        self, endpoint: str, params: dict | None = None, desde: float | None = None, ate: float | None = None
+    ) -> list[Capture]:
+        """Capturas do endpoint em ordem cronológica.
+
+        Argumentos:
+            endpoint (str): Endpoint.
+            params (dict | None, optional): Apenas capturas com estes parâmetros. Padrão:  None (todas).
+            desde (float | None, optional): Capturadas a partir deste momento. Padrão:  None.
+            ate (float | None, optional): Capturadas até este momento, inclusive. Padrão:  None.
+
+        Retorno:
+            list[Capture]: As capturas.
+        """
+        where, args = ['endpoint = ?'], [endpoint]
+        if params is not None:
+            where.append('params = ?')
+            args.append(_params(params))
+        if desde is not None:
+            where.append('capturado_em >= ?')
+            args.append(desde)
+        if ate is not None:
+            where.append('capturado_em <= ?')
+            args.append(ate)
+        return self._capturas(' AND '.join(where), tuple(args))
+
+    def at(self, endpoint: str, params: dict | None = None, momento: float | None = None) -> Capture | None:
+        """Última captura do endpoint com os parâmetros feita até `momento`.
+
+        Argumentos:
+            endpoint (str): Endpoint.
+            params (dict | None, optional): Parâmetros da requisição. Padrão:  None.
+            momento (float | None, optional): Timestamp Unix. Padrão:  None (a mais recente).
+
+        Retorno:
+            Capture | None: A captura, ou None se não houver.
+        """
+        capturas = self.captures(endpoint, params, ate=momento)
+        return capturas[-1] if capturas else None
+
+    def endpoints(self) -> list[str]:
+        """Endpoints com capturas."""
+        return [e for (e,) in self._conn.execute('SELECT DISTINCT endpoint FROM capturas ORDER BY endpoint')]
+
+    def iter_chunks(self, captura: Capture | int, inicio: int = 0, fim: int | None = None) -> Iterator[bytes]:
+        """Descompacta a captura em fluxo, um bloco por vez.
+
+        Argumentos:
+            captura (Capture | int): A captura ou seu identificador.
+            inicio (int, optional): Primeiro byte (descompactado) desejado. Padrão:  0.
+            fim (int | None, optional): Byte final, exclusivo. Padrão:  None (até o fim).
+
+        Retorno:
+            Iterator[bytes]: Os trechos descompactados, em ordem.
+        """
+        identificador = captura if isinstance(captura, int) else captura.id
+        with self._lock:
+            linha = self._conn.execute(
+                'SELECT endpoint, dicionario, codec, tamanho FROM capturas WHERE id = ?', (identificador,)
+            ).fetchone()
+            if linha is None:
+                raise KeyError(identificador)
+            endpoint, dicionario, nome, tamanho = linha
+            fim = tamanho if fim is None else min(fim, tamanho)
+            blocos = self._conn.execute(
+                'SELECT inicio, posicao, compactado, tamanho FROM blocos'
+                ' WHERE captura = ? AND inicio < ? AND inicio + tamanho > ? ORDER BY seq',
+                (identificador, fim, inicio),
+            ).fetchall()
+            codec = self._codec(dicionario, nome)
+        with open(self._arquivo_dados(endpoint), 'rb') as arquivo:
+            for comeco, posicao, compactado, n in blocos:
+                arquivo.seek(posicao)
+                bloco = codec.decompress(arquivo.read(compactado), n)
+                yield bloco[max(inicio - comeco, 0):fim - comeco] if comeco < inicio or comeco + n > fim else bloco
+
+    def read(self, captura: Capture | int, inicio: int = 0, fim: int | None = None) -> bytes:
+        """Corpo da captura (ou o intervalo `[inicio, fim)`), descompactando só os blocos necessários."""
+        return b''.join(self.iter_chunks(captura, inicio, fim))
+
+    def open(self, captura: Capture | int, buffer_size: int = io.DEFAULT_BUFFER_SIZE) -> io.BufferedReader:
+        """Abre a captura como arquivo binário, descompactada sob demanda.
+
+        Serve a leitores em fluxo, como `csv.reader(io.TextIOWrapper(arquivo.open(captura)))`.
+        """
+        return io.BufferedReader(_Leitor(self.iter_chunks(captura)), buffer_size)
+
+    def stats(self) -> dict[str, dict]:
+        """Capturas, bytes originais, bytes compactados e razão de compressão por endpoint."""
+        linhas = self._conn.execute(
+            'SELECT endpoint, count(*), sum(tamanho), sum(compactado) FROM capturas GROUP BY endpoint ORDER BY endpoint'
+        ).fetchall()
+        return {
+            endpoint: {'capturas': n, 'tamanho': tamanho, 'compactado': compactado, 'ratio': tamanho / compactado if compactado else None}
+            for endpoint, n, tamanho, compactado in linhas
+        }
@@ -0,0 +1,204 @@
+"""Tabela colunar com exportação sem cópia para Arrow, pandas e polars.
+
+Colunas numéricas são guardadas em buffers contíguos (`array.array` ou
+arrays NumPy), que o Arrow e o NumPy conseguem referenciar diretamente; os
+nulos ficam em uma máscara à parte (`nulls`), que vira o bitmap de validade
+do Arrow. Colunas `Decimal` (valores em reais) permanecem exatas e viram
+`decimal128` no Arrow; com `decimais_em_float`, viram buffers float64.
+Colunas de texto e datas permanecem listas Python.
+"""
+
+import math
+from array import array
+from datetime import date
+from decimal import Decimal
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_ARRAY_TYPECODES = {'int64': 'q', 'float64': 'd'}
+
+
+def _kind(valores: list, decimais_em_float: bool = False) -> str:
+    tipos = {type(v) for v in valores if v is not None}
+    if tipos == {int}:
+        return 'int64'
+    if Decimal in tipos and tipos <= {int, Decimal} and not decimais_em_float:
+        return 'decimal'
+    if tipos and tipos <= {int, float, Decimal}:
+        return 'float64'
+    if tipos == {bool}:
+        return 'bool'
+    if tipos == {date}:
+        return 'date'
+    if tipos <= {str}:
+        return 'string'
+    return 'object'
+
+
+def _buffer(valores: list, kind: str) -> tuple[array, bytearray | None]:
+    """Buffer da coluna e a máscara de nulos (1 = nulo), ou None sem nulos."""
+    nulos = bytearray(v is None for v in valores) if None in valores else None
+    vazio = math.nan if kind == 'float64' else 0
+    if kind == 'float64':
+        valores = [vazio if v is None else float(v) for v in valores]
+    elif nulos is not None:
+        valores = [vazio if v is None else v for v in valores]
+    return array(_ARRAY_TYPECODES[kind], valores), nulos
+
+
+def _validade(nulos: bytearray) -> bytes:
+    # Bitmap de validade do Arrow: um bit por linha, 1 = válido, bit menos significativo primeiro.
+    if np is not None:
+        return np.packbits(np.frombuffer(nulos, dtype=np.uint8) == 0, bitorder='little').tobytes()
+    bits = bytearray((len(nulos) + 7) // 8)
+    for i, nulo in enumerate(nulos):
+        if not nulo:
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+
+class Table:
+    """Resultado tabular com uma coluna tipada por campo."""
+
+    def __init__(self, colunas: dict[str, Any], decimais_em_float: bool = False):
+        """Inicializa a tabela a partir de colunas já convertidas.
+
+        Colunas inteiras e reais viram buffers contíguos, com os nulos em
+        `nulls`; as demais são mantidas como listas.
+
+        Argumentos:
+            colunas (dict[str, Any]): Colunas pelo nome, como listas, `array.array` ou arrays NumPy.
+            decimais_em_float (bool, optional): Guardar colunas `Decimal` em buffers float64 (15-16 dígitos
+                significativos) em vez de mantê-las exatas. Padrão:  False.
+        """
+        self.columns: dict[str, Any] = {}
+        self.kinds: dict[str, str] = {}
+        self.nulls: dict[str, bytearray] = {}
+        tamanhos = set()
+        for nome, valores in colunas.items():
+            if isinstance(valores, array):
+                kind = {'q': 'int64', 'd': 'float64'}.get(valores.typecode, 'object')
+            elif np is not None and isinstance(valores, np.ndarray):
+                kind = str(valores.dtype) if valores.dtype.kind in 'if' else ('date' if valores.dtype.kind == 'M' else 'object')
+            else:
+                valores = list(valores)
+                kind = _kind(valores, decimais_em_float)
+                if kind in _ARRAY_TYPECODES:
+                    valores, nulos = _buffer(valores, kind)
+                    if nulos is not None:
+                        self.nulls[nome] = nulos
+                elif kind == 'decimal':
+                    valores = [Decimal(v) if type(v) is int else v for v in valores]
+            self.columns[nome] = valores
+            self.kinds[nome] = kind
+            tamanhos.add(len(valores))
+        if len(tamanhos) > 1:
+            raise ValueError(f'Colunas com tamanhos diferentes: {sorted(tamanhos)}.')
+        self.num_rows = tamanhos.pop() if tamanhos else 0
+
+    @classmethod
+    def from_records(cls, registros: Iterable[dict], decimais_em_float: bool = False) -> 'Table':
+        """Monta a tabela a partir de registros (ex.: o `value` de uma resposta OData).
+
+        Argumentos:
+            registros (Iterable[dict]): Registros com os mesmos campos.
+            decimais_em_float (bool, optional): Ver `Table`. Padrão:  False.
+
+        Retorno:
+            Table: A tabela.
+        """
+        registros = registros if isinstance(registros, list) else list(registros)
+        nomes = dict.fromkeys(nome for registro in registros[:1] for nome in registro)
+        for registro in registros:
+            if len(registro) != len(nomes) or registro.keys() != nomes.keys():
+                nomes.update(dict.fromkeys(registro))
+        return cls({nome: [registro.get(nome) for registro in registros] for nome in nomes}, decimais_em_float)
+
+    @property
+    def column_names(self) -> list[str]:
+        return list(self.columns)
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+    def __getitem__(self, nome: str):
+        return self.columns[nome]
+
+    def __repr__(self) -> str:
+        tipos = ', '.join(f'{nome}: {kind}' for nome, kind in self.kinds.items())
+        return f'Table({self.num_rows} linhas; {tipos})'
+
+    def _lista(self, nome: str) -> list:
+        valores = list(self.columns[nome])
+        nulos = self.nulls.get(nome)
+        if nulos is not None:
+            valores = [None if nulo else v for v, nulo in zip(valores, nulos)]
+        return valores
+
+    def to_records(self) -> list[dict]:
+        """Converte a tabela em uma lista de registros; nulos viram None."""
+        nomes = list(self.columns)
+        return [dict(zip(nomes, linha)) for linha in zip(*(self._lista(nome) for nome in nomes))]
+
+    def _numpy_column(self, nome: str):
+        valores = self.columns[nome]
+        if isinstance(valores, array):
+            # Visão sobre o mesmo buffer, sem cópia.
+            return np.frombuffer(valores, dtype=self.kinds[nome])
+        return valores
+
+    def to_arrow(self):
+        """Exporta para `pyarrow.Table`. Buffers numéricos são compartilhados sem cópia.
+
+        Retorno:
+            pyarrow.Table: A tabela Arrow.
+        """
+        import pyarrow as pa
+
+        arrays = []
+        for nome, valores in self.columns.items():
+            kind = self.kinds[nome]
+            if isinstance(valores, array):
+                tipo = pa.int64() if kind == 'int64' else pa.float64()
+                nulos = self.nulls.get(nome)
+                validade = None if nulos is None else pa.py_buffer(_validade(nulos))
+                arrays.append(pa.Array.from_buffers(
+                    tipo, len(valores), [validade, pa.py_buffer(valores)], null_count=0 if nulos is None else sum(nulos),
+                ))
+            else:
+                arrays.append(pa.array(valores))
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
+
+    def to_pandas(self):
+        """Exporta para `pandas.DataFrame`. Colunas numéricas referenciam os mesmos buffers.
+
+        Colunas numéricas com nulos viram arrays anuláveis do pandas (`Int64`, `Float64`).
+
+        Retorno:
+            pandas.DataFrame: O DataFrame.
+        """
+        import pandas as pd
+
+        colunas = {}
+        for nome in self.columns:
+            coluna = self._numpy_column(nome)
+            nulos = self.nulls.get(nome)
+            if nulos is not None:
+                anulavel = pd.arrays.IntegerArray if self.kinds[nome] == 'int64' else pd.arrays.FloatingArray
+                coluna = anulavel(coluna, np.frombuffer(nulos, dtype=bool))
+            colunas[nome] = coluna
+        return pd.DataFrame(colunas, copy=False)
+
+    def to_polars(self):
+        """Exporta para `polars.DataFrame` via Arrow, sem cópia das colunas numéricas.
+
+        Retorno:
+            polars.DataFrame: O DataFrame.
+        """
+        import polars as pl
+
+        return pl.from_arrow(self.to_arrow(), rechunk=False)
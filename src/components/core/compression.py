@@ -0,0 +1,79 @@
+"""Negociação de compressão e descompressão incremental das respostas."""
+
+from typing import Iterator
+
+import requests
+
+try:
+    import zstandard  # noqa: F401
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+try:
+    import brotli  # noqa: F401
+    HAS_BROTLI = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        HAS_BROTLI = True
+    except ImportError:
+        HAS_BROTLI = False
+
+
+def available_encodings() -> list[str]:
+    """Codificações de conteúdo suportadas neste ambiente, em ordem de preferência.
+
+    Apenas são anunciadas codificações que o `urllib3` consegue decodificar
+    com as bibliotecas instaladas: `zstd` requer `zstandard` e `br` requer
+    `brotli` ou `brotlicffi`.
+
+    Retorno:
+        list[str]: Codificações disponíveis.
+    """
+    encodings = []
+    if HAS_ZSTD:
+        encodings.append('zstd')
+    if HAS_BROTLI:
+        encodings.append('br')
+    encodings += ['gzip', 'deflate']
+    return encodings
+
+
+def accept_encoding() -> str:
+    """Valor do cabeçalho `Accept-Encoding` com a melhor codificação disponível primeiro."""
+    return ', '.join(available_encodings())
+
+
+def wire_size(response: requests.Response) -> int | None:
+    """Número de bytes recebidos pela rede, antes da descompressão.
+
+    Retorno:
+        int | None: Bytes lidos do socket, ou None se não for possível medir.
+    """
+    raw = getattr(response, 'raw', None)
+    tell = getattr(raw, 'tell', None)
+    if tell is None:
+        return None
+    size = tell()
+    return size if isinstance(size, int) else None
+
+
+def iter_decoded(response: requests.Response, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    """Itera sobre o corpo da resposta já descomprimido, em blocos.
+
+    A descompressão é incremental, então o resultado pode alimentar diretamente
+    parsers de streaming sem materializar o corpo inteiro. Use com respostas
+    obtidas com `stream=True`.
+
+    Argumentos:
+        response (requests.Response): Resposta da requisição.
+        chunk_size (int, optional): Tamanho máximo de cada bloco lido. Padrão:  65536.
+
+    Retorno:
+        Iterator[bytes]: Blocos descomprimidos do corpo.
+    """
+    if response.raw is None or getattr(response, '_content_consumed', False):
+        yield response.content
+        return
+    yield from response.raw.stream(chunk_size, decode_content=True)
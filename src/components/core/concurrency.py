@@ -0,0 +1,116 @@
+"""Limite adaptativo de requisições simultâneas por host (algoritmo de gradiente).
+
+O limite acompanha duas medidas da latência (RTT): a linha de base, o menor
+RTT das janelas recentes, que representa o servidor sem fila (como no TCP
+Vegas), e a de curto prazo, média das últimas respostas. A razão entre elas,
+com uma tolerância, é o gradiente: perto de 1, o servidor
+absorve a carga e o limite cresce `sqrt(limite)`; abaixo de 1, há fila se
+formando e o limite encolhe na mesma proporção. Cada novo cálculo entra no
+limite suavizado por `suavizacao`. Erros e respostas de sobrecarga (429, 502, 503, 504) reduzem o
+limite multiplicativamente.
+
+O limite só cresce quando está sendo usado (ao menos metade das vagas
+ocupadas), para não inflar em períodos de pouca demanda.
+"""
+
+import math
+import threading
+
+
+class AdaptiveLimiter:
+    """Limite adaptativo de chamadas simultâneas, seguro entre threads."""
+
+    def __init__(
+        self,
+        inicial: int = 4,
+        minimo: int = 1,
+        maximo: int = 64,
+        suavizacao: float = 0.2,
+        tolerancia: float = 1.5,
+        janela: int = 500,
+        recuo: float = 0.9,
+    ):
+        """Inicializa o limitador.
+
+        Argumentos:
+            inicial (int, optional): Limite inicial. Padrão:  4.
+            minimo (int, optional): Menor limite. Padrão:  1.
+            maximo (int, optional): Maior limite. Padrão:  64.
+            suavizacao (float, optional): Peso de cada novo cálculo no limite. Padrão:  0.2.
+            tolerancia (float, optional): Quanto o RTT de curto prazo pode exceder a linha de base sem reduzir
+                o limite. Padrão:  1.5.
+            janela (int, optional): Amostras por janela do RTT mínimo; a linha de base é renovada a cada janela
+                e acompanha mudanças duradouras do servidor. Padrão:  500.
+            recuo (float, optional): Fator aplicado ao limite a cada erro. Padrão:  0.9.
+        """
+        self.minimo = minimo
+        self.maximo = maximo
+        self.suavizacao = suavizacao
+        self.tolerancia = tolerancia
+        self.janela = janela
+        self.recuo = recuo
+        self._limite = float(min(max(inicial, minimo), maximo))
+        self._em_voo = 0
+        self._rtt_curto: float | None = None
+        self._rtt_base = math.inf  # mínimo da janela anterior
+        self._minimo_janela = math.inf
+        self._amostras = 0
+        self._cond = threading.Condition()
+
+    @property
+    def limit(self) -> int:
+        """Limite atual de chamadas simultâneas."""
+        return int(self._limite)
+
+    @property
+    def in_flight(self) -> int:
+        """Chamadas em andamento."""
+        return self._em_voo
+
+    def acquire(self, timeout: float | None = None) -> bool:
+        """Aguarda uma vaga.
+
+        Argumentos:
+            timeout (float | None, optional): Máximo de segundos de espera. Padrão:  None (sem limite).
+
+        Retorno:
+            bool: False se o tempo de espera se esgotou.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._em_voo < int(self._limite), timeout):
+                return False
+            self._em_voo += 1
+            return True
+
+    def release(self, rtt: float | None, erro: bool = False) -> None:
+        """Libera a vaga e ajusta o limite.
+
+        Argumentos:
+            rtt (float | None): Duração da chamada, em segundos; None não ajusta o limite (ex.: chamada cancelada).
+            erro (bool, optional): Se a chamada falhou ou o servidor indicou sobrecarga. Padrão:  False.
+        """
+        with self._cond:
+            em_voo = self._em_voo
+            self._em_voo -= 1
+            if erro:
+                self._limite = max(self._limite * self.recuo, self.minimo)
+            elif rtt is not None and rtt > 0:
+                self._ajustar(rtt, em_voo)
+            self._cond.notify_all()
+
+    def _ajustar(self, rtt: float, em_voo: int) -> None:
+        self._rtt_curto = rtt if self._rtt_curto is None else self._rtt_curto + (rtt - self._rtt_curto) * 0.5
+        self._minimo_janela = min(self._minimo_janela, rtt)
+        self._amostras += 1
+        base = min(self._rtt_base, self._minimo_janela)
+        if self._amostras >= self.janela:
+            self._rtt_base, self._minimo_janela, self._amostras = self._minimo_janela, math.inf, 0
+        gradiente = max(0.5, min(1.0, self.tolerancia * base / self._rtt_curto))
+        if gradiente < 1:
+            novo = self._limite * gradiente
+        elif em_voo >= self._limite / 2:
+            novo = self._limite + math.sqrt(self._limite)
+        else:
+            return
+        novo = self._limite * (1 - self.suavizacao) + novo * self.suavizacao
+        self._limite = min(max(novo, self.minimo), self.maximo)
@@ -0,0 +1,234 @@
+"""Decodificação tipada de CSVs no formato brasileiro.
+
+Os CSVs do Senado e do SGS usam `;` como separador, vírgula decimal com ponto
+de milhar (`1.234,56`) e datas `dd/mm/aaaa`. A conversão é feita por coluna:
+cada coluna é normalizada de uma só vez sobre a string concatenada e então
+convertida com funções nativas (`map`) ou com NumPy, quando instalado.
+"""
+
+import csv
+import io
+import re
+from datetime import date
+from decimal import Decimal
+from enum import StrEnum
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from .normalize import NUMERO_BR
+
+
+class TipoColuna(StrEnum):
+    """Tipo de uma coluna decodificada."""
+
+    INTEIRO = "int"
+    REAL = "float"
+    DECIMAL = "decimal"
+    DATA = "date"
+    BOOLEANO = "bool"
+    TEXTO = "str"
+
+
+Schema = dict[str, TipoColuna]
+
+# Separador usado para concatenar as células de uma coluna; não ocorre em dados textuais.
+_SEP = '\x00'
+
+_DATA_BR = re.compile(r'(\d{2})/(\d{2})/(\d{4})')
+_BOOLEANOS = {
+    's': True, 'sim': True, 'true': True, '1': True,
+    'n': False, 'nao': False, 'não': False, 'false': False, '0': False,
+}
+
+_CELULA = r'(?:{})?'
+_PADROES = [
+    # Zeros à esquerda indicam identificadores (CPF, CNPJ), que permanecem texto;
+    # com 11 dígitos ou mais também, para o tipo não depender de algum começar com 0.
+    (TipoColuna.INTEIRO, r'-?(?:0|[1-9]\d{0,9})'),
+    (TipoColuna.REAL, r'-?\d{1,3}(?:\.\d{3})*,\d+|-?\d+,\d+'),
+    (TipoColuna.DATA, r'\d{2}/\d{2}/\d{4}'),
+]
+_INFERENCIA = [
+    (tipo, re.compile(f'{_CELULA.format(padrao)}(?:{_SEP}{_CELULA.format(padrao)})*'))
+    for tipo, padrao in _PADROES
+]
+
+
+def infer_type(coluna: tuple[str, ...] | list[str]) -> TipoColuna:
+    """Infere o tipo de uma coluna de células em texto.
+
+    Argumentos:
+        coluna (tuple[str, ...] | list[str]): Células da coluna.
+
+    Retorno:
+        TipoColuna: Tipo inferido; colunas vazias ou mistas são texto.
+    """
+    junta = _SEP.join(coluna)
+    if not junta.strip(_SEP):
+        return TipoColuna.TEXTO
+    for tipo, padrao in _INFERENCIA:
+        if padrao.fullmatch(junta):
+            return tipo
+    return TipoColuna.TEXTO
+
+
+def _normalizar_numeros(coluna) -> list[str]:
+    # Sempre no formato brasileiro, mesmo sem nenhuma vírgula na coluna: '1.500' é mil e quinhentos.
+    return _SEP.join(coluna).translate(NUMERO_BR).split(_SEP)
+
+
+def _normalizar_datas(coluna) -> list[str]:
+    valores = _DATA_BR.sub(r'\3-\2-\1', _SEP.join(coluna)).split(_SEP)
+    if any(len(v) > 10 for v in valores):
+        # Data e hora: apenas a data é mantida.
+        valores = [v[:10] for v in valores]
+    return valores
+
+
+def _converter(valores: list[str], fn, tem_nulos: bool) -> list:
+    if not tem_nulos:
+        return list(map(fn, valores))
+    return [fn(v) if v else None for v in valores]
+
+
+def _converter_numpy(valores: list[str], tipo: TipoColuna, tem_nulos: bool):
+    if tipo == TipoColuna.DATA:
+        return np.array(valores, dtype='datetime64[D]')
+    if tipo == TipoColuna.INTEIRO and not tem_nulos:
+        return np.array(valores).astype(np.int64)
+    if tem_nulos:
+        valores = [v or 'nan' for v in valores]
+    return np.array(valores).astype(np.float64)
+
+
+def _invalido(coluna, valores: list[str], fn, tipo: TipoColuna) -> ValueError:
+    for i, valor in enumerate(valores):
+        if valor:
+            try:
+                fn(valor)
+            except (ValueError, ArithmeticError):
+                return ValueError(f'{coluna[i]!r} não é um valor {tipo} válido (linha {i + 1} dos dados)')
+    return ValueError(f'Coluna com valores inválidos para o tipo {tipo}')
+
+
+def convert_column(coluna, tipo: TipoColuna, use_numpy: bool = False):
+    """Converte uma coluna de texto para o tipo indicado.
+
+    Células vazias viram None (ou NaN/NaT nas colunas NumPy). Com NumPy,
+    inteiros com nulos viram float64, como no pandas; decimais e textos
+    permanecem listas Python.
+
+    Argumentos:
+        coluna: Células em texto.
+        tipo (TipoColuna): Tipo de destino.
+        use_numpy (bool, optional): Produzir arrays NumPy para colunas numéricas e de data. Padrão:  False.
+
+    Retorno:
+        list | numpy.ndarray: A coluna convertida.
+
+    Raises:
+        ValueError: Se uma célula não é um valor válido do tipo; a mensagem traz a célula e a linha.
+    """
+    tem_nulos = '' in coluna
+    if tipo == TipoColuna.TEXTO:
+        return [v if v else None for v in coluna] if tem_nulos else list(coluna)
+    if tipo == TipoColuna.BOOLEANO:
+        return [_BOOLEANOS.get(v.strip().lower()) if v else None for v in coluna]
+    if tipo == TipoColuna.DATA:
+        valores, fn = _normalizar_datas(coluna), date.fromisoformat
+    else:
+        valores = _normalizar_numeros(coluna)
+        fn = {TipoColuna.INTEIRO: int, TipoColuna.REAL: float, TipoColuna.DECIMAL: Decimal}[tipo]
+    try:
+        if use_numpy and tipo != TipoColuna.DECIMAL:
+            return _converter_numpy(valores, tipo, tem_nulos)
+        return _converter(valores, fn, tem_nulos)
+    except (ValueError, ArithmeticError):
+        raise _invalido(coluna, valores, fn, tipo) from None
+
+
+def decode_csv(
+    texto: str | bytes,
+    schema: Schema | None = None,
+    *,
+    sep: str | None = None,
+    use_numpy: bool | None = None,
+    encoding: str = 'utf-8',
+) -> dict[str, list]:
+    """Decodifica um CSV em colunas tipadas.
+
+    As colunas presentes no schema são convertidas para o tipo indicado; as
+    demais têm o tipo inferido a partir do conteúdo.
+
+    Argumentos:
+        texto (str | bytes): Conteúdo do CSV.
+        schema (Schema | None, optional): Tipo de cada coluna, pelo nome do cabeçalho. Padrão:  None.
+        sep (str | None, optional): Separador. Padrão:  None (detecta entre `;` e `,`).
+        use_numpy (bool | None, optional): Usar NumPy. Padrão:  None (usa se instalado).
+        encoding (str, optional): Codificação, quando `texto` é bytes. Padrão:  'utf-8'.
+
+    Retorno:
+        dict[str, list]: Colunas tipadas indexadas pelo nome do cabeçalho.
+
+    Raises:
+        ValueError: Se uma célula não é válida para o tipo da coluna; a mensagem traz a coluna, a célula e a linha.
+    """
+    return _decode_csv(texto, schema, sep=sep, use_numpy=use_numpy, encoding=encoding)[0]
+
+
+def _decode_csv(
+    texto: str | bytes,
+    schema: Schema | None = None,
+    *,
+    sep: str | None = None,
+    use_numpy: bool | None = None,
+    encoding: str = 'utf-8',
+) -> tuple[dict[str, list], dict[str, TipoColuna | None]]:
+    """`decode_csv` que também retorna o tipo usado em cada coluna (None para colunas vazias sem schema)."""
+    if isinstance(texto, bytes):
+        texto = texto.decode(encoding)
+    texto = texto.lstrip('\ufeff')
+    if sep is None:
+        primeira_linha = texto.split('\n', 1)[0]
+        sep = ';' if primeira_linha.count(';') >= primeira_linha.count(',') else ','
+    if use_numpy is None:
+        use_numpy = np is not None
+    elif use_numpy and np is None:
+        raise ImportError('NumPy não está instalado.')
+
+    linhas = csv.reader(io.StringIO(texto), delimiter=sep)
+    cabecalho = next(linhas, None)
+    if cabecalho is None:
+        return {}, {}
+    cabecalho = [nome.strip() for nome in cabecalho]
+    n = len(cabecalho)
+    # Linhas com campos faltando ou sobrando são ajustadas para não desalinhar as colunas.
+    linhas = [linha if len(linha) == n else (linha + [''] * n)[:n] for linha in linhas if linha]
+    colunas = list(zip(*linhas)) or [()] * n
+    schema = schema or {}
+
+    resultado, tipos = {}, {}
+    for nome, coluna in zip(cabecalho, colunas):
+        tipo = schema.get(nome) or infer_type(coluna)
+        try:
+            resultado[nome] = convert_column(coluna, tipo, use_numpy)
+        except ValueError as e:
+            raise ValueError(f'Coluna {nome!r}: {e}') from None
+        tipos[nome] = tipo if nome in schema or any(coluna) else None
+    return resultado, tipos
+
+
+def to_records(colunas: dict[str, list]) -> list[dict]:
+    """Converte colunas decodificadas em uma lista de registros.
+
+    Argumentos:
+        colunas (dict[str, list]): Colunas, como retornadas por `decode_csv`.
+
+    Retorno:
+        list[dict]: Um dicionário por linha.
+    """
+    nomes = list(colunas)
+    return [dict(zip(nomes, linha)) for linha in zip(*(list(c) for c in colunas.values()))]
@@ -0,0 +1,68 @@
+"""Prazos por operação para as requisições do `Transport`.
+
+Um prazo vale para todas as requisições feitas dentro do bloco, inclusive
+novas tentativas e requisições de hedge: o timeout de cada chamada é
+reduzido ao tempo restante e, vencido o prazo, nenhuma requisição nova é
+enviada.
+
+    with deadline(30):
+        contratos = contratacoes.contratos(ano=2024)
+        pagamentos = [contratacoes.pagamentos('contratos', c['id']) for c in contratos]
+
+Prazos aninhados valem pelo menor. O prazo acompanha o contexto
+(`contextvars`): vale na thread que abriu o bloco e nas tarefas asyncio,
+mas não em threads de um `ThreadPoolExecutor`, que começam sem prazo.
+"""
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+import requests
+
+_limite: contextvars.ContextVar[float | None] = contextvars.ContextVar('pybr_dados_deadline', default=None)
+
+
+class DeadlineExceeded(requests.Timeout):
+    """O prazo da operação venceu antes de a requisição ser concluída."""
+
+
+@contextmanager
+def deadline(segundos: float) -> Iterator[None]:
+    """Define o prazo, em segundos, das requisições feitas dentro do bloco.
+
+    Argumentos:
+        segundos (float): Prazo a partir de agora.
+    """
+    limite = time.monotonic() + segundos
+    atual = _limite.get()
+    token = _limite.set(limite if atual is None else min(atual, limite))
+    try:
+        yield
+    finally:
+        _limite.reset(token)
+
+
+def remaining() -> float | None:
+    """Segundos restantes do prazo em vigor (negativo se venceu), ou None sem prazo."""
+    limite = _limite.get()
+    return None if limite is None else limite - time.monotonic()
+
+
+def call_timeout(timeout: float | tuple | None) -> float | tuple | None:
+    """Timeout de uma chamada: o menor entre `timeout` (ou cada parte de `(conexão, leitura)`) e o prazo restante.
+
+    Raises:
+        DeadlineExceeded: Se o prazo já venceu.
+    """
+    restante = remaining()
+    if restante is None:
+        return timeout
+    if restante <= 0:
+        raise DeadlineExceeded('Prazo da operação esgotado')
+    if timeout is None:
+        return restante
+    if isinstance(timeout, tuple):
+        return tuple(restante if t is None else min(t, restante) for t in timeout)
+    return min(timeout, restante)
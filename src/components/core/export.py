@@ -0,0 +1,436 @@
+"""Exportação em paralelo para arquivos particionados (NDJSON.gz ou Parquet).
+
+As linhas de uma fonte (qualquer método de cliente, ou o mesmo método
+chamado para uma faixa de períodos) são divididas em lotes e distribuídas
+entre N shards. Cada shard tem uma fila limitada e uma thread escritora
+própria, que grava arquivos rotativos (um novo a cada `linhas_por_arquivo`
+linhas). Quando as escritoras ficam para trás, as filas enchem e quem baixa
+as linhas fica bloqueado até haver espaço: a memória fica limitada a
+`shards * fila` lotes mais os períodos em download, por mais rápida que
+seja a rede.
+
+A compressão gzip e a escrita Parquet liberam o GIL, por isso as escritoras
+são threads. Ao final, `manifest.json` lista cada arquivo com o número de
+linhas, o tamanho e o SHA-256.
+
+    exportador = ShardedExporter('lake/remuneracoes', shards=4)
+    manifesto = exportador.export_periods(
+        servidores.remuneracoes, periods((2019, 1), (2024, 12)), workers=4,
+    )
+"""
+
+import dataclasses
+import gzip
+import hashlib
+import itertools
+import json
+import os
+import queue
+import threading
+import time
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator
+
+from .columnar import Table
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+_FIM = object()  # sinaliza às escritoras que não há mais lotes
+
+
+@dataclass
+class ShardFile:
+    """Arquivo gravado por um shard."""
+
+    arquivo: str  # relativo à pasta de destino
+    shard: int
+    linhas: int
+    bytes: int
+    sha256: str
+
+
+@dataclass
+class ExportManifest:
+    """Resumo de uma exportação, gravado em `manifest.json`."""
+
+    formato: str
+    linhas: int = 0
+    arquivos: list[ShardFile] = field(default_factory=list)
+    fonte: str | None = None
+    criado_em: float = field(default_factory=time.time)
+    segundos: float = 0.0
+
+    def to_dict(self) -> dict:
+        return dataclasses.asdict(self)
+
+
+def periods(inicio: int | tuple[int, int], fim: int | tuple[int, int]) -> list[tuple[int, ...]]:
+    """Faixa de períodos para `export_periods`: anos (`2019, 2024`) ou meses (`(2019, 1), (2024, 12)`).
+
+    Argumentos:
+        inicio (int | tuple[int, int]): Primeiro ano ou (ano, mês).
+        fim (int | tuple[int, int]): Último ano ou (ano, mês), inclusive.
+
+    Retorno:
+        list[tuple[int, ...]]: Os argumentos posicionais de cada chamada.
+    """
+    if isinstance(inicio, int):
+        return [(ano,) for ano in range(inicio, fim + 1)]
+    (ano, mes), (ano_fim, mes_fim) = inicio, fim
+    resultado = []
+    while (ano, mes) <= (ano_fim, mes_fim):
+        resultado.append((ano, mes))
+        ano, mes = (ano + 1, 1) if mes == 12 else (ano, mes + 1)
+    return resultado
+
+
+def _linha(registro: Any) -> dict:
+    if isinstance(registro, dict):
+        return registro
+    if isinstance(registro, Mapping):  # `LazyRow`
+        return dict(registro)
+    if dataclasses.is_dataclass(registro):  # registros de `TipoRetorno.REGISTROS`
+        return {f.name: getattr(registro, f.name) for f in dataclasses.fields(registro)}
+    raise TypeError(f'Linha não exportável: {type(registro).__name__}')
+
+
+def iter_rows(resultado: Any) -> Iterator[dict]:
+    """Linhas do retorno de um método de cliente (lista, envelope OData, `Table`, `LazyRows`...)."""
+    if isinstance(resultado, (str, bytes)):
+        raise TypeError('Retornos em texto (CSV) não são exportáveis; use um tipo de retorno com linhas.')
+    if isinstance(resultado, dict):
+        resultado = resultado.get('value', [resultado])
+    if isinstance(resultado, Table):
+        nomes = list(resultado.columns)
+        for valores in zip(*(list(c) for c in resultado.columns.values())):
+            yield dict(zip(nomes, valores))
+        return
+    for registro in resultado or ():
+        yield _linha(registro)
+
+
+def _padrao(valor: Any) -> Any:
+    # Decimal vira texto, sem perder precisão; demais tipos desconhecidos também.
+    return str(valor)
+
+
+def _ndjson(linhas: list[dict]) -> bytes:
+    if orjson is not None:
+        return b''.join(orjson.dumps(linha, default=_padrao, option=orjson.OPT_APPEND_NEWLINE) for linha in linhas)
+    return ''.join(json.dumps(linha, ensure_ascii=False, default=_padrao) + '\n' for linha in linhas).encode()
+
+
+class _Hashing:
+    """Arquivo de saída que calcula o SHA-256 e o tamanho do que é escrito."""
+
+    def __init__(self, arquivo):
+        self._arquivo = arquivo
+        self.sha256 = hashlib.sha256()
+        self.bytes = 0
+
+    def write(self, dados) -> int:
+        self.sha256.update(dados)
+        self.bytes += len(dados)
+        return self._arquivo.write(dados)
+
+    def flush(self) -> None:
+        self._arquivo.flush()
+
+
+class _NdjsonWriter:
+    extensao = '.ndjson.gz'
+
+    def __init__(self, caminho: str, compresslevel: int):
+        self._bruto = open(caminho, 'wb')
+        self._hashing = _Hashing(self._bruto)
+        self._gzip = gzip.GzipFile(fileobj=self._hashing, mode='wb', compresslevel=compresslevel, mtime=0)
+
+    def write(self, linhas: list[dict]) -> None:
+        self._gzip.write(_ndjson(linhas))
+
+    def close(self) -> tuple[int, str]:
+        self._gzip.close()
+        self._bruto.close()
+        return self._hashing.bytes, self._hashing.sha256.hexdigest()
+
+    def abort(self) -> None:
+        try:
+            self._gzip.close()
+        finally:
+            self._bruto.close()
+
+
+class _ParquetWriter:
+    extensao = '.parquet'
+
+    def __init__(self, caminho: str, compresslevel: int):
+        self._caminho = caminho
+        self._writer = None
+        self._schema = None
+
+    def write(self, linhas: list[dict]) -> None:
+        # O schema do arquivo vem do primeiro lote e não pode mudar depois: campos novos são um erro.
+        if self._writer is None:
+            tabela = pa.Table.from_pylist(linhas)
+            self._schema = tabela.schema
+            self._writer = pq.ParquetWriter(self._caminho, self._schema, compression='zstd')
+        else:
+            novos = {campo for linha in linhas for campo in linha}.difference(self._schema.names)
+            if novos:
+                raise ValueError(
+                    f'Campos ausentes do schema do arquivo Parquet (definido pelo primeiro lote): {sorted(novos)}. '
+                    "Normalize as linhas para os mesmos campos ou exporte com formato='ndjson'."
+                )
+            tabela = pa.Table.from_pylist(linhas, schema=self._schema)
+        self._writer.write_table(tabela)
+
+    def close(self) -> tuple[int, str]:
+        if self._writer is not None:
+            self._writer.close()
+        sha256 = hashlib.sha256()
+        with open(self._caminho, 'rb') as arquivo:
+            for bloco in iter(lambda: arquivo.read(1 << 20), b''):
+                sha256.update(bloco)
+        return os.path.getsize(self._caminho), sha256.hexdigest()
+
+    def abort(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+
+
+class ShardedExporter:
+    """Exporta linhas para arquivos particionados, com filas limitadas e escritoras em paralelo."""
+
+    def __init__(
+        self,
+        destino: str,
+        *,
+        formato: str | None = None,
+        shards: int = 4,
+        linhas_por_arquivo: int = 1_000_000,
+        lote: int = 1_000,
+        fila: int = 8,
+        prefixo: str = 'part',
+        compresslevel: int = 6,
+    ):
+        """Configura a exportação.
+
+        Argumentos:
+            destino (str): Pasta dos arquivos e do manifesto; criada se não existir.
+            formato (str | None, optional): 'ndjson' ou 'parquet'. Padrão:  None ('parquet' se o pyarrow estiver instalado).
+            shards (int, optional): Número de shards, cada um com sua escritora. Padrão:  4.
+            linhas_por_arquivo (int, optional): Linhas por arquivo antes da rotação. Padrão:  1_000_000.
+            lote (int, optional): Linhas por lote enviado às escritoras. Padrão:  1_000.
+            fila (int, optional): Lotes em espera por shard antes de bloquear quem produz. Padrão:  8.
+            prefixo (str, optional): Prefixo dos nomes dos arquivos. Padrão:  'part'.
+            compresslevel (int, optional): Nível do gzip no NDJSON. Padrão:  6.
+        """
+        self.formato = formato or ('parquet' if pa is not None else 'ndjson')
+        if self.formato not in ('ndjson', 'parquet'):
+            raise ValueError(f'Formato desconhecido: {self.formato!r}')
+        if self.formato == 'parquet' and pa is None:
+            raise ImportError('PyArrow não está instalado. Instale com: pip install pyarrow')
+        self.destino = destino
+        self.shards = shards
+        self.linhas_por_arquivo = linhas_por_arquivo
+        self.lote = lote
+        self.fila = fila
+        self.prefixo = prefixo
+        self.compresslevel = compresslevel
+
+    def _writer(self, caminho: str):
+        classe = _ParquetWriter if self.formato == 'parquet' else _NdjsonWriter
+        return classe(caminho, self.compresslevel)
+
+    def _escrever(self, shard: int, fila: queue.Queue, manifesto: ExportManifest, estado: dict) -> None:
+        extensao = _ParquetWriter.extensao if self.formato == 'parquet' else _NdjsonWriter.extensao
+        writer, nome, linhas, parte = None, None, 0, 0
+
+        def fechar():
+            nonlocal writer
+            tamanho, sha256 = writer.close()
+            writer = None
+            os.replace(os.path.join(self.destino, nome + '.tmp'), os.path.join(self.destino, nome))
+            with estado['lock']:
+                manifesto.arquivos.append(ShardFile(nome, shard, linhas, tamanho, sha256))
+                manifesto.linhas += linhas
+
+        def descartar():
+            # Falha no meio de um arquivo: a escritora é fechada e o .tmp incompleto, removido.
+            try:
+                writer.abort()
+            except Exception:
+                pass
+            try:
+                os.unlink(os.path.join(self.destino, nome + '.tmp'))
+            except FileNotFoundError:
+                pass
+
+        def gravar(lote: list[dict]) -> None:
+            nonlocal writer, nome, linhas, parte
+            while lote:
+                if writer is None:
+                    nome = f'{self.prefixo}-{shard:03d}-{parte:04d}{extensao}'
+                    writer, linhas, parte = self._writer(os.path.join(self.destino, nome + '.tmp')), 0, parte + 1
+                espaco = self.linhas_por_arquivo - linhas
+                trecho, lote = lote[:espaco], lote[espaco:]
+                writer.write(trecho)
+                linhas += len(trecho)
+                if linhas >= self.linhas_por_arquivo:
+                    fechar()
+
+        def falhar(erro: BaseException) -> None:
+            with estado['lock']:
+                estado['erro'] = estado['erro'] or erro
+
+        try:
+            # A fila é lida até o _FIM mesmo depois de uma falha: parar antes
+            # deixaria `_run` bloqueado ao enviar o _FIM para uma fila cheia.
+            while True:
+                lote = fila.get()
+                if lote is _FIM:
+                    break
+                if estado['erro'] is not None:
+                    continue  # apenas esvazia a fila
+                try:
+                    gravar(lote)
+                except BaseException as e:
+                    falhar(e)
+            if writer is not None and estado['erro'] is None:
+                try:
+                    fechar()
+                except BaseException as e:
+                    falhar(e)
+        finally:
+            if writer is not None:
+                descartar()
+
+    def _run(self, produzir: Callable[[Callable[[Callable[[], Any]], None]], None], fonte: str | None) -> ExportManifest:
+        os.makedirs(self.destino, exist_ok=True)
+        inicio = time.perf_counter()
+        manifesto = ExportManifest(self.formato, fonte=fonte)
+        estado = {'erro': None, 'lock': threading.Lock()}
+        filas = [queue.Queue(maxsize=self.fila) for _ in range(self.shards)]
+        escritoras = [
+            threading.Thread(target=self._escrever, args=(i, f, manifesto, estado), name=f'pybr-dados-export-{i}')
+            for i, f in enumerate(filas)
+        ]
+        for escritora in escritoras:
+            escritora.start()
+        proximo = itertools.count()
+
+        def enviar(lote: list[dict]) -> None:
+            fila = filas[next(proximo) % self.shards]
+            while estado['erro'] is None:
+                try:
+                    fila.put(lote, timeout=0.1)  # bloqueia enquanto a fila do shard está cheia
+                    return
+                except queue.Full:
+                    continue
+            raise estado['erro']
+
+        def consumir(obter: Callable[[], Any]) -> None:
+            # Depois de uma falha (em outra chamada ou em uma escritora), as chamadas restantes são abandonadas.
+            if estado['erro'] is not None:
+                raise estado['erro']
+            try:
+                lote = []
+                for linha in iter_rows(obter()):
+                    lote.append(linha)
+                    if len(lote) >= self.lote:
+                        enviar(lote)
+                        lote = []
+                if lote:
+                    enviar(lote)
+            except BaseException as e:
+                with estado['lock']:
+                    estado['erro'] = estado['erro'] or e
+                raise
+
+        try:
+            produzir(consumir)
+        except BaseException as e:
+            with estado['lock']:
+                estado['erro'] = estado['erro'] or e
+        finally:
+            for fila in filas:
+                fila.put(_FIM)
+            for escritora in escritoras:
+                escritora.join()
+        if estado['erro'] is not None:
+            raise estado['erro']
+
+        manifesto.arquivos.sort(key=lambda a: a.arquivo)
+        manifesto.segundos = time.perf_counter() - inicio
+        caminho = os.path.join(self.destino, 'manifest.json')
+        with open(caminho + '.tmp', 'w', encoding='utf-8') as arquivo:
+            json.dump(manifesto.to_dict(), arquivo, ensure_ascii=False, indent=2)
+        os.replace(caminho + '.tmp', caminho)
+        return manifesto
+
+    def export(self, linhas: Iterable[Any], fonte: str | None = None) -> ExportManifest:
+        """Exporta as linhas de um iterável (ou do retorno de um método de cliente).
+
+        Argumentos:
+            linhas (Iterable[Any]): Dicts, `LazyRows`, `Table`, registros ou um envelope OData.
+            fonte (str | None, optional): Descrição da fonte, gravada no manifesto. Padrão:  None.
+
+        Retorno:
+            ExportManifest: O manifesto gravado.
+        """
+        return self._run(lambda consumir: consumir(lambda: linhas), fonte)
+
+    def export_method(self, metodo: Callable[..., Any], *args: Any, **kwargs: Any) -> ExportManifest:
+        """Chama um método de cliente e exporta as linhas retornadas."""
+        return self._run(lambda consumir: consumir(lambda: metodo(*args, **kwargs)), getattr(metodo, '__qualname__', None))
+
+    def export_periods(
+        self,
+        metodo: Callable[..., Any],
+        periodos: Iterable[tuple | dict],
+        *,
+        workers: int = 4,
+        **kwargs: Any,
+    ) -> ExportManifest:
+        """Chama o método para cada período em paralelo e exporta todas as linhas.
+
+        Cada thread de download só busca o próximo período depois de entregar
+        as linhas do anterior às filas, então no máximo `workers` períodos
+        ficam na memória ao mesmo tempo. Com o transporte do cliente em modo
+        `adaptive`, `workers` é só o teto: as requisições simultâneas seguem
+        o limite do host.
+
+        Argumentos:
+            metodo (Callable[..., Any]): Método do cliente (ex.: `servidores.remuneracoes`).
+            periodos (Iterable[tuple | dict]): Argumentos de cada chamada, posicionais (tupla) ou nomeados (dict); ver `periods`.
+            workers (int, optional): Chamadas simultâneas. Padrão:  4.
+            **kwargs: Argumentos repassados a todas as chamadas.
+
+        Retorno:
+            ExportManifest: O manifesto gravado.
+        """
+        periodos = list(periodos)
+
+        def chamar(periodo: tuple | dict) -> Any:
+            if isinstance(periodo, dict):
+                return metodo(**periodo, **kwargs)
+            return metodo(*periodo, **kwargs)
+
+        def produzir(consumir: Callable[[Callable[[], Any]], None]) -> None:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futuros = [executor.submit(consumir, lambda p=p: chamar(p)) for p in periodos]
+                for futuro in futuros:
+                    futuro.result()
+
+        return self._run(produzir, getattr(metodo, '__qualname__', None))
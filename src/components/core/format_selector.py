@@ -0,0 +1,105 @@
+"""Escolha automática do formato de transferência (JSON ou CSV) por endpoint."""
+
+import threading
+from dataclasses import dataclass
+
+FORMATOS = ('json', 'csv')
+
+
+@dataclass
+class FormatStats:
+    """Médias móveis exponenciais de uma combinação endpoint/formato."""
+
+    amostras: int = 0
+    wire_bytes: float = 0.0
+    decode_seconds: float = 0.0
+
+    def update(self, wire_bytes: int, decode_seconds: float, alpha: float) -> None:
+        if not self.amostras:
+            self.wire_bytes, self.decode_seconds = float(wire_bytes), decode_seconds
+        else:
+            self.wire_bytes += alpha * (wire_bytes - self.wire_bytes)
+            self.decode_seconds += alpha * (decode_seconds - self.decode_seconds)
+        self.amostras += 1
+
+
+class FormatSelector:
+    """Escolhe, por endpoint, o formato de menor custo estimado.
+
+    O custo de um formato é o tempo estimado de transferência (bytes na rede
+    divididos pela banda) somado ao tempo de decodificação medido. Cada
+    formato é medido ao menos uma vez; depois disso, o formato mais caro volta
+    a ser medido a cada `explore_every` chamadas, para acompanhar mudanças.
+    """
+
+    def __init__(self, bandwidth: float = 2_000_000, alpha: float = 0.3, explore_every: int = 20):
+        """Inicializa o seletor.
+
+        Argumentos:
+            bandwidth (float, optional): Banda estimada em bytes por segundo. Padrão:  2000000.
+            alpha (float, optional): Peso das novas amostras nas médias móveis. Padrão:  0.3.
+            explore_every (int, optional): Intervalo de chamadas entre medições do formato preterido. Padrão:  20.
+        """
+        self.bandwidth = bandwidth
+        self.alpha = alpha
+        self.explore_every = explore_every
+        self._lock = threading.Lock()
+        self._stats: dict[tuple[str, str], FormatStats] = {}
+        self._chamadas: dict[str, int] = {}
+
+    def cost(self, endpoint: str, formato: str) -> float | None:
+        """Custo estimado, em segundos, de obter o endpoint no formato; None se nunca medido."""
+        stats = self._stats.get((endpoint, formato))
+        if stats is None or not stats.amostras:
+            return None
+        return stats.wire_bytes / self.bandwidth + stats.decode_seconds
+
+    def choose(self, endpoint: str) -> str:
+        """Escolhe o formato para a próxima chamada ao endpoint.
+
+        Argumentos:
+            endpoint (str): Identificador do endpoint.
+
+        Retorno:
+            str: 'json' ou 'csv'.
+        """
+        with self._lock:
+            chamada = self._chamadas.get(endpoint, 0)
+            self._chamadas[endpoint] = chamada + 1
+            custos = {formato: self.cost(endpoint, formato) for formato in FORMATOS}
+            for formato, custo in custos.items():
+                if custo is None:
+                    return formato
+            melhor, pior = sorted(FORMATOS, key=custos.get)
+            if self.explore_every and chamada % self.explore_every == self.explore_every - 1:
+                return pior
+            return melhor
+
+    def record(self, endpoint: str, formato: str, wire_bytes: int, decode_seconds: float) -> None:
+        """Registra a medição de uma chamada.
+
+        Argumentos:
+            endpoint (str): Identificador do endpoint.
+            formato (str): Formato transferido.
+            wire_bytes (int): Bytes recebidos pela rede.
+            decode_seconds (float): Tempo de decodificação e normalização.
+        """
+        with self._lock:
+            stats = self._stats.setdefault((endpoint, formato), FormatStats())
+            stats.update(wire_bytes, decode_seconds, self.alpha)
+
+    def snapshot(self) -> dict[str, dict[str, dict]]:
+        """Estatísticas e custo estimado de cada endpoint e formato."""
+        with self._lock:
+            resultado: dict[str, dict[str, dict]] = {}
+            for (endpoint, formato), stats in self._stats.items():
+                resultado.setdefault(endpoint, {})[formato] = {
+                    'amostras': stats.amostras,
+                    'wire_bytes': stats.wire_bytes,
+                    'decode_seconds': stats.decode_seconds,
+                    'cost': self.cost(endpoint, formato),
+                }
+            return resultado
+
+
+default_format_selector = FormatSelector()
@@ -0,0 +1,201 @@
+"""Requisições de hedge para cortar a cauda de latência de GETs idempotentes.
+
+A latência de cada rota (host e caminho sem ids) é acompanhada em uma janela
+das chamadas recentes. Se a resposta não chega até o percentil configurado
+(ex.: p95), uma segunda requisição idêntica é enviada e vale a primeira que
+responder; a perdedora é descartada e sua conexão é fechada ao terminar.
+
+O orçamento limita o acréscimo de carga: cada requisição acumula `razao`
+fichas (até `rajada`) e cada hedge gasta uma, de modo que os hedges não
+passam de `razao` das requisições mais a rajada inicial.
+"""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable
+from urllib.parse import urlsplit
+
+
+def route_key(url: str) -> str:
+    """Rota da URL: host e caminho sem os segmentos numéricos (ids, anos, meses)."""
+    partes = urlsplit(url)
+    return partes.netloc + '/' + '/'.join(p for p in partes.path.split('/') if p and not p.isdigit())
+
+
+class LatencyTracker:
+    """Percentis de latência por rota, sobre uma janela das chamadas recentes."""
+
+    def __init__(self, janela: int = 200, minimo: int = 20):
+        """Argumentos:
+            janela (int, optional): Latências guardadas por rota. Padrão:  200.
+            minimo (int, optional): Amostras necessárias para estimar um percentil. Padrão:  20.
+        """
+        self.janela = janela
+        self.minimo = minimo
+        self._lock = threading.Lock()
+        self._amostras: dict[str, deque[float]] = {}
+
+    def record(self, rota: str, segundos: float) -> None:
+        """Registra a latência de uma chamada."""
+        with self._lock:
+            amostras = self._amostras.get(rota)
+            if amostras is None:
+                amostras = self._amostras[rota] = deque(maxlen=self.janela)
+            amostras.append(segundos)
+
+    def percentile(self, rota: str, q: float) -> float | None:
+        """Percentil `q` (entre 0 e 1) da latência da rota, ou None com poucas amostras."""
+        with self._lock:
+            amostras = sorted(self._amostras.get(rota, ()))
+        if len(amostras) < self.minimo:
+            return None
+        return amostras[min(int(q * len(amostras)), len(amostras) - 1)]
+
+
+class HedgeBudget:
+    """Orçamento de hedges: fichas acumuladas por requisição, gastas por hedge."""
+
+    def __init__(self, razao: float = 0.05, rajada: float = 5.0):
+        """Argumentos:
+            razao (float, optional): Hedges por requisição, no longo prazo. Padrão:  0.05.
+            rajada (float, optional): Máximo de fichas acumuladas. Padrão:  5.0.
+        """
+        self.razao = razao
+        self.rajada = rajada
+        self._fichas = 0.0
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        """Acumula as fichas de uma requisição."""
+        with self._lock:
+            self._fichas = min(self._fichas + self.razao, self.rajada)
+
+    def take(self) -> bool:
+        """Gasta uma ficha, se houver."""
+        with self._lock:
+            if self._fichas < 1:
+                return False
+            self._fichas -= 1
+            return True
+
+
+def _fechar(future: Future) -> None:
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), 'close', None)
+        if close is not None:
+            close()
+
+
+class Hedger:
+    """Executa chamadas com hedge após o percentil de latência da rota."""
+
+    def __init__(
+        self,
+        percentil: float = 0.95,
+        orcamento: HedgeBudget | None = None,
+        tracker: LatencyTracker | None = None,
+        max_workers: int = 32,
+    ):
+        """Inicializa o hedger.
+
+        Argumentos:
+            percentil (float, optional): Percentil da latência após o qual o hedge é enviado. Padrão:  0.95.
+            orcamento (HedgeBudget | None, optional): Orçamento de hedges. Padrão:  None (5% das requisições).
+            tracker (LatencyTracker | None, optional): Latências por rota. Padrão:  None (um novo).
+            max_workers (int, optional): Threads que executam as chamadas com hedge. Padrão:  32.
+        """
+        self.percentil = percentil
+        self.orcamento = orcamento or HedgeBudget()
+        self.tracker = tracker or LatencyTracker()
+        self.max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='pybr-dados-hedge')
+            return self._executor
+
+    def close(self) -> None:
+        """Encerra as threads; chamadas perdedoras em andamento terminam em segundo plano."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def __enter__(self) -> 'Hedger':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _submeter(self, rota: str, fn: Callable[[], Any], partida: Future | None = None) -> Future:
+        # O contexto vai junto para a thread: o prazo da operação (`deadline`) continua valendo.
+        return self._pool().submit(contextvars.copy_context().run, self._medir(rota, fn, partida))
+
+    def _medir(self, rota: str, fn: Callable[[], Any], partida: Future | None = None) -> Callable[[], Any]:
+        def medida() -> Any:
+            inicio = time.monotonic()
+            if partida is not None:
+                partida.set_result(inicio)
+            resultado = fn()
+            self.tracker.record(rota, time.monotonic() - inicio)
+            return resultado
+
+        return medida
+
+    def call(
+        self,
+        rota: str,
+        fn: Callable[[], Any],
+        hedge: Callable[[], Any] | None = None,
+        on_hedge: Callable[[], None] | None = None,
+    ) -> tuple[Any, bool]:
+        """Executa `fn`; se demorar mais que o percentil da rota, executa também `hedge`.
+
+        Argumentos:
+            rota (str): Rota da chamada (ver `route_key`).
+            fn (Callable[[], Any]): A chamada.
+            hedge (Callable[[], Any] | None, optional): A chamada de hedge. Padrão:  None (`fn`).
+            on_hedge (Callable[[], None] | None, optional): Chamado quando o hedge é enviado. Padrão:  None.
+
+        Retorno:
+            tuple[Any, bool]: O resultado da primeira chamada bem-sucedida e se ele veio do hedge.
+        """
+        self.orcamento.deposit()
+        atraso = self.tracker.percentile(rota, self.percentil)
+        if atraso is None:
+            return self._medir(rota, fn)(), False
+
+        # O atraso conta do início da chamada, não da submissão: com as
+        # threads ocupadas, a primária pode esperar na fila do executor.
+        partida = Future()
+        primaria = self._submeter(rota, fn, partida)
+        wait([primaria, partida], return_when=FIRST_COMPLETED)
+        if partida.done():
+            atraso = max(atraso - (time.monotonic() - partida.result()), 0)
+        if wait([primaria], timeout=atraso).done or not self.orcamento.take():
+            return primaria.result(), False
+
+        if on_hedge is not None:
+            on_hedge()
+        secundaria = self._submeter(rota, hedge or fn)
+        pendentes = {primaria, secundaria}
+        while True:
+            concluidas, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            vencedora = next((f for f in concluidas if f.exception() is None), None)
+            if vencedora is not None or not pendentes:
+                break
+        for future in (primaria, secundaria):
+            if future is not vencedora:
+                # Uma requisição em andamento não é interrompível: a perdedora
+                # termina em segundo plano (limitada pelo timeout) e é fechada.
+                future.cancel()
+                future.add_done_callback(_fechar)
+        if vencedora is None:
+            return primaria.result(), False
+        return vencedora.result(), vencedora is secundaria
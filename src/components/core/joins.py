@@ -0,0 +1,140 @@
+"""Junção por hash entre sequências de registros (dicts).
+
+O lado menor vira uma tabela hash `chave -> [registros]`; o maior é
+percorrido uma única vez, em fluxo, e as linhas combinadas são produzidas
+por um gerador. O custo é linear no tamanho das entradas e a memória fica
+limitada ao lado construído, em vez das comparações quadráticas de laços
+aninhados.
+"""
+
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence
+
+Chave = str | Sequence[str] | Callable[[dict], Any]
+
+
+def key_function(chave: Chave, normalizar: Callable[[Any], Any] | None = None) -> Callable[[dict], Any]:
+    """Função que extrai a chave de junção de um registro.
+
+    Registros sem a chave, ou com algum componente None, retornam None e
+    nunca se combinam, como em SQL.
+
+    Argumentos:
+        chave (str | Sequence[str] | Callable[[dict], Any]): Campo, campos (chave composta) ou função.
+        normalizar (Callable[[Any], Any] | None, optional): Aplicada a cada componente da chave. Padrão:  None.
+
+    Retorno:
+        Callable[[dict], Any]: A função de extração.
+    """
+    if callable(chave):
+        if normalizar is None:
+            return chave
+        return lambda registro: None if (valor := chave(registro)) is None else normalizar(valor)
+    if isinstance(chave, str):
+        if normalizar is None:
+            return lambda registro: registro.get(chave)
+        return lambda registro: None if (valor := registro.get(chave)) is None else normalizar(valor)
+    campos = tuple(chave)
+
+    def composta(registro: dict) -> tuple | None:
+        valores = []
+        for campo in campos:
+            valor = registro.get(campo)
+            if valor is not None and normalizar is not None:
+                valor = normalizar(valor)
+            if valor is None:
+                return None
+            valores.append(valor)
+        return tuple(valores)
+
+    return composta
+
+
+def build_hash_table(registros: Iterable[dict], chave: Callable[[dict], Any]) -> dict[Any, list[dict]]:
+    """Agrupa os registros pela chave, ignorando chaves None."""
+    tabela: dict[Any, list[dict]] = {}
+    for registro in registros:
+        valor = chave(registro)
+        if valor is not None:
+            tabela.setdefault(valor, []).append(registro)
+    return tabela
+
+
+def _combinar(esquerda: dict, direita: dict, sufixo: str) -> dict:
+    linha = dict(esquerda)
+    for campo, valor in direita.items():
+        linha[f'{campo}{sufixo}' if campo in esquerda else campo] = valor
+    return linha
+
+
+def hash_join(
+    esquerda: Iterable[dict],
+    direita: Iterable[dict],
+    chave_esquerda: Chave,
+    chave_direita: Chave | None = None,
+    *,
+    how: Literal['inner', 'left'] = 'inner',
+    construir: Literal['esquerda', 'direita'] | None = None,
+    normalizar: Callable[[Any], Any] | None = None,
+    sufixo: str = '_direita',
+) -> Iterator[dict]:
+    """Combina os registros das duas entradas cujas chaves são iguais.
+
+    Cada linha resultante tem os campos do registro da esquerda e os do
+    registro da direita; campos da direita que já existem na esquerda
+    recebem o `sufixo`. Em junções `left`, registros da esquerda sem
+    correspondente aparecem uma vez, sem campos da direita.
+
+    O lado construído fica inteiro na memória; o outro é consumido em
+    fluxo e pode ser um gerador. Sem `construir`, é construído o lado menor
+    quando os dois têm tamanho conhecido e, caso contrário, a direita. A
+    ordem de saída segue o lado percorrido; com a esquerda construída, os
+    registros sem correspondente de uma junção `left` saem ao final.
+
+    Argumentos:
+        esquerda (Iterable[dict]): Registros da esquerda.
+        direita (Iterable[dict]): Registros da direita.
+        chave_esquerda (str | Sequence[str] | Callable[[dict], Any]): Chave da esquerda.
+        chave_direita (str | Sequence[str] | Callable[[dict], Any] | None, optional): Chave da direita. Padrão:  None (igual à da esquerda).
+        how (Literal['inner', 'left'], optional): Tipo de junção. Padrão:  'inner'.
+        construir (Literal['esquerda', 'direita'] | None, optional): Lado da tabela hash. Padrão:  None (automático).
+        normalizar (Callable[[Any], Any] | None, optional): Normalização de cada componente das chaves. Padrão:  None.
+        sufixo (str, optional): Sufixo dos campos da direita repetidos na esquerda. Padrão:  '_direita'.
+
+    Retorno:
+        Iterator[dict]: As linhas combinadas.
+    """
+    if how not in ('inner', 'left'):
+        raise ValueError(f'Tipo de junção inválido: {how!r}')
+    if construir is None:
+        construir = 'direita'
+        if hasattr(esquerda, '__len__') and hasattr(direita, '__len__') and len(esquerda) < len(direita):
+            construir = 'esquerda'
+    chave_e = key_function(chave_esquerda, normalizar)
+    chave_d = key_function(chave_esquerda if chave_direita is None else chave_direita, normalizar)
+
+    if construir == 'direita':
+        tabela = build_hash_table(direita, chave_d)
+        for registro in esquerda:
+            valor = chave_e(registro)
+            correspondentes = tabela.get(valor) if valor is not None else None
+            if correspondentes:
+                for outro in correspondentes:
+                    yield _combinar(registro, outro, sufixo)
+            elif how == 'left':
+                yield dict(registro)
+        return
+
+    # Esquerda construída: os registros sem correspondente são lembrados pelo id.
+    registros = list(esquerda)
+    tabela = build_hash_table(registros, chave_e)
+    combinados: set[int] = set()
+    for outro in direita:
+        valor = chave_d(outro)
+        for registro in (tabela.get(valor, ()) if valor is not None else ()):
+            if how == 'left':
+                combinados.add(id(registro))
+            yield _combinar(registro, outro, sufixo)
+    if how == 'left':
+        for registro in registros:
+            if id(registro) not in combinados:
+                yield dict(registro)
@@ -0,0 +1,97 @@
+"""Backends de decodificação JSON a partir dos bytes da resposta.
+
+Os backends rápidos (orjson, msgspec, simdjson) são usados quando instalados;
+o módulo `json` da biblioteca padrão é o fallback. Todos decodificam
+diretamente de `bytes`, sem criar uma `str` intermediária do corpo.
+"""
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+try:
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+_BACKENDS: dict[str, Callable[[bytes], Any] | None] = {
+    'orjson': orjson.loads if orjson else None,
+    'msgspec': msgspec.json.decode if msgspec else None,
+    'simdjson': simdjson.loads if simdjson else None,
+    'json': json.loads,
+}
+
+# Backends que aceitam qualquer objeto com protocolo de buffer, inclusive `memoryview`.
+_BUFFER_BACKENDS = {'orjson', 'msgspec'}
+
+_default_backend = 'auto'
+
+
+def available_backends() -> list[str]:
+    """Backends instalados, em ordem de preferência."""
+    return [nome for nome, loads in _BACKENDS.items() if loads is not None]
+
+
+def resolve_backend(backend: str | None = None) -> str:
+    """Resolve o nome do backend a ser usado.
+
+    Argumentos:
+        backend (str | None, optional): Nome do backend, 'auto' ou None para o padrão global. Padrão:  None.
+
+    Raises:
+        ValueError: Backend desconhecido ou não instalado.
+
+    Retorno:
+        str: Nome do backend efetivo.
+    """
+    backend = backend or _default_backend
+    if backend == 'auto':
+        return available_backends()[0]
+    if backend not in _BACKENDS:
+        raise ValueError(f"Backend JSON desconhecido: {backend}. Use um de {list(_BACKENDS)} ou 'auto'.")
+    if _BACKENDS[backend] is None:
+        raise ValueError(f'Backend JSON não instalado: {backend}.')
+    return backend
+
+
+def set_default_backend(backend: str) -> None:
+    """Define o backend JSON padrão de todos os clientes.
+
+    Argumentos:
+        backend (str): Nome do backend ou 'auto'.
+    """
+    global _default_backend
+    if backend != 'auto':
+        resolve_backend(backend)
+    _default_backend = backend
+
+
+def get_default_backend() -> str:
+    """Retorna o backend JSON padrão configurado."""
+    return _default_backend
+
+
+def decode_json(content: bytes | bytearray | memoryview, backend: str | None = None) -> Any:
+    """Decodifica um documento JSON diretamente dos bytes.
+
+    Argumentos:
+        content (bytes | bytearray | memoryview): Corpo da resposta.
+        backend (str | None, optional): Backend a ser usado. Padrão:  None (padrão global).
+
+    Retorno:
+        Any: O documento decodificado.
+    """
+    backend = resolve_backend(backend)
+    if isinstance(content, memoryview) and backend not in _BUFFER_BACKENDS:
+        content = bytes(content)
+    return _BACKENDS[backend](content)
@@ -0,0 +1,283 @@
+"""Visões preguiçosas de linhas sobre o corpo bruto de uma resposta JSON.
+
+O buffer (bytes, `memoryview` ou `mmap`) é mantido como está. Uma única
+passada marca o início e o fim de cada objeto da lista de registros; o mapa
+de campos de uma linha só é montado quando ela é acessada, e cada valor só é
+decodificado quando lido. Varreduras que tocam poucos campos por linha
+(somar `valorReembolsado`, filtrar por `cnpjCpf`) evitam decodificar o
+restante do payload, e a memória fica próxima do tamanho da resposta.
+"""
+
+import json
+import mmap
+import re
+from array import array
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+from .json_decoders import decode_json
+
+# Caracteres estruturais fora de strings. Strings e demais bytes são consumidos
+# sem gerar correspondências, de modo que há uma correspondência por `[]{}`.
+_ESTRUTURA = re.compile(rb'[^"\[\]{}]*+(?:"[^"\\]*+(?:\\.[^"\\]*+)*+"[^"\[\]{}]*+)*+([\[\]{}])', re.S)
+# Dentro de uma linha também interessam `,` e `:`, que delimitam chaves e valores.
+_CAMPOS = re.compile(rb'[^"\[\]{},:]*+(?:"[^"\\]*+(?:\\.[^"\\]*+)*+"[^"\[\]{},:]*+)*+([\[\]{},:])', re.S)
+_VALOR = rb'\s*:\s*("[^"\\]*+(?:\\.[^"\\]*+)*+"|[^,}\]\s]++)'
+_VALUE_VAZIO = re.compile(rb'"value"\s*:\s*(\[)\s*\]')
+
+_ABRE = frozenset(b'[{')
+_ESPACOS = frozenset(b' \t\r\n')
+
+
+def _ocorrencias(buffer, alvo: bytes):
+    encontrar = buffer.find
+    pos = encontrar(alvo)
+    while pos != -1:
+        yield pos
+        pos = encontrar(alvo, pos + 1)
+
+
+def _estruturais(buffer):
+    """Posições dos caracteres `[]{}` que estão fora de strings."""
+    if isinstance(buffer, (bytes, bytearray)) and b'\\"' not in buffer:
+        # Sem aspas escapadas, um colchete está dentro de uma string quando há
+        # um número ímpar de aspas antes dele. `find` e `count` percorrem o
+        # buffer em C; o laço em Python só visita os colchetes.
+        posicoes = sorted([pos for alvo in (b'[', b']', b'{', b'}') for pos in _ocorrencias(buffer, alvo)])
+        dentro, anterior = False, 0
+        for pos in posicoes:
+            if buffer.count(b'"', anterior, pos) & 1:
+                dentro = not dentro
+            anterior = pos
+            if not dentro:
+                yield pos
+    else:
+        for m in _ESTRUTURA.finditer(buffer):
+            yield m.start(1)
+
+
+def _indexar(buffer) -> tuple[array, array, set[int]]:
+    """Início e fim de cada objeto da primeira lista de objetos do documento e as linhas com valores aninhados."""
+    inicios, fins = array('q'), array('q')
+    aninhadas = set()
+    pilha = bytearray()
+    lista = None  # profundidade da lista de registros, quando encontrada
+    listas_raiz = set()  # listas que são campos do objeto raiz
+    for pos in _estruturais(buffer):
+        c = buffer[pos]
+        if c in _ABRE:
+            if c == 0x5B and pilha == b'{':
+                listas_raiz.add(pos)
+            if lista is not None and len(pilha) > lista:
+                aninhadas.add(len(inicios) - 1)
+            elif c == 0x7B and pilha and pilha[-1] == 0x5B and (lista is None or lista == len(pilha)):
+                lista = len(pilha)
+                inicios.append(pos)
+            pilha.append(c)
+        else:
+            pilha.pop()
+            if lista is not None:
+                if c == 0x7D and len(pilha) == lista:
+                    fins.append(pos + 1)
+                elif len(pilha) < lista:
+                    break
+    if lista is None:
+        if any(m.start(1) in listas_raiz for m in _VALUE_VAZIO.finditer(buffer)):
+            # Envelope OData sem registros: `{"value": []}`.
+            return inicios, fins, aninhadas
+        # Documento com um único objeto: ele é a única linha.
+        inicio = re.search(rb'\S', buffer)
+        if inicio is not None and buffer[inicio.start()] == 0x7B:
+            inicios.append(inicio.start())
+            fins.append(len(buffer))
+            aninhadas.add(0)
+    return inicios, fins, aninhadas
+
+
+def _decode_key(chave: bytes) -> str:
+    chave = chave.strip()
+    if b'\\' in chave:
+        return json.loads(chave)
+    return chave[1:-1].decode()
+
+
+class LazyRow(Mapping):
+    """Linha de um `LazyRows`; decodifica cada campo no primeiro acesso."""
+
+    __slots__ = ('_rows', '_inicio', '_fim', '_campos', '_valores')
+
+    def __init__(self, rows: 'LazyRows', inicio: int, fim: int):
+        self._rows = rows
+        self._inicio = inicio
+        self._fim = fim
+        self._campos: dict[str, tuple[int, int]] | None = None
+        self._valores: dict[str, Any] = {}
+
+    def _mapa(self) -> dict[str, tuple[int, int]]:
+        if self._campos is None:
+            buffer, view = self._rows._buffer, self._rows._view
+            campos = {}
+            profundidade = 0
+            marca = inicio_valor = self._inicio
+            chave = None
+            for m in _CAMPOS.finditer(buffer, self._inicio, self._fim):
+                pos = m.start(1)
+                c = buffer[pos]
+                if c in _ABRE:
+                    profundidade += 1
+                    if profundidade == 1:
+                        marca = pos + 1
+                    continue
+                if profundidade == 1:
+                    if c == 0x3A:  # ':'
+                        chave = _decode_key(bytes(view[marca:pos]))
+                        inicio_valor = pos + 1
+                    elif chave is not None:  # ',' ou '}'
+                        campos[chave] = (inicio_valor, pos)
+                        chave = None
+                    marca = pos + 1
+                if c in b']}':
+                    profundidade -= 1
+                    if profundidade == 0:
+                        break
+            self._campos = campos
+        return self._campos
+
+    def raw(self, campo: str) -> memoryview:
+        """Bytes do valor do campo, sem decodificar."""
+        inicio, fim = self._mapa()[campo]
+        view = self._rows._view
+        while view[inicio] in _ESPACOS:
+            inicio += 1
+        while view[fim - 1] in _ESPACOS:
+            fim -= 1
+        return view[inicio:fim]
+
+    def __getitem__(self, campo: str) -> Any:
+        try:
+            return self._valores[campo]
+        except KeyError:
+            pass
+        valor = self._valores[campo] = decode_json(self.raw(campo), self._rows.json_backend)
+        return valor
+
+    def __contains__(self, campo) -> bool:
+        return campo in self._mapa()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._mapa())
+
+    def __len__(self) -> int:
+        return len(self._mapa())
+
+    def to_dict(self) -> dict:
+        """Decodifica a linha inteira."""
+        return decode_json(self._rows._view[self._inicio:self._fim], self._rows.json_backend)
+
+    def __repr__(self) -> str:
+        return f'LazyRow({", ".join(self._mapa())})'
+
+
+class LazyRows:
+    """Sequência de linhas preguiçosas sobre um documento JSON bruto.
+
+    As linhas são os objetos da primeira lista de objetos do documento: a
+    própria raiz, quando é uma lista, ou o `value` de um envelope OData.
+    """
+
+    def __init__(self, buffer: bytes | bytearray | memoryview | mmap.mmap | str, json_backend: str | None = None):
+        """Indexa o documento em uma passada.
+
+        Argumentos:
+            buffer (bytes | bytearray | memoryview | mmap.mmap | str): Corpo da resposta. Não é copiado.
+            json_backend (str | None, optional): Backend usado para decodificar os valores. Padrão:  None (padrão global).
+        """
+        if isinstance(buffer, str):
+            buffer = buffer.encode()
+        self._buffer = buffer
+        self._view = memoryview(buffer).cast('B')
+        self._mapeado = False
+        self.json_backend = json_backend
+        self._inicios, self._fins, self._aninhadas = _indexar(buffer)
+
+    @classmethod
+    def open(cls, caminho: str, json_backend: str | None = None) -> 'LazyRows':
+        """Mapeia um arquivo JSON em memória e indexa suas linhas.
+
+        Argumentos:
+            caminho (str): Caminho do arquivo.
+            json_backend (str | None, optional): Backend usado para decodificar os valores. Padrão:  None.
+
+        Retorno:
+            LazyRows: As linhas, apoiadas no mapeamento do arquivo.
+        """
+        with open(caminho, 'rb') as arquivo:
+            mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        linhas = cls(mapa, json_backend)
+        linhas._mapeado = True
+        return linhas
+
+    def close(self) -> None:
+        """Libera o buffer e fecha o mapeamento aberto por `open`."""
+        self._view.release()
+        if self._mapeado:
+            self._buffer.close()
+
+    def __enter__(self) -> 'LazyRows':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._inicios)
+
+    def __getitem__(self, indice: int) -> LazyRow:
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        return LazyRow(self, self._inicios[indice], self._fins[indice])
+
+    def __iter__(self) -> Iterator[LazyRow]:
+        for inicio, fim in zip(self._inicios, self._fins):
+            yield LazyRow(self, inicio, fim)
+
+    def column(self, campo: str, default: Any = None) -> list:
+        """Valores de um campo em todas as linhas, decodificando apenas esse campo.
+
+        Quando nenhuma linha tem valores aninhados e todas têm o campo, os
+        valores são localizados por uma única busca no buffer e decodificados
+        em lote; caso contrário, cada linha é consultada individualmente.
+
+        Argumentos:
+            campo (str): Nome do campo, como no JSON.
+            default (Any, optional): Valor para linhas sem o campo. Padrão:  None.
+
+        Retorno:
+            list: Um valor por linha.
+        """
+        valores = self._column_scan(campo)
+        if valores is None:
+            valores = [linha[campo] if campo in linha else default for linha in self]
+        return valores
+
+    def _column_scan(self, campo: str) -> list | None:
+        if self._aninhadas or not self._inicios:
+            return None
+        chave = json.dumps(campo, ensure_ascii=False).encode()
+        # Com linhas planas, `"campo":` só ocorre fora de strings como chave de
+        # linha, a menos que as aspas iniciais estejam escapadas.
+        if re.search(re.escape(b'\\' + chave), self._buffer):
+            return None
+        padrao = re.compile(re.escape(chave) + _VALOR)
+        brutos = padrao.findall(self._buffer, self._inicios[0], self._fins[-1])
+        if len(brutos) != len(self):
+            return None
+        return decode_json(b'[' + b','.join(brutos) + b']', self.json_backend)
+
+    @property
+    def nbytes(self) -> int:
+        """Tamanho do buffer bruto."""
+        return self._view.nbytes
+
+    def __repr__(self) -> str:
+        return f'LazyRows({len(self)} linhas, {self.nbytes} bytes)'
@@ -0,0 +1,101 @@
+"""Métricas do transporte HTTP."""
+
+import threading
+from dataclasses import dataclass, field, asdict
+
+
+@dataclass
+class HostMetrics:
+    """Contadores acumulados de um host."""
+
+    requests: int = 0
+    upstream_requests: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    revalidations: int = 0  # respostas guardadas confirmadas pelo servidor (304)
+    retries: int = 0
+    hedged_requests: int = 0  # requisições repetidas em paralelo por hedge
+    hedge_wins: int = 0  # hedges que responderam antes da original
+    concurrency_limit: int = 0  # limite atual de requisições simultâneas (Transport com `adaptive`)
+    wire_bytes: int = 0
+    decoded_bytes: int = 0
+    encodings: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Chamadas atendidas por uma requisição já em andamento."""
+        return self.requests - self.upstream_requests - self.cache_hits
+
+    @property
+    def compression_ratio(self) -> float | None:
+        """Razão entre bytes descomprimidos e bytes recebidos pela rede."""
+        if not self.wire_bytes:
+            return None
+        return self.decoded_bytes / self.wire_bytes
+
+
+class TransportMetrics:
+    """Coleta métricas do transporte por host, de forma segura entre threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._hosts: dict[str, HostMetrics] = {}
+
+    def _host(self, host: str) -> HostMetrics:
+        metrics = self._hosts.get(host)
+        if metrics is None:
+            metrics = self._hosts[host] = HostMetrics()
+        return metrics
+
+    def incr(self, host: str, name: str, value: int = 1) -> None:
+        """Incrementa um contador do host."""
+        with self._lock:
+            metrics = self._host(host)
+            setattr(metrics, name, getattr(metrics, name) + value)
+
+    def set(self, host: str, name: str, value: int) -> None:
+        """Define o valor de uma medida do host (ex.: `concurrency_limit`)."""
+        with self._lock:
+            setattr(self._host(host), name, value)
+
+    def record_transfer(self, host: str, wire_bytes: int | None, decoded_bytes: int, encoding: str | None) -> None:
+        """Registra o tamanho de uma transferência concluída.
+
+        Argumentos:
+            host (str): Host da requisição.
+            wire_bytes (int | None): Bytes recebidos pela rede. Se None, assume o tamanho decodificado.
+            decoded_bytes (int): Bytes do corpo após a descompressão.
+            encoding (str | None): Valor do cabeçalho `Content-Encoding` da resposta.
+        """
+        with self._lock:
+            metrics = self._host(host)
+            metrics.wire_bytes += decoded_bytes if wire_bytes is None else wire_bytes
+            metrics.decoded_bytes += decoded_bytes
+            encoding = encoding or 'identity'
+            metrics.encodings[encoding] = metrics.encodings.get(encoding, 0) + 1
+
+    def host(self, host: str) -> HostMetrics:
+        """Retorna uma cópia dos contadores do host."""
+        with self._lock:
+            return HostMetrics(**asdict(self._host(host)))
+
+    def snapshot(self) -> dict[str, dict]:
+        """Retorna as métricas de todos os hosts, incluindo as derivadas.
+
+        Retorno:
+            dict[str, dict]: Métricas indexadas por host.
+        """
+        with self._lock:
+            return {
+                host: {
+                    **asdict(metrics),
+                    'coalesced_requests': metrics.coalesced_requests,
+                    'compression_ratio': metrics.compression_ratio,
+                }
+                for host, metrics in self._hosts.items()
+            }
+
+    def reset(self) -> None:
+        """Zera todas as métricas."""
+        with self._lock:
+            self._hosts.clear()
@@ -0,0 +1,118 @@
+"""Normalização de registros vindos de JSON ou de CSV para uma mesma forma."""
+
+import re
+import unicodedata
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from typing import Any
+
+_CAMEL = re.compile(r'(?<=[a-z0-9])(?=[A-Z])')
+_NAO_ALFANUMERICO = re.compile(r'[^a-z0-9]+')
+_DIACRITICOS = re.compile('[\u0300-\u036f]')
+_DATA_ISO = re.compile(r'\d{4}-\d{2}-\d{2}(?:[T ][\d:.]+(?:Z|[+-]\d{2}:?\d{2})?)?')
+_MILHARES = re.compile(r'[+-]?\d{1,3}(?:\.\d{3})+')
+# Tabela de `str.translate` do formato brasileiro para o do Python: '1.234,56' -> '1234.56'.
+NUMERO_BR = str.maketrans({'.': None, ',': '.'})
+
+
+@lru_cache(maxsize=4096)
+def normalize_key(nome: str) -> str:
+    """Normaliza o nome de um campo para snake_case sem acentos.
+
+    Exemplos: `valorReembolsado`, `VALOR_REEMBOLSADO` e `Valor Reembolsado`
+    viram `valor_reembolsado`.
+    """
+    nome = unicodedata.normalize('NFKD', nome).encode('ascii', 'ignore').decode()
+    nome = _CAMEL.sub('_', nome).lower()
+    return _NAO_ALFANUMERICO.sub('_', nome).strip('_')
+
+
+def fold_text(texto: str) -> str:
+    """Remove acentos e diferenças entre maiúsculas e minúsculas (`Construção` -> `construcao`)."""
+    return _DIACRITICOS.sub('', unicodedata.normalize('NFKD', texto)).casefold()
+
+
+def parse_decimal(valor: Any) -> Decimal | None:
+    """Converte um número vindo da API, inclusive em formato brasileiro, para `Decimal`.
+
+    Textos com vírgula decimal (`1.234,56`) ou só com pontos de milhar
+    (`1.500`, `1.234.567`) seguem o formato brasileiro; os demais são lidos
+    como estão (`150.25`). Números (int, float) não passam pela leitura de
+    texto.
+
+    Argumentos:
+        valor (Any): Número ou texto.
+
+    Retorno:
+        Decimal | None: O valor, ou None se vazio ou inválido.
+    """
+    if valor is None or valor == '' or isinstance(valor, bool):
+        return None
+    if isinstance(valor, Decimal):
+        return valor
+    if isinstance(valor, (int, float)):
+        texto = str(valor)
+    else:
+        texto = str(valor).strip()
+        if ',' in texto or _MILHARES.fullmatch(texto):
+            texto = texto.translate(NUMERO_BR)
+    try:
+        numero = Decimal(texto)
+    except InvalidOperation:
+        return None
+    return numero if numero.is_finite() else None
+
+
+def _normalize_value(valor):
+    if isinstance(valor, str):
+        if not valor:
+            return None
+        if _DATA_ISO.fullmatch(valor):
+            return date.fromisoformat(valor[:10])
+        return valor
+    if isinstance(valor, Decimal):
+        return float(valor)
+    return valor
+
+
+def _flatten(registro: dict, prefixo: str = '') -> dict:
+    plano = {}
+    for chave, valor in registro.items():
+        chave = normalize_key(f'{prefixo}_{chave}' if prefixo else chave)
+        if isinstance(valor, dict):
+            plano.update(_flatten(valor, chave))
+        else:
+            plano[chave] = _normalize_value(valor)
+    return plano
+
+
+def normalize_json_records(documento) -> list[dict]:
+    """Normaliza registros decodificados de JSON.
+
+    Chaves viram snake_case, objetos aninhados são achatados com prefixo,
+    strings vazias viram None e datas ISO viram `date`.
+
+    Argumentos:
+        documento: Lista de registros, um registro, ou envelope OData com `value`.
+
+    Retorno:
+        list[dict]: Registros normalizados.
+    """
+    if isinstance(documento, dict):
+        documento = documento.get('value', [documento])
+    return [_flatten(registro) for registro in documento]
+
+
+def normalize_csv_columns(colunas: dict[str, list]) -> list[dict]:
+    """Normaliza colunas decodificadas de CSV nos mesmos registros de `normalize_json_records`.
+
+    Argumentos:
+        colunas (dict[str, list]): Colunas tipadas, como retornadas por `decode_csv`.
+
+    Retorno:
+        list[dict]: Registros normalizados.
+    """
+    nomes = [normalize_key(nome) for nome in colunas]
+    convertidas = [list(map(_normalize_value, coluna)) for coluna in colunas.values()]
+    return [dict(zip(nomes, linha)) for linha in zip(*convertidas)]
@@ -0,0 +1,270 @@
+"""Decodificação de payloads grandes (JSON e CSV) em vários processos.
+
+O corpo é copiado uma vez para um bloco de memória compartilhada
+(`multiprocessing.shared_memory`) e dividido em trechos que terminam em
+limites seguros de registro:
+
+- JSON: entre objetos da lista de registros (a raiz ou o `value` de um
+  envelope OData), localizados pelo mesmo índice estrutural de `LazyRows`;
+- CSV: em quebras de linha fora de campos entre aspas; cada trecho é
+  decodificado com o cabeçalho do arquivo.
+
+Os processos leem seus trechos direto da memória compartilhada, sem receber
+cópias do payload por `pickle`; apenas os resultados voltam ao processo
+principal, que os junta na ordem original. Payloads pequenos são
+decodificados no próprio processo.
+"""
+
+import os
+import re
+from bisect import bisect_left
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any
+
+from .csv_decoder import Schema, TipoColuna, _decode_csv, decode_csv
+from .json_decoders import decode_json
+from .lazy import _indexar
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+_BOM = b'\xef\xbb\xbf'
+_CHAVE_LISTA = re.compile(rb'"((?:[^"\\]|\\.)*)"\s*:\s*\[\s*$')
+
+
+def _json_trecho(nome: str, inicio: int, fim: int, backend: str | None) -> list:
+    memoria = SharedMemory(name=nome)
+    try:
+        with memoria.buf[inicio:fim] as trecho:
+            documento = b''.join((b'[', trecho, b']'))
+        return decode_json(documento, backend)
+    finally:
+        memoria.close()
+
+
+def _csv_trecho(
+    nome: str, inicio: int, fim: int, cabecalho: bytes, schema: Schema | None, sep: str, use_numpy: bool, encoding: str
+) -> tuple[dict[str, list], dict[str, TipoColuna | None]]:
+    memoria = SharedMemory(name=nome)
+    try:
+        with memoria.buf[inicio:fim] as trecho:
+            texto = str(cabecalho, encoding) + str(trecho, encoding)
+        return _decode_csv(texto, schema, sep=sep, use_numpy=use_numpy)
+    finally:
+        memoria.close()
+
+
+def _tipo_comum(tipos: set[TipoColuna]) -> TipoColuna | None:
+    # Como na inferência do arquivo inteiro, uma coluna só tem tipo se todas as células o têm.
+    if not tipos:
+        return None
+    return next(iter(tipos)) if len(tipos) == 1 else TipoColuna.TEXTO
+
+
+def _fim_de_linha(content: bytes, alvo: int, inicio: int) -> int:
+    """Posição após a primeira quebra de linha, a partir de `alvo`, que está fora de aspas.
+
+    `inicio` é um limite de registro anterior, onde nenhuma aspa está aberta.
+    """
+    paridade = 0
+    pos = content.find(b'\n', alvo)
+    while pos != -1:
+        paridade ^= content.count(b'"', inicio, pos) & 1
+        if not paridade:
+            return pos + 1
+        inicio = pos
+        pos = content.find(b'\n', pos + 1)
+    return len(content)
+
+
+class ParsePool:
+    """Pool de processos para decodificar payloads grandes em paralelo."""
+
+    def __init__(self, processos: int | None = None, min_bytes: int = 4_000_000, mp_context: str | None = None):
+        """Inicializa o pool; os processos são criados no primeiro payload grande.
+
+        Argumentos:
+            processos (int | None, optional): Número de processos. Padrão:  None (número de CPUs).
+            min_bytes (int, optional): Tamanho mínimo para dividir o payload; menores são decodificados no processo atual. Padrão:  4_000_000.
+            mp_context (str | None, optional): Método de início dos processos ('fork', 'spawn', 'forkserver'). Padrão:  None.
+        """
+        self.processos = processos or os.cpu_count() or 1
+        self.min_bytes = min_bytes
+        self.mp_context = mp_context
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            contexto = get_context(self.mp_context) if self.mp_context else None
+            self._executor = ProcessPoolExecutor(self.processos, mp_context=contexto)
+        return self._executor
+
+    def close(self) -> None:
+        """Encerra os processos."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self) -> 'ParsePool':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _partes(self, tamanho: int) -> int:
+        return max(1, min(self.processos * 2, tamanho // max(self.min_bytes // 4, 1)))
+
+    def _compartilhar(self, content: bytes) -> SharedMemory:
+        memoria = SharedMemory(create=True, size=len(content))
+        memoria.buf[:len(content)] = content
+        return memoria
+
+    def decode_json(self, content: bytes | bytearray | memoryview, backend: str | None = None) -> Any:
+        """Decodifica um documento JSON; o mesmo resultado de `decode_json`.
+
+        Documentos cujos registros estão na raiz ou em uma chave do objeto
+        raiz (como o `value` do OData) são divididos entre os processos; os
+        demais são decodificados no processo atual.
+
+        Argumentos:
+            content (bytes | bytearray | memoryview): Corpo da resposta.
+            backend (str | None, optional): Backend JSON. Padrão:  None (padrão global).
+
+        Retorno:
+            Any: O documento decodificado.
+        """
+        content = bytes(content) if isinstance(content, memoryview) else content
+        if len(content) < self.min_bytes or self.processos < 2:
+            return decode_json(content, backend)
+        inicios, fins, _ = _indexar(content)
+        partes = self._partes(len(content))
+        if len(inicios) < 2 * partes:
+            return decode_json(content, backend)
+
+        # Esqueleto do documento sem os registros: `[]` ou `{..., "value": [], ...}`.
+        prefixo, sufixo = content[:inicios[0]], content[fins[-1]:]
+        esqueleto = decode_json(prefixo + sufixo, backend)
+        chave = None
+        if isinstance(esqueleto, dict):
+            encontrada = _CHAVE_LISTA.search(prefixo)
+            chave = decode_json(b'"' + encontrada.group(1) + b'"') if encontrada else None
+            if chave is None or esqueleto.get(chave) != []:
+                return decode_json(content, backend)
+        elif esqueleto != []:
+            return decode_json(content, backend)
+
+        # Cortes entre registros, próximos de partes de mesmo tamanho em bytes.
+        cortes = [0]
+        for i in range(1, partes):
+            alvo = inicios[0] + (fins[-1] - inicios[0]) * i // partes
+            indice = bisect_left(inicios, alvo)
+            if cortes[-1] < indice < len(inicios):
+                cortes.append(indice)
+        cortes.append(len(inicios))
+
+        memoria = self._compartilhar(content)
+        try:
+            futuros = [
+                self._pool().submit(_json_trecho, memoria.name, inicios[a], fins[b - 1], backend)
+                for a, b in zip(cortes, cortes[1:])
+            ]
+            registros = []
+            for futuro in futuros:
+                registros.extend(futuro.result())
+        finally:
+            memoria.close()
+            memoria.unlink()
+        if chave is None:
+            return registros
+        esqueleto[chave] = registros
+        return esqueleto
+
+    def decode_csv(
+        self,
+        content: str | bytes,
+        schema: Schema | None = None,
+        *,
+        sep: str | None = None,
+        use_numpy: bool | None = None,
+        encoding: str = 'utf-8',
+    ) -> dict[str, list]:
+        """Decodifica um CSV em colunas tipadas; o mesmo resultado de `decode_csv`.
+
+        Colunas sem schema cujo tipo inferido difere entre trechos (inteiros
+        em um, datas em outro) são redecodificadas como texto, como faria a
+        inferência sobre o arquivo inteiro.
+
+        Argumentos:
+            content (str | bytes): Conteúdo do CSV.
+            schema (Schema | None, optional): Tipo de cada coluna. Padrão:  None.
+            sep (str | None, optional): Separador. Padrão:  None (detecta entre `;` e `,`).
+            use_numpy (bool | None, optional): Usar NumPy. Padrão:  None (usa se instalado).
+            encoding (str, optional): Codificação, quando `content` é bytes. Padrão:  'utf-8'.
+
+        Retorno:
+            dict[str, list]: Colunas tipadas indexadas pelo nome do cabeçalho.
+        """
+        if isinstance(content, str):
+            content, encoding = content.encode(), 'utf-8'
+        if len(content) < self.min_bytes or self.processos < 2:
+            return decode_csv(content, schema, sep=sep, use_numpy=use_numpy, encoding=encoding)
+        if content.startswith(_BOM):
+            content = content[len(_BOM):]
+        fim_cabecalho = content.find(b'\n') + 1
+        if not fim_cabecalho:
+            return decode_csv(content, schema, sep=sep, use_numpy=use_numpy, encoding=encoding)
+        cabecalho = content[:fim_cabecalho]
+        if sep is None:
+            primeira = str(cabecalho, encoding)
+            sep = ';' if primeira.count(';') >= primeira.count(',') else ','
+        if use_numpy is None:
+            use_numpy = np is not None
+
+        partes = self._partes(len(content))
+        trechos, inicio = [], fim_cabecalho
+        for i in range(1, partes + 1):
+            alvo = fim_cabecalho + (len(content) - fim_cabecalho) * i // partes
+            fim = len(content) if i == partes else _fim_de_linha(content, max(alvo, inicio), inicio)
+            if fim > inicio:
+                trechos.append((inicio, fim))
+                inicio = fim
+
+        memoria = self._compartilhar(content)
+        try:
+            def decodificar(trecho: tuple[int, int], schema: Schema | None):
+                return self._pool().submit(
+                    _csv_trecho, memoria.name, *trecho, cabecalho, schema, sep, use_numpy, encoding
+                )
+
+            resultados = [futuro.result() for futuro in [decodificar(t, schema) for t in trechos]]
+            comuns = {
+                nome: _tipo_comum({tipos[nome] for _, tipos in resultados if tipos.get(nome) is not None})
+                for nome in resultados[0][1]
+            }
+            refazer = {}
+            for i, (_, tipos) in enumerate(resultados):
+                # Colunas vazias no trecho só precisam do tipo comum quando viram arrays NumPy.
+                divergentes = [
+                    n for n, t in comuns.items()
+                    if t is not None and tipos.get(n) != t and (tipos.get(n) is not None or use_numpy)
+                ]
+                if divergentes:
+                    refazer[i] = decodificar(trechos[i], {**(schema or {}), **comuns})
+            for i, futuro in refazer.items():
+                resultados[i] = futuro.result()
+        finally:
+            memoria.close()
+            memoria.unlink()
+
+        colunas = {}
+        for nome in resultados[0][0]:
+            partes_coluna = [resultado[nome] for resultado, _ in resultados]
+            if np is not None and any(isinstance(p, np.ndarray) for p in partes_coluna):
+                colunas[nome] = np.concatenate(partes_coluna)
+            else:
+                colunas[nome] = [valor for parte in partes_coluna for valor in parte]
+        return colunas
@@ -0,0 +1,260 @@
+"""Armazenamento dos corpos brutos das respostas em arquivos mapeados em memória.
+
+Cada resposta fica em um arquivo próprio, nomeado pelo hash da chave da
+requisição (`request_key`): uma linha JSON com os cabeçalhos, seguida do
+corpo já descomprimido. Na releitura o arquivo é mapeado com `mmap` e o
+corpo é entregue como `memoryview`, sem cópia para a memória do Python; os
+decodificadores que aceitam buffers (orjson, `LazyRows`) leem direto das
+páginas do arquivo, que o sistema operacional compartilha entre todos os
+processos que mapeiam o mesmo arquivo.
+
+A gravação é atômica (arquivo temporário + `os.replace`): leitores que já
+mapearam a versão anterior continuam com ela, e os novos veem a nova.
+
+O `Transport` serve uma resposta guardada sem ir à rede apenas enquanto ela
+está fresca (`fresh`): pelo `max-age` do `Cache-Control` da resposta ou, sem
+ele, pelo `ttl` do store. Vencida, ela é revalidada com `If-None-Match` /
+`If-Modified-Since`; um 304 renova a cópia sem baixar o corpo de novo.
+Respostas com `no-store` não são guardadas, e `no-cache` exige revalidação
+a cada uso.
+
+    store = RawStore('~/.cache/pybr-dados', ttl=3600)
+    transporte = Transport(store=store)  # releituras na próxima hora não vão à rede
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+import time
+from typing import Any
+
+from .json_decoders import decode_json
+from .transport import request_key
+
+# Cabeçalhos que descrevem a transferência, e não o corpo guardado (já descomprimido).
+_TRANSFERENCIA = frozenset(('content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'))
+
+
+def _cache_control(valor: str | None) -> dict[str, str | None]:
+    """Diretivas do cabeçalho `Cache-Control` (`max-age=60, no-cache` -> {'max-age': '60', 'no-cache': None})."""
+    diretivas = {}
+    for parte in (valor or '').split(','):
+        nome, _, argumento = parte.strip().partition('=')
+        if nome:
+            diretivas[nome.lower()] = argumento.strip('"') or None
+    return diretivas
+
+
+class _Cabecalhos(dict):
+    """Cabeçalhos com acesso sem diferenciar maiúsculas, como em `requests`."""
+
+    def __init__(self, cabecalhos: dict[str, str]):
+        super().__init__({k.lower(): v for k, v in cabecalhos.items()})
+
+    def __getitem__(self, nome: str) -> str:
+        return super().__getitem__(nome.lower())
+
+    def __contains__(self, nome: object) -> bool:
+        return isinstance(nome, str) and super().__contains__(nome.lower())
+
+    def get(self, nome: str, default: Any = None) -> Any:
+        return super().get(nome.lower(), default)
+
+
+class StoredResponse:
+    """Resposta lida do `RawStore`, com a interface usada pelos clientes de `requests.Response`.
+
+    `buffer` é uma `memoryview` sobre o arquivo mapeado; `content` faz uma
+    cópia em `bytes` apenas quando acessado.
+    """
+
+    status_code = 200
+    ok = True
+    reason = 'OK'
+    from_store = True
+
+    def __init__(self, url: str, headers: dict[str, str], mapa: mmap.mmap | None, inicio: int, gravada_em: float = 0):
+        self.url = url
+        self.headers = _Cabecalhos(headers)
+        self._mapa = mapa
+        self.buffer = memoryview(mapa)[inicio:] if mapa is not None else memoryview(b'')
+        self._content: bytes | None = None
+        self.gravada_em = gravada_em  # gravação ou última revalidação (epoch)
+
+    @property
+    def age(self) -> float:
+        """Segundos desde a gravação ou a última revalidação."""
+        return max(time.time() - self.gravada_em, 0.0)
+
+    def validators(self) -> dict[str, str]:
+        """Cabeçalhos da requisição condicional que revalida esta resposta (`If-None-Match`, `If-Modified-Since`)."""
+        cabecalhos = {}
+        if self.headers.get('ETag'):
+            cabecalhos['If-None-Match'] = self.headers['ETag']
+        if self.headers.get('Last-Modified'):
+            cabecalhos['If-Modified-Since'] = self.headers['Last-Modified']
+        return cabecalhos
+
+    @property
+    def content(self) -> bytes:
+        if self._content is None:
+            self._content = bytes(self.buffer)
+        return self._content
+
+    @property
+    def encoding(self) -> str:
+        tipo = self.headers.get('Content-Type', '')
+        for parte in tipo.split(';')[1:]:
+            nome, _, valor = parte.strip().partition('=')
+            if nome.lower() == 'charset' and valor:
+                return valor.strip('"\'')
+        return 'utf-8'
+
+    @property
+    def text(self) -> str:
+        return str(self.buffer, self.encoding, errors='replace')
+
+    def json(self) -> Any:
+        return decode_json(self.buffer)
+
+    def close(self) -> None:
+        """Libera o buffer e fecha o mapeamento, se nenhuma outra visão o estiver usando."""
+        self.buffer.release()
+        if self._mapa is not None:
+            try:
+                self._mapa.close()
+            except BufferError:  # ainda exportado (ex.: `LazyRows` aberto); o coletor fecha depois
+                pass
+
+    def __enter__(self) -> 'StoredResponse':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f'<StoredResponse [{self.status_code}] {self.url}>'
+
+
+def response_body(response: Any) -> bytes | memoryview:
+    """Corpo da resposta sem cópia: o `buffer` de uma `StoredResponse`, ou `content`."""
+    buffer = getattr(response, 'buffer', None)
+    return buffer if isinstance(buffer, memoryview) else response.content
+
+
+class RawStore:
+    """Guarda corpos brutos de respostas em disco e os relê por `mmap`."""
+
+    def __init__(self, pasta: str, ttl: float | None = None):
+        """Inicializa o armazenamento.
+
+        Argumentos:
+            pasta (str): Diretório dos arquivos; criado se não existir.
+            ttl (float | None, optional): Idade máxima, em segundos, de um corpo servido sem revalidação, para
+                respostas sem `max-age`. Padrão:  None (o `Transport` revalida a cada uso; `open` não expira).
+        """
+        self.pasta = os.path.expanduser(pasta)
+        self.ttl = ttl
+        os.makedirs(self.pasta, exist_ok=True)
+
+    def path(self, url: str, params: dict | None = None) -> str:
+        """Caminho do arquivo da requisição."""
+        chave = repr(request_key(url, params)).encode()
+        nome = hashlib.blake2b(chave, digest_size=20).hexdigest()
+        return os.path.join(self.pasta, nome[:2], nome)
+
+    def put(self, url: str, params: dict | None, content: bytes | memoryview, headers: dict | None = None) -> str | None:
+        """Grava o corpo da resposta, substituindo o anterior de forma atômica.
+
+        Argumentos:
+            url (str): URL da requisição.
+            params (dict | None): Parâmetros da requisição.
+            content (bytes | memoryview): Corpo já descomprimido.
+            headers (dict | None, optional): Cabeçalhos da resposta. Padrão:  None.
+
+        Retorno:
+            str | None: Caminho do arquivo gravado, ou None se a resposta pede `Cache-Control: no-store`.
+        """
+        cabecalhos = {k: v for k, v in (headers or {}).items() if k.lower() not in _TRANSFERENCIA}
+        if 'no-store' in _cache_control(_Cabecalhos(cabecalhos).get('Cache-Control')):
+            return None
+        caminho = self.path(url, params)
+        os.makedirs(os.path.dirname(caminho), exist_ok=True)
+        meta = json.dumps({'url': url, 'headers': cabecalhos}, ensure_ascii=False).encode()
+        descritor, temporario = tempfile.mkstemp(dir=os.path.dirname(caminho), suffix='.tmp')
+        try:
+            with os.fdopen(descritor, 'wb') as arquivo:
+                arquivo.write(meta + b'\n')
+                arquivo.write(content)
+            os.replace(temporario, caminho)
+        except BaseException:
+            os.unlink(temporario)
+            raise
+        return caminho
+
+    def _expirado(self, caminho: str) -> bool:
+        return self.ttl is not None and time.time() - os.stat(caminho).st_mtime > self.ttl
+
+    def open(self, url: str, params: dict | None = None, *, vencida: bool = False) -> StoredResponse | None:
+        """Mapeia o corpo guardado da requisição.
+
+        Argumentos:
+            url (str): URL da requisição.
+            params (dict | None, optional): Parâmetros da requisição. Padrão:  None.
+            vencida (bool, optional): Retornar também respostas mais velhas que o `ttl`, para revalidação.
+                Padrão:  False.
+
+        Retorno:
+            StoredResponse | None: A resposta guardada, ou None se ausente ou expirada.
+        """
+        caminho = self.path(url, params)
+        try:
+            if not vencida and self._expirado(caminho):
+                return None
+            with open(caminho, 'rb') as arquivo:
+                gravada_em = os.fstat(arquivo.fileno()).st_mtime
+                mapa = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            return None
+        fim_meta = mapa.find(b'\n')
+        meta = json.loads(mapa[:fim_meta])
+        if fim_meta + 1 == len(mapa):  # corpo vazio
+            mapa.close()
+            return StoredResponse(meta['url'], meta['headers'], None, 0, gravada_em)
+        return StoredResponse(meta['url'], meta['headers'], mapa, fim_meta + 1, gravada_em)
+
+    def fresh(self, response: StoredResponse) -> bool:
+        """Se a resposta guardada pode ser servida sem revalidação.
+
+        O `max-age` do `Cache-Control` da resposta prevalece sobre o `ttl`; `no-cache` exige revalidação.
+        """
+        diretivas = _cache_control(response.headers.get('Cache-Control'))
+        if 'no-cache' in diretivas:
+            return False
+        max_age = diretivas.get('max-age')
+        validade = float(max_age) if max_age and max_age.isdigit() else self.ttl
+        return validade is not None and response.age < validade
+
+    def touch(self, url: str, params: dict | None = None) -> None:
+        """Marca a resposta guardada como revalidada agora (ex.: após um 304)."""
+        try:
+            os.utime(self.path(url, params))
+        except FileNotFoundError:
+            pass
+
+    def invalidate(self, url: str, params: dict | None = None) -> None:
+        """Remove o corpo guardado da requisição, se houver."""
+        try:
+            os.unlink(self.path(url, params))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        """Remove todos os corpos guardados."""
+        for nome in os.listdir(self.pasta):
+            caminho = os.path.join(self.pasta, nome)
+            if os.path.isdir(caminho) and len(nome) == 2:
+                shutil.rmtree(caminho)
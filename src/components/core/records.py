@@ -0,0 +1,146 @@
+"""Registros compactos (dataclasses com `__slots__`) construídos direto do decodificador.
+
+Cada combinação de campos de um endpoint gera uma dataclass com `__slots__`,
+sem o dicionário por instância. Strings categóricas (lotação,
+cargo, UF...) são internadas, de modo que todas as linhas compartilham o
+mesmo objeto `str`, e campos com enum conhecido viram o membro do enum.
+"""
+
+import json
+import keyword
+import sys
+import threading
+from dataclasses import make_dataclass
+from enum import Enum
+from typing import Any, Iterable
+
+from .normalize import normalize_key
+
+
+def _field_name(nome: str) -> str:
+    if nome.isidentifier() and not keyword.iskeyword(nome):
+        return nome
+    nome = normalize_key(nome) or 'campo'
+    return f'_{nome}' if nome[0].isdigit() or keyword.iskeyword(nome) else nome
+
+
+class RecordFactory:
+    """Cria as classes de registro de um endpoint e converte valores categóricos."""
+
+    def __init__(
+        self,
+        nome: str,
+        categoricos: Iterable[str] = (),
+        enums: dict[str, type[Enum]] | None = None,
+    ):
+        """Inicializa a fábrica.
+
+        Argumentos:
+            nome (str): Nome base das classes geradas.
+            categoricos (Iterable[str], optional): Campos cujos valores textuais são internados. Padrão:  ().
+            enums (dict[str, type[Enum]] | None, optional): Enum de cada campo; valores válidos viram membros. Padrão:  None.
+        """
+        self.nome = nome
+        self.categoricos = {normalize_key(c) for c in categoricos}
+        self.enums = {normalize_key(k): v for k, v in (enums or {}).items()}
+        self._lock = threading.Lock()
+        self._classes: dict[tuple[str, ...], type] = {}
+        self._conversores: dict[str, Any] = {}
+        self._planos: dict[tuple[str, ...], tuple[type, list]] = {}
+
+    def record_class(self, campos: tuple[str, ...]) -> type:
+        """Classe de registro para a sequência de campos, criada na primeira vez.
+
+        Argumentos:
+            campos (tuple[str, ...]): Nomes dos campos, na ordem do payload.
+
+        Retorno:
+            type: Dataclass com `__slots__`.
+        """
+        classe = self._classes.get(campos)
+        if classe is None:
+            with self._lock:
+                classe = self._classes.get(campos)
+                if classe is None:
+                    sufixo = f'_{len(self._classes)}' if self._classes else ''
+                    classe = make_dataclass(
+                        f'{self.nome}{sufixo}',
+                        [_field_name(c) for c in campos],
+                        slots=True,
+                    )
+                    self._classes[campos] = classe
+        return classe
+
+    def converter(self, campo: str):
+        """Função que converte o valor de um campo, ou None se o valor é mantido."""
+        try:
+            return self._conversores[campo]
+        except KeyError:
+            pass
+        chave = normalize_key(campo)
+        conversor = None
+        if chave in self.enums:
+            enum = self.enums[chave]
+            membros = {m.value: m for m in enum}
+
+            def conversor(valor, membros=membros):
+                if isinstance(valor, str):
+                    return membros.get(valor) or sys.intern(valor)
+                return valor
+        elif chave in self.categoricos:
+            def conversor(valor):
+                return sys.intern(valor) if isinstance(valor, str) else valor
+        self._conversores[campo] = conversor
+        return conversor
+
+    def _plano(self, campos: tuple[str, ...]) -> tuple[type, list]:
+        plano = self._planos.get(campos)
+        if plano is None:
+            conversoes = [(i, self.converter(c)) for i, c in enumerate(campos) if self.converter(c)]
+            plano = self._planos[campos] = (self.record_class(campos), conversoes)
+        return plano
+
+    def from_pairs(self, pares: list[tuple[str, Any]]):
+        """Constrói um registro a partir dos pares (campo, valor) do decodificador JSON."""
+        campos, valores = zip(*pares) if pares else ((), ())
+        classe, conversoes = self._plano(campos)
+        if conversoes:
+            valores = list(valores)
+            for i, conversor in conversoes:
+                valores[i] = conversor(valores[i])
+        return classe(*valores)
+
+
+def decode_json_records(content: bytes | str, factory: RecordFactory) -> Any:
+    """Decodifica JSON construindo registros diretamente, sem dicionários intermediários.
+
+    Usa o gancho `object_pairs_hook` do decodificador da biblioteca padrão,
+    que entrega os pares de cada objeto antes de qualquer `dict` ser criado.
+
+    Argumentos:
+        content (bytes | str): Documento JSON.
+        factory (RecordFactory): Fábrica de registros do endpoint.
+
+    Retorno:
+        Any: O documento com cada objeto substituído por um registro.
+    """
+    return json.loads(content, object_pairs_hook=factory.from_pairs)
+
+
+def records_from_columns(colunas: dict[str, list], factory: RecordFactory) -> list:
+    """Constrói registros a partir de colunas tipadas (ver `decode_csv`), sem dicionários por linha.
+
+    Argumentos:
+        colunas (dict[str, list]): Colunas decodificadas.
+        factory (RecordFactory): Fábrica de registros do endpoint.
+
+    Retorno:
+        list: Um registro por linha.
+    """
+    campos = tuple(colunas)
+    classe = factory.record_class(campos)
+    convertidas = []
+    for campo, coluna in colunas.items():
+        conversor = factory.converter(campo)
+        convertidas.append(list(map(conversor, coluna)) if conversor else coluna)
+    return [classe(*linha) for linha in zip(*convertidas)]
@@ -0,0 +1,89 @@
+"""Coalescência de requisições concorrentes idênticas (single-flight)."""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable
+
+
+class SingleFlight:
+    """Garante que apenas uma chamada por chave esteja em andamento por vez.
+
+    Chamadores concorrentes com a mesma chave aguardam a chamada em andamento
+    e recebem o mesmo resultado (ou a mesma exceção). Funciona entre threads e
+    entre tarefas asyncio, pois todos compartilham o mesmo `Future`.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._em_andamento: dict[Hashable, Future] = {}
+
+    def _entrar(self, chave: Hashable) -> tuple[Future, bool]:
+        """Retorna o `Future` da chave e se o chamador é o líder da chamada."""
+        with self._lock:
+            future = self._em_andamento.get(chave)
+            if future is not None:
+                return future, False
+            future = Future()
+            self._em_andamento[chave] = future
+            return future, True
+
+    def _concluir(self, chave: Hashable, future: Future, resultado: Any = None, erro: BaseException = None) -> None:
+        with self._lock:
+            self._em_andamento.pop(chave, None)
+        if erro is not None:
+            future.set_exception(erro)
+        else:
+            future.set_result(resultado)
+
+    def do(self, chave: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Executa `fn` uma única vez para chamadas concorrentes com a mesma chave.
+
+        Argumentos:
+            chave (Hashable): Chave normalizada da chamada.
+            fn (Callable): Função a ser executada pelo líder.
+
+        Retorno:
+            Any: O resultado da chamada compartilhada.
+        """
+        future, lider = self._entrar(chave)
+        if not lider:
+            return future.result()
+        try:
+            resultado = fn(*args, **kwargs)
+        except BaseException as erro:
+            self._concluir(chave, future, erro=erro)
+            raise
+        self._concluir(chave, future, resultado)
+        return resultado
+
+    async def do_async(self, chave: Hashable, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Versão assíncrona de `do`. A função bloqueante roda no executor padrão do loop.
+
+        Argumentos:
+            chave (Hashable): Chave normalizada da chamada.
+            fn (Callable): Função bloqueante a ser executada pelo líder.
+
+        Retorno:
+            Any: O resultado da chamada compartilhada.
+        """
+        future, lider = self._entrar(chave)
+        if lider:
+            # O próprio trabalho no executor conclui o `Future` compartilhado:
+            # cancelar a tarefa líder não afeta os demais chamadores.
+            asyncio.get_running_loop().run_in_executor(None, self._executar, chave, future, fn, args, kwargs)
+        # `shield`: cancelar quem espera não cancela o `Future` compartilhado.
+        return await asyncio.shield(asyncio.wrap_future(future))
+
+    def _executar(self, chave: Hashable, future: Future, fn: Callable[..., Any], args: tuple, kwargs: dict) -> None:
+        try:
+            resultado = fn(*args, **kwargs)
+        except BaseException as erro:
+            self._concluir(chave, future, erro=erro)
+        else:
+            self._concluir(chave, future, resultado)
+
+    def em_andamento(self) -> int:
+        """Número de chamadas atualmente em andamento."""
+        with self._lock:
+            return len(self._em_andamento)
@@ -0,0 +1,493 @@
+"""Sumários aproximados em fluxo: contagem de distintos, frequências, top-K e quantis.
+
+Todos os sumários ocupam memória fixa (alguns KB), recebem valores um a um,
+podem ser combinados (`merge`) entre processos, máquinas ou períodos e são
+serializados com `to_bytes` / `from_bytes`. O hash dos valores é estável
+entre processos (BLAKE2b), de modo que sumários feitos em paralelo combinam
+exatamente como se os dados tivessem passado por um único sumário.
+
+- `HyperLogLog`: número de valores distintos (erro relativo ~1,04/sqrt(2**p));
+- `CountMinSketch`: frequência (ou soma de pesos) de cada valor, nunca subestimada;
+- `SpaceSaving`: os K valores mais frequentes ou de maior soma de pesos;
+- `TDigest`: quantis, mais precisos nas caudas.
+"""
+
+import hashlib
+import heapq
+import itertools
+import json
+import math
+import struct
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, Mapping
+
+_HLL, _CMS, _SS, _TD = b'HLL1', b'CMS1', b'SSK1', b'TDG1'
+
+
+def _bytes(valor: Any) -> bytes:
+    if isinstance(valor, bytes):
+        return valor
+    return str(valor).encode()
+
+
+def stable_hash(valor: Any) -> int:
+    """Hash de 64 bits do valor, igual em qualquer processo."""
+    return int.from_bytes(hashlib.blake2b(_bytes(valor), digest_size=8).digest(), 'little')
+
+
+def _verificar(dados: bytes, magica: bytes) -> memoryview:
+    if dados[:4] != magica:
+        raise ValueError(f'Dados não são de um {magica[:3].decode()} serializado.')
+    return memoryview(dados)[4:]
+
+
+class HyperLogLog:
+    """Contagem aproximada de valores distintos."""
+
+    def __init__(self, p: int = 14):
+        """Cria o sumário vazio.
+
+        Argumentos:
+            p (int, optional): Precisão; usa 2**p registradores de um byte. Padrão:  14 (16 KB, erro ~0,8%).
+        """
+        if not 4 <= p <= 18:
+            raise ValueError('A precisão deve estar entre 4 e 18.')
+        self.p = p
+        self.m = 1 << p
+        self.registros = bytearray(self.m)
+
+    def add(self, valor: Any) -> None:
+        """Adiciona um valor."""
+        h = stable_hash(valor)
+        indice = h >> (64 - self.p)
+        resto = h & ((1 << (64 - self.p)) - 1)
+        posicao = (64 - self.p) - resto.bit_length() + 1
+        if posicao > self.registros[indice]:
+            self.registros[indice] = posicao
+
+    def extend(self, valores: Iterable[Any]) -> None:
+        """Adiciona vários valores."""
+        for valor in valores:
+            self.add(valor)
+
+    def count(self) -> int:
+        """Estimativa do número de valores distintos."""
+        m = self.m
+        alfa = 0.7213 / (1 + 1.079 / m) if m >= 128 else {16: 0.673, 32: 0.697, 64: 0.709}[m]
+        soma = math.fsum(2.0 ** -r for r in self.registros)
+        estimativa = alfa * m * m / soma
+        zeros = self.registros.count(0)
+        if estimativa <= 2.5 * m and zeros:
+            estimativa = m * math.log(m / zeros)  # contagem linear para cardinalidades pequenas
+        return round(estimativa)
+
+    def __len__(self) -> int:
+        return self.count()
+
+    def merge(self, outro: 'HyperLogLog') -> 'HyperLogLog':
+        """Incorpora outro sumário de mesma precisão (união dos conjuntos)."""
+        if outro.p != self.p:
+            raise ValueError('Só é possível combinar HyperLogLogs de mesma precisão.')
+        self.registros = bytearray(map(max, self.registros, outro.registros))
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Serializa o sumário."""
+        return _HLL + bytes([self.p]) + bytes(self.registros)
+
+    @classmethod
+    def from_bytes(cls, dados: bytes) -> 'HyperLogLog':
+        """Reconstrói um sumário serializado por `to_bytes`."""
+        corpo = _verificar(dados, _HLL)
+        sumario = cls(corpo[0])
+        sumario.registros[:] = corpo[1:]
+        return sumario
+
+
+class CountMinSketch:
+    """Frequência aproximada de cada valor; a estimativa nunca é menor que o valor real."""
+
+    def __init__(self, largura: int = 2048, profundidade: int = 5):
+        """Cria o sumário vazio.
+
+        O erro de cada estimativa é no máximo `e / largura` vezes o total,
+        com probabilidade `1 - exp(-profundidade)`.
+
+        Argumentos:
+            largura (int, optional): Contadores por linha. Padrão:  2048.
+            profundidade (int, optional): Número de linhas (funções de hash). Padrão:  5.
+        """
+        self.largura = largura
+        self.profundidade = profundidade
+        self.total = 0.0
+        self.contadores = array('d', bytes(8 * largura * profundidade))
+
+    def _posicoes(self, valor: Any) -> list[int]:
+        digest = hashlib.blake2b(_bytes(valor), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [i * self.largura + (h1 + i * h2) % self.largura for i in range(self.profundidade)]
+
+    def add(self, valor: Any, peso: float = 1) -> None:
+        """Adiciona uma ocorrência (ou um peso, como um valor em reais) do valor."""
+        contadores = self.contadores
+        for posicao in self._posicoes(valor):
+            contadores[posicao] += peso
+        self.total += peso
+
+    def extend(self, valores: Iterable[Any]) -> None:
+        """Adiciona uma ocorrência de cada valor."""
+        for valor in valores:
+            self.add(valor)
+
+    def estimate(self, valor: Any) -> float:
+        """Frequência (ou soma de pesos) estimada do valor."""
+        contadores = self.contadores
+        return min(contadores[posicao] for posicao in self._posicoes(valor))
+
+    def __getitem__(self, valor: Any) -> float:
+        return self.estimate(valor)
+
+    def merge(self, outro: 'CountMinSketch') -> 'CountMinSketch':
+        """Incorpora outro sumário de mesmas dimensões."""
+        if (outro.largura, outro.profundidade) != (self.largura, self.profundidade):
+            raise ValueError('Só é possível combinar CountMinSketches de mesmas dimensões.')
+        self.contadores = array('d', map(float.__add__, self.contadores, outro.contadores))
+        self.total += outro.total
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Serializa o sumário."""
+        return _CMS + struct.pack('<IId', self.largura, self.profundidade, self.total) + self.contadores.tobytes()
+
+    @classmethod
+    def from_bytes(cls, dados: bytes) -> 'CountMinSketch':
+        """Reconstrói um sumário serializado por `to_bytes`."""
+        corpo = _verificar(dados, _CMS)
+        largura, profundidade, total = struct.unpack_from('<IId', corpo)
+        sumario = cls(largura, profundidade)
+        sumario.total = total
+        sumario.contadores = array('d', corpo[struct.calcsize('<IId'):].tobytes())
+        return sumario
+
+
+class SpaceSaving:
+    """Os valores mais frequentes (ou de maior soma de pesos), com memória limitada.
+
+    Cada valor monitorado tem uma contagem que pode superestimar a real em
+    até `erro`; qualquer valor cuja soma real ultrapasse `total / capacidade`
+    está garantidamente entre os monitorados.
+
+    O menor valor monitorado sai de um heap de contagens, com as entradas
+    desatualizadas descartadas ao chegar ao topo: com o sumário cheio, cada
+    substituição custa O(log capacidade).
+    """
+
+    def __init__(self, capacidade: int = 100):
+        """Cria o sumário vazio.
+
+        Argumentos:
+            capacidade (int, optional): Número de valores monitorados; use algumas vezes o K desejado. Padrão:  100.
+        """
+        self.capacidade = capacidade
+        self.total = 0.0
+        self.contagens: dict[Any, float] = {}
+        self.erros: dict[Any, float] = {}
+        self._heap: list[tuple[float, int, Any]] = []  # (contagem, ordem, valor)
+        self._ordem = itertools.count()
+
+    def _empilhar(self, valor: Any, contagem: float) -> None:
+        heapq.heappush(self._heap, (contagem, next(self._ordem), valor))
+        if len(self._heap) > 4 * self.capacidade + 64:
+            self._reconstruir()
+
+    def _reconstruir(self) -> None:
+        self._heap = [(contagem, next(self._ordem), valor) for valor, contagem in self.contagens.items()]
+        heapq.heapify(self._heap)
+
+    def _menor(self) -> Any:
+        # Entradas cuja contagem não é mais a atual do valor (ou de valores já substituídos) são descartadas.
+        heap, contagens = self._heap, self.contagens
+        while True:
+            contagem, _, valor = heap[0]
+            if contagens.get(valor) == contagem:
+                return valor
+            heapq.heappop(heap)
+
+    def add(self, valor: Any, peso: float = 1) -> None:
+        """Adiciona uma ocorrência (ou um peso) do valor."""
+        self.total += peso
+        contagens = self.contagens
+        if valor in contagens:
+            contagens[valor] += peso
+        elif len(contagens) < self.capacidade:
+            contagens[valor] = peso
+            self.erros[valor] = 0.0
+        else:
+            # Substitui o valor de menor contagem, herdando-a como erro.
+            menor = self._menor()
+            minimo = contagens.pop(menor)
+            del self.erros[menor]
+            contagens[valor] = minimo + peso
+            self.erros[valor] = minimo
+        self._empilhar(valor, contagens[valor])
+
+    def extend(self, valores: Iterable[Any]) -> None:
+        """Adiciona uma ocorrência de cada valor."""
+        for valor in valores:
+            self.add(valor)
+
+    def top(self, k: int | None = None) -> list[tuple[Any, float, float]]:
+        """Os `k` valores de maior contagem, como `(valor, contagem, erro máximo)`."""
+        ordenados = sorted(self.contagens.items(), key=lambda item: item[1], reverse=True)
+        return [(valor, contagem, self.erros[valor]) for valor, contagem in ordenados[:k]]
+
+    def merge(self, outro: 'SpaceSaving') -> 'SpaceSaving':
+        """Incorpora outro sumário.
+
+        Valores ausentes de um dos lados recebem a menor contagem daquele lado
+        (o máximo que podem ter tido ali), que também entra no erro.
+        """
+        piso_a = min(self.contagens.values()) if len(self.contagens) >= self.capacidade else 0.0
+        piso_b = min(outro.contagens.values()) if len(outro.contagens) >= outro.capacidade else 0.0
+        contagens, erros = {}, {}
+        for valor in self.contagens.keys() | outro.contagens.keys():
+            a, b = self.contagens.get(valor), outro.contagens.get(valor)
+            contagens[valor] = (piso_a if a is None else a) + (piso_b if b is None else b)
+            erros[valor] = (
+                (piso_a if a is None else self.erros[valor]) + (piso_b if b is None else outro.erros[valor])
+            )
+        mantidos = sorted(contagens, key=contagens.__getitem__, reverse=True)[: self.capacidade]
+        self.contagens = {valor: contagens[valor] for valor in mantidos}
+        self.erros = {valor: erros[valor] for valor in mantidos}
+        self.total += outro.total
+        self._reconstruir()
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Serializa o sumário.
+
+        Os valores monitorados devem ser texto, números, booleanos, None ou
+        tuplas desses tipos (ex.: chaves compostas); tuplas voltam como tuplas.
+
+        Raises:
+            TypeError: Se algum valor monitorado não for de um desses tipos.
+        """
+        itens = [[_codificar_valor(valor), self.contagens[valor], self.erros[valor]] for valor in self.contagens]
+        return _SS + json.dumps({'capacidade': self.capacidade, 'total': self.total, 'itens': itens}).encode()
+
+    @classmethod
+    def from_bytes(cls, dados: bytes) -> 'SpaceSaving':
+        """Reconstrói um sumário serializado por `to_bytes`."""
+        estado = json.loads(bytes(_verificar(dados, _SS)))
+        sumario = cls(estado['capacidade'])
+        sumario.total = estado['total']
+        for valor, contagem, erro in estado['itens']:
+            valor = _decodificar_valor(valor)
+            sumario.contagens[valor] = contagem
+            sumario.erros[valor] = erro
+        sumario._reconstruir()
+        return sumario
+
+
+def _codificar_valor(valor: Any) -> Any:
+    # O JSON não tem tuplas: viram {"t": [...]}, distintas das listas (que não são chaves válidas).
+    if isinstance(valor, tuple):
+        return {'t': [_codificar_valor(v) for v in valor]}
+    if valor is None or isinstance(valor, (str, int, float)):
+        return valor
+    raise TypeError(f'Valor do SpaceSaving não serializável: {valor!r} ({type(valor).__name__}).')
+
+
+def _decodificar_valor(valor: Any) -> Any:
+    if isinstance(valor, dict):
+        return tuple(_decodificar_valor(v) for v in valor['t'])
+    return valor
+
+
+class TDigest:
+    """Quantis aproximados (t-digest com fusão), precisos nas caudas."""
+
+    def __init__(self, compressao: float = 100):
+        """Cria o sumário vazio.
+
+        Argumentos:
+            compressao (float, optional): Controla o número de centroides (~compressao) e a precisão. Padrão:  100.
+        """
+        self.compressao = compressao
+        self.medias: list[float] = []
+        self.pesos: list[float] = []
+        self.contagem = 0.0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self._buffer: list[tuple[float, float]] = []
+
+    def add(self, valor: float, peso: float = 1) -> None:
+        """Adiciona um valor."""
+        valor = float(valor)
+        self._buffer.append((valor, peso))
+        self.contagem += peso
+        if valor < self.minimo:
+            self.minimo = valor
+        if valor > self.maximo:
+            self.maximo = valor
+        if len(self._buffer) >= 10 * self.compressao:
+            self._comprimir()
+
+    def extend(self, valores: Iterable[float]) -> None:
+        """Adiciona vários valores."""
+        for valor in valores:
+            self.add(valor)
+
+    def _k(self, q: float) -> float:
+        return self.compressao / (2 * math.pi) * math.asin(2 * q - 1)
+
+    def _comprimir(self) -> None:
+        if not self._buffer:
+            return
+        pontos = sorted([*zip(self.medias, self.pesos), *self._buffer])
+        self._buffer = []
+        total = self.contagem
+        medias, pesos = [], []
+        media, peso = pontos[0]
+        acumulado = 0.0
+        limite = self._k(0) + 1
+        for m, w in pontos[1:]:
+            q = (acumulado + peso + w) / total
+            if self._k(min(q, 1.0)) <= limite:
+                peso += w
+                media += (m - media) * w / peso
+            else:
+                medias.append(media)
+                pesos.append(peso)
+                acumulado += peso
+                limite = self._k(acumulado / total) + 1
+                media, peso = m, w
+        medias.append(media)
+        pesos.append(peso)
+        self.medias, self.pesos = medias, pesos
+
+    def _pontos(self) -> tuple[list[float], list[float]]:
+        """Pontos da função de distribuição acumulada: (mínimo, 0), (média, centro da massa)..., (máximo, total)."""
+        xs, ys = [self.minimo], [0.0]
+        acumulado = 0.0
+        for media, peso in zip(self.medias, self.pesos):
+            xs.append(media)
+            ys.append(acumulado + peso / 2)
+            acumulado += peso
+        xs.append(self.maximo)
+        ys.append(acumulado)
+        return xs, ys
+
+    def quantile(self, q: float) -> float:
+        """Valor aproximado do quantil `q` (entre 0 e 1)."""
+        self._comprimir()
+        if not self.medias:
+            return math.nan
+        if q <= 0:
+            return self.minimo
+        if q >= 1:
+            return self.maximo
+        xs, ys = self._pontos()
+        alvo = q * self.contagem
+        i = max(bisect_left(ys, alvo), 1)
+        if ys[i] == ys[i - 1]:
+            return xs[i]
+        return xs[i - 1] + (xs[i] - xs[i - 1]) * (alvo - ys[i - 1]) / (ys[i] - ys[i - 1])
+
+    def quantiles(self, qs: Iterable[float]) -> list[float]:
+        """Vários quantis de uma vez."""
+        return [self.quantile(q) for q in qs]
+
+    def cdf(self, valor: float) -> float:
+        """Fração aproximada dos valores menores ou iguais a `valor`."""
+        self._comprimir()
+        if not self.medias or valor < self.minimo:
+            return 0.0
+        if valor >= self.maximo:
+            return 1.0
+        xs, ys = self._pontos()
+        i = max(bisect_left(xs, valor), 1)
+        if xs[i] == xs[i - 1]:
+            return ys[i] / self.contagem
+        return (ys[i - 1] + (ys[i] - ys[i - 1]) * (valor - xs[i - 1]) / (xs[i] - xs[i - 1])) / self.contagem
+
+    def merge(self, outro: 'TDigest') -> 'TDigest':
+        """Incorpora outro sumário."""
+        outro._comprimir()
+        self._buffer.extend(zip(outro.medias, outro.pesos))
+        self.contagem += outro.contagem
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self._comprimir()
+        return self
+
+    def to_bytes(self) -> bytes:
+        """Serializa o sumário."""
+        self._comprimir()
+        cabecalho = struct.pack('<dddd I', self.compressao, self.contagem, self.minimo, self.maximo, len(self.medias))
+        return _TD + cabecalho + array('d', self.medias).tobytes() + array('d', self.pesos).tobytes()
+
+    @classmethod
+    def from_bytes(cls, dados: bytes) -> 'TDigest':
+        """Reconstrói um sumário serializado por `to_bytes`."""
+        corpo = _verificar(dados, _TD)
+        compressao, contagem, minimo, maximo, n = struct.unpack_from('<dddd I', corpo)
+        inicio = struct.calcsize('<dddd I')
+        valores = array('d', corpo[inicio:inicio + 16 * n].tobytes())
+        sumario = cls(compressao)
+        sumario.contagem, sumario.minimo, sumario.maximo = contagem, minimo, maximo
+        sumario.medias, sumario.pesos = list(valores[:n]), list(valores[n:])
+        return sumario
+
+
+Sketch = HyperLogLog | CountMinSketch | SpaceSaving | TDigest
+
+_TIPOS = {_HLL: HyperLogLog, _CMS: CountMinSketch, _SS: SpaceSaving, _TD: TDigest}
+
+
+def load_sketch(dados: bytes) -> Sketch:
+    """Reconstrói qualquer sumário serializado por `to_bytes`, pelo cabeçalho."""
+    tipo = _TIPOS.get(bytes(dados[:4]))
+    if tipo is None:
+        raise ValueError('Sumário serializado desconhecido.')
+    return tipo.from_bytes(dados)
+
+
+def feed_sketches(linhas: Iterable[Mapping], alimentacoes: Iterable[tuple]) -> int:
+    """Alimenta vários sumários em uma única passada pelas linhas.
+
+    Cada alimentação é `(sumario, campo)` ou `(sumario, campo, campo_peso)`;
+    o campo também pode ser uma função da linha. Linhas sem o valor (None ou
+    vazio) são ignoradas por aquele sumário. As linhas podem vir de qualquer
+    iterador: listas de dicts, `LazyRows`, registros decodificados em fluxo.
+
+    Argumentos:
+        linhas (Iterable[Mapping]): As linhas.
+        alimentacoes (Iterable[tuple]): Ex.: `[(hll, 'cnpjCpf'), (topk, 'fornecedor', 'valorReembolsado')]`.
+
+    Retorno:
+        int: Número de linhas lidas.
+    """
+    planos: list[tuple[Sketch, Callable[[Mapping], Any], Callable[[Mapping], Any] | None]] = []
+    for sumario, campo, *peso in alimentacoes:
+        extrair = campo if callable(campo) else (lambda linha, campo=campo: linha.get(campo))
+        pesar = None
+        if peso:
+            pesar = peso[0] if callable(peso[0]) else (lambda linha, campo=peso[0]: linha.get(campo))
+        planos.append((sumario, extrair, pesar))
+    n = 0
+    for linha in linhas:
+        n += 1
+        for sumario, extrair, pesar in planos:
+            valor = extrair(linha)
+            if valor is None or valor == '':
+                continue
+            if pesar is None:
+                sumario.add(valor)
+                continue
+            peso = pesar(linha)
+            if peso is not None and peso != '':
+                sumario.add(valor, float(peso))
+    return n
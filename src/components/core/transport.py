@@ -0,0 +1,368 @@
+"""Caminho compartilhado de requisições HTTP dos clientes."""
+
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING, Any, Callable, Iterator
+from urllib.parse import urlsplit
+
+import requests
+
+from .concurrency import AdaptiveLimiter
+from .compression import accept_encoding, iter_decoded, wire_size
+from .deadlines import DeadlineExceeded, call_timeout, remaining
+from .hedging import Hedger, route_key
+from .metrics import TransportMetrics
+from .singleflight import SingleFlight
+
+if TYPE_CHECKING:
+    from .rawstore import RawStore
+
+
+def request_key(url: str, params: dict | None = None) -> tuple:
+    """Normaliza URL e parâmetros em uma chave estável para a requisição.
+
+    Parâmetros com valor `None` são descartados, assim como o `requests` faz
+    ao montar a query string, e a ordem dos parâmetros é irrelevante.
+
+    Argumentos:
+        url (str): URL da requisição.
+        params (dict | None, optional): Parâmetros da requisição. Padrão:  None.
+
+    Retorno:
+        tuple: Chave normalizada.
+    """
+    itens = tuple(sorted(
+        (str(k), str(v)) for k, v in (params or {}).items() if v is not None
+    ))
+    return ('GET', url.rstrip('/'), itens)
+
+
+class _SemVaga(Exception):
+    """Hedge dispensado: o host não tinha vaga livre no limitador."""
+
+
+# Respostas transitórias que valem uma nova tentativa.
+_REPETIR = frozenset((429, 502, 503, 504))
+
+
+def _retry_after(response: requests.Response) -> float | None:
+    """Espera pedida pelo servidor no `Retry-After` (segundos ou data HTTP), ou None."""
+    valor = (getattr(response, 'headers', None) or {}).get('Retry-After')
+    if not valor:
+        return None
+    try:
+        return max(float(valor), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(valor).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RateLimiter:
+    """Limita a taxa de requisições (balde de fichas), de forma segura entre threads."""
+
+    def __init__(self, rate: float, burst: int = 1):
+        """Inicializa o limitador.
+
+        Argumentos:
+            rate (float): Requisições por segundo.
+            burst (int, optional): Requisições que podem sair de uma vez após um período ocioso. Padrão:  1.
+        """
+        self.rate = rate
+        self.burst = burst
+        self._lock = threading.Lock()
+        self._proximo = 0.0
+
+    def acquire(self) -> float:
+        """Aguarda a vez da próxima requisição.
+
+        Retorno:
+            float: Segundos aguardados.
+        """
+        intervalo = 1 / self.rate
+        with self._lock:
+            agora = time.monotonic()
+            vez = max(self._proximo, agora - (self.burst - 1) * intervalo)
+            self._proximo = vez + intervalo
+        espera = vez - agora
+        if espera > 0:
+            time.sleep(espera)
+        return max(espera, 0.0)
+
+
+class Transport:
+    """Executa as requisições GET dos clientes.
+
+    Chamadas idênticas concorrentes são coalescidas, a melhor compressão
+    disponível é negociada e os tamanhos transferidos são registrados em
+    `metrics`. Com um `store`, os corpos recebidos são guardados em disco e
+    as releituras são servidas pelo arquivo mapeado em memória enquanto
+    frescas (ver `RawStore.fresh`); vencidas, são revalidadas com uma
+    requisição condicional, e um 304 devolve a cópia guardada.
+
+    Falhas de conexão, timeouts e respostas 429/502/503/504 podem ser
+    repetidas (`retries`) com espera exponencial, ou a pedida pelo servidor
+    em `Retry-After`, se maior, e `rate` limita as
+    requisições enviadas por segundo.
+
+    Com `hedge` (um percentil, ex.: 0.95), uma requisição sem resposta após
+    esse percentil da latência da rota é repetida em paralelo e vale a
+    primeira resposta (ver `Hedger`). O `timeout` padrão de cada chamada é
+    reduzido ao prazo da operação em vigor (ver `deadline`).
+
+    Com `adaptive`, as requisições simultâneas a cada host são limitadas por
+    um `AdaptiveLimiter`, ajustado pela latência e pelos erros observados; o
+    limite atual aparece em `metrics` (`concurrency_limit`). Fan-outs com
+    muitas threads passam a ter a concorrência real decidida pelo servidor.
+    Um hedge não espera por vaga: sem vaga livre no host, não é enviado.
+    """
+
+    def __init__(
+        self,
+        coalesce: bool = True,
+        store: 'RawStore | None' = None,
+        *,
+        rate: float | None = None,
+        retries: int = 0,
+        backoff: float = 0.5,
+        timeout: float | None = None,
+        hedge: 'float | Hedger | None' = None,
+        adaptive: bool | Callable[[], AdaptiveLimiter] = False,
+    ):
+        """Inicializa o transporte.
+
+        Argumentos:
+            coalesce (bool, optional): Coalescer requisições idênticas concorrentes. Padrão:  True.
+            store (RawStore | None, optional): Armazenamento dos corpos brutos das respostas. Padrão:  None.
+            rate (float | None, optional): Máximo de requisições por segundo. Padrão:  None (sem limite).
+            retries (int, optional): Novas tentativas após falhas transitórias. Padrão:  0.
+            backoff (float, optional): Espera, em segundos, antes da primeira nova tentativa; dobra a cada uma. Padrão:  0.5.
+            timeout (float | None, optional): Timeout das chamadas que não informam um. Padrão:  None (sem timeout).
+            hedge (float | Hedger | None, optional): Percentil da latência após o qual a requisição é
+                repetida em paralelo, ou um `Hedger` configurado. Padrão:  None (sem hedge).
+            adaptive (bool | Callable[[], AdaptiveLimiter], optional): Limitar a concorrência por host; True usa
+                `AdaptiveLimiter()`, e uma função cria o limitador de cada host. Padrão:  False.
+        """
+        self.coalesce = coalesce
+        self.store = store
+        self.rate_limiter = RateLimiter(rate) if rate else None
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.hedger = Hedger(hedge) if isinstance(hedge, (int, float)) else hedge
+        self.metrics = TransportMetrics()
+        self._singleflight = SingleFlight()
+        self._novo_limitador = (AdaptiveLimiter if adaptive is True else adaptive) or None
+        self._limitadores: dict[str, AdaptiveLimiter] = {}
+        self._lock = threading.Lock()
+
+    def close(self) -> None:
+        """Encerra as threads do `hedger`, se houver."""
+        if self.hedger is not None:
+            self.hedger.close()
+
+    def __enter__(self) -> 'Transport':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def limiter(self, host: str) -> AdaptiveLimiter | None:
+        """Limitador de concorrência do host, ou None sem `adaptive`."""
+        if self._novo_limitador is None:
+            return None
+        with self._lock:
+            limitador = self._limitadores.get(host)
+            if limitador is None:
+                limitador = self._limitadores[host] = self._novo_limitador()
+                self.metrics.set(host, 'concurrency_limit', limitador.limit)
+            return limitador
+
+    def _fetch(self, url: str, params: dict | None, **kwargs: Any) -> requests.Response:
+        host = urlsplit(url).netloc
+        condicional = self._condicional(kwargs)
+        kwargs['headers'] = {'Accept-Encoding': accept_encoding(), **(kwargs.get('headers') or {})}
+        guardada = None
+        if self.store is not None and not kwargs.get('stream') and not condicional:
+            # Cópia vencida com validadores: a requisição passa a ser condicional.
+            guardada = self.store.open(url, params, vencida=True)
+            validadores = guardada.validators() if guardada is not None else {}
+            if validadores:
+                kwargs['headers'].update(validadores)
+            elif guardada is not None:
+                guardada.close()
+                guardada = None
+        self.metrics.incr(host, 'upstream_requests')
+        pedida = None
+        for tentativa in range(self.retries + 1):
+            if tentativa:
+                self.metrics.incr(host, 'retries')
+                espera = max(self.backoff * 2 ** (tentativa - 1), pedida or 0.0)
+                restante = remaining()
+                time.sleep(espera if restante is None else max(min(espera, restante), 0))
+            try:
+                response = self._send(host, url, params, kwargs)
+            except DeadlineExceeded:
+                self.metrics.incr(host, 'errors')
+                raise
+            except (requests.ConnectionError, requests.Timeout):
+                self.metrics.incr(host, 'errors')
+                if tentativa == self.retries:
+                    raise
+                continue
+            except requests.RequestException:
+                self.metrics.incr(host, 'errors')
+                raise
+            if response.status_code not in _REPETIR or tentativa == self.retries:
+                break
+            pedida = _retry_after(response)
+        if kwargs.get('stream'):
+            return response
+        self._record_transfer(host, response)
+        if guardada is not None:
+            if response.status_code == 304:
+                self.metrics.incr(host, 'revalidations')
+                self.store.touch(url, params)
+                return guardada
+            guardada.close()
+        if self.store is not None and response.status_code == 200 and not condicional:
+            self.store.put(url, params, response.content, response.headers)
+        return response
+
+    def _send(self, host: str, url: str, params: dict | None, kwargs: dict) -> requests.Response:
+        # A vez do `rate` e a vaga do limitador são obtidas antes do hedge: o
+        # atraso do hedge e o RTT medem só a requisição. O prazo é verificado
+        # antes de cada envio: vencido, DeadlineExceeded (um requests.Timeout)
+        # encerra também as novas tentativas.
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        limitador = self.limiter(host)
+        if limitador is not None and not limitador.acquire(remaining()):
+            raise DeadlineExceeded('Prazo da operação esgotado à espera de vaga')
+
+        def enviar() -> requests.Response:
+            # Com limitador, chamada já com a vaga, que é liberada ao final.
+            if limitador is None:
+                return requests.get(url, params=params, **{**kwargs, 'timeout': call_timeout(kwargs.get('timeout', self.timeout))})
+            try:
+                timeout = call_timeout(kwargs.get('timeout', self.timeout))
+            except DeadlineExceeded:
+                self._liberar(host, limitador, None)
+                raise
+            inicio = time.monotonic()
+            try:
+                response = requests.get(url, params=params, **{**kwargs, 'timeout': timeout})
+            except BaseException:
+                self._liberar(host, limitador, None, erro=True)
+                raise
+            self._liberar(host, limitador, time.monotonic() - inicio, erro=response.status_code in _REPETIR)
+            return response
+
+        def hedge() -> requests.Response:
+            # O hedge só sai se houver vaga livre no host; sem ela, é dispensado
+            # e vale a resposta da primária.
+            if limitador is not None and not limitador.acquire(timeout=0):
+                raise _SemVaga(host)
+            self.metrics.incr(host, 'hedged_requests')
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            return enviar()
+
+        if self.hedger is None or kwargs.get('stream'):
+            return enviar()
+        response, do_hedge = self.hedger.call(route_key(url), enviar, hedge)
+        if do_hedge:
+            self.metrics.incr(host, 'hedge_wins')
+        return response
+
+    def _liberar(self, host: str, limitador: AdaptiveLimiter, rtt: float | None, erro: bool = False) -> None:
+        limitador.release(rtt, erro=erro)
+        self.metrics.set(host, 'concurrency_limit', limitador.limit)
+
+    def _record_transfer(self, host: str, response: requests.Response, decoded_bytes: int | None = None) -> None:
+        if decoded_bytes is None:
+            content = response.content
+            if not isinstance(content, bytes):
+                return
+            decoded_bytes = len(content)
+        headers = getattr(response, 'headers', None) or {}
+        self.metrics.record_transfer(host, wire_size(response), decoded_bytes, headers.get('Content-Encoding'))
+
+    def iter_content(self, response: requests.Response, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Itera sobre o corpo descomprimido de uma resposta obtida com `stream=True`.
+
+        A descompressão é incremental e, ao final, o tamanho transferido é
+        registrado nas métricas.
+
+        Argumentos:
+            response (requests.Response): Resposta obtida com `stream=True`.
+            chunk_size (int, optional): Tamanho máximo de cada bloco lido. Padrão:  65536.
+
+        Retorno:
+            Iterator[bytes]: Blocos descomprimidos do corpo.
+        """
+        decoded_bytes = 0
+        for chunk in iter_decoded(response, chunk_size):
+            decoded_bytes += len(chunk)
+            yield chunk
+        self._record_transfer(urlsplit(response.url).netloc, response, decoded_bytes)
+
+    @staticmethod
+    def _condicional(kwargs: dict) -> bool:
+        headers = kwargs.get('headers') or {}
+        return 'If-None-Match' in headers or 'If-Modified-Since' in headers
+
+    def _coalescivel(self, kwargs: dict) -> bool:
+        # Respostas em streaming não podem ser compartilhadas, e requisições
+        # condicionais podem receber 304 em vez do corpo.
+        return self.coalesce and not kwargs.get('stream') and not self._condicional(kwargs)
+
+    def _guardada(self, url: str, params: dict | None, kwargs: dict):
+        # Requisições condicionais perguntam ao servidor se houve mudança, e
+        # respostas em streaming são lidas pelo corpo da rede: ambas ignoram o `store`.
+        if self.store is None or kwargs.get('stream') or self._condicional(kwargs):
+            return None
+        response = self.store.open(url, params, vencida=True)
+        if response is None:
+            return None
+        if not self.store.fresh(response):
+            response.close()  # vencida: revalidada por `_fetch`
+            return None
+        self.metrics.incr(urlsplit(url).netloc, 'cache_hits')
+        return response
+
+    def get(self, url: str, params: dict | None = None, **kwargs: Any) -> requests.Response:
+        """Faz uma requisição GET.
+
+        Argumentos:
+            url (str): URL da requisição.
+            params (dict | None, optional): Parâmetros da requisição. Padrão:  None.
+            **kwargs: Argumentos repassados a `requests.get`.
+
+        Retorno:
+            requests.Response: A resposta da requisição (uma `StoredResponse` quando servida pelo `store`).
+        """
+        self.metrics.incr(urlsplit(url).netloc, 'requests')
+        guardada = self._guardada(url, params, kwargs)
+        if guardada is not None:
+            return guardada
+        if not self._coalescivel(kwargs):
+            return self._fetch(url, params, **kwargs)
+        return self._singleflight.do(request_key(url, params), self._fetch, url, params, **kwargs)
+
+    async def aget(self, url: str, params: dict | None = None, **kwargs: Any) -> requests.Response:
+        """Versão assíncrona de `get`, coalescida com chamadas feitas por threads e por tarefas."""
+        self.metrics.incr(urlsplit(url).netloc, 'requests')
+        guardada = self._guardada(url, params, kwargs)
+        if guardada is not None:
+            return guardada
+        if not self._coalescivel(kwargs):
+            return await asyncio.to_thread(self._fetch, url, params, **kwargs)
+        return await self._singleflight.do_async(request_key(url, params), self._fetch, url, params, **kwargs)
+
+
+default_transport = Transport()
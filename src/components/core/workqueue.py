@@ -0,0 +1,559 @@
+"""Fila de tarefas de coleta para vários processos e várias máquinas.
+
+Uma tarefa é um endpoint (o nome de um handler) com parâmetros. Seu
+identificador é a chave de deduplicação, derivada do endpoint e dos
+parâmetros: a mesma tarefa enviada duas vezes, por workers diferentes ou
+como filha de pais diferentes, entra na fila uma única vez.
+
+Os workers pegam tarefas por concessão (lease) com prazo; se o worker morre
+ou o prazo vence, a tarefa volta para a fila. Cada concessão tem um token, e
+só quem tem o token vigente conclui ou devolve a tarefa. A conclusão é
+registrada exatamente uma vez e grava, na mesma operação, as tarefas filhas
+(ex.: `pagamentos` -> `empenhos`). Falhas voltam para a fila com espera
+exponencial até `max_tentativas`.
+
+Dois backends: `SQLiteQueue`, para processos em uma máquina, e
+`RedisQueue`, para várias máquinas, sobre qualquer cliente compatível com a
+API do `redis-py`.
+
+    fila = SQLiteQueue('crawl.db')
+    fila.push([('contratacoes/contratos', {})])
+    Worker(fila, crawl_handlers(), sink=gravar).run()
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable
+
+from .export import iter_rows
+
+Filhas = Iterable[tuple[str, dict]]
+Handler = Callable[[dict], tuple[Any, Filhas]]
+
+
+def task_key(endpoint: str, params: dict | None = None) -> str:
+    """Chave de deduplicação da tarefa: endpoint e parâmetros normalizados (`None` é descartado)."""
+    normalizados = {str(k): v for k, v in (params or {}).items() if v is not None}
+    conteudo = json.dumps([endpoint, normalizados], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(conteudo.encode()).hexdigest()
+
+
+def _token() -> str:
+    return os.urandom(8).hex()
+
+
+@dataclass
+class Task:
+    """Tarefa de coleta."""
+
+    id: str
+    endpoint: str
+    params: dict = field(default_factory=dict)
+    pai: str | None = None
+    estado: str = 'pendente'  # pendente, em_execucao, concluida ou falhou
+    tentativas: int = 0
+    token: str | None = None  # token da concessão vigente
+    erro: str | None = None
+
+
+class WorkQueue(ABC):
+    """Interface dos backends da fila de tarefas."""
+
+    def __init__(self, max_tentativas: int = 5, backoff: float = 5.0):
+        """Argumentos:
+            max_tentativas (int, optional): Tentativas antes de a tarefa ser dada como falha. Padrão:  5.
+            backoff (float, optional): Espera, em segundos, antes da segunda tentativa; dobra a cada falha. Padrão:  5.0.
+        """
+        self.max_tentativas = max_tentativas
+        self.backoff = backoff
+
+    @abstractmethod
+    def push(self, tarefas: Filhas, pai: str | None = None) -> int:
+        """Enfileira tarefas `(endpoint, params)`; as já conhecidas são ignoradas.
+
+        Retorno:
+            int: Número de tarefas novas.
+        """
+
+    @abstractmethod
+    def lease(self, worker: str, n: int = 1, prazo: float = 300.0) -> list[Task]:
+        """Concede até `n` tarefas disponíveis ao worker por `prazo` segundos."""
+
+    @abstractmethod
+    def complete(self, tarefa: Task, filhas: Filhas = ()) -> bool:
+        """Conclui a tarefa e enfileira as filhas, se a concessão ainda for do chamador.
+
+        Retorno:
+            bool: False se a concessão venceu e a tarefa já foi concedida a outro worker ou concluída.
+        """
+
+    @abstractmethod
+    def fail(self, tarefa: Task, erro: str) -> bool:
+        """Devolve a tarefa para nova tentativa, ou a dá como falha após `max_tentativas`."""
+
+    @abstractmethod
+    def get(self, id: str) -> Task | None:
+        """Tarefa pelo identificador."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        """Número de tarefas por estado."""
+
+    def _espera(self, tentativas: int) -> float:
+        return self.backoff * 2 ** (tentativas - 1)
+
+    def drained(self) -> bool:
+        """Se não há tarefas pendentes nem em execução."""
+        estados = self.stats()
+        return not estados.get('pendente') and not estados.get('em_execucao')
+
+
+_DDL = '''
+CREATE TABLE IF NOT EXISTS tarefas (
+    id TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    pai TEXT,
+    estado TEXT NOT NULL DEFAULT 'pendente',
+    tentativas INTEGER NOT NULL DEFAULT 0,
+    disponivel_em DOUBLE NOT NULL,
+    lease_ate DOUBLE,
+    worker TEXT,
+    token TEXT,
+    erro TEXT,
+    criado_em DOUBLE NOT NULL,
+    concluido_em DOUBLE
+);
+CREATE INDEX IF NOT EXISTS tarefas_disponiveis ON tarefas (estado, disponivel_em);
+'''
+
+
+class SQLiteQueue(WorkQueue):
+    """Fila em um banco SQLite, compartilhada pelos processos de uma máquina."""
+
+    def __init__(self, caminho: str = 'crawl.db', max_tentativas: int = 5, backoff: float = 5.0):
+        """Abre (ou cria) a fila.
+
+        Argumentos:
+            caminho (str, optional): Arquivo do banco. Padrão:  'crawl.db'.
+            max_tentativas (int, optional): Tentativas antes de a tarefa ser dada como falha. Padrão:  5.
+            backoff (float, optional): Espera, em segundos, antes da segunda tentativa. Padrão:  5.0.
+        """
+        super().__init__(max_tentativas, backoff)
+        self.caminho = caminho
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(caminho, isolation_level=None, check_same_thread=False, timeout=30)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(_DDL)
+
+    def close(self) -> None:
+        """Fecha a conexão."""
+        self._conn.close()
+
+    @contextmanager
+    def _transacao(self):
+        # BEGIN IMMEDIATE reserva a escrita já no início: entre processos, só
+        # um concede ou conclui tarefas por vez.
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                yield
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def _inserir(self, tarefas: Filhas, pai: str | None) -> int:
+        agora = time.time()
+        linhas = [
+            (task_key(endpoint, params), endpoint, json.dumps(params or {}, default=str), pai, agora, agora)
+            for endpoint, params in tarefas
+        ]
+        antes = self._conn.total_changes
+        self._conn.executemany(
+            'INSERT OR IGNORE INTO tarefas (id, endpoint, params, pai, disponivel_em, criado_em) VALUES (?, ?, ?, ?, ?, ?)',
+            linhas,
+        )
+        return self._conn.total_changes - antes
+
+    def push(self, tarefas: Filhas, pai: str | None = None) -> int:
+        with self._transacao():
+            return self._inserir(tarefas, pai)
+
+    def lease(self, worker: str, n: int = 1, prazo: float = 300.0) -> list[Task]:
+        agora = time.time()
+        with self._transacao():
+            # Concessões vencidas voltam para a fila.
+            self._conn.execute(
+                "UPDATE tarefas SET estado = 'pendente' WHERE estado = 'em_execucao' AND lease_ate < ?", (agora,)
+            )
+            linhas = self._conn.execute(
+                "SELECT id, endpoint, params, pai, tentativas FROM tarefas"
+                " WHERE estado = 'pendente' AND disponivel_em <= ? ORDER BY disponivel_em LIMIT ?",
+                (agora, n),
+            ).fetchall()
+            tarefas = []
+            for id, endpoint, params, pai, tentativas in linhas:
+                token = _token()
+                self._conn.execute(
+                    "UPDATE tarefas SET estado = 'em_execucao', lease_ate = ?, worker = ?, token = ? WHERE id = ?",
+                    (agora + prazo, worker, token, id),
+                )
+                tarefas.append(Task(id, endpoint, json.loads(params), pai, 'em_execucao', tentativas, token))
+        return tarefas
+
+    def complete(self, tarefa: Task, filhas: Filhas = ()) -> bool:
+        with self._transacao():
+            cursor = self._conn.execute(
+                "UPDATE tarefas SET estado = 'concluida', concluido_em = ?, lease_ate = NULL"
+                " WHERE id = ? AND token = ? AND estado IN ('em_execucao', 'pendente')",
+                (time.time(), tarefa.id, tarefa.token),
+            )
+            if cursor.rowcount != 1:
+                return False
+            self._inserir(filhas, tarefa.id)
+        return True
+
+    def fail(self, tarefa: Task, erro: str) -> bool:
+        with self._transacao():
+            linha = self._conn.execute(
+                "SELECT tentativas FROM tarefas WHERE id = ? AND token = ? AND estado IN ('em_execucao', 'pendente')",
+                (tarefa.id, tarefa.token),
+            ).fetchone()
+            if linha is None:
+                return False
+            tentativas = linha[0] + 1
+            estado = 'falhou' if tentativas >= self.max_tentativas else 'pendente'
+            self._conn.execute(
+                'UPDATE tarefas SET estado = ?, tentativas = ?, erro = ?, disponivel_em = ?, lease_ate = NULL,'
+                ' token = NULL WHERE id = ?',
+                (estado, tentativas, erro, time.time() + self._espera(tentativas), tarefa.id),
+            )
+        return True
+
+    def get(self, id: str) -> Task | None:
+        with self._lock:
+            linha = self._conn.execute(
+                'SELECT id, endpoint, params, pai, estado, tentativas, token, erro FROM tarefas WHERE id = ?', (id,)
+            ).fetchone()
+        if linha is None:
+            return None
+        id, endpoint, params, *resto = linha
+        return Task(id, endpoint, json.loads(params), *resto)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return dict(self._conn.execute('SELECT estado, count(*) FROM tarefas GROUP BY estado').fetchall())
+
+
+def _texto(valor: Any) -> str | None:
+    # O redis-py devolve bytes, a menos que o cliente use `decode_responses=True`.
+    return valor.decode() if isinstance(valor, bytes) else valor
+
+
+class RedisQueue(WorkQueue):
+    """Fila em um servidor compatível com Redis, compartilhada por várias máquinas.
+
+    `push`, `complete` e `fail` são transações otimistas (`WATCH` e
+    `MULTI`/`EXEC`, via `Redis.transaction`): as leituras que decidem a
+    operação (tarefas já conhecidas, token da concessão) são observadas, e
+    as gravações saem juntas no `EXEC` ou são refeitas se outra conexão
+    alterou o que foi lido. Um worker que morre no meio não deixa tarefa
+    registrada sem dados nem conclusão sem as filhas. A concessão e a
+    devolução de concessões vencidas também são transações por tarefa: a
+    tarefa passa de um conjunto ao outro sem ficar fora de ambos.
+    """
+
+    def __init__(self, redis: Any, prefixo: str = 'pybr-dados:crawl', max_tentativas: int = 5, backoff: float = 5.0):
+        """Inicializa a fila.
+
+        Argumentos:
+            redis (Any): Cliente com a API do `redis-py` (ex.: `redis.Redis(host=...)`).
+            prefixo (str, optional): Prefixo das chaves. Padrão:  'pybr-dados:crawl'.
+            max_tentativas (int, optional): Tentativas antes de a tarefa ser dada como falha. Padrão:  5.
+            backoff (float, optional): Espera, em segundos, antes da segunda tentativa. Padrão:  5.0.
+        """
+        super().__init__(max_tentativas, backoff)
+        self.redis = redis
+        self.prefixo = prefixo
+
+    def _chave(self, nome: str) -> str:
+        return f'{self.prefixo}:{nome}'
+
+    def _tarefa(self, id: str) -> str:
+        return f'{self.prefixo}:tarefa:{id}'
+
+    def _novas(self, pipe: Any, tarefas: list[tuple[str, dict]]) -> dict[str, tuple[str, dict]]:
+        # Leitura dentro do WATCH: id -> (endpoint, params) das tarefas ainda não conhecidas.
+        ids = {task_key(endpoint, params): (endpoint, params) for endpoint, params in tarefas}
+        if not ids:
+            return {}
+        conhecidas = pipe.smismember(self._chave('chaves'), list(ids))
+        return {id: tarefa for (id, tarefa), conhecida in zip(ids.items(), conhecidas) if not conhecida}
+
+    def _gravar(self, pipe: Any, novas: dict[str, tuple[str, dict]], pai: str | None) -> None:
+        # Enfileirada no MULTI, depois de `_novas`.
+        if not novas:
+            return
+        pipe.sadd(self._chave('chaves'), *novas)
+        for id, (endpoint, params) in novas.items():
+            pipe.hset(self._tarefa(id), mapping={
+                'endpoint': endpoint,
+                'params': json.dumps(params or {}, default=str),
+                'pai': pai or '',
+                'estado': 'pendente',
+                'tentativas': 0,
+            })
+        agora = time.time()
+        pipe.zadd(self._chave('pendentes'), {id: agora for id in novas})
+
+    def push(self, tarefas: Filhas, pai: str | None = None) -> int:
+        tarefas = list(tarefas)
+        if not tarefas:
+            return 0
+
+        def transacao(pipe: Any) -> int:
+            novas = self._novas(pipe, tarefas)
+            pipe.multi()
+            self._gravar(pipe, novas, pai)
+            return len(novas)
+
+        return self.redis.transaction(transacao, self._chave('chaves'), value_from_callable=True)
+
+    def _devolver(self, id: str, agora: float) -> None:
+        # Concessão vencida volta para a fila. Toda mudança de conjunto de uma
+        # tarefa grava também o seu hash: observá-lo basta para a transação.
+        chave = self._tarefa(id)
+
+        def transacao(pipe: Any) -> None:
+            vence = pipe.zscore(self._chave('concedidas'), id)
+            if vence is None or vence > agora:
+                return  # concluída, devolvida ou renovada por outro worker
+            pipe.multi()
+            pipe.zrem(self._chave('concedidas'), id)
+            pipe.hset(chave, 'estado', 'pendente')
+            pipe.zadd(self._chave('pendentes'), {id: agora})
+
+        self.redis.transaction(transacao, chave)
+
+    def _conceder(self, id: str, worker: str, agora: float, prazo: float) -> Task | None:
+        chave = self._tarefa(id)
+
+        def transacao(pipe: Any) -> Task | None:
+            disponivel = pipe.zscore(self._chave('pendentes'), id)
+            if disponivel is None or disponivel > agora:
+                return None  # levada por outro worker
+            if pipe.sismember(self._chave('concluidas'), id):
+                pipe.multi()
+                pipe.zrem(self._chave('pendentes'), id)
+                return None
+            tarefa = self._de_campos(id, pipe.hgetall(chave))
+            tarefa.estado, tarefa.token = 'em_execucao', _token()
+            pipe.multi()
+            pipe.zrem(self._chave('pendentes'), id)
+            pipe.hset(chave, mapping={'estado': 'em_execucao', 'token': tarefa.token, 'worker': worker})
+            pipe.zadd(self._chave('concedidas'), {id: agora + prazo})
+            return tarefa
+
+        return self.redis.transaction(transacao, chave, value_from_callable=True)
+
+    def lease(self, worker: str, n: int = 1, prazo: float = 300.0) -> list[Task]:
+        agora = time.time()
+        for id in self.redis.zrangebyscore(self._chave('concedidas'), '-inf', agora):
+            self._devolver(_texto(id), agora)
+        tarefas = []
+        candidatas = self.redis.zrangebyscore(self._chave('pendentes'), '-inf', agora, start=0, num=n * 2)
+        for id in candidatas:
+            if len(tarefas) == n:
+                break
+            tarefa = self._conceder(_texto(id), worker, agora, prazo)
+            if tarefa is not None:
+                tarefas.append(tarefa)
+        return tarefas
+
+    def complete(self, tarefa: Task, filhas: Filhas = ()) -> bool:
+        filhas = list(filhas)
+        chave = self._tarefa(tarefa.id)
+
+        def transacao(pipe: Any) -> bool:
+            if _texto(pipe.hget(chave, 'token')) != tarefa.token or pipe.sismember(self._chave('concluidas'), tarefa.id):
+                return False
+            novas = self._novas(pipe, filhas)
+            pipe.multi()
+            pipe.sadd(self._chave('concluidas'), tarefa.id)
+            pipe.zrem(self._chave('concedidas'), tarefa.id)
+            pipe.zrem(self._chave('pendentes'), tarefa.id)
+            pipe.hset(chave, 'estado', 'concluida')
+            self._gravar(pipe, novas, tarefa.id)
+            return True
+
+        observadas = (chave, self._chave('concluidas'), self._chave('chaves')) if filhas else (chave, self._chave('concluidas'))
+        return self.redis.transaction(transacao, *observadas, value_from_callable=True)
+
+    def fail(self, tarefa: Task, erro: str) -> bool:
+        chave = self._tarefa(tarefa.id)
+
+        def transacao(pipe: Any) -> bool:
+            token, estado, tentativas = (_texto(v) for v in pipe.hmget(chave, 'token', 'estado', 'tentativas'))
+            if token != tarefa.token or estado != 'em_execucao':
+                return False
+            tentativas = int(tentativas or 0) + 1
+            pipe.multi()
+            pipe.zrem(self._chave('concedidas'), tarefa.id)
+            if tentativas >= self.max_tentativas:
+                pipe.hset(chave, mapping={'estado': 'falhou', 'tentativas': tentativas, 'erro': erro, 'token': ''})
+                pipe.sadd(self._chave('falhas'), tarefa.id)
+            else:
+                pipe.hset(chave, mapping={'estado': 'pendente', 'tentativas': tentativas, 'erro': erro, 'token': ''})
+                pipe.zadd(self._chave('pendentes'), {tarefa.id: time.time() + self._espera(tentativas)})
+            return True
+
+        return self.redis.transaction(transacao, chave, value_from_callable=True)
+
+    def get(self, id: str) -> Task | None:
+        return self._de_campos(id, self.redis.hgetall(self._tarefa(id)))
+
+    @staticmethod
+    def _de_campos(id: str, campos: dict) -> Task | None:
+        campos = {_texto(k): _texto(v) for k, v in campos.items()}
+        if not campos:
+            return None
+        return Task(
+            id, campos['endpoint'], json.loads(campos['params']), campos.get('pai') or None, campos['estado'],
+            int(campos.get('tentativas') or 0), campos.get('token') or None, campos.get('erro') or None,
+        )
+
+    def stats(self) -> dict[str, int]:
+        estados = {
+            'pendente': self.redis.zcard(self._chave('pendentes')),
+            'em_execucao': self.redis.zcard(self._chave('concedidas')),
+            'concluida': self.redis.scard(self._chave('concluidas')),
+            'falhou': self.redis.scard(self._chave('falhas')),
+        }
+        return {estado: n for estado, n in estados.items() if n}
+
+
+def method_handler(metodo: Callable[..., Any], filhas: Callable[[dict, dict], Filhas] | None = None) -> Handler:
+    """Handler que chama um método de cliente com os parâmetros da tarefa.
+
+    Argumentos:
+        metodo (Callable[..., Any]): Método do cliente; recebe os parâmetros como argumentos nomeados.
+        filhas (Callable[[dict, dict], Filhas] | None, optional): Recebe `(params, linha)` e devolve as tarefas
+            filhas derivadas de cada linha retornada. Padrão:  None.
+
+    Retorno:
+        Handler: Função `params -> (resultado, filhas)`.
+    """
+    def handler(params: dict) -> tuple[Any, list[tuple[str, dict]]]:
+        resultado = metodo(**params)
+        if filhas is None:
+            return resultado, []
+        return resultado, [filha for linha in iter_rows(resultado) for filha in filhas(params, linha)]
+
+    return handler
+
+
+class Worker:
+    """Executa tarefas da fila com os handlers de cada endpoint."""
+
+    def __init__(
+        self,
+        fila: WorkQueue,
+        handlers: dict[str, Handler],
+        *,
+        nome: str | None = None,
+        lote: int = 1,
+        prazo: float = 300.0,
+        sink: Callable[[Task, Any], None] | None = None,
+    ):
+        """Inicializa o worker.
+
+        Argumentos:
+            fila (WorkQueue): A fila.
+            handlers (dict[str, Handler]): Endpoint -> handler.
+            nome (str | None, optional): Nome do worker nas concessões. Padrão:  None (host e pid).
+            lote (int, optional): Tarefas concedidas por vez. Padrão:  1.
+            prazo (float, optional): Prazo da concessão, em segundos; deve exceder a duração de uma tarefa. Padrão:  300.
+            sink (Callable[[Task, Any], None] | None, optional): Recebe o resultado de cada tarefa antes da conclusão.
+                Se o worker morrer entre o sink e a conclusão, a tarefa é refeita: o sink deve ser idempotente
+                (ex.: `Warehouse.write_partition`). Padrão:  None.
+        """
+        self.fila = fila
+        self.handlers = handlers
+        self.nome = nome or f'{os.uname().nodename}:{os.getpid()}:{threading.get_ident()}'
+        self.lote = lote
+        self.prazo = prazo
+        self.sink = sink
+        self.contagem = {'concluidas': 0, 'falhas': 0, 'descartadas': 0}
+        self._lock = threading.Lock()
+
+    def _contar(self, nome: str) -> None:
+        with self._lock:
+            self.contagem[nome] += 1
+
+    def execute(self, tarefa: Task) -> None:
+        """Executa uma tarefa concedida e registra a conclusão ou a falha."""
+        handler = self.handlers.get(tarefa.endpoint)
+        try:
+            if handler is None:
+                raise KeyError(f'Sem handler para {tarefa.endpoint!r}')
+            resultado, filhas = handler(tarefa.params)
+            if self.sink is not None:
+                self.sink(tarefa, resultado)
+        except Exception as e:
+            self.fila.fail(tarefa, f'{type(e).__name__}: {e}')
+            self._contar('falhas')
+            return
+        # Concessão perdida: outro worker já refez (ou concluiu) a tarefa.
+        self._contar('concluidas' if self.fila.complete(tarefa, filhas) else 'descartadas')
+
+    def run(self, *, max_tarefas: int | None = None, parar_quando_vazia: bool = True, espera: float = 1.0, threads: int = 1) -> dict[str, int]:
+        """Pega e executa tarefas até a fila esvaziar (ou até `max_tarefas`).
+
+        Argumentos:
+            max_tarefas (int | None, optional): Máximo de tarefas executadas. Padrão:  None.
+            parar_quando_vazia (bool, optional): Termina quando não há tarefas pendentes nem em execução. Padrão:  True.
+            espera (float, optional): Segundos entre consultas quando não há tarefa disponível. Padrão:  1.0.
+            threads (int, optional): Threads executando tarefas neste processo. Padrão:  1.
+
+        Retorno:
+            dict[str, int]: Tarefas concluídas, com falha e descartadas (concessão perdida).
+        """
+        executadas = 0
+
+        def laco(indice: int) -> None:
+            nonlocal executadas
+            nome = self.nome if threads == 1 else f'{self.nome}#{indice}'
+            while True:
+                with self._lock:
+                    if max_tarefas is not None and executadas >= max_tarefas:
+                        return
+                    n = self.lote if max_tarefas is None else min(self.lote, max_tarefas - executadas)
+                    executadas += n  # reserva; devolvido abaixo se vierem menos tarefas
+                tarefas = self.fila.lease(nome, n, self.prazo)
+                with self._lock:
+                    executadas -= n - len(tarefas)
+                if not tarefas:
+                    if parar_quando_vazia and self.fila.drained():
+                        return
+                    time.sleep(espera)
+                    continue
+                for tarefa in tarefas:
+                    self.execute(tarefa)
+
+        if threads == 1:
+            laco(0)
+        else:
+            grupo = [threading.Thread(target=laco, args=(i,), name=f'pybr-dados-worker-{i}') for i in range(threads)]
+            for thread in grupo:
+                thread.start()
+            for thread in grupo:
+                thread.join()
+        return dict(self.contagem)
@@ -11,6 +11,14 @@ from .helpers import (
     Situacao,
     TipoVinculo
 )
+from .cdc import SNAPSHOTS, Change, SnapshotSpec, SnapshotWatcher
+from .crawl import crawl_handlers, seed_tasks
+from .concessoes import AtoConcessao, SupridosRelacional
+from .entities import EntityIndex, EntityRef, normalize_documento
+from .planner import LocalPlanner
+from .relations import RELATIONS, Relation, join_relation
+from .search import SearchHit, TextIndex
+from .warehouse import DATASETS, DatasetSpec, SyncResult, Warehouse
 
 
 senadores = SenadoresSenadoClient()
@@ -28,5 +36,26 @@ __all__ = [
     'TipoContratacao',
     'TipoRetorno',
     'Situacao',
-    'TipoVinculo'
+    'TipoVinculo',
+    'SNAPSHOTS',
+    'Change',
+    'SnapshotSpec',
+    'SnapshotWatcher',
+    'crawl_handlers',
+    'seed_tasks',
+    'AtoConcessao',
+    'SupridosRelacional',
+    'DATASETS',
+    'DatasetSpec',
+    'EntityIndex',
+    'EntityRef',
+    'normalize_documento',
+    'LocalPlanner',
+    'RELATIONS',
+    'Relation',
+    'join_relation',
+    'SearchHit',
+    'TextIndex',
+    'SyncResult',
+    'Warehouse',
 ]
\ No newline at end of file
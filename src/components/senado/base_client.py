@@ -1,42 +1,147 @@
 """Cliente base da API do Senado."""
 
+import time
+from typing import TYPE_CHECKING
+from urllib.parse import urlsplit
+
 import requests
+from ..core.columnar import Table
+from ..core.compression import wire_size
+from ..core.csv_decoder import decode_csv
+from ..core.format_selector import FormatSelector, default_format_selector
+from ..core.json_decoders import decode_json
+from ..core.lazy import LazyRows
+from ..core.normalize import normalize_csv_columns, normalize_json_records
+from ..core.rawstore import response_body
+from ..core.records import decode_json_records
+from ..core.transport import Transport, default_transport
 from .exceptions import SenadoApiError
+from .helpers import TipoRetorno
+from .models import record_factory
+from .schemas import CSV_SCHEMAS
+
+if TYPE_CHECKING:
+    from ..core.parallel import ParsePool
+    from .planner import LocalPlanner
 
 
 class SenadoBaseClient:
     """Cliente base da API do Senado."""
 
+    _transport: Transport = default_transport
+    _format_selector: FormatSelector = default_format_selector
+    json_backend: str | None = None  # None usa o backend JSON padrão global
+    planner: 'LocalPlanner | None' = None  # responde chamadas JSON filtradas pelo banco local
+    parse_pool: 'ParsePool | None' = None  # decodifica payloads grandes em vários processos
+    timeout: float | None = 10  # segundos por chamada; None usa o do transporte. Prazos por operação: `deadline`
+
     def __init__(self, base_url: str):
         """Inicializa o cliente com a URL base da API do Senado."""
         self._base_url = base_url
 
-    def _get(self, endpoint: str, params: dict = None) -> list | str:
-        """Faz uma requisição GET para a API do Senado.
+    def _endpoint_key(self, endpoint: str) -> str:
+        """Identifica o endpoint independentemente de ids, períodos e formato.
+
+        Exemplo: `servidores/remuneracoes/2024/1/csv` -> `servidores/remuneracoes`.
+        """
+        caminho = urlsplit(f'{self._base_url}/{endpoint}').path.split('/api/v1/', 1)[-1]
+        return '/'.join(p for p in caminho.split('/') if p and not p.isdigit() and p != 'csv')
+
+    def _request(self, endpoint: str, params: dict = None, headers: dict | None = None) -> requests.Response:
+        """Faz a requisição GET e verifica erros.
 
         Argumentos:
             endpoint (str): O endpoint da API a ser chamado.
             params (dict, optional): Parâmetros a serem enviados na requisição. Padrão:  None.
+            headers (dict | None, optional): Cabeçalhos adicionais (ex.: `If-None-Match`). Padrão:  None.
 
         Retorno:
-            list | str: A resposta da API ou um erro.
+            requests.Response: A resposta da requisição.
         """
         url = f'{self._base_url}/{endpoint}'
-        response = requests.get(
-            url, params=params, timeout=10, allow_redirects=False
-        )  # TODO : Tornar timeout configurável
+        kwargs = {} if self.timeout is None else {'timeout': self.timeout}
+        response = self._transport.get(url, params=params, allow_redirects=False, headers=headers, **kwargs)
 
         self._handle_error(response)
+        return response
+
+    def _get(self, endpoint: str, params: dict = None, tipo_retorno: TipoRetorno | None = None) -> list | str | dict:
+        """Faz uma requisição GET para a API do Senado.
+
+        Com um `planner` configurado, chamadas JSON são respondidas pelo banco
+        local sempre que a cópia do conjunto de dados está atualizada.
+
+        Argumentos:
+            endpoint (str): O endpoint da API a ser chamado.
+            params (dict, optional): Parâmetros a serem enviados na requisição. Padrão:  None.
+            tipo_retorno (TipoRetorno | None, optional): Tipo de retorno desejado. Define o sufixo `/csv`
+                do endpoint e a decodificação da resposta. Padrão:  None (decodifica pelo Content-Type).
+
+        Retorno:
+            list | str | dict: A resposta da API ou um erro.
+        """
+        if tipo_retorno is not None:
+            tipo_retorno = TipoRetorno(tipo_retorno)  # aceita também a string ('csv', 'json'...)
+        if tipo_retorno == TipoRetorno.AUTO:
+            return self._get_auto(endpoint, params)
+        if self.planner is not None and tipo_retorno in (None, TipoRetorno.JSON):
+            registros = self.planner.answer(self._endpoint_key(endpoint), params)
+            if registros is not None:
+                return registros
+        if tipo_retorno is not None and tipo_retorno.formato == 'csv' and not endpoint.endswith('.csv'):
+            endpoint += '/csv'
+        response = self._request(endpoint, params)
 
         if (
             'text/csv' in response.headers.get('Content-Type', '') 
             or '.csv' in response.headers.get('content-disposition', '')
         ):
+            if tipo_retorno == TipoRetorno.CSV_TIPADO:
+                return self._decode_csv(response.text, CSV_SCHEMAS.get(self._endpoint_key(endpoint)))
+            elif tipo_retorno == TipoRetorno.COLUNAS:
+                return Table(self._decode_csv(response.text, CSV_SCHEMAS.get(self._endpoint_key(endpoint))))
             return response.text
         elif 'application/json' in response.headers.get('Content-Type', ''):
-            return response.json()
+            if tipo_retorno == TipoRetorno.REGISTROS:
+                return decode_json_records(response.content, record_factory(self._endpoint_key(endpoint)))
+            elif tipo_retorno == TipoRetorno.VISOES:
+                return LazyRows(response_body(response), self.json_backend)
+            if self.parse_pool is not None:
+                return self.parse_pool.decode_json(response_body(response), self.json_backend)
+            return decode_json(response_body(response), self.json_backend)
         return response.text
 
+    def _decode_csv(self, texto: str, schema: dict | None) -> dict[str, list]:
+        """Decodifica o CSV em colunas tipadas, pelo `parse_pool` quando configurado."""
+        if self.parse_pool is not None:
+            return self.parse_pool.decode_csv(texto, schema)
+        return decode_csv(texto, schema)
+
+    def _get_auto(self, endpoint: str, params: dict = None) -> list[dict]:
+        """Obtém o endpoint no formato de menor custo medido e retorna registros normalizados.
+
+        Argumentos:
+            endpoint (str): O endpoint da API a ser chamado, sem o sufixo `/csv`.
+            params (dict, optional): Parâmetros a serem enviados na requisição. Padrão:  None.
+
+        Retorno:
+            list[dict]: Registros normalizados, iguais para os dois formatos.
+        """
+        chave = self._endpoint_key(endpoint)
+        formato = self._format_selector.choose(chave)
+        response = self._request(f'{endpoint}/csv' if formato == 'csv' else endpoint, params)
+
+        inicio = time.perf_counter()
+        if formato == 'csv':
+            colunas = decode_csv(response.text, CSV_SCHEMAS.get(chave), use_numpy=False)
+            registros = normalize_csv_columns(colunas)
+        else:
+            registros = normalize_json_records(decode_json(response_body(response), self.json_backend))
+        decode_seconds = time.perf_counter() - inicio
+
+        self._format_selector.record(chave, formato, wire_size(response) or len(response.content), decode_seconds)
+        return registros
+
     def _handle_error(self, response: requests.Response) -> None:
         """Lida com erros da API do Senado.
 
@@ -0,0 +1,280 @@
+"""Captura de mudanças em endpoints que retornam o estado atual (retratos).
+
+O `SnapshotWatcher` consulta periodicamente cada endpoint com requisições
+condicionais (`If-None-Match`) e compara o retrato recebido com o anterior
+pela impressão digital de cada linha, um hash estável do registro. Apenas as
+linhas inseridas, alteradas e removidas são entregues, como `Change`, às
+funções de retorno e/ou a uma fila.
+
+Endpoints com chave (ex.: `id`) distinguem alterações de inserções; nos
+demais a linha é identificada pelo próprio conteúdo, e uma alteração aparece
+como remoção seguida de inserção.
+
+O novo retrato só substitui o anterior (e só é gravado em `estado`) depois
+que as mudanças foram entregues: se um retorno ou a fila falhar, as mesmas
+mudanças são entregues de novo na consulta seguinte.
+"""
+
+import hashlib
+import json
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Literal
+
+import requests
+
+from ..core.json_decoders import decode_json
+from .clients.dados_abertos.dados_abertos import SenadoDadosAbertosClient
+from .exceptions import SenadoApiError
+
+
+@dataclass(frozen=True)
+class SnapshotSpec:
+    """Endpoint de retrato observado pelo `SnapshotWatcher`."""
+
+    nome: str
+    caminho: str  # relativo a /api/v1
+    chave: tuple[str, ...] = ()  # campos que identificam a linha; vazio usa o conteúdo
+    params: tuple[tuple[str, Any], ...] = ()
+    intervalo: float | None = None  # segundos entre consultas; None usa o do watcher
+
+
+SNAPSHOTS: dict[str, SnapshotSpec] = {spec.nome: spec for spec in (
+    SnapshotSpec('terceirizados', 'contratacoes/terceirizados', ('id',)),
+    SnapshotSpec('menores_aprendizes', 'contratacoes/menores_aprendizes', ('id',)),
+    SnapshotSpec('servidores_ativos', 'servidores/servidores/ativos', ('id',)),
+    SnapshotSpec('estagiarios', 'servidores/estagiarios'),
+    SnapshotSpec('auxilio_moradia', 'senadores/auxilio-moradia'),
+)}
+
+
+@dataclass
+class Change:
+    """Mudança em uma linha de um retrato."""
+
+    dataset: str
+    tipo: Literal['insert', 'update', 'delete']
+    chave: str
+    registro: dict | None  # None nas remoções
+    anterior: dict | None = None  # None nas inserções
+
+
+def row_fingerprint(registro: dict) -> str:
+    """Hash estável do registro, independente da ordem dos campos."""
+    conteudo = json.dumps(registro, sort_keys=True, ensure_ascii=False, separators=(',', ':'), default=str)
+    return hashlib.blake2b(conteudo.encode(), digest_size=16).hexdigest()
+
+
+def _linhas(spec: SnapshotSpec, registros: Iterable[dict]) -> dict[str, tuple[str, dict]]:
+    """Chave -> (impressão digital, registro)."""
+    linhas = {}
+    for registro in registros:
+        impressao = row_fingerprint(registro)
+        if spec.chave and all(registro.get(c) is not None for c in spec.chave):
+            chave = '|'.join(str(registro[c]) for c in spec.chave)
+        else:
+            chave = impressao
+        base, n = chave, 1
+        while chave in linhas:  # linhas repetidas são numeradas
+            n += 1
+            chave = f'{base}#{n}'
+        linhas[chave] = (impressao, registro)
+    return linhas
+
+
+def diff_snapshots(
+    dataset: str, anterior: dict[str, tuple[str, dict]], atual: dict[str, tuple[str, dict]]
+) -> list[Change]:
+    """Mudanças entre dois retratos indexados por chave.
+
+    Argumentos:
+        dataset (str): Nome do conjunto de dados.
+        anterior (dict[str, tuple[str, dict]]): Retrato anterior (chave -> impressão digital, registro).
+        atual (dict[str, tuple[str, dict]]): Retrato atual.
+
+    Retorno:
+        list[Change]: Inserções e alterações na ordem do retrato atual, seguidas das remoções.
+    """
+    mudancas = []
+    for chave, (impressao, registro) in atual.items():
+        antiga = anterior.get(chave)
+        if antiga is None:
+            mudancas.append(Change(dataset, 'insert', chave, registro))
+        elif antiga[0] != impressao:
+            mudancas.append(Change(dataset, 'update', chave, registro, antiga[1]))
+    for chave, (_, registro) in anterior.items():
+        if chave not in atual:
+            mudancas.append(Change(dataset, 'delete', chave, None, registro))
+    return mudancas
+
+
+class SnapshotWatcher:
+    """Observa endpoints de retrato e entrega apenas as linhas que mudaram."""
+
+    def __init__(
+        self,
+        snapshots: Iterable[str | SnapshotSpec] | None = None,
+        *,
+        intervalo: float = 300,
+        callbacks: Iterable[Callable[[Change], None]] = (),
+        fila: queue.Queue | None = None,
+        emitir_inicial: bool = False,
+        estado: str | None = None,
+        client: SenadoDadosAbertosClient | None = None,
+    ):
+        """Inicializa o observador.
+
+        Argumentos:
+            snapshots (Iterable[str | SnapshotSpec] | None, optional): Nomes em `SNAPSHOTS` ou especificações. Padrão:  None (todos).
+            intervalo (float, optional): Segundos entre consultas de cada endpoint. Padrão:  300.
+            callbacks (Iterable[Callable[[Change], None]], optional): Chamadas para cada mudança. Padrão:  ().
+            fila (queue.Queue | None, optional): Fila que recebe cada mudança. Padrão:  None.
+            emitir_inicial (bool, optional): Entregar as linhas do primeiro retrato como inserções. Padrão:  False.
+            estado (str | None, optional): Arquivo JSON onde os retratos são guardados entre execuções. Padrão:  None.
+            client (SenadoDadosAbertosClient | None, optional): Cliente usado nas requisições. Padrão:  None.
+        """
+        specs = SNAPSHOTS.values() if snapshots is None else snapshots
+        self.snapshots = {s.nome: s for s in (SNAPSHOTS[s] if isinstance(s, str) else s for s in specs)}
+        self.intervalo = intervalo
+        self.callbacks = list(callbacks)
+        self.fila = fila
+        self.emitir_inicial = emitir_inicial
+        self.estado = estado
+        self.client = client or SenadoDadosAbertosClient()
+        self.erros: dict[str, str] = {}
+        self._etags: dict[str, str | None] = {}
+        self._corpos: dict[str, str] = {}
+        self._retratos: dict[str, dict[str, tuple[str, dict]]] = {}
+        self._proximas: dict[str, float] = {}
+        self._parar = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._carregar()
+
+    def _carregar(self) -> None:
+        if not self.estado or not os.path.exists(self.estado):
+            return
+        with open(self.estado, 'rb') as arquivo:
+            salvo = decode_json(arquivo.read())
+        for nome, dados in salvo.items():
+            self._etags[nome] = dados.get('etag')
+            self._corpos[nome] = dados.get('corpo')
+            self._retratos[nome] = {chave: tuple(valor) for chave, valor in dados['linhas'].items()}
+
+    def _salvar(self) -> None:
+        if not self.estado:
+            return
+        salvo = {
+            nome: {'etag': self._etags.get(nome), 'corpo': self._corpos.get(nome), 'linhas': linhas}
+            for nome, linhas in self._retratos.items()
+        }
+        temporario = f'{self.estado}.tmp'
+        with open(temporario, 'w', encoding='utf-8') as arquivo:
+            json.dump(salvo, arquivo, ensure_ascii=False, default=str)
+        os.replace(temporario, self.estado)
+
+    def _emitir(self, mudancas: list[Change]) -> None:
+        for mudanca in mudancas:
+            for callback in self.callbacks:
+                callback(mudanca)
+            if self.fila is not None:
+                self.fila.put(mudanca)
+
+    def poll(self, nome: str) -> list[Change]:
+        """Consulta um endpoint e entrega as mudanças desde a consulta anterior.
+
+        Argumentos:
+            nome (str): Nome do retrato.
+
+        Retorno:
+            list[Change]: As mudanças entregues.
+
+        Raises:
+            SenadoApiError: Se a API retornar erro, um corpo vazio ou um JSON inválido.
+        """
+        spec = self.snapshots[nome]
+        etag = self._etags.get(nome)
+        headers = {'If-None-Match': etag} if etag and nome in self._retratos else None
+        response = self.client._request(spec.caminho, dict(spec.params) or None, headers=headers)
+        if response.status_code == 304:
+            return []
+        corpo = hashlib.sha1(response.content).hexdigest()
+        if nome in self._retratos and self._corpos.get(nome) == corpo:
+            return []
+
+        # Um corpo vazio não é um retrato vazio (isso seria `[]`): tomá-lo como tal removeria todas as linhas.
+        if not response.content.strip():
+            raise SenadoApiError(f'Retrato vazio recebido de {spec.caminho}.')
+        try:
+            documento = decode_json(response.content, self.client.json_backend)
+        except Exception as e:
+            raise SenadoApiError(f'Retrato inválido recebido de {spec.caminho}: {e}') from e
+        registros = documento.get('value', [documento]) if isinstance(documento, dict) else documento
+        atual = _linhas(spec, registros)
+        primeiro = nome not in self._retratos
+        mudancas = diff_snapshots(nome, self._retratos.get(nome, {}), atual)
+        if primeiro and not self.emitir_inicial:
+            mudancas = []
+        self._emitir(mudancas)
+        self._retratos[nome] = atual
+        self._etags[nome] = response.headers.get('ETag')
+        self._corpos[nome] = corpo
+        self._salvar()
+        return mudancas
+
+    def poll_all(self) -> list[Change]:
+        """Consulta todos os endpoints uma vez; falhas (da API, da rede ou da entrega) vão para `erros` sem interromper os demais."""
+        mudancas = []
+        for nome in self.snapshots:
+            mudancas += self._consultar(nome)
+        return mudancas
+
+    def _consultar(self, nome: str) -> list[Change]:
+        try:
+            mudancas = self.poll(nome)
+        except (SenadoApiError, requests.RequestException) as e:
+            self.erros[nome] = str(e)
+            return []
+        except Exception as e:
+            # Falha de um retorno ou da fila: o retrato não foi substituído e as
+            # mudanças voltam na próxima consulta; o laço de `run` continua.
+            self.erros[nome] = f'{type(e).__name__}: {e}'
+            return []
+        self.erros.pop(nome, None)
+        return mudancas
+
+    def run(self, iteracoes: int | None = None) -> None:
+        """Consulta os endpoints conforme seus intervalos até `stop` (ou até `iteracoes` consultas).
+
+        Argumentos:
+            iteracoes (int | None, optional): Número máximo de consultas. Padrão:  None (sem limite).
+        """
+        feitas = 0
+        agora = time.monotonic()
+        for nome in self.snapshots:
+            self._proximas.setdefault(nome, agora)
+        while not self._parar.is_set() and (iteracoes is None or feitas < iteracoes):
+            nome = min(self._proximas, key=self._proximas.get)
+            espera = self._proximas[nome] - time.monotonic()
+            if espera > 0 and self._parar.wait(espera):
+                break
+            self._consultar(nome)
+            feitas += 1
+            intervalo = self.snapshots[nome].intervalo or self.intervalo
+            self._proximas[nome] = time.monotonic() + intervalo
+
+    def start(self) -> 'SnapshotWatcher':
+        """Executa `run` em uma thread de fundo."""
+        self._parar.clear()
+        self._thread = threading.Thread(target=self.run, name='pybr-dados-cdc', daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self, timeout: float | None = None) -> None:
+        """Interrompe o laço de consultas e aguarda a thread de fundo."""
+        self._parar.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
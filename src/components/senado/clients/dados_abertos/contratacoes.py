@@ -33,9 +33,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             Union[list, str]: Lista de pagamentos da contratação do tipo especificado com id.
         """
         url = f'{tipo_contratacao}/{id_contratacao}/pagamentos'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def empenhos(
         self,
@@ -56,9 +54,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             dict | str: Emprenhos da contratação do tipo especificado com id.
         """
         url = f'{tipo_contratacao}/{id_contratacao}/pagamentos/{id_pagamento}/empenhos'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def documentos_fiscais(
         self,
@@ -79,9 +75,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             Union[list, str]: Documentos fiscais da contratação do tipo especificado com id.
         """
         url = f'{tipo_contratacao}/{id_contratacao}/pagamentos/{id_pagamento}/documentos_fiscais'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def itens(
         self,
@@ -100,9 +94,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             Union[list, str]: Lista de itens da contratação do tipo especificado com id.
         """
         url = f'{tipo_contratacao}/{id_contratacao}/itens'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def garantias(
         self,
@@ -121,9 +113,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             dict | str: Garantias da contratação do tipo especificado com id.
         """
         url = f'{tipo_contratacao}/{id_contratacao}/garantias'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def terceirizados(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> Union[list, str]:
         """Retornará todos os terceirizados ativos ou substitutos, no presente momento.
@@ -135,9 +125,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             dict | str: Lista de todos os terceirizados no presente momento.
         """
         url = 'terceirizados'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def notas_empenho(
         self,
@@ -174,9 +162,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
         }
 
         url = 'notas_empenho'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url, params)
+        return self._get(url, params, tipo_retorno)
 
     def menores_aprendizes(
         self,
@@ -191,9 +177,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             Union[list, str]: Lista de todos os menores aprendizes no presente momento.
         """
         url = 'menores_aprendizes'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def licitacoes(
         self,
@@ -223,9 +207,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             'aberturaRangeEnd': abertura_fim.strftime('%Y-%m-%d') if abertura_fim else None,
         }
         url = 'licitacoes'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url, params)
+        return self._get(url, params, tipo_retorno)
 
     def licitacao_detalhamentos(
         self,
@@ -247,10 +229,8 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
 
         if id_detalhamento:
             url += f'/{id_detalhamento}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
 
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def empresas(
         self,
@@ -283,9 +263,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             'pagina': pagina,
         }
         url = 'empresas'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url, params)
+        return self._get(url, params, tipo_retorno)
 
     def contratos(
         self,
@@ -331,9 +309,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
         }
 
         url = 'contratos'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url, params)
+        return self._get(url, params, tipo_retorno)
 
     def aditivos_contrato(
         self,
@@ -350,9 +326,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             Union[list, str]: Lista dos aditivos do contrato.
         """
         url = f'contratos/{id_contrato}/aditivos'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def contratos_terceirizados(
         self,
@@ -375,9 +349,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
         params = {
             'situacaoTerceirizadoParam': situacao_terceirizado
         }
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url, params)
+        return self._get(url, params, tipo_retorno)
 
     def atas_registro_preco(
         self,
@@ -416,9 +388,7 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             'obraEngenhariaEquals': obra_engenharia,
         }
         url = 'atas_registro_preco'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url, params)
+        return self._get(url, params, tipo_retorno)
 
     def ata_registro_preco_acionamentos(
         self,
@@ -435,6 +405,4 @@ class ContratacoesSenadoClient(SenadoDadosAbertosClient):
             Union[list, str]: _description_
         """
         url = f'atas_registro_preco/{id_arp}/acionamentos'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
@@ -23,9 +23,7 @@ class SenadoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista dos quantitativos e a distribuição por grupos de Senadores e ex-Senadores.
         """
         url = 'quantitativos/senadores'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def escritorios(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará lista de escritórios de apoio dos senadores.
@@ -37,9 +35,7 @@ class SenadoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de escritórios de apoio dos senadores.
         """
         url = 'escritorios'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def despesas_ceaps(self, ano: int, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retorna uma coleção de despesas CEAPS de todos os senadores do ano especificado.
@@ -52,9 +48,7 @@ class SenadoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Coleção de despesas CEAPS de todos os senadores do ano especificado.
         """
         url = f'despesas_ceaps/{ano}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def auxilio_moradia(
         self,
@@ -75,15 +69,13 @@ class SenadoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de parlamentares indicando se optaram por auxílio moradia e imóvel funcional.
         """
         url = 'auxilio-moradia'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
         params = {
             'nomeParlamentarContains': nome_parlamentar,
             'estadoEleitoEquals': estado_eleito,
             'partidoEleitoEquals': partido_eleito,
         }
 
-        return self._get(url, params=params)
+        return self._get(url, params=params, tipo_retorno=tipo_retorno)
 
     def aposentados(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará lista de senadores aposentados.
@@ -95,6 +87,4 @@ class SenadoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de senadores aposentados.
         """
         url = 'aposentados'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
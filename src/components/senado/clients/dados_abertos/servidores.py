@@ -38,9 +38,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             'lotacaoEquals': lotacao,
             'cargoEquals': cargo,
         }
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url, params)
+        return self._get(url, params, tipo_retorno)
 
     def servidores_inativos(self) -> list:
         """Retornará lista de servidores inativos.
@@ -90,9 +88,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de remunerações ou mensagem de erro.
         """
         url = f'remuneracoes/{ano}/{mes}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def quantitativos_pessoal(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Lista os quantitativos físicos de servidores efetivos, ativos, aposentados e pensionistas.
@@ -104,9 +100,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de quantitativos de servidores ou mensagem de erro.
         """
         url = 'quantitativos/pessoal'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def quantitativos_cargos_funcoes(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Lista os quantitativos de cargos em comissão e funções de confiança do Senado Federal.
@@ -118,9 +112,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de quantitativos de cargos ou mensagem de erro.
         """
         url = 'quantitativos/cargos-funcoes'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def previsao_aposentadoria(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará quantitativo previsto de aposentadorias, por cargo, ano e mês.
@@ -132,9 +124,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de quantitativos de aposentadorias ou mensagem de erro.
         """
         url = 'previsao-aposentadoria'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def pensionistas(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará lista de todos os pensionistas.
@@ -146,9 +136,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de pensionistas ou mensagem de erro.
         """
         url = 'pensionistas'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def pensionistas_remuneracoes(
         self, ano: int, mes: int, tipo_retorno: TipoRetorno = TipoRetorno.JSON
@@ -164,9 +152,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de remunerações ou mensagem de erro.
         """
         url = f'pensionistas/remuneracoes/{ano}/{mes}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def lotacoes(self) -> list | str:
         """Retornará lista de lotações.
@@ -189,9 +175,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de horas extras ou mensagem de erro.
         """
         url = f'horas-extras/{ano}/{mes}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def estagiarios(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará relação de estagiários.
@@ -203,9 +187,7 @@ class ServidoresSenadoClient(SenadoDadosAbertosClient):
             list | str: Relação de estagiários.
         """
         url = 'estagiarios'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def cargos(self) -> list:
         """Retornará lista de cargos.
@@ -2,7 +2,11 @@
 https://adm.senado.gov.br/adm-dadosabertos/swagger-ui/index.html?configUrl=/adm-dadosabertos/swagger-config.json#/Supridos
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
 from .dados_abertos import SenadoDadosAbertosClient
+from ...concessoes import SupridosRelacional, build_supridos
 from ...helpers import TipoRetorno
 
 
@@ -24,9 +28,7 @@ class SupridosSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de pessoas supridas.
         """
         url = f'{ano}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def transacoes(self, ano: int, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará lista de transações vinculadas a atos de concessão de um determinado ano.
@@ -39,9 +41,7 @@ class SupridosSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de transações.
         """
         url = f'transacoes/{ano}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def movimentacoes(self, ano: int, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará lista de movimentações vinculadas a atos de concessão de um determinado ano.
@@ -54,9 +54,7 @@ class SupridosSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de movimentações.
         """
         url = f'movimentacoes/{ano}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def empenhos(self, ano: int, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará lista de empenhos vinculados a atos de concessão de um determinado ano.
@@ -69,9 +67,7 @@ class SupridosSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista de empenhos.
         """
         url = f'empenhos/{ano}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
 
     def atos_concessao(self, ano: int, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> list | str:
         """Retornará lista dos Atos de concessão de um determinado ano.
@@ -84,6 +80,38 @@ class SupridosSenadoClient(SenadoDadosAbertosClient):
             list | str: Lista dos Atos de concessão.
         """
         url = f'atosConcessao/{ano}'
-        if tipo_retorno == TipoRetorno.CSV:
-            url += '/csv'
-        return self._get(url)
+        return self._get(url, tipo_retorno=tipo_retorno)
+
+    def relacional(self, anos: int | Iterable[int], max_workers: int = 10) -> SupridosRelacional:
+        """Retornará os atos de concessão dos anos, ligados às pessoas supridas, transações, movimentações e empenhos.
+
+        Os cinco endpoints de cada ano são baixados em paralelo.
+
+        Argumentos:
+            anos (int | Iterable[int]): Ano ou anos desejados.
+            max_workers (int, optional): Número máximo de requisições simultâneas. Padrão:  10.
+
+        Retorno:
+            SupridosRelacional: Atos indexados por número e por pessoa, com totais concedido, gasto e devolvido.
+        """
+        anos = [anos] if isinstance(anos, int) else list(anos)
+        metodos = {
+            'supridos': self.por_ano,
+            'atos_concessao': self.atos_concessao,
+            'transacoes': self.transacoes,
+            'movimentacoes': self.movimentacoes,
+            'empenhos': self.empenhos,
+        }
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futuros = {
+                (ano, nome): executor.submit(metodo, ano, TipoRetorno.JSON)
+                for ano in anos
+                for nome, metodo in metodos.items()
+            }
+            por_ano: dict[int, dict[str, list[dict]]] = {ano: {} for ano in anos}
+            for (ano, nome), futuro in futuros.items():
+                documento = futuro.result()
+                if isinstance(documento, dict):
+                    documento = documento.get('value', [documento])
+                por_ano[ano][nome] = documento if isinstance(documento, list) else []
+        return build_supridos(por_ano)
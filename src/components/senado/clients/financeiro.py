@@ -24,8 +24,10 @@ class FinanceiroSenadoClient(SenadoBaseClient):
             return self._get('DespesaSenadoDadosAbertos.json')
         elif tipo_retorno == TipoRetorno.CSV:
             return self._get('DespesaSenado.csv')
+        elif tipo_retorno == TipoRetorno.CSV_TIPADO:
+            return self._get('DespesaSenado.csv', tipo_retorno=tipo_retorno)
         else:
-            raise ValueError("Tipo de retorno inválido. Use 'json' ou 'csv'.")
+            raise ValueError("Tipo de retorno inválido. Use 'json', 'csv' ou 'csv_tipado'.")
 
     def receitas(self, tipo_retorno: TipoRetorno = TipoRetorno.JSON) -> dict:
         """Dados relativos à previsão e à arrecadação de receitas próprias pelo Senado Federal.
@@ -43,5 +45,7 @@ class FinanceiroSenadoClient(SenadoBaseClient):
             return self._get('ReceitasSenadoDadosAbertos.json')
         elif tipo_retorno == TipoRetorno.CSV:
             return self._get('ReceitasSenado.csv')
+        elif tipo_retorno == TipoRetorno.CSV_TIPADO:
+            return self._get('ReceitasSenado.csv', tipo_retorno=tipo_retorno)
         else:
-            raise ValueError("Tipo de retorno inválido. Use 'json' ou 'csv'.")
+            raise ValueError("Tipo de retorno inválido. Use 'json', 'csv' ou 'csv_tipado'.")
@@ -0,0 +1,147 @@
+"""Visão relacional dos dados de suprimento de fundos, ligados por ato de concessão.
+
+Os cinco endpoints anuais de supridos (pessoas supridas, atos de concessão,
+transações, movimentações e empenhos) são indexados pelo número do ato e
+pela pessoa suprida. Cada `AtoConcessao` reúne os registros ligados ao ato e
+os totais concedido, gasto e devolvido, calculados uma única vez.
+"""
+
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Iterable
+
+from ..core.normalize import parse_decimal
+
+_ATO = 'numeroAtoConcessao'
+_ENDPOINTS = ('supridos', 'atos_concessao', 'transacoes', 'movimentacoes', 'empenhos')
+
+
+def _decimal(valor: Any) -> Decimal:
+    numero = parse_decimal(valor)
+    return Decimal(0) if numero is None else numero
+
+
+def _soma(registros: Iterable[dict], campo: str) -> Decimal:
+    return sum((_decimal(r.get(campo)) for r in registros), Decimal(0))
+
+
+def _numero(registro: dict) -> str | None:
+    valor = registro.get(_ATO)
+    return None if valor is None or valor == '' else str(valor).strip()
+
+
+def _pessoa(registro: dict) -> str | None:
+    return registro.get('cpf') or registro.get('nome')
+
+
+@dataclass
+class AtoConcessao:
+    """Um ato de concessão e os registros ligados a ele."""
+
+    ano: int
+    numero: str
+    ato: dict | None = None  # registro de `atos_concessao`
+    supridos: list[dict] = field(default_factory=list)
+    transacoes: list[dict] = field(default_factory=list)
+    movimentacoes: list[dict] = field(default_factory=list)
+    empenhos: list[dict] = field(default_factory=list)
+    concedido: Decimal = Decimal(0)
+    gasto: Decimal = Decimal(0)
+    devolvido: Decimal = Decimal(0)
+
+    @property
+    def saldo(self) -> Decimal:
+        """Valor concedido ainda não gasto nem devolvido."""
+        return self.concedido - self.gasto - self.devolvido
+
+    def _totalizar(self) -> None:
+        # Os valores do próprio ato prevalecem; na falta deles, somam-se os registros ligados.
+        ato = self.ato or {}
+        self.concedido = (
+            _decimal(ato['valorConcedido']) if ato.get('valorConcedido') is not None
+            else _soma(self.supridos, 'valorConcedido')
+        )
+        self.gasto = (
+            _decimal(ato['valorUtilizado']) if ato.get('valorUtilizado') is not None
+            else _soma(self.transacoes, 'valor')
+        )
+        self.devolvido = (
+            _decimal(ato['valorDevolvido']) if ato.get('valorDevolvido') is not None
+            else _soma(self.movimentacoes, 'valorDevolvido')
+        )
+
+
+@dataclass
+class SupridosRelacional:
+    """Atos de concessão de um ou mais anos, indexados por ato e por pessoa suprida."""
+
+    atos: dict[tuple[int, str], AtoConcessao] = field(default_factory=dict)
+    pessoas: dict[str, list[AtoConcessao]] = field(default_factory=dict)
+    sem_ato: list[dict] = field(default_factory=list)  # registros sem número de ato
+
+    def ato(self, numero: str, ano: int | None = None) -> AtoConcessao | None:
+        """Ato pelo número; sem o ano, o primeiro encontrado.
+
+        Argumentos:
+            numero (str): Número do ato de concessão.
+            ano (int | None, optional): Ano do ato. Padrão:  None.
+
+        Retorno:
+            AtoConcessao | None: O ato.
+        """
+        numero = str(numero).strip()
+        if ano is not None:
+            return self.atos.get((ano, numero))
+        return next((ato for (_, n), ato in self.atos.items() if n == numero), None)
+
+    def pessoa(self, cpf_ou_nome: str) -> list[AtoConcessao]:
+        """Atos de concessão de uma pessoa suprida, pelo CPF (como publicado) ou nome."""
+        return self.pessoas.get(cpf_ou_nome, [])
+
+    def totais(self) -> dict[str, Decimal]:
+        """Totais concedido, gasto e devolvido de todos os atos."""
+        return {
+            'concedido': sum((a.concedido for a in self.atos.values()), Decimal(0)),
+            'gasto': sum((a.gasto for a in self.atos.values()), Decimal(0)),
+            'devolvido': sum((a.devolvido for a in self.atos.values()), Decimal(0)),
+        }
+
+    def __len__(self) -> int:
+        return len(self.atos)
+
+    def __iter__(self):
+        return iter(self.atos.values())
+
+
+def build_supridos(por_ano: dict[int, dict[str, list[dict]]]) -> SupridosRelacional:
+    """Liga os registros dos cinco endpoints de supridos por ato de concessão.
+
+    Argumentos:
+        por_ano (dict[int, dict[str, list[dict]]]): Registros por ano e por endpoint
+            (`supridos`, `atos_concessao`, `transacoes`, `movimentacoes`, `empenhos`).
+
+    Retorno:
+        SupridosRelacional: Os atos ligados e totalizados.
+    """
+    visao = SupridosRelacional()
+    for ano in sorted(por_ano):
+        registros = por_ano[ano]
+        for endpoint in _ENDPOINTS:
+            for registro in registros.get(endpoint) or ():
+                numero = _numero(registro)
+                if numero is None:
+                    visao.sem_ato.append(registro)
+                    continue
+                ato = visao.atos.get((ano, numero))
+                if ato is None:
+                    ato = visao.atos[(ano, numero)] = AtoConcessao(ano, numero)
+                if endpoint == 'atos_concessao':
+                    ato.ato = registro
+                else:
+                    getattr(ato, endpoint).append(registro)
+    for ato in visao.atos.values():
+        ato._totalizar()
+        pessoas = {_pessoa(r) for r in ([ato.ato] if ato.ato else []) + ato.supridos} - {None}
+        for pessoa in pessoas:
+            visao.pessoas.setdefault(pessoa, []).append(ato)
+    return visao
@@ -0,0 +1,74 @@
+"""Handlers da fila de coleta (`core.workqueue`) para as contratações do Senado.
+
+As listas de contratações geram uma tarefa de pagamentos por contratação, e
+cada pagamento gera as tarefas de empenhos e de documentos fiscais:
+
+    cliente = ContratacoesSenadoClient()
+    cliente._transport = Transport(adaptive=True)  # concorrência ajustada pelo servidor
+    fila = SQLiteQueue('crawl.db')
+    fila.push(seed_tasks())
+    Worker(fila, crawl_handlers(cliente), sink=gravar).run(threads=32)
+
+Os endpoints das tarefas seguem os identificadores de `RELATIONS`.
+"""
+
+from typing import Any, Iterable
+
+from ..core.workqueue import Handler, method_handler
+from .clients import ContratacoesSenadoClient
+from .helpers import TipoContratacao
+
+_LISTAS = {
+    'contratacoes/contratos': TipoContratacao.CONTRATOS,
+    'contratacoes/notas_empenho': TipoContratacao.NOTAS_EMPENHO,
+    'contratacoes/atas_registro_preco': TipoContratacao.ATAS_REGISTRO_PRECO,
+}
+
+
+def _pagamentos(tipo: TipoContratacao):
+    def filhas(params: dict, linha: dict) -> list[tuple[str, dict]]:
+        return [('contratacoes/pagamentos', {'tipo_contratacao': str(tipo), 'id_contratacao': linha['id']})]
+
+    return filhas
+
+
+def _detalhes_pagamento(params: dict, linha: dict) -> list[tuple[str, dict]]:
+    # Os registros de empenhos e documentos fiscais referenciam o `id` do pagamento.
+    filha = {**params, 'id_pagamento': linha['id']}
+    return [('contratacoes/empenhos', filha), ('contratacoes/documentos_fiscais', dict(filha))]
+
+
+def crawl_handlers(client: ContratacoesSenadoClient | None = None) -> dict[str, Handler]:
+    """Handlers das tarefas de contratações.
+
+    Argumentos:
+        client (ContratacoesSenadoClient | None, optional): Cliente usado nas chamadas. Padrão:  None (um novo).
+
+    Retorno:
+        dict[str, Handler]: Endpoint -> handler, para o `Worker`.
+    """
+    client = client or ContratacoesSenadoClient()
+    handlers = {
+        endpoint: method_handler(getattr(client, endpoint.split('/', 1)[1]), _pagamentos(tipo))
+        for endpoint, tipo in _LISTAS.items()
+    }
+    handlers['contratacoes/pagamentos'] = method_handler(client.pagamentos, _detalhes_pagamento)
+    handlers['contratacoes/empenhos'] = method_handler(client.empenhos)
+    handlers['contratacoes/documentos_fiscais'] = method_handler(client.documentos_fiscais)
+    return handlers
+
+
+def seed_tasks(endpoints: Iterable[str] = tuple(_LISTAS), **params: Any) -> list[tuple[str, dict]]:
+    """Tarefas iniciais da coleta: as listas de contratações.
+
+    Argumentos:
+        endpoints (Iterable[str], optional): Listas a coletar. Padrão:  contratos, notas de empenho e ARPs.
+        **params: Filtros repassados às listas (ex.: `ano=2024`).
+
+    Retorno:
+        list[tuple[str, dict]]: Tarefas `(endpoint, params)` para `WorkQueue.push`.
+    """
+    desconhecidos = set(endpoints) - set(_LISTAS)
+    if desconhecidos:
+        raise ValueError(f'Endpoints sem handler de lista: {sorted(desconhecidos)}')
+    return [(endpoint, dict(params)) for endpoint in endpoints]
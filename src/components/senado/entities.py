@@ -0,0 +1,182 @@
+"""Índice de pessoas e empresas por CPF/CNPJ sobre todos os conjuntos sincronizados.
+
+Cada valor de CPF ou CNPJ encontrado em uma coluna cujo nome contém `cpf`
+ou `cnpj` é normalizado para apenas dígitos e associado a uma referência
+compacta do registro: `(dataset, chave, campo)`. A tabela `_entidades` tem
+o documento como início da chave primária, de modo que o perfil completo de
+uma entidade sai de uma única busca por faixa no índice.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+from ..core.json_decoders import decode_json
+from .warehouse import DatasetSpec, Warehouse, _ident, _lotes
+
+_NAO_DIGITOS = re.compile(r'\D')
+_LOTE = 10_000
+
+
+def normalize_documento(valor: Any, campo: str = '') -> str | None:
+    """Normaliza um CPF (11 dígitos) ou CNPJ (14 dígitos) para apenas dígitos.
+
+    Valores mascarados ou incompletos retornam None. Números inteiros, que
+    perdem os zeros à esquerda, são completados conforme o nome do campo.
+
+    Argumentos:
+        valor (Any): CPF ou CNPJ, formatado ou não.
+        campo (str, optional): Nome do campo, usado para completar inteiros. Padrão:  ''.
+
+    Retorno:
+        str | None: O documento com 11 ou 14 dígitos.
+    """
+    if valor is None or isinstance(valor, bool):
+        return None
+    if isinstance(valor, int):
+        cpf, cnpj = 'cpf' in campo, 'cnpj' in campo
+        if cpf == cnpj:
+            return None
+        return str(valor).zfill(11 if cpf else 14)
+    if not isinstance(valor, str) or '*' in valor:
+        return None
+    digitos = _NAO_DIGITOS.sub('', valor)
+    return digitos if len(digitos) in (11, 14) else None
+
+
+def _campos_documento(colunas: Iterable[str]) -> list[str]:
+    return [c for c in colunas if not c.startswith('_') and ('cpf' in c or 'cnpj' in c)]
+
+
+@dataclass(frozen=True)
+class EntityRef:
+    """Referência a um registro que menciona o documento."""
+
+    dataset: str
+    chave: str
+    campo: str
+
+
+class EntityIndex:
+    """Índice CPF/CNPJ -> registros, mantido junto com o `Warehouse`."""
+
+    def __init__(self, warehouse: Warehouse):
+        """Cria o índice, indexa os registros já sincronizados e passa a acompanhar as gravações.
+
+        Argumentos:
+            warehouse (Warehouse): Banco local.
+        """
+        self.warehouse = warehouse
+        sem_rowid = ' WITHOUT ROWID' if warehouse.dialeto == 'sqlite' else ''
+        with warehouse._lock:
+            conn = warehouse._conn
+            novo = not warehouse.columns('_entidades')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS _entidades ('
+                'documento TEXT NOT NULL, dataset TEXT NOT NULL, chave TEXT NOT NULL, campo TEXT NOT NULL, '
+                f'PRIMARY KEY (documento, dataset, chave, campo)){sem_rowid}'
+            )
+            conn.execute('CREATE INDEX IF NOT EXISTS ix__entidades_registro ON _entidades (dataset, chave)')
+        if novo:
+            self.rebuild()
+        warehouse.add_listener(self._on_write)
+
+    def rebuild(self) -> int:
+        """Reconstrói o índice em uma passada por todas as tabelas sincronizadas.
+
+        As linhas são lidas em lotes pelo cursor, sem carregar tabelas inteiras.
+
+        Retorno:
+            int: Número de referências gravadas.
+        """
+        conn = self.warehouse._conn
+        total = 0
+        with self.warehouse._transacao():
+            conn.execute('DELETE FROM _entidades')
+            for dataset in self.warehouse.datasets:
+                campos = _campos_documento(self.warehouse.columns(dataset))
+                if not campos:
+                    continue
+                cursor = conn.execute(f'SELECT _chave, {", ".join(map(_ident, campos))} FROM {_ident(dataset)}')
+                while linhas := cursor.fetchmany(_LOTE):
+                    referencias = [
+                        (documento, dataset, linha[0], campo)
+                        for linha in linhas
+                        for campo, valor in zip(campos, linha[1:])
+                        if (documento := normalize_documento(valor, campo))
+                    ]
+                    self._inserir(referencias)
+                    total += len(referencias)
+        return total
+
+    def _inserir(self, referencias: list[tuple[str, str, str, str]]) -> None:
+        self.warehouse._conn.executemany(
+            'INSERT INTO _entidades (documento, dataset, chave, campo) VALUES (?, ?, ?, ?) ON CONFLICT DO NOTHING',
+            referencias,
+        )
+
+    def _on_write(self, spec: DatasetSpec, periodo: str, gravados: list[tuple[str, dict]], removidos: list[str]) -> None:
+        """Aplica as mudanças de uma gravação; chamado dentro da transação do `Warehouse`."""
+        conn = self.warehouse._conn
+        campos = _campos_documento(self.warehouse.columns(spec.nome))
+        novas = {
+            (documento, spec.nome, chave, campo)
+            for chave, registro in gravados
+            for campo in campos
+            if (documento := normalize_documento(registro.get(campo), campo))
+        }
+        # Só as referências dos registros gravados ou removidos (índice `ix__entidades_registro`).
+        atuais = set()
+        for lote in _lotes(list(dict.fromkeys([*(chave for chave, _ in gravados), *removidos]))):
+            cursor = conn.execute(
+                f'SELECT documento, chave, campo FROM _entidades WHERE dataset = ? AND chave IN ({", ".join("?" * len(lote))})',
+                [spec.nome, *lote],
+            )
+            atuais.update((documento, spec.nome, chave, campo) for documento, chave, campo in cursor)
+        conn.executemany(
+            'DELETE FROM _entidades WHERE documento = ? AND dataset = ? AND chave = ? AND campo = ?',
+            list(atuais - novas),
+        )
+        self._inserir(list(novas - atuais))
+
+    def references(self, documento: str) -> list[EntityRef]:
+        """Registros que mencionam o documento.
+
+        Argumentos:
+            documento (str): CPF ou CNPJ, formatado ou não.
+
+        Retorno:
+            list[EntityRef]: As referências, por conjunto de dados.
+        """
+        documento = normalize_documento(documento)
+        if documento is None:
+            return []
+        linhas = self.warehouse.query(
+            'SELECT dataset, chave, campo FROM _entidades WHERE documento = ? ORDER BY dataset, chave', [documento]
+        )
+        return [EntityRef(**linha) for linha in linhas]
+
+    def profile(self, documento: str) -> dict[str, list[dict]]:
+        """Perfil completo da entidade: os registros originais de cada conjunto de dados.
+
+        Argumentos:
+            documento (str): CPF ou CNPJ, formatado ou não.
+
+        Retorno:
+            dict[str, list[dict]]: Registros (como vieram da API) por conjunto de dados.
+        """
+        por_dataset: dict[str, list[str]] = {}
+        for ref in self.references(documento):
+            chaves = por_dataset.setdefault(ref.dataset, [])
+            if not chaves or chaves[-1] != ref.chave:
+                chaves.append(ref.chave)
+        perfil = {}
+        for dataset, chaves in por_dataset.items():
+            linhas = []
+            for lote in _lotes(list(dict.fromkeys(chaves))):
+                linhas += self.warehouse.query(
+                    f'SELECT rowid, _registro FROM {_ident(dataset)} WHERE _chave IN ({", ".join("?" * len(lote))})', lote,
+                )
+            linhas.sort(key=lambda linha: linha['rowid'])  # ordem de gravação, entre os lotes
+            perfil[dataset] = [decode_json(linha['_registro'].encode()) for linha in linhas if linha['_registro']]
+        return perfil
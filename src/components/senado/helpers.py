@@ -2,10 +2,31 @@ from enum import StrEnum
 
 
 class TipoRetorno(StrEnum):
-    """Representa o tipo de retorno da API."""
+    """Representa o tipo de retorno da API.
+
+    `CSV_TIPADO` transfere o CSV e o decodifica em colunas tipadas. `AUTO`
+    transfere o formato de menor custo medido para o endpoint (JSON ou CSV) e
+    retorna sempre os mesmos registros normalizados: chaves em snake_case,
+    datas como `date`, números como `int`/`float` e vazios como None.
+    `REGISTROS` retorna dataclasses compactas com `__slots__` e strings
+    categóricas internadas (ver `senado.models`). `COLUNAS` transfere o CSV
+    e retorna uma `core.Table`, com colunas tipadas exportáveis sem cópia
+    para Arrow, pandas e polars. `VISOES` mantém o JSON bruto e retorna um
+    `core.LazyRows`, cujas linhas decodificam cada campo só quando lido.
+    """
 
     JSON = "json"
     CSV = "csv"
+    CSV_TIPADO = "csv_tipado"
+    AUTO = "auto"
+    REGISTROS = "registros"
+    COLUNAS = "colunas"
+    VISOES = "visoes"
+
+    @property
+    def formato(self) -> str:
+        """Formato transferido pela API: 'json' ou 'csv'. `AUTO` é resolvido a cada chamada."""
+        return 'csv' if self in (TipoRetorno.CSV, TipoRetorno.CSV_TIPADO, TipoRetorno.COLUNAS) else 'json'
 
 
 class TipoVinculo(StrEnum):
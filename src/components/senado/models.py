@@ -0,0 +1,54 @@
+"""Registros compactos dos conjuntos de dados do Senado (ver `TipoRetorno.REGISTROS`)."""
+
+from functools import lru_cache
+
+from ..core.records import RecordFactory
+from .helpers import Situacao, TipoVinculo
+
+# Nome das classes de registro por endpoint; os demais usam o último segmento do caminho.
+RECORD_NAMES = {
+    'servidores/servidores': 'Servidor',
+    'servidores/remuneracoes': 'Remuneracao',
+    'servidores/pensionistas': 'Pensionista',
+    'servidores/pensionistas/remuneracoes': 'RemuneracaoPensionista',
+    'servidores/horas-extras': 'HoraExtra',
+    'servidores/estagiarios': 'Estagiario',
+    'senadores/despesas_ceaps': 'DespesaCeaps',
+    'senadores/auxilio-moradia': 'AuxilioMoradia',
+    'contratacoes/contratos': 'Contrato',
+    'contratacoes/notas_empenho': 'NotaEmpenho',
+    'contratacoes/atas_registro_preco': 'AtaRegistroPreco',
+    'contratacoes/empresas': 'Empresa',
+    'contratacoes/terceirizados': 'Terceirizado',
+    'contratacoes/licitacoes': 'Licitacao',
+}
+
+# Campos de baixa cardinalidade, repetidos em milhares de linhas.
+CATEGORICOS = (
+    'lotacao', 'cargo', 'funcao', 'vinculo', 'tipoVinculo', 'situacao', 'categoria', 'especialidade',
+    'padrao', 'classe', 'uf', 'siglaUf', 'estado', 'estadoEleito', 'partido', 'partidoEleito',
+    'status', 'tipoDespesa', 'tipoDocumento', 'tipoContratacao', 'modalidade', 'nomeSenador',
+)
+
+ENUMS = {
+    'tipoVinculo': TipoVinculo,
+    'vinculo': TipoVinculo,
+    'situacao': Situacao,
+}
+
+
+@lru_cache(maxsize=None)
+def record_factory(endpoint: str) -> RecordFactory:
+    """Fábrica de registros do endpoint, compartilhada por todos os clientes.
+
+    Argumentos:
+        endpoint (str): Identificador do endpoint (ex.: `servidores/remuneracoes`).
+
+    Retorno:
+        RecordFactory: A fábrica do endpoint.
+    """
+    nome = RECORD_NAMES.get(endpoint)
+    if nome is None:
+        ultimo = endpoint.rsplit('/', 1)[-1] or 'registro'
+        nome = ''.join(parte.capitalize() for parte in ultimo.replace('-', '_').split('_'))
+    return RecordFactory(nome, CATEGORICOS, ENUMS)
@@ -0,0 +1,142 @@
+"""Responde chamadas filtradas a partir do espelho local (ver `Warehouse`).
+
+Os parâmetros de filtro da API seguem o padrão `<campo><Operador>`:
+`nomeFornecedorContains`, `cnpjCpfEquals`, `aberturaRangeBegin`... Quando o
+conjunto de dados do endpoint foi sincronizado há menos de `max_age`
+segundos, o planejador traduz os parâmetros para uma consulta SQL sobre as
+colunas indexadas e devolve os registros exatamente como a API os
+devolveria (coluna `_registro`). Filtros desconhecidos, paginação, colunas
+ausentes ou cópia desatualizada fazem a chamada seguir para a API.
+
+Semântica dos operadores, igual à dos filtros do servidor:
+
+- `Equals` e parâmetros sem sufixo: igualdade exata;
+- `Contains`: substring, sem diferenciar maiúsculas de minúsculas;
+- `RangeBegin` / `RangeEnd`: limites inclusivos.
+"""
+
+import threading
+import time
+from datetime import date
+from typing import Any
+
+from ..core.json_decoders import decode_json
+from ..core.normalize import normalize_key
+from .warehouse import DatasetSpec, Warehouse, _ident
+
+_OPERADORES = (('RangeBegin', '>='), ('RangeEnd', '<='), ('Contains', 'contains'), ('Equals', '='))
+
+# Parâmetros cujo nome não corresponde ao campo filtrado.
+_CAMPOS = {
+    'statusContratoParam': 'status',
+    'situacaoTerceirizadoParam': 'situacaoTerceirizado',
+    'abertura': 'dataAbertura',
+}
+
+# Parâmetros que alteram a forma da resposta e não podem ser reproduzidos localmente.
+_NAO_FILTROS = frozenset({'pagina'})
+
+
+def _filtro(nome: str) -> tuple[str, str]:
+    if nome in _CAMPOS:
+        return _CAMPOS[nome], '='
+    for sufixo, operador in _OPERADORES:
+        if nome.endswith(sufixo) and len(nome) > len(sufixo):
+            return nome[: -len(sufixo)], operador
+    return nome, '='
+
+
+def _valor(valor: Any) -> Any:
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if isinstance(valor, str):
+        return str(valor)
+    return valor
+
+
+class LocalPlanner:
+    """Planejador que atende filtros pelo banco local e recorre à API quando necessário."""
+
+    def __init__(self, warehouse: Warehouse, max_age: float = 24 * 3600):
+        """Inicializa o planejador.
+
+        Argumentos:
+            warehouse (Warehouse): Banco local sincronizado.
+            max_age (float, optional): Idade máxima, em segundos, da última verificação da cópia local. Padrão:  86400.
+        """
+        self.warehouse = warehouse
+        self.max_age = max_age
+        self.local = 0
+        self.remoto = 0
+        self._lock = threading.Lock()
+
+    def _spec(self, endpoint: str) -> DatasetSpec | None:
+        for spec in self.warehouse.datasets.values():
+            if spec.periodicidade is None and spec.caminho == endpoint:
+                return spec
+        return None
+
+    def is_fresh(self, spec: DatasetSpec) -> bool:
+        """Indica se a cópia local do conjunto de dados foi verificada há menos de `max_age` segundos."""
+        estado = self.warehouse.state(spec.nome).get('')
+        return bool(estado) and time.time() - (estado['verificado_em'] or 0) < self.max_age
+
+    def plan(self, endpoint: str, params: dict | None) -> tuple[str, list] | None:
+        """Traduz a chamada em uma consulta ao banco local.
+
+        Argumentos:
+            endpoint (str): Identificador do endpoint (ex.: `contratacoes/contratos`).
+            params (dict | None): Parâmetros da chamada; valores None são ignorados, como na API.
+
+        Retorno:
+            tuple[str, list] | None: SQL e parâmetros, ou None se a chamada precisa ir à API.
+        """
+        spec = self._spec(endpoint)
+        if spec is None or not self.is_fresh(spec):
+            return None
+        colunas = self.warehouse.columns(spec.nome)
+        condicoes, argumentos = [], []
+        for nome, valor in (params or {}).items():
+            if valor is None:
+                continue
+            if nome in _NAO_FILTROS:
+                return None
+            campo, operador = _filtro(nome)
+            coluna = normalize_key(campo)
+            if coluna not in colunas:
+                return None
+            if operador == 'contains':
+                condicoes.append(self.warehouse.contains_sql(_ident(coluna)))
+            else:
+                condicoes.append(f'{_ident(coluna)} {operador} ?')
+            argumentos.append(_valor(valor))
+        where = ' AND '.join(condicoes) or '1 = 1'
+        return f'SELECT _registro FROM {_ident(spec.nome)} WHERE {where} ORDER BY rowid', argumentos
+
+    def answer(self, endpoint: str, params: dict | None) -> list | None:
+        """Responde a chamada pelo banco local.
+
+        Argumentos:
+            endpoint (str): Identificador do endpoint.
+            params (dict | None): Parâmetros da chamada.
+
+        Retorno:
+            list | None: Os registros, como a API os devolveria, ou None se a chamada precisa ir à API.
+        """
+        plano = self.plan(endpoint, params)
+        linhas = None
+        if plano is not None:
+            linhas = [linha['_registro'] for linha in self.warehouse.query(*plano)]
+            if None in linhas:
+                # Linhas gravadas sem o registro original.
+                linhas = None
+        with self._lock:
+            if linhas is None:
+                self.remoto += 1
+                return None
+            self.local += 1
+        return decode_json(f'[{",".join(linhas)}]'.encode())
+
+    def stats(self) -> dict[str, int]:
+        """Chamadas atendidas localmente e encaminhadas à API."""
+        return {'local': self.local, 'remoto': self.remoto}
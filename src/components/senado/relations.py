@@ -0,0 +1,108 @@
+"""Relacionamentos conhecidos entre endpoints do Senado, para junções por hash.
+
+Os campos usam os nomes devolvidos pela API (camelCase), de modo que as
+listas retornadas pelos clientes podem ser combinadas diretamente:
+
+    contratos = contratacoes.contratos()
+    empresas = contratacoes.empresas()
+    enriquecidos = list(join_relation('contratos_empresas', contratos, empresas, how='left'))
+"""
+
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Literal
+
+from ..core.joins import hash_join
+from ..core.normalize import fold_text
+from .entities import normalize_documento
+
+
+def _texto(valor: Any) -> str | None:
+    return fold_text(str(valor)).strip() or None
+
+
+def _identificador(valor: Any) -> str | None:
+    return str(valor).strip() or None
+
+
+@dataclass(frozen=True)
+class Relation:
+    """Relacionamento entre os registros de dois endpoints."""
+
+    esquerda: str  # identificador do endpoint (ex.: `contratacoes/contratos`)
+    direita: str
+    chave_esquerda: tuple[str, ...]
+    chave_direita: tuple[str, ...]
+    normalizar: Callable[[Any], Any] | None = _identificador
+    sufixo: str = '_direita'  # campos da direita repetidos na esquerda
+
+
+_ATO = ('numeroAtoConcessao',)
+_PAGAMENTO = (('id',), ('idPagamento',))
+
+RELATIONS: dict[str, Relation] = {
+    'contratos_empresas': Relation(
+        'contratacoes/contratos', 'contratacoes/empresas', ('cnpjCpf',), ('cnpjCpf',), normalize_documento, '_empresa',
+    ),
+    'notas_empenho_empresas': Relation(
+        'contratacoes/notas_empenho', 'contratacoes/empresas', ('cnpjCpf',), ('cnpjCpf',), normalize_documento, '_empresa',
+    ),
+    'atas_registro_preco_empresas': Relation(
+        'contratacoes/atas_registro_preco', 'contratacoes/empresas', ('cnpjCpf',), ('cnpjCpf',), normalize_documento,
+        '_empresa',
+    ),
+    'terceirizados_empresas': Relation(
+        'contratacoes/terceirizados', 'contratacoes/empresas', ('cnpjEmpresa',), ('cnpjCpf',), normalize_documento,
+        '_empresa',
+    ),
+    'pagamentos_empenhos': Relation('contratacoes/pagamentos', 'contratacoes/empenhos', *_PAGAMENTO, sufixo='_empenho'),
+    'pagamentos_documentos_fiscais': Relation(
+        'contratacoes/pagamentos', 'contratacoes/documentos_fiscais', *_PAGAMENTO, sufixo='_documento',
+    ),
+    'atos_concessao_transacoes': Relation('supridos/atosConcessao', 'supridos/transacoes', _ATO, _ATO, sufixo='_transacao'),
+    'atos_concessao_movimentacoes': Relation(
+        'supridos/atosConcessao', 'supridos/movimentacoes', _ATO, _ATO, sufixo='_movimentacao',
+    ),
+    'atos_concessao_empenhos': Relation('supridos/atosConcessao', 'supridos/empenhos', _ATO, _ATO, sufixo='_empenho'),
+    'atos_concessao_supridos': Relation('supridos/atosConcessao', 'supridos', _ATO, _ATO, sufixo='_suprido'),
+    'remuneracoes_lotacoes': Relation(
+        'servidores/remuneracoes', 'servidores/lotacoes', ('lotacao',), ('nome',), _texto, '_lotacao',
+    ),
+    'remuneracoes_cargos': Relation('servidores/remuneracoes', 'servidores/cargos', ('cargo',), ('nome',), _texto, '_cargo'),
+    'servidores_lotacoes': Relation(
+        'servidores/servidores', 'servidores/lotacoes', ('lotacao',), ('nome',), _texto, '_lotacao',
+    ),
+}
+
+
+def join_relation(
+    relacao: str | Relation,
+    esquerda: Iterable[dict],
+    direita: Iterable[dict],
+    *,
+    how: Literal['inner', 'left'] = 'inner',
+    construir: Literal['esquerda', 'direita'] | None = None,
+) -> Iterator[dict]:
+    """Junta os registros de dois endpoints por um relacionamento conhecido.
+
+    Argumentos:
+        relacao (str | Relation): Nome em `RELATIONS` ou o próprio relacionamento.
+        esquerda (Iterable[dict]): Registros do endpoint da esquerda.
+        direita (Iterable[dict]): Registros do endpoint da direita.
+        how (Literal['inner', 'left'], optional): Tipo de junção. Padrão:  'inner'.
+        construir (Literal['esquerda', 'direita'] | None, optional): Lado da tabela hash. Padrão:  None (o menor).
+
+    Retorno:
+        Iterator[dict]: As linhas combinadas (ver `hash_join`).
+    """
+    if isinstance(relacao, str):
+        relacao = RELATIONS[relacao]
+    return hash_join(
+        esquerda,
+        direita,
+        relacao.chave_esquerda,
+        relacao.chave_direita,
+        how=how,
+        construir=construir,
+        normalizar=relacao.normalizar,
+        sufixo=relacao.sufixo,
+    )
@@ -0,0 +1,95 @@
+"""Schemas dos CSVs dos endpoints do Senado.
+
+Cada schema indica o tipo das colunas conhecidas, pelo nome do cabeçalho.
+Colunas que não constam do schema têm o tipo inferido pelo decodificador;
+os schemas garantem principalmente que identificadores (CPF, CNPJ, números
+de documentos) permaneçam texto e que valores monetários sejam `Decimal`.
+"""
+
+from ..core.csv_decoder import Schema, TipoColuna
+
+_TEXTO = TipoColuna.TEXTO
+_INTEIRO = TipoColuna.INTEIRO
+_DECIMAL = TipoColuna.DECIMAL
+_DATA = TipoColuna.DATA
+
+_REMUNERACAO: Schema = {
+    'nome': _TEXTO,
+    'vinculo': _TEXTO,
+    'situacao': _TEXTO,
+    'cargo': _TEXTO,
+    'lotacao': _TEXTO,
+    'remuneracaoBasica': _DECIMAL,
+    'vantagensPessoais': _DECIMAL,
+    'funcaoComissionada': _DECIMAL,
+    'gratificacaoNatalina': _DECIMAL,
+    'horasExtras': _DECIMAL,
+    'outrasEventuais': _DECIMAL,
+    'abonoPermanencia': _DECIMAL,
+    'reversaoTetoConstitucional': _DECIMAL,
+    'impostoRenda': _DECIMAL,
+    'previdencia': _DECIMAL,
+    'faltas': _DECIMAL,
+    'remuneracaoLiquida': _DECIMAL,
+    'diarias': _DECIMAL,
+    'auxilios': _DECIMAL,
+    'vantagensIndenizatorias': _DECIMAL,
+}
+
+_CONTRATACAO: Schema = {
+    'numero': _TEXTO,
+    'ano': _INTEIRO,
+    'cnpjCpf': _TEXTO,
+    'nomeFornecedor': _TEXTO,
+    'objetoDescricao': _TEXTO,
+    'status': _TEXTO,
+    'valorGlobal': _DECIMAL,
+    'valor': _DECIMAL,
+    'inicioVigencia': _DATA,
+    'fimVigencia': _DATA,
+    'dataAssinatura': _DATA,
+}
+
+_SUPRIDOS: Schema = {
+    'numeroAtoConcessao': _TEXTO,
+    'cpf': _TEXTO,
+    'nome': _TEXTO,
+    'valor': _DECIMAL,
+    'valorConcedido': _DECIMAL,
+    'valorUtilizado': _DECIMAL,
+    'valorDevolvido': _DECIMAL,
+    'data': _DATA,
+}
+
+CSV_SCHEMAS: dict[str, Schema] = {
+    'servidores/servidores': {'nome': _TEXTO, 'cargo': _TEXTO, 'lotacao': _TEXTO, 'tipoVinculo': _TEXTO, 'situacao': _TEXTO},
+    'servidores/remuneracoes': _REMUNERACAO,
+    'servidores/pensionistas/remuneracoes': _REMUNERACAO,
+    'servidores/horas-extras': {'nome': _TEXTO, 'lotacao': _TEXTO, 'cargo': _TEXTO, 'valor': _DECIMAL},
+    'servidores/pensionistas': {'nome': _TEXTO, 'cpf': _TEXTO, 'dataInicio': _DATA},
+    'servidores/estagiarios': {'nome': _TEXTO, 'lotacao': _TEXTO, 'dataInicio': _DATA, 'dataFim': _DATA},
+    'senadores/despesas_ceaps': {
+        'ano': _INTEIRO,
+        'mes': _INTEIRO,
+        'nomeSenador': _TEXTO,
+        'tipoDespesa': _TEXTO,
+        'cpfCnpj': _TEXTO,
+        'fornecedor': _TEXTO,
+        'documento': _TEXTO,
+        'data': _DATA,
+        'detalhamento': _TEXTO,
+        'valorReembolsado': _DECIMAL,
+    },
+    'senadores/auxilio-moradia': {'nomeParlamentar': _TEXTO, 'estadoEleito': _TEXTO, 'partidoEleito': _TEXTO},
+    'contratacoes/contratos': _CONTRATACAO,
+    'contratacoes/notas_empenho': _CONTRATACAO,
+    'contratacoes/atas_registro_preco': _CONTRATACAO,
+    'contratacoes/empresas': {'nome': _TEXTO, 'cnpjCpf': _TEXTO},
+    'contratacoes/terceirizados': {'nome': _TEXTO, 'cpf': _TEXTO, 'cnpjEmpresa': _TEXTO, 'lotacao': _TEXTO},
+    'contratacoes/licitacoes': {'numero': _TEXTO, 'objeto': _TEXTO, 'dataAbertura': _DATA},
+    'supridos': _SUPRIDOS,
+    'supridos/transacoes': _SUPRIDOS,
+    'supridos/movimentacoes': _SUPRIDOS,
+    'supridos/empenhos': _SUPRIDOS,
+    'supridos/atosConcessao': _SUPRIDOS,
+}
@@ -0,0 +1,275 @@
+"""Índice textual das descrições de contratações e licitações (SQLite FTS5).
+
+Os textos são gravados sem acentos e em minúsculas em `_fts_docs` e
+indexados por duas tabelas FTS5 sobre o mesmo conteúdo:
+
+- `_fts_palavras` (tokenizador `unicode61`): palavras, prefixos (`manut*`),
+  frases (`"ar condicionado"`) e operadores `AND`, `OR`, `NOT`, com
+  resultados ordenados por BM25;
+- `_fts_trigramas` (tokenizador `trigram`): buscas por trecho de palavra,
+  como os filtros `...Contains` da API.
+
+O índice é atualizado dentro da transação de cada partição gravada pelo
+`Warehouse`, apenas para os registros cujo texto mudou.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable
+
+from ..core.json_decoders import decode_json
+from ..core.normalize import fold_text
+from .warehouse import DatasetSpec, Warehouse, _ident, _lotes
+
+# Campos indexados por conjunto de dados (nomes normalizados).
+CAMPOS_TEXTO: dict[str, tuple[str, ...]] = {
+    'contratos': ('objeto_descricao',),
+    'notas_empenho': ('objeto_descricao',),
+    'atas_registro_preco': ('objeto_descricao',),
+    'licitacoes': ('objeto',),
+}
+
+_DDL = (
+    'CREATE TABLE IF NOT EXISTS _fts_docs ('
+    'id INTEGER PRIMARY KEY, dataset TEXT NOT NULL, chave TEXT NOT NULL, campo TEXT NOT NULL, texto TEXT NOT NULL, '
+    'UNIQUE (dataset, chave, campo))',
+    "CREATE VIRTUAL TABLE IF NOT EXISTS _fts_palavras USING fts5("
+    "texto, content='_fts_docs', content_rowid='id', tokenize='unicode61 remove_diacritics 2')",
+    "CREATE VIRTUAL TABLE IF NOT EXISTS _fts_trigramas USING fts5("
+    "texto, content='_fts_docs', content_rowid='id', tokenize='trigram')",
+)
+_FTS = ('_fts_palavras', '_fts_trigramas')
+
+_TOKEN = re.compile(r'"[^"]*"|[()]|[^\s()"]+')
+_OPERADORES = frozenset({'AND', 'OR', 'NOT'})
+
+
+def fts_query(consulta: str) -> str:
+    """Converte uma consulta do usuário na sintaxe do FTS5, sem acentos.
+
+    Termos e frases são citados, de modo que hífens e pontuação não sejam
+    lidos como operadores; `AND`, `OR`, `NOT`, parênteses e o `*` de prefixo
+    são mantidos. `NOT` é binário, como no FTS5: `a NOT b` ou `a AND NOT b`.
+
+    Argumentos:
+        consulta (str): Ex.: `manut* AND (elevador OR "ar condicionado") NOT predial`.
+
+    Retorno:
+        str: Consulta FTS5; vazia se a consulta não tiver termos.
+
+    Raises:
+        ValueError: Se os operadores ou parênteses estiverem mal posicionados (ex.: `NOT a`, `a OR NOT b`,
+            `a AND`, `(a`).
+    """
+    partes = []
+    for token in _TOKEN.findall(consulta):
+        if token in _OPERADORES or token in '()':
+            if token == 'NOT' and partes and partes[-1] == 'AND':
+                # No FTS5, NOT é binário: `a AND NOT b` se escreve `a NOT b`.
+                partes.pop()
+            partes.append(token)
+            continue
+        prefixo = token.endswith('*') and not token.startswith('"')
+        termo = fold_text(token.strip('"').rstrip('*') if prefixo else token.strip('"'))
+        if termo:
+            partes.append('"' + termo.replace('"', '""') + '"' + ('*' if prefixo else ''))
+    if partes:
+        _validar(partes, consulta)
+    return ' '.join(partes)
+
+
+def _validar(partes: list[str], consulta: str) -> None:
+    # Termos adjacentes são unidos por AND; um operador precisa de um termo ou grupo de cada lado.
+    espera_termo, abertos = True, 0
+    for parte in partes:
+        if parte == '(':
+            abertos += 1
+            espera_termo = True
+        elif parte == ')':
+            if espera_termo or not abertos:
+                raise ValueError(f'Parêntese mal posicionado na consulta: {consulta!r}')
+            abertos -= 1
+        elif parte in _OPERADORES:
+            if espera_termo:
+                raise ValueError(f'Operador {parte} sem termo à esquerda na consulta: {consulta!r}')
+            espera_termo = True
+        else:
+            espera_termo = False
+    if espera_termo:
+        raise ValueError(f'Consulta termina sem termo após operador ou parêntese: {consulta!r}')
+    if abertos:
+        raise ValueError(f'Parêntese sem fechamento na consulta: {consulta!r}')
+
+
+@dataclass
+class SearchHit:
+    """Resultado de uma busca."""
+
+    dataset: str
+    chave: str
+    campo: str
+    score: float  # menor é melhor (BM25 do FTS5)
+    registro: dict | None = None
+
+
+class TextIndex:
+    """Índice textual mantido junto com o `Warehouse`."""
+
+    def __init__(self, warehouse: Warehouse, campos: dict[str, tuple[str, ...]] | None = None):
+        """Cria o índice, indexa os registros já sincronizados e passa a acompanhar as gravações.
+
+        Argumentos:
+            warehouse (Warehouse): Banco local (SQLite).
+            campos (dict[str, tuple[str, ...]] | None, optional): Campos por conjunto de dados. Padrão:  None (`CAMPOS_TEXTO`).
+        """
+        if warehouse.dialeto != 'sqlite':
+            raise ValueError('O índice textual usa o FTS5 e requer um Warehouse SQLite.')
+        self.warehouse = warehouse
+        self.campos = dict(CAMPOS_TEXTO if campos is None else campos)
+        conn = warehouse._conn
+        with warehouse._lock:
+            for ddl in _DDL:
+                conn.execute(ddl)
+        self._indexar_existentes()
+        warehouse.add_listener(self._on_write)
+
+    def _indexar_existentes(self) -> None:
+        conn = self.warehouse._conn
+        for dataset, campos in self.campos.items():
+            colunas = [c for c in campos if c in self.warehouse.columns(dataset)]
+            if not colunas:
+                continue
+            with self.warehouse._transacao():
+                if conn.execute('SELECT 1 FROM _fts_docs WHERE dataset = ? LIMIT 1', [dataset]).fetchone():
+                    continue
+                linhas = conn.execute(
+                    f'SELECT _chave, {", ".join(map(_ident, colunas))} FROM {_ident(dataset)}'
+                ).fetchall()
+                gravados = [(linha[0], dict(zip(colunas, linha[1:]))) for linha in linhas]
+                self._atualizar(dataset, gravados, [])
+
+    def _on_write(self, spec: DatasetSpec, periodo: str, gravados: list[tuple[str, dict]], removidos: list[str]) -> None:
+        if spec.nome in self.campos:
+            self._atualizar(spec.nome, gravados, removidos)
+
+    def _atualizar(self, dataset: str, gravados: list[tuple[str, dict]], removidos: list[str]) -> None:
+        """Aplica as mudanças de uma gravação; chamado dentro da transação do `Warehouse`."""
+        conn = self.warehouse._conn
+        atuais = {}
+        for lote in _lotes(list(dict.fromkeys([*(chave for chave, _ in gravados), *removidos]))):
+            cursor = conn.execute(
+                f'SELECT id, chave, campo, texto FROM _fts_docs WHERE dataset = ? AND chave IN ({", ".join("?" * len(lote))})',
+                [dataset, *lote],
+            )
+            atuais.update(((chave, campo), (id_, texto)) for id_, chave, campo, texto in cursor)
+        apagar, inserir = [], []
+        for chave, registro in gravados:
+            for campo in self.campos[dataset]:
+                valor = registro.get(campo)
+                texto = fold_text(str(valor)) if valor else ''
+                atual = atuais.get((chave, campo))
+                if atual is not None and atual[1] == texto:
+                    continue
+                if atual is not None:
+                    apagar.append(atual)
+                if texto:
+                    inserir.append((dataset, chave, campo, texto))
+        removidos = set(removidos)
+        apagar.extend(doc for (chave, _), doc in atuais.items() if chave in removidos)
+        if not apagar and not inserir:
+            return
+
+        for fts in _FTS:
+            conn.executemany(f"INSERT INTO {fts} ({fts}, rowid, texto) VALUES ('delete', ?, ?)", apagar)
+        conn.executemany('DELETE FROM _fts_docs WHERE id = ?', [(id_,) for id_, _ in apagar])
+        novos = []
+        for doc in inserir:
+            cursor = conn.execute('INSERT INTO _fts_docs (dataset, chave, campo, texto) VALUES (?, ?, ?, ?)', doc)
+            novos.append((cursor.lastrowid, doc[3]))
+        for fts in _FTS:
+            conn.executemany(f'INSERT INTO {fts} (rowid, texto) VALUES (?, ?)', novos)
+
+    def _registros(self, hits: list[SearchHit]) -> None:
+        por_dataset: dict[str, list[SearchHit]] = {}
+        for hit in hits:
+            por_dataset.setdefault(hit.dataset, []).append(hit)
+        for dataset, lista in por_dataset.items():
+            registros = {}
+            for lote in _lotes(list(dict.fromkeys(hit.chave for hit in lista))):
+                linhas = self.warehouse.query(
+                    f'SELECT _chave, _registro FROM {_ident(dataset)} WHERE _chave IN ({", ".join("?" * len(lote))})',
+                    lote,
+                )
+                registros.update((linha['_chave'], linha['_registro']) for linha in linhas)
+            for hit in lista:
+                bruto = registros.get(hit.chave)
+                hit.registro = decode_json(bruto.encode()) if bruto else None
+
+    def _buscar(self, fts: str, match: str, datasets: Iterable[str] | None, limite: int, registros: bool) -> list[SearchHit]:
+        filtro, params = '', [match]
+        if datasets is not None:
+            datasets = list(datasets)
+            filtro = f' AND d.dataset IN ({", ".join("?" * len(datasets))})'
+            params += datasets
+        linhas = self.warehouse.query(
+            f'SELECT d.dataset, d.chave, d.campo, f.rank AS score FROM {fts} f '
+            f'JOIN _fts_docs d ON d.id = f.rowid WHERE {fts} MATCH ?{filtro} ORDER BY f.rank LIMIT ?',
+            [*params, limite],
+        )
+        hits = [SearchHit(**linha) for linha in linhas]
+        if registros:
+            self._registros(hits)
+        return hits
+
+    def search(
+        self, consulta: str, datasets: Iterable[str] | None = None, limite: int = 20, registros: bool = True
+    ) -> list[SearchHit]:
+        """Busca por palavras, prefixos, frases e operadores booleanos, do melhor ao pior resultado.
+
+        Argumentos:
+            consulta (str): Consulta (ver `fts_query`); acentos e maiúsculas são ignorados.
+            datasets (Iterable[str] | None, optional): Conjuntos de dados pesquisados. Padrão:  None (todos).
+            limite (int, optional): Número máximo de resultados. Padrão:  20.
+            registros (bool, optional): Incluir o registro original de cada resultado. Padrão:  True.
+
+        Retorno:
+            list[SearchHit]: Os resultados.
+        """
+        match = fts_query(consulta)
+        if not match:
+            return []
+        return self._buscar('_fts_palavras', match, datasets, limite, registros)
+
+    def substring(
+        self, trecho: str, datasets: Iterable[str] | None = None, limite: int = 20, registros: bool = True
+    ) -> list[SearchHit]:
+        """Busca por trecho de texto, como os filtros `...Contains` da API.
+
+        Trechos com menos de três caracteres não usam o índice de trigramas e
+        percorrem os textos.
+
+        Argumentos:
+            trecho (str): Trecho procurado; acentos e maiúsculas são ignorados.
+            datasets (Iterable[str] | None, optional): Conjuntos de dados pesquisados. Padrão:  None (todos).
+            limite (int, optional): Número máximo de resultados. Padrão:  20.
+            registros (bool, optional): Incluir o registro original de cada resultado. Padrão:  True.
+
+        Retorno:
+            list[SearchHit]: Os resultados.
+        """
+        trecho = fold_text(trecho)
+        if len(trecho) >= 3:
+            return self._buscar('_fts_trigramas', '"' + trecho.replace('"', '""') + '"', datasets, limite, registros)
+        filtro, params = '', [trecho]
+        if datasets is not None:
+            datasets = list(datasets)
+            filtro = f' AND dataset IN ({", ".join("?" * len(datasets))})'
+            params += datasets
+        linhas = self.warehouse.query(
+            f"SELECT dataset, chave, campo, 0.0 AS score FROM _fts_docs WHERE instr(texto, ?) > 0{filtro} LIMIT ?",
+            [*params, limite],
+        )
+        hits = [SearchHit(**linha) for linha in linhas]
+        if registros:
+            self._registros(hits)
+        return hits
@@ -0,0 +1,565 @@
+"""Espelho local e incremental dos dados abertos do Senado (SQLite ou DuckDB).
+
+Cada conjunto de dados (`DatasetSpec`) vira uma tabela, com colunas em
+snake_case criadas conforme aparecem nos registros, e a coluna `_registro`
+guarda cada registro como veio da API. Conjuntos periódicos
+(por ano ou por mês) são divididos em partições, uma por período; conjuntos
+de referência (servidores, empresas, contratos...) têm uma única partição.
+
+Cada partição baixada é gravada como um retrato completo, em uma única
+transação: as linhas são inseridas ou atualizadas pela chave e as linhas que
+deixaram de existir são removidas. Repetir a sincronização não altera o
+resultado. A tabela `_sync_state` guarda, por partição, o ETag e a impressão
+digital do corpo da resposta: períodos encerrados já sincronizados não são
+baixados de novo, e partições abertas ou de referência só são regravadas
+quando o conteúdo muda.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any, Callable, Iterable, Iterator, Literal
+
+import requests
+
+try:
+    import duckdb
+except ImportError:
+    duckdb = None
+
+from ..core.json_decoders import decode_json
+from ..core.normalize import normalize_json_records
+from .clients.dados_abertos.dados_abertos import SenadoDadosAbertosClient
+from .exceptions import SenadoApiError
+
+
+@dataclass(frozen=True)
+class DatasetSpec:
+    """Conjunto de dados espelhado em uma tabela local.
+
+    Os campos de chave e de índice usam os nomes normalizados (snake_case);
+    campos ausentes nos registros são ignorados.
+    """
+
+    nome: str
+    caminho: str  # relativo a /api/v1; conjuntos periódicos usam {ano} e {mes}
+    periodicidade: Literal['ano', 'mes'] | None = None
+    chave: tuple[str, ...] = ()
+    indices: tuple[str, ...] = ()
+    inicio: int = 2019  # primeiro ano sincronizado dos conjuntos periódicos
+    reabrir: int = 2  # últimos períodos que ainda podem ser revisados pela fonte
+    ttl: float = 24 * 3600  # intervalo mínimo, em segundos, entre verificações de uma partição aberta
+    paginado: bool = False  # a listagem vem em páginas (`pagina`), baixadas até a primeira vazia
+
+
+_PESSOA = ('cpf', 'cpf_cnpj', 'cnpj_cpf', 'cnpj_empresa')
+
+DATASETS: dict[str, DatasetSpec] = {spec.nome: spec for spec in (
+    DatasetSpec('servidores', 'servidores/servidores', chave=('id',), indices=('id', 'nome', 'lotacao', 'cargo')),
+    DatasetSpec(
+        'remuneracoes', 'servidores/remuneracoes/{ano}/{mes}', 'mes',
+        chave=('sequencial',), indices=('sequencial', 'nome', 'lotacao'),
+    ),
+    DatasetSpec('pensionistas', 'servidores/pensionistas', indices=('nome', *_PESSOA)),
+    DatasetSpec(
+        'pensionistas_remuneracoes', 'servidores/pensionistas/remuneracoes/{ano}/{mes}', 'mes',
+        chave=('sequencial',), indices=('sequencial', 'nome'),
+    ),
+    DatasetSpec('horas_extras', 'servidores/horas-extras/{ano}/{mes}', 'mes', indices=('nome', 'lotacao')),
+    DatasetSpec('terceirizados', 'contratacoes/terceirizados', chave=('id',), indices=('id', 'nome', *_PESSOA)),
+    DatasetSpec('contratos', 'contratacoes/contratos', chave=('id',), indices=('id', 'numero', 'ano', *_PESSOA)),
+    DatasetSpec('notas_empenho', 'contratacoes/notas_empenho', chave=('id',), indices=('id', 'numero', 'ano', *_PESSOA)),
+    DatasetSpec(
+        'atas_registro_preco', 'contratacoes/atas_registro_preco', chave=('id',), indices=('id', 'numero', 'ano', *_PESSOA),
+    ),
+    DatasetSpec('empresas', 'contratacoes/empresas', chave=('id',), indices=('id', 'nome', *_PESSOA), paginado=True),
+    DatasetSpec('licitacoes', 'contratacoes/licitacoes', chave=('id',), indices=('id', 'numero', 'data_abertura')),
+    DatasetSpec('supridos', 'supridos/{ano}', 'ano', indices=('numero_ato_concessao', *_PESSOA)),
+    DatasetSpec('supridos_transacoes', 'supridos/transacoes/{ano}', 'ano', indices=('numero_ato_concessao', *_PESSOA)),
+    DatasetSpec('supridos_movimentacoes', 'supridos/movimentacoes/{ano}', 'ano', indices=('numero_ato_concessao', *_PESSOA)),
+    DatasetSpec('supridos_empenhos', 'supridos/empenhos/{ano}', 'ano', indices=('numero_ato_concessao',)),
+    DatasetSpec(
+        'supridos_atos_concessao', 'supridos/atosConcessao/{ano}', 'ano', indices=('numero_ato_concessao', *_PESSOA),
+    ),
+    DatasetSpec(
+        'despesas_ceaps', 'senadores/despesas_ceaps/{ano}', 'ano',
+        chave=('id',), indices=('id', 'cod_senador', 'mes', *_PESSOA),
+    ),
+)}
+
+
+@dataclass
+class SyncResult:
+    """Resumo da sincronização de um conjunto de dados."""
+
+    dataset: str
+    baixadas: list[str] = field(default_factory=list)  # partições gravadas
+    inalteradas: list[str] = field(default_factory=list)  # partições verificadas sem mudança
+    linhas: int = 0
+    erros: dict[str, str] = field(default_factory=dict)  # partição -> mensagem
+
+
+_ESTADO_DDL = '''
+CREATE TABLE IF NOT EXISTS _sync_state (
+    dataset TEXT NOT NULL,
+    periodo TEXT NOT NULL,
+    etag TEXT,
+    fingerprint TEXT,
+    linhas INTEGER,
+    sincronizado_em DOUBLE,
+    verificado_em DOUBLE,
+    PRIMARY KEY (dataset, periodo)
+)
+'''
+
+_TIPOS = {bool: 'BOOLEAN', int: 'BIGINT', float: 'DOUBLE', date: 'DATE'}
+
+
+def _tipo_sql(valor: Any) -> str:
+    return _TIPOS.get(type(valor), 'TEXT')
+
+
+def _valor_sql(valor: Any) -> Any:
+    if isinstance(valor, date):
+        return valor.isoformat()
+    if isinstance(valor, (list, dict)):
+        return json.dumps(valor, ensure_ascii=False, default=str)
+    return valor
+
+
+def _contains(valor: Any, termo: str) -> bool:
+    return valor is not None and termo.casefold() in str(valor).casefold()
+
+
+def _ident(nome: str) -> str:
+    return '"' + nome.replace('"', '""') + '"'
+
+
+def periodos(spec: DatasetSpec, desde: int | None = None, ate: date | None = None) -> list[str]:
+    """Partições do conjunto de dados, da mais antiga à mais recente.
+
+    Argumentos:
+        spec (DatasetSpec): Conjunto de dados.
+        desde (int | None, optional): Primeiro ano. Padrão:  None (usa `spec.inicio`).
+        ate (date | None, optional): Data de referência. Padrão:  None (hoje).
+
+    Retorno:
+        list[str]: `AAAA` ou `AAAA-MM`; `''` para conjuntos de referência.
+    """
+    if spec.periodicidade is None:
+        return ['']
+    ate = ate or date.today()
+    anos = range(desde or spec.inicio, ate.year + 1)
+    if spec.periodicidade == 'ano':
+        return [str(ano) for ano in anos]
+    return [f'{ano}-{mes:02d}' for ano in anos for mes in range(1, 13) if (ano, mes) <= (ate.year, ate.month)]
+
+
+def _caminho(spec: DatasetSpec, periodo: str) -> str:
+    if not periodo:
+        return spec.caminho
+    ano, _, mes = periodo.partition('-')
+    return spec.caminho.format(ano=int(ano), mes=int(mes) if mes else '')
+
+
+_PRIMEIRA_PAGINA = 1
+_MAX_PARAMS = 900  # parâmetros por comando, abaixo do limite dos SQLite mais antigos (999)
+
+
+def _lotes(valores: list, tamanho: int = _MAX_PARAMS) -> Iterator[list]:
+    """Fatias de `valores` para consultas `IN (...)` com um número limitado de parâmetros."""
+    for i in range(0, len(valores), tamanho):
+        yield valores[i:i + tamanho]
+
+
+def _chaves(spec: DatasetSpec, periodo: str, registros: list[dict]) -> list[str]:
+    """Chave de cada registro: os campos de `spec.chave` ou, na falta deles, o hash do conteúdo."""
+    chaves = []
+    repetidas: dict[str, int] = {}
+    for registro in registros:
+        if spec.chave and all(registro.get(c) is not None for c in spec.chave):
+            chave = '|'.join(str(registro[c]) for c in spec.chave)
+        else:
+            conteudo = json.dumps(registro, sort_keys=True, ensure_ascii=False, default=str)
+            chave = hashlib.sha1(conteudo.encode()).hexdigest()
+        # Linhas idênticas são numeradas para que nenhuma se perca.
+        n = repetidas[chave] = repetidas.get(chave, 0) + 1
+        if n > 1:
+            chave = f'{chave}#{n}'
+        chaves.append(f'{periodo}|{chave}' if periodo else chave)
+    return chaves
+
+
+class Warehouse:
+    """Banco local com uma tabela por conjunto de dados do Senado."""
+
+    def __init__(
+        self,
+        caminho: str = 'senado.db',
+        client: SenadoDadosAbertosClient | None = None,
+        datasets: dict[str, DatasetSpec] | None = None,
+    ):
+        """Abre (ou cria) o banco local.
+
+        Argumentos:
+            caminho (str, optional): Arquivo do banco; `.duckdb` usa DuckDB, os demais SQLite. Padrão:  'senado.db'.
+            client (SenadoDadosAbertosClient | None, optional): Cliente usado nas requisições. Padrão:  None.
+            datasets (dict[str, DatasetSpec] | None, optional): Conjuntos conhecidos. Padrão:  None (`DATASETS`).
+        """
+        self.caminho = caminho
+        self.client = client or SenadoDadosAbertosClient()
+        self.datasets = dict(DATASETS if datasets is None else datasets)
+        self._lock = threading.RLock()
+        if caminho.endswith('.duckdb'):
+            if duckdb is None:
+                raise ImportError('DuckDB não está instalado. Instale com: pip install duckdb')
+            self.dialeto = 'duckdb'
+            self._conn = duckdb.connect(caminho)
+        else:
+            self.dialeto = 'sqlite'
+            self._conn = sqlite3.connect(caminho, isolation_level=None, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.create_function('pybr_contains', 2, _contains, deterministic=True)
+        self._conn.execute(_ESTADO_DDL)
+        self._colunas: dict[str, dict[str, str]] = {}
+        self._listeners: list[Callable[..., None]] = []
+
+    def add_listener(self, listener: Callable[..., None]) -> None:
+        """Registra uma função chamada a cada partição gravada, dentro da mesma transação.
+
+        A função recebe `(spec, periodo, gravados, removidos)`: os pares
+        `(chave, registro normalizado)` gravados e as chaves removidas.
+
+        Argumentos:
+            listener (Callable[..., None]): A função.
+        """
+        self._listeners.append(listener)
+
+    def close(self) -> None:
+        """Fecha a conexão."""
+        self._conn.close()
+
+    def __enter__(self) -> 'Warehouse':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @contextmanager
+    def _transacao(self) -> Iterator[None]:
+        with self._lock:
+            self._conn.execute('BEGIN TRANSACTION')
+            try:
+                yield
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._conn.execute('COMMIT')
+
+    def contains_sql(self, coluna: str) -> str:
+        """Expressão SQL que testa se a coluna contém o parâmetro, sem diferenciar maiúsculas de minúsculas."""
+        if self.dialeto == 'duckdb':
+            return f'contains(lower(CAST({coluna} AS VARCHAR)), lower(?))'
+        return f'pybr_contains({coluna}, ?)'
+
+    def query(self, sql: str, params: Iterable[Any] = ()) -> list[dict]:
+        """Executa uma consulta no banco local.
+
+        Argumentos:
+            sql (str): Consulta SQL.
+            params (Iterable[Any], optional): Parâmetros posicionais (`?`). Padrão:  ().
+
+        Retorno:
+            list[dict]: Uma linha por dicionário.
+        """
+        with self._lock:
+            cursor = self._conn.execute(sql, list(params))
+            if cursor.description is None:
+                return []
+            nomes = [d[0] for d in cursor.description]
+            return [dict(zip(nomes, linha)) for linha in cursor.fetchall()]
+
+    def columns(self, tabela: str) -> dict[str, str]:
+        """Colunas da tabela e seus tipos; vazio se a tabela não existe."""
+        if tabela not in self._colunas:
+            with self._lock:
+                linhas = self._conn.execute(f'PRAGMA table_info({_ident(tabela)})').fetchall()
+            if not linhas:
+                return {}
+            self._colunas[tabela] = {linha[1]: linha[2] for linha in linhas}
+        return self._colunas[tabela]
+
+    def state(self, dataset: str) -> dict[str, dict]:
+        """Estado de sincronização de cada partição do conjunto de dados."""
+        linhas = self.query('SELECT * FROM _sync_state WHERE dataset = ? ORDER BY periodo', [dataset])
+        return {linha['periodo']: linha for linha in linhas}
+
+    def watermark(self, dataset: str) -> str | None:
+        """Partição mais recente já sincronizada (`AAAA`, `AAAA-MM` ou `''`), ou None."""
+        linhas = self.query('SELECT MAX(periodo) AS periodo FROM _sync_state WHERE dataset = ?', [dataset])
+        return linhas[0]['periodo'] if linhas else None
+
+    def _garantir_tabela(self, tabela: str, registros: list[dict]) -> list[str]:
+        """Cria a tabela e as colunas que faltam; retorna as colunas dos registros."""
+        tipos: dict[str, str] = {}
+        for registro in registros:
+            for nome, valor in registro.items():
+                if tipos.get(nome) is None:
+                    tipos[nome] = None if valor is None else _tipo_sql(valor)
+        existentes = self.columns(tabela)
+        if not existentes:
+            self._conn.execute(
+                f'CREATE TABLE IF NOT EXISTS {_ident(tabela)} '
+                '(_chave TEXT PRIMARY KEY, _periodo TEXT NOT NULL, _lote BIGINT NOT NULL, _registro TEXT)'
+            )
+            existentes = {'_chave': 'TEXT', '_periodo': 'TEXT', '_lote': 'BIGINT', '_registro': 'TEXT'}
+            self._conn.execute(f'CREATE INDEX IF NOT EXISTS {_ident(f"ix_{tabela}__periodo")} ON {_ident(tabela)} (_periodo)')
+        for nome, tipo in tipos.items():
+            if nome not in existentes:
+                self._conn.execute(f'ALTER TABLE {_ident(tabela)} ADD COLUMN {_ident(nome)} {tipo or "TEXT"}')
+                existentes[nome] = tipo or 'TEXT'
+        self._colunas[tabela] = existentes
+        return list(tipos)
+
+    def _criar_indices(self, spec: DatasetSpec) -> None:
+        colunas = self.columns(spec.nome)
+        for coluna in spec.indices:
+            if coluna in colunas:
+                self._conn.execute(
+                    f'CREATE INDEX IF NOT EXISTS {_ident(f"ix_{spec.nome}_{coluna}")} '
+                    f'ON {_ident(spec.nome)} ({_ident(coluna)})'
+                )
+
+    def write_partition(
+        self,
+        spec: DatasetSpec,
+        periodo: str,
+        registros: list[dict],
+        originais: list[dict] | None = None,
+        **estado: Any,
+    ) -> int:
+        """Grava o retrato completo de uma partição em uma transação.
+
+        Registros existentes são atualizados pela chave, novos são inseridos e
+        os que não constam do retrato são removidos.
+
+        Argumentos:
+            spec (DatasetSpec): Conjunto de dados.
+            periodo (str): Partição.
+            registros (list[dict]): Registros normalizados da partição.
+            originais (list[dict] | None, optional): Registros como vieram da API, guardados em `_registro`. Padrão:  None.
+            **estado: `etag` e `fingerprint` gravados em `_sync_state`.
+
+        Retorno:
+            int: Número de linhas gravadas.
+        """
+        tabela = spec.nome
+        lote = time.time_ns()
+        agora = time.time()
+        chaves: list[str] = []
+        with self._transacao():
+            colunas = self._garantir_tabela(tabela, registros)
+            if registros:
+                todas = ['_chave', '_periodo', '_lote', '_registro', *colunas]
+                atualizacao = ', '.join(f'{_ident(c)} = excluded.{_ident(c)}' for c in todas[1:])
+                sql = (
+                    f'INSERT INTO {_ident(tabela)} ({", ".join(map(_ident, todas))}) '
+                    f'VALUES ({", ".join("?" * len(todas))}) '
+                    f'ON CONFLICT (_chave) DO UPDATE SET {atualizacao}'
+                )
+                chaves = _chaves(spec, periodo, registros)
+                brutos = (
+                    [json.dumps(o, ensure_ascii=False) for o in originais] if originais is not None
+                    else [None] * len(registros)
+                )
+                self._conn.executemany(sql, [
+                    (chave, periodo, lote, bruto, *(_valor_sql(registro.get(c)) for c in colunas))
+                    for chave, bruto, registro in zip(chaves, brutos, registros)
+                ])
+            removidos = []
+            if self._listeners:
+                removidos = [linha[0] for linha in self._conn.execute(
+                    f'SELECT _chave FROM {_ident(tabela)} WHERE _periodo = ? AND _lote <> ?', [periodo, lote]
+                ).fetchall()]
+            self._conn.execute(f'DELETE FROM {_ident(tabela)} WHERE _periodo = ? AND _lote <> ?', [periodo, lote])
+            for listener in self._listeners:
+                listener(spec, periodo, list(zip(chaves, registros)), removidos)
+            self._conn.execute(
+                'INSERT INTO _sync_state (dataset, periodo, etag, fingerprint, linhas, sincronizado_em, verificado_em) '
+                'VALUES (?, ?, ?, ?, ?, ?, ?) '
+                'ON CONFLICT (dataset, periodo) DO UPDATE SET etag = excluded.etag, fingerprint = excluded.fingerprint, '
+                'linhas = excluded.linhas, sincronizado_em = excluded.sincronizado_em, verificado_em = excluded.verificado_em',
+                [tabela, periodo, estado.get('etag'), estado.get('fingerprint'), len(registros), agora, agora],
+            )
+            self._criar_indices(spec)
+        return len(registros)
+
+    def _marcar_verificada(self, dataset: str, periodo: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                'UPDATE _sync_state SET verificado_em = ? WHERE dataset = ? AND periodo = ?',
+                [time.time(), dataset, periodo],
+            )
+
+    def _pendentes(
+        self, spec: DatasetSpec, desde: int | None, ate: date | None, force: bool
+    ) -> list[tuple[str, dict | None]]:
+        """Partições a verificar: períodos novos e partições abertas cujo `ttl` venceu."""
+        todas = periodos(spec, desde, ate)
+        abertas = set(todas[-spec.reabrir:]) if spec.periodicidade else set(todas)
+        estados = self.state(spec.nome)
+        agora = time.time()
+        pendentes = []
+        for periodo in todas:
+            estado = estados.get(periodo)
+            if estado is not None and not force:
+                if periodo not in abertas:
+                    continue
+                if agora - (estado['verificado_em'] or 0) < spec.ttl:
+                    continue
+            pendentes.append((periodo, estado))
+        return pendentes
+
+    def _registros(self, corpo: bytes) -> list:
+        documento = decode_json(corpo, self.client.json_backend) if corpo.strip() else []
+        return documento.get('value', [documento]) if isinstance(documento, dict) else documento
+
+    def _baixar_paginas(self, spec: DatasetSpec, periodo: str) -> tuple[list[bytes], list]:
+        """Baixa as páginas da partição até a primeira vazia (ou repetida, se a fonte ignorar `pagina`)."""
+        corpos, originais = [], []
+        pagina = _PRIMEIRA_PAGINA
+        while True:
+            corpo = self.client._request(_caminho(spec, periodo), params={'pagina': pagina}).content
+            registros = self._registros(corpo)
+            if not registros or (corpos and corpo == corpos[-1]):
+                return corpos, originais
+            corpos.append(corpo)
+            originais.extend(registros)
+            pagina += 1
+
+    def _sync_partition(self, spec: DatasetSpec, periodo: str, estado: dict | None) -> tuple[str, int | str]:
+        """Baixa e grava uma partição; retorna ('baixada', linhas), ('inalterada', 0) ou ('erro', mensagem).
+
+        Conjuntos paginados só são gravados depois de baixadas todas as
+        páginas: o retrato da partição é sempre a listagem completa.
+        """
+        headers = {'If-None-Match': estado['etag']} if estado and estado['etag'] else None
+        try:
+            if spec.paginado:
+                corpos, originais = self._baixar_paginas(spec, periodo)
+                etag = None
+            else:
+                response = self.client._request(_caminho(spec, periodo), headers=headers)
+                corpos, originais, etag = [response.content], None, response.headers.get('ETag')
+        except (SenadoApiError, requests.RequestException) as e:
+            # Falhas de rede depois das novas tentativas do transporte valem só para a partição.
+            return 'erro', str(e)
+        if not spec.paginado and response.status_code == 304:
+            self._marcar_verificada(spec.nome, periodo)
+            return 'inalterada', 0
+        fingerprint = hashlib.sha1(b''.join(corpos)).hexdigest()
+        if estado and estado['fingerprint'] == fingerprint:
+            self._marcar_verificada(spec.nome, periodo)
+            return 'inalterada', 0
+        if originais is None:
+            originais = self._registros(corpos[0])
+        linhas = self.write_partition(
+            spec, periodo, normalize_json_records(originais), originais, etag=etag, fingerprint=fingerprint,
+        )
+        return 'baixada', linhas
+
+    def sync_dataset(
+        self,
+        dataset: str | DatasetSpec,
+        *,
+        desde: int | None = None,
+        ate: date | None = None,
+        force: bool = False,
+        workers: int = 1,
+        callback: Callable[[str, str, str], None] | None = None,
+    ) -> SyncResult:
+        """Sincroniza um conjunto de dados.
+
+        Com `workers` > 1, as partições são baixadas e decodificadas em
+        paralelo; a gravação no banco continua serializada. Com o transporte
+        do cliente em modo `adaptive`, `workers` é o teto e o limite do host
+        decide quantas requisições saem ao mesmo tempo.
+
+        Argumentos:
+            dataset (str | DatasetSpec): Nome em `datasets` ou a especificação.
+            desde (int | None, optional): Primeiro ano dos conjuntos periódicos. Padrão:  None (`spec.inicio`).
+            ate (date | None, optional): Data de referência para as partições. Padrão:  None (hoje).
+            force (bool, optional): Verifica todas as partições, mesmo as encerradas. Padrão:  False.
+            workers (int, optional): Partições baixadas ao mesmo tempo. Padrão:  1.
+            callback (Callable[[str, str, str], None] | None, optional): Chamada com `(dataset, periodo, situacao)`
+                ao fim de cada partição; a situação é 'baixada', 'inalterada' ou 'erro'. Padrão:  None.
+
+        Retorno:
+            SyncResult: Partições gravadas, inalteradas e com erro.
+        """
+        spec = self.datasets[dataset] if isinstance(dataset, str) else dataset
+        resultado = SyncResult(spec.nome)
+        pendentes = self._pendentes(spec, desde, ate, force)
+
+        def sincronizar(item: tuple[str, dict | None]) -> tuple[str, int | str]:
+            situacao, valor = self._sync_partition(spec, *item)
+            if callback is not None:
+                callback(spec.nome, item[0], situacao)
+            return situacao, valor
+
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                situacoes = list(executor.map(sincronizar, pendentes))
+        else:
+            situacoes = [sincronizar(item) for item in pendentes]
+        for (periodo, _), (situacao, valor) in zip(pendentes, situacoes):
+            if situacao == 'erro':
+                resultado.erros[periodo] = valor
+            elif situacao == 'inalterada':
+                resultado.inalteradas.append(periodo)
+            else:
+                resultado.linhas += valor
+                resultado.baixadas.append(periodo)
+        return resultado
+
+    def sync(
+        self,
+        datasets: Iterable[str] | None = None,
+        *,
+        desde: int | None = None,
+        ate: date | None = None,
+        force: bool = False,
+        workers: int = 1,
+        callback: Callable[[str, str, str], None] | None = None,
+    ) -> dict[str, SyncResult]:
+        """Sincroniza os conjuntos de dados.
+
+        Argumentos:
+            datasets (Iterable[str] | None, optional): Nomes dos conjuntos. Padrão:  None (todos).
+            desde (int | None, optional): Primeiro ano dos conjuntos periódicos. Padrão:  None.
+            ate (date | None, optional): Data de referência para as partições. Padrão:  None (hoje).
+            force (bool, optional): Verifica todas as partições. Padrão:  False.
+            workers (int, optional): Partições baixadas ao mesmo tempo. Padrão:  1.
+            callback (Callable[[str, str, str], None] | None, optional): Ver `sync_dataset`. Padrão:  None.
+
+        Retorno:
+            dict[str, SyncResult]: Resultado por conjunto de dados.
+        """
+        nomes = list(self.datasets) if datasets is None else list(datasets)
+        return {
+            nome: self.sync_dataset(nome, desde=desde, ate=ate, force=force, workers=workers, callback=callback)
+            for nome in nomes
+        }
+
+    def pending(
+        self, dataset: str, *, desde: int | None = None, ate: date | None = None, force: bool = False
+    ) -> list[str]:
+        """Partições que `sync_dataset` verificaria agora, com os mesmos argumentos."""
+        return [periodo for periodo, _ in self._pendentes(self.datasets[dataset], desde, ate, force)]
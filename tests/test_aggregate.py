@@ -0,0 +1,68 @@
+import pickle
+import unittest
+from decimal import Decimal
+
+from src.components.core import GroupBy
+
+FOLHA = [
+    {'lotacao': 'SGIDOC', 'tipoVinculo': 'EFETIVO', 'remuneracaoBasica': Decimal('10000.00'), 'horasExtras': '1.200,50'},
+    {'lotacao': 'SGIDOC', 'tipoVinculo': 'EFETIVO', 'remuneracaoBasica': Decimal('12000.00'), 'horasExtras': None},
+    {'lotacao': 'PRODASEN', 'tipoVinculo': 'COMISSIONADO', 'remuneracaoBasica': Decimal('8000.00'), 'horasExtras': 300},
+    {'lotacao': 'SGIDOC', 'tipoVinculo': 'EFETIVO', 'remuneracaoBasica': Decimal('14000.00'), 'horasExtras': ''},
+]
+
+
+def _agregador():
+    return GroupBy(('lotacao', 'tipoVinculo'), {
+        'n': ('count',),
+        'com_horas': ('count', 'horasExtras'),
+        'basica': ('sum', 'remuneracaoBasica'),
+        'media': ('mean', 'remuneracaoBasica'),
+        'minimo': ('min', 'remuneracaoBasica'),
+        'maximo': ('max', 'remuneracaoBasica'),
+        'horas': ('sum', 'horasExtras'),
+        'mediana': ('quantile', 'remuneracaoBasica', 0.5),
+        'quartis': ('quantile', 'remuneracaoBasica', [0.25, 0.75]),
+    })
+
+
+class TestGroupBy(unittest.TestCase):
+    def test_agregacoes(self):
+        resultado = _agregador().consume(iter(FOLHA)).result(ordenar=True)
+        self.assertEqual([(r['lotacao'], r['n']) for r in resultado], [('PRODASEN', 1), ('SGIDOC', 3)])
+        sgidoc = resultado[1]
+        self.assertEqual(sgidoc['basica'], Decimal('36000.00'))
+        self.assertEqual(sgidoc['media'], Decimal('12000.00'))
+        self.assertEqual((sgidoc['minimo'], sgidoc['maximo']), (Decimal('10000.00'), Decimal('14000.00')))
+        self.assertEqual(sgidoc['com_horas'], 1)
+        self.assertEqual(sgidoc['horas'], Decimal('1200.50'))
+        self.assertEqual(sgidoc['mediana'], 12000.0)
+        self.assertEqual(sgidoc['quartis'], [11000.0, 13000.0])
+
+    def test_merge_de_parciais(self):
+        parciais = [pickle.loads(pickle.dumps(_agregador().consume(parte))) for parte in (FOLHA[:2], FOLHA[2:])]
+        combinado = parciais[0].merge(parciais[1])
+        self.assertEqual(combinado.linhas, 4)
+        self.assertEqual(combinado.result(ordenar=True), _agregador().consume(FOLHA).result(ordenar=True))
+        with self.assertRaises(ValueError):
+            combinado.merge(GroupBy('lotacao', {'n': ('count',)}))
+        with self.assertRaises(ValueError):
+            GroupBy('lotacao', {'x': ('median', 'valor')})
+
+    def test_merge_nao_compartilha_acumuladores(self):
+        a, b = _agregador().consume(FOLHA[:2]), _agregador().consume(FOLHA[2:])
+        a.merge(b)
+        esperado = _agregador().consume(FOLHA[2:]).result(ordenar=True)
+        a.consume(FOLHA[2:])  # alimentar o combinado não altera o parcial incorporado
+        self.assertEqual(b.result(ordenar=True), esperado)
+        b.merge(_agregador().consume(FOLHA[:1]))
+        self.assertEqual(a.result(ordenar=True)[0]['n'], 2)
+
+    def test_milhares_sem_virgula(self):
+        linhas = [{'g': 1, 'v': '1.500'}, {'g': 1, 'v': '1.234.567'}, {'g': 1, 'v': '2,5'}]
+        (resultado,) = GroupBy('g', {'total': ('sum', 'v'), 'maximo': ('max', 'v')}).consume(linhas).result()
+        self.assertEqual((resultado['total'], resultado['maximo']), (Decimal('1236069.5'), Decimal(1234567)))
+
+
+if __name__ == '__main__':
+    unittest.main()
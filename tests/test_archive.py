@@ -0,0 +1,105 @@
+import csv
+import io
+import json
+import random
+import tempfile
+import unittest
+
+from src.components.core import SnapshotArchive, decode_json, train_zlib_dictionary
+from src.components.core.archive import zstandard
+
+
+def _retrato(dia: int, n: int = 300) -> bytes:
+    rnd = random.Random(dia)
+    return json.dumps([
+        {
+            'id': i,
+            'nome': f'SERVIDOR {i}',
+            'cargo': rnd.choice(['ANALISTA LEGISLATIVO', 'TECNICO LEGISLATIVO', 'ASSESSOR PARLAMENTAR']),
+            'lotacao': rnd.choice(['SECRETARIA DE GESTAO', 'CONSULTORIA LEGISLATIVA', 'POLICIA DO SENADO']),
+            'situacao': 'ATIVO',
+        }
+        for i in range(n)
+    ]).encode()
+
+
+class TestSnapshotArchive(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.arquivo = SnapshotArchive(self.pasta, codec='zlib', bloco=4096, treinar_com=3)
+        self.endpoint = 'servidores/servidores/ativos'
+
+    def tearDown(self):
+        self.arquivo.close()
+
+    def test_ida_e_volta_com_indice_por_momento(self):
+        for dia in range(5):
+            self.arquivo.put(self.endpoint, None, _retrato(dia), capturado_em=1_700_000_000 + dia * 86400)
+        capturas = self.arquivo.captures(self.endpoint)
+        self.assertEqual(len(capturas), 5)
+        for dia, captura in enumerate(capturas):
+            self.assertEqual(self.arquivo.read(captura), _retrato(dia))
+        captura = self.arquivo.at(self.endpoint, momento=1_700_000_000 + 2.5 * 86400)
+        self.assertEqual(decode_json(self.arquivo.read(captura)), json.loads(_retrato(2)))
+        self.assertIsNone(self.arquivo.at(self.endpoint, momento=0))
+        self.assertEqual(len(self.arquivo.captures(self.endpoint, desde=1_700_000_000 + 3 * 86400)), 2)
+
+    def test_dicionario_treinado_melhora_compressao(self):
+        sem = [self.arquivo.put(self.endpoint, None, _retrato(dia)) for dia in range(3)]
+        com = self.arquivo.put(self.endpoint, None, _retrato(3))  # treina com as três anteriores
+        self.assertGreater(com.ratio, max(c.ratio for c in sem))
+        self.assertEqual(self.arquivo.read(com), _retrato(3))
+        self.assertEqual(self.arquivo.read(sem[0]), _retrato(0))  # capturas antigas seguem legíveis
+
+    def test_leitura_de_intervalo_e_fluxo(self):
+        corpo = _retrato(7, 1000)
+        captura = self.arquivo.put(self.endpoint, {'ano': 2024}, corpo)
+        self.assertEqual(self.arquivo.read(captura, 5000, 9000), corpo[5000:9000])
+        self.assertEqual(self.arquivo.read(captura.id, len(corpo) - 10), corpo[-10:])
+        self.assertEqual(b''.join(self.arquivo.iter_chunks(captura)), corpo)
+        with self.arquivo.open(captura) as leitor:
+            self.assertEqual(leitor.read(), corpo)
+        self.assertEqual(self.arquivo.captures(self.endpoint, {'ano': '2024'}), [captura])
+        self.assertEqual(self.arquivo.captures(self.endpoint, {'ano': 2023}), [])
+
+    def test_csv_em_fluxo(self):
+        corpo = 'nome;valor\n' + ''.join(f'N{i};{i},50\n' for i in range(2000))
+        captura = self.arquivo.put('servidores/remuneracoes', {'ano': 2024, 'mes': 1}, corpo.encode())
+        linhas = list(csv.reader(io.TextIOWrapper(self.arquivo.open(captura), encoding='utf-8'), delimiter=';'))
+        self.assertEqual(len(linhas), 2001)
+        self.assertEqual(linhas[-1], ['N1999', '1999,50'])
+
+    def test_reabertura(self):
+        captura = self.arquivo.put(self.endpoint, None, b'[]')
+        self.arquivo.close()
+        self.arquivo = SnapshotArchive(self.pasta, codec='zlib')
+        self.assertEqual(self.arquivo.read(captura), b'[]')
+        self.assertEqual(self.arquivo.endpoints(), [self.endpoint])
+        self.assertEqual(self.arquivo.stats()[self.endpoint]['capturas'], 1)
+
+    def test_dicionario_zlib(self):
+        amostras = [_retrato(dia) for dia in range(3)]
+        dicionario = train_zlib_dictionary(amostras, 1024)
+        self.assertLessEqual(len(dicionario), 1024)
+        self.assertIn(b'"situacao": "ATIVO"', dicionario)
+
+    @unittest.skipIf(zstandard is None, 'zstandard não instalado')
+    def test_zstd(self):
+        with SnapshotArchive(tempfile.mkdtemp(), codec='zstd', treinar_com=3) as arquivo:
+            capturas = [arquivo.put(self.endpoint, None, _retrato(dia)) for dia in range(5)]
+            self.assertEqual([arquivo.read(c) for c in capturas], [_retrato(dia) for dia in range(5)])
+
+    @unittest.skipIf(zstandard is None, 'zstandard não instalado')
+    def test_capturas_zlib_e_zstd_no_mesmo_arquivo(self):
+        # Sem dicionário, os dois codecs compartilhavam a mesma entrada do cache.
+        antigas = [self.arquivo.put(self.endpoint, None, _retrato(dia)) for dia in range(2)]
+        self.arquivo.close()
+        self.arquivo = SnapshotArchive(self.pasta, codec='zstd', treinar_com=None)
+        self.assertEqual(self.arquivo.read(antigas[0]), _retrato(0))
+        novas = [self.arquivo.put(self.endpoint, None, _retrato(dia)) for dia in range(2, 4)]
+        self.assertEqual([c.codec for c in antigas + novas], ['zlib', 'zlib', 'zstd', 'zstd'])
+        self.assertEqual([self.arquivo.read(c) for c in antigas + novas], [_retrato(dia) for dia in range(4)])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,145 @@
+import json
+import os
+import queue
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+import requests
+
+from src.components.senado import SnapshotSpec, SnapshotWatcher
+
+TERCEIRIZADOS = SnapshotSpec('terceirizados', 'contratacoes/terceirizados', ('id',))
+ESTAGIARIOS = SnapshotSpec('estagiarios', 'servidores/estagiarios')
+
+
+def _resposta(corpo, status=200, etag=None):
+    headers = {'Content-Type': 'application/json'}
+    if etag:
+        headers['ETag'] = etag
+    return MagicMock(ok=status < 400, status_code=status, content=json.dumps(corpo).encode(), headers=headers)
+
+
+class TestSnapshotWatcher(unittest.TestCase):
+    def setUp(self):
+        self.respostas = {}
+        patcher = patch('requests.get', side_effect=lambda url, **kw: self.respostas[url.rsplit('/v1/', 1)[1]](kw))
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_entrega_apenas_mudancas(self):
+        fila = queue.Queue()
+        recebidas = []
+        watcher = SnapshotWatcher([TERCEIRIZADOS, ESTAGIARIOS], callbacks=[recebidas.append], fila=fila)
+        self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta(
+            [{'id': 1, 'nome': 'Ana', 'lotacao': 'A'}, {'id': 2, 'nome': 'Bia', 'lotacao': 'B'}], etag='"v1"'
+        )
+        self.respostas['servidores/estagiarios'] = lambda kw: _resposta([{'nome': 'Caio'}])
+        self.assertEqual(watcher.poll_all(), [])  # o primeiro retrato é a referência
+
+        self.respostas['contratacoes/terceirizados'] = lambda kw: (
+            _resposta(None, status=304) if kw['headers'].get('If-None-Match') == '"v1"' else None
+        )
+        self.assertEqual(watcher.poll('terceirizados'), [])
+
+        self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta(
+            [{'lotacao': 'C', 'nome': 'Ana', 'id': 1}, {'id': 3, 'nome': 'Davi', 'lotacao': 'B'}], etag='"v2"'
+        )
+        self.respostas['servidores/estagiarios'] = lambda kw: _resposta([{'nome': 'Caio'}, {'nome': 'Eva'}])
+        mudancas = watcher.poll_all()
+        self.assertEqual([(m.dataset, m.tipo, m.chave) for m in mudancas], [
+            ('terceirizados', 'update', '1'),
+            ('terceirizados', 'insert', '3'),
+            ('terceirizados', 'delete', '2'),
+            ('estagiarios', 'insert', mudancas[3].chave),
+        ])
+        self.assertEqual(mudancas[0].anterior['lotacao'], 'A')
+        self.assertEqual(mudancas[2].anterior['nome'], 'Bia')
+        self.assertEqual(mudancas[3].registro, {'nome': 'Eva'})
+        self.assertEqual(recebidas, mudancas)
+        self.assertEqual([fila.get_nowait() for _ in range(fila.qsize())], mudancas)
+
+        # Campos reordenados não são mudança.
+        self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta(
+            [{'id': 1, 'nome': 'Ana', 'lotacao': 'C'}, {'id': 3, 'nome': 'Davi', 'lotacao': 'B'}]
+        )
+        self.assertEqual(watcher.poll('terceirizados'), [])
+
+    def test_estado_persistido_e_erros(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            estado = os.path.join(pasta, 'cdc.json')
+            self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([{'id': 1, 'nome': 'Ana'}], etag='"v1"')
+            SnapshotWatcher([TERCEIRIZADOS], estado=estado).run(iteracoes=1)
+
+            self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([], status=500)
+            watcher = SnapshotWatcher([TERCEIRIZADOS], estado=estado)
+            self.assertEqual(watcher.poll_all(), [])
+            self.assertIn('terceirizados', watcher.erros)
+
+            self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([])
+            mudancas = watcher.poll_all()
+            self.assertEqual([(m.tipo, m.anterior) for m in mudancas], [('delete', {'id': 1, 'nome': 'Ana'})])
+            self.assertEqual(watcher.erros, {})
+
+    def test_falhas_de_rede_e_corpos_invalidos_nao_alteram_o_retrato(self):
+        watcher = SnapshotWatcher([TERCEIRIZADOS])
+        self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([{'id': 1, 'nome': 'Ana'}])
+        watcher.poll_all()
+
+        def queda(kw):
+            raise requests.ConnectionError('reset')
+
+        vazio = _resposta(None)
+        vazio.content = b'  '
+        invalido = _resposta(None)
+        invalido.content = b'[{"id": 1'
+        for resposta in (queda, lambda kw: vazio, lambda kw: invalido):
+            self.respostas['contratacoes/terceirizados'] = resposta
+            self.assertEqual(watcher.poll_all(), [])
+            self.assertIn('terceirizados', watcher.erros)
+
+        self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([{'id': 1, 'nome': 'Ana'}, {'id': 2}])
+        self.assertEqual([(m.tipo, m.chave) for m in watcher.poll_all()], [('insert', '2')])
+        self.assertEqual(watcher.erros, {})
+
+    def test_estado_gravado_apos_a_entrega(self):
+        with tempfile.TemporaryDirectory() as pasta:
+            estado = os.path.join(pasta, 'cdc.json')
+            self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([{'id': 1}])
+            SnapshotWatcher([TERCEIRIZADOS], estado=estado).poll('terceirizados')
+
+            def falha(mudanca):
+                raise RuntimeError('destino indisponível')
+
+            self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([{'id': 1}, {'id': 2}])
+            watcher = SnapshotWatcher([TERCEIRIZADOS], estado=estado, callbacks=[falha])
+            with self.assertRaises(RuntimeError):
+                watcher.poll('terceirizados')
+
+            # A mudança não entregue volta na consulta seguinte, nesta execução ou na próxima.
+            recebidas = []
+            novo = SnapshotWatcher([TERCEIRIZADOS], estado=estado, callbacks=[recebidas.append])
+            self.assertEqual([m.chave for m in novo.poll('terceirizados')], ['2'])
+            watcher.callbacks = [recebidas.append]
+            self.assertEqual([m.chave for m in watcher.poll('terceirizados')], ['2'])
+            self.assertEqual(len(recebidas), 2)
+
+    def test_falha_na_entrega_nao_interrompe_o_laco(self):
+        self.respostas['contratacoes/terceirizados'] = lambda kw: _resposta([{'id': 1}])
+        recebidas, erros = [], []
+
+        def entregar(mudanca):
+            if not erros:
+                erros.append(mudanca.chave)
+                raise RuntimeError('destino indisponível')
+            recebidas.append(mudanca.chave)
+
+        watcher = SnapshotWatcher([TERCEIRIZADOS], intervalo=0.01, callbacks=[entregar], emitir_inicial=True)
+        watcher.run(iteracoes=1)
+        self.assertEqual(watcher.erros, {'terceirizados': 'RuntimeError: destino indisponível'})
+        watcher.run(iteracoes=2)
+        self.assertEqual((erros, recebidas), (['1'], ['1']))
+        self.assertEqual(watcher.erros, {})
+
+if __name__ == '__main__':
+    unittest.main()
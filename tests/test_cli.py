@@ -0,0 +1,160 @@
+import io
+import json
+import os
+import tempfile
+import time
+import unittest
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from src.components.cli import main
+from src.components.core import RateLimiter, Transport
+from src.components.core.archive import SnapshotArchive
+
+
+def _resposta(corpo, status=200):
+    return MagicMock(
+        ok=status < 400, status_code=status, content=json.dumps(corpo).encode(),
+        headers={'Content-Type': 'application/json'}, text=json.dumps(corpo),
+    )
+
+
+def _senado(url, **kwargs):
+    caminho = url.rsplit('/v1/', 1)[1]
+    if caminho == 'contratacoes/contratos':
+        return _resposta([{'id': i, 'numero': f'{i}/2024'} for i in range(5)])
+    if caminho.startswith('senadores/despesas_ceaps/'):
+        ano = int(caminho.rsplit('/', 1)[1])
+        return _resposta([{'id': ano * 10 + i, 'ano': ano, 'valorReembolsado': 1.5} for i in range(3)])
+    return _resposta({'erro': caminho}, status=404)
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.ano = date.today().year
+        patcher = patch('requests.get', side_effect=_senado)
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _main(self, *argv):
+        saida = io.StringIO()
+        with patch('sys.stderr', io.StringIO()):
+            codigo = main(list(argv) + ['--progress', '0.05'], saida)
+        return codigo, saida.getvalue()
+
+    def test_sync_senado_retoma_de_onde_parou(self):
+        db = os.path.join(self.pasta, 'senado.db')
+        args = ('sync', 'senado', 'contratos', 'despesas_ceaps', '--db', db, '--since', str(self.ano - 1), '--workers', '2')
+        codigo, saida = self._main(*args)
+        self.assertEqual(codigo, 0)
+        self.assertIn('contratos: 1 baixadas', saida)
+        self.assertIn('despesas_ceaps: 2 baixadas', saida)
+        self.assertIn('cache hits:', saida)
+        self.assertEqual(self.mock_get.call_count, 3)
+
+        # Segunda execução: o ano anterior está encerrado e não é baixado de novo.
+        self.mock_get.reset_mock()
+        codigo, saida = self._main(*args)
+        self.assertEqual(codigo, 0)
+        self.assertLess(self.mock_get.call_count, 3)
+
+    def test_sync_senado_com_erro(self):
+        codigo, saida = self._main('sync', 'senado', 'licitacoes', '--db', os.path.join(self.pasta, 'x.db'), '--retries', '0')
+        self.assertEqual(codigo, 1)
+        self.assertIn('1 com erro', saida)
+
+    def test_sync_senado_falha_de_rede_fica_na_particao(self):
+        def responder(url, **kwargs):
+            if url.endswith(f'/despesas_ceaps/{self.ano}'):
+                raise requests.ConnectionError('reset')
+            return _senado(url, **kwargs)
+
+        self.mock_get.side_effect = responder
+        db = os.path.join(self.pasta, 'senado.db')
+        codigo, saida = self._main('sync', 'senado', 'despesas_ceaps', '--db', db, '--since', str(self.ano - 1), '--retries', '0')
+        self.assertEqual(codigo, 1)
+        self.assertIn('despesas_ceaps: 1 baixadas, 0 inalteradas, 1 com erro', saida)
+        self.assertIn(f'  {self.ano}: reset', saida)
+
+    def test_sync_bacen_arquiva_o_corpo_recebido(self):
+        corpo = b'[ {"data": "02/01/2024", "valor": "0.42"} ]'
+        self.mock_get.side_effect = lambda url, **kwargs: MagicMock(
+            ok=True, status_code=200, content=corpo, headers={'Content-Type': 'application/json'},
+        )
+        pasta = os.path.join(self.pasta, 'arquivo')
+        codigo, _ = self._main('sync', 'bacen', '--archive', pasta, '--sgs', '433')
+        self.assertEqual(codigo, 0)
+        with SnapshotArchive(pasta) as arquivo:
+            self.assertEqual(arquivo.read(arquivo.at('sgs/433', {'dataInicial': None})), corpo)
+
+    def test_export_com_resume(self):
+        destino = os.path.join(self.pasta, 'lake')
+        args = ('export', 'despesas_ceaps', '--out', destino, '--since', str(self.ano - 2), '--format', 'ndjson', '--shards', '2')
+        codigo, saida = self._main(*args)
+        self.assertEqual(codigo, 0)
+        self.assertEqual(sorted(os.listdir(destino)), [f'periodo={a}' for a in range(self.ano - 2, self.ano + 1)])
+        with open(os.path.join(destino, f'periodo={self.ano}', 'manifest.json')) as arquivo:
+            self.assertEqual(json.load(arquivo)['linhas'], 3)
+
+        self.mock_get.reset_mock()
+        codigo, saida = self._main(*args, '--resume')
+        self.assertEqual((codigo, self.mock_get.call_count), (0, 0))
+
+    def test_cache_de_respostas(self):
+        cache = os.path.join(self.pasta, 'cache')
+        destino = os.path.join(self.pasta, 'contratos')
+        self._main('export', 'contratos', '--out', destino, '--format', 'ndjson', '--cache', cache)
+        codigo, saida = self._main('export', 'contratos', '--out', destino, '--format', 'ndjson', '--cache', cache)
+        self.assertEqual(self.mock_get.call_count, 1)
+        self.assertRegex(saida, r'cache hits:\s+1')
+
+    def test_bench(self):
+        codigo, saida = self._main('bench', 'contratacoes/contratos', '--repeat', '3')
+        self.assertEqual(codigo, 0)
+        self.assertIn('decode_json[json]', saida)
+        self.assertRegex(saida, r'enviadas:\s+3')
+
+    def test_concorrencia_adaptativa(self):
+        codigo, saida = self._main('bench', 'contratacoes/contratos', '--repeat', '3', '--adaptive', '--workers', '8')
+        self.assertEqual(codigo, 0)
+        self.assertRegex(saida, r'concorrência:\s+adm.senado.gov.br=\d+')
+
+
+class TestTransportRetries(unittest.TestCase):
+    @patch('time.sleep')
+    @patch('requests.get')
+    def test_repete_falhas_transitorias(self, mock_get, _):
+        mock_get.side_effect = [requests.ConnectionError('reset'), _resposta([], status=503), _resposta([1])]
+        transporte = Transport(retries=3, backoff=0.01)
+        self.assertEqual(transporte.get('https://api.bcb.gov.br/x').content, b'[1]')
+        metricas = transporte.metrics.host('api.bcb.gov.br')
+        self.assertEqual((metricas.upstream_requests, metricas.retries, metricas.errors), (1, 2, 1))
+
+    @patch('time.sleep')
+    @patch('requests.get')
+    def test_respeita_retry_after(self, mock_get, mock_sleep):
+        limite = _resposta([], status=429)
+        limite.headers['Retry-After'] = '3'
+        mock_get.side_effect = [limite, _resposta([], status=503), _resposta([1])]
+        transporte = Transport(retries=2, backoff=0.01)
+        self.assertEqual(transporte.get('https://api.bcb.gov.br/x').content, b'[1]')
+        self.assertEqual([c.args[0] for c in mock_sleep.call_args_list], [3.0, 0.02])
+
+    @patch('requests.get', side_effect=requests.ConnectionError('reset'))
+    def test_sem_retries_propaga(self, _):
+        with self.assertRaises(requests.ConnectionError):
+            Transport().get('https://api.bcb.gov.br/x')
+
+    def test_rate_limiter(self):
+        limitador = RateLimiter(50)
+        inicio = time.monotonic()
+        for _ in range(6):
+            limitador.acquire()
+        self.assertGreaterEqual(time.monotonic() - inicio, 5 / 50 * 0.9)
+
+
+if __name__ == '__main__':
+    unittest.main()
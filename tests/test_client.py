@@ -1,3 +1,4 @@
+import json
 import unittest
 from unittest.mock import patch, MagicMock
 from datetime import date
@@ -13,7 +14,7 @@ class TestBacenClient(unittest.TestCase):
     def test_sgs_json_default(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'foo': 'bar'}
+        mock_response.content = json.dumps({'foo': 'bar'}).encode()
         mock_get.return_value = mock_response
 
         result = self.client.sgs(100)
@@ -41,7 +42,7 @@ class TestBacenClient(unittest.TestCase):
     def test_sgs_with_dates(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'ok': True}
+        mock_response.content = json.dumps({'ok': True}).encode()
         mock_get.return_value = mock_response
 
         di = date(2022, 5, 1)
@@ -56,7 +57,7 @@ class TestBacenClient(unittest.TestCase):
     def test_sgs_with_ultimos(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'ultimos': 5}
+        mock_response.content = json.dumps({'ultimos': 5}).encode()
         mock_get.return_value = mock_response
 
         result = self.client.sgs(400, ultimos=5)
@@ -81,7 +82,7 @@ class TestBacenClient(unittest.TestCase):
         # JSON
         mock_response_json = MagicMock()
         mock_response_json.ok = True
-        mock_response_json.json.return_value = {'a': 1}
+        mock_response_json.content = json.dumps({'a': 1}).encode()
         mock_get.return_value = mock_response_json
         self.assertIsInstance(self.client.sgs(600), dict)
 
@@ -96,7 +97,7 @@ class TestBacenClient(unittest.TestCase):
     def test_sgs_params_combination(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'combo': True}
+        mock_response.content = json.dumps({'combo': True}).encode()
         mock_get.return_value = mock_response
 
         di = date(2023, 1, 1)
@@ -115,7 +116,7 @@ class TestBacenClient(unittest.TestCase):
     def test_expectativas_json_default(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'result': 123}
+        mock_response.content = json.dumps({'result': 123}).encode()
         mock_get.return_value = mock_response
 
         result = self.client.expectativas('RelatorioTeste')
@@ -154,7 +155,7 @@ class TestBacenClient(unittest.TestCase):
     def test_expectativas_with_odata_params(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'odata': True}
+        mock_response.content = json.dumps({'odata': True}).encode()
         mock_get.return_value = mock_response
 
         result = self.client.expectativas('RelatorioOData', top=10, filter="foo eq 'bar'")
@@ -179,7 +180,7 @@ class TestBacenClient(unittest.TestCase):
     def test_emissao_moedas_anual_default(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'data': [1, 2, 3]}
+        mock_response.content = json.dumps({'data': [1, 2, 3]}).encode()
         mock_get.return_value = mock_response
 
         result = self.client.emissao_moedas_anual()
@@ -193,7 +194,7 @@ class TestBacenClient(unittest.TestCase):
     def test_emissao_moedas_anual_with_odata_params(self, mock_get):
         mock_response = MagicMock()
         mock_response.ok = True
-        mock_response.json.return_value = {'odata': 'yes'}
+        mock_response.content = json.dumps({'odata': 'yes'}).encode()
         mock_get.return_value = mock_response
 
         result = self.client.emissao_moedas_anual(top=5, filter="ano eq 2023")
@@ -0,0 +1,142 @@
+import importlib.util
+import json
+import math
+import unittest
+from array import array
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+from src.components.bacen.client import BacenClient
+from src.components.core import Table
+from src.components.senado import ServidoresSenadoClient, TipoRetorno
+
+
+def _instalado(modulo: str) -> bool:
+    return importlib.util.find_spec(modulo) is not None
+
+
+class TestTable(unittest.TestCase):
+    def setUp(self):
+        self.tabela = Table({
+            'ano': [2023, 2024],
+            'valor': [1.5, None],
+            'nome': ['A', 'B'],
+            'data': [date(2024, 1, 1), date(2024, 2, 1)],
+        })
+
+    def test_colunas_numericas_em_buffers(self):
+        self.assertIsInstance(self.tabela['ano'], array)
+        self.assertEqual(self.tabela['ano'].typecode, 'q')
+        self.assertEqual(self.tabela['valor'].typecode, 'd')
+        self.assertTrue(math.isnan(self.tabela['valor'][1]))
+        self.assertEqual(self.tabela.kinds['nome'], 'string')
+        self.assertEqual(self.tabela.kinds['data'], 'date')
+        self.assertEqual(len(self.tabela), 2)
+
+    def test_coluna_monetaria_exata(self):
+        tabela = Table({'valor': [Decimal('1234.56'), None, 3]})
+        self.assertEqual(tabela.kinds['valor'], 'decimal')
+        self.assertEqual(tabela.to_records(), [{'valor': Decimal('1234.56')}, {'valor': None}, {'valor': Decimal(3)}])
+
+    def test_coluna_monetaria_em_buffer(self):
+        tabela = Table({'valor': [Decimal('1234.56'), None, Decimal('0.10')]}, decimais_em_float=True)
+        self.assertEqual(tabela.kinds['valor'], 'float64')
+        self.assertIsInstance(tabela['valor'], array)
+        self.assertEqual(tabela['valor'][0], 1234.56)
+        self.assertTrue(math.isnan(tabela['valor'][1]))
+        self.assertIsNone(tabela.to_records()[1]['valor'])
+
+    def test_inteiros_com_nulos(self):
+        tabela = Table.from_records([{'n': 1}, {'n': None}, {'n': 2 ** 62 + 1}])
+        self.assertEqual((tabela.kinds['n'], tabela['n'].typecode), ('int64', 'q'))
+        self.assertEqual(tabela.to_records(), [{'n': 1}, {'n': None}, {'n': 2 ** 62 + 1}])
+
+    @unittest.skipUnless(_instalado('numpy'), 'numpy não instalado')
+    def test_coluna_monetaria_sem_copia(self):
+        import numpy as np
+
+        tabela = Table({'valor': [Decimal('1234.56'), Decimal('0.10')]}, decimais_em_float=True)
+        coluna = tabela._numpy_column('valor')
+        self.assertEqual(coluna.dtype, np.float64)
+        coluna[0] = 1.0  # visão sobre o mesmo buffer
+        self.assertEqual(tabela['valor'][0], 1.0)
+
+    @unittest.skipUnless(_instalado('pyarrow'), 'pyarrow não instalado')
+    def test_coluna_monetaria_no_arrow(self):
+        import pyarrow as pa
+
+        tabela = Table({'valor': [Decimal('1234.56'), Decimal('0.10')]}).to_arrow()
+        self.assertTrue(pa.types.is_decimal(tabela.column('valor').type))
+        self.assertEqual(tabela.column('valor').to_pylist(), [Decimal('1234.56'), Decimal('0.10')])
+        tabela = Table({'valor': [Decimal('1234.56'), Decimal('0.10')]}, decimais_em_float=True).to_arrow()
+        self.assertEqual(tabela.column('valor').type, pa.float64())
+
+    @unittest.skipUnless(_instalado('pyarrow'), 'pyarrow não instalado')
+    def test_nulos_no_arrow(self):
+        import pyarrow as pa
+
+        registros = [{'n': i if i % 3 else None, 'x': i / 2 if i % 4 else None} for i in range(11)]
+        tabela = Table.from_records(registros).to_arrow()
+        self.assertEqual(tabela.column('n').type, pa.int64())
+        self.assertEqual((tabela.column('n').null_count, tabela.column('x').null_count), (4, 3))
+        self.assertEqual(tabela.to_pylist(), registros)
+
+    def test_from_records(self):
+        tabela = Table.from_records([{'a': 1}, {'a': 2, 'b': 'x'}])
+        self.assertEqual(tabela.column_names, ['a', 'b'])
+        self.assertEqual(tabela['b'], [None, 'x'])
+        self.assertEqual(tabela.to_records(), [{'a': 1, 'b': None}, {'a': 2, 'b': 'x'}])
+
+    def test_tamanhos_diferentes(self):
+        with self.assertRaises(ValueError):
+            Table({'a': [1], 'b': [1, 2]})
+
+    @unittest.skipUnless(_instalado('pyarrow'), 'pyarrow não instalado')
+    def test_to_arrow(self):
+        tabela = self.tabela.to_arrow()
+        self.assertEqual(tabela.column('ano').to_pylist(), [2023, 2024])
+        self.assertEqual(tabela.num_rows, 2)
+
+    @unittest.skipUnless(_instalado('pandas'), 'pandas não instalado')
+    def test_to_pandas(self):
+        df = self.tabela.to_pandas()
+        self.assertEqual(list(df['ano']), [2023, 2024])
+
+
+class TestClientesColunares(unittest.TestCase):
+    @patch('requests.get')
+    def test_senado_colunas(self, mock_get):
+        mock_get.return_value = MagicMock(
+            ok=True,
+            text='ano;valor;nome\n2024;1.234,50;A\n2024;10,00;B\n',
+            headers={'Content-Type': 'text/csv'},
+        )
+        tabela = ServidoresSenadoClient().remuneracoes(2024, 1, TipoRetorno.COLUNAS)
+        self.assertIsInstance(tabela, Table)
+        self.assertEqual(list(tabela['ano']), [2024, 2024])
+        self.assertEqual((tabela.kinds['valor'], list(tabela['valor'])), ('float64', [1234.5, 10.0]))
+        args, _ = mock_get.call_args
+        self.assertTrue(args[0].endswith('/servidores/remuneracoes/2024/1/csv'))
+
+    @patch('requests.get')
+    def test_bacen_sgs_colunar(self, mock_get):
+        mock_get.return_value = MagicMock(ok=True, text='data;valor\n01/01/2024;0,04\n02/01/2024;0,05\n')
+        tabela = BacenClient().sgs(11, colunar=True)
+        # Com o numpy, a coluna de datas é um datetime64[D]; sem ele, uma lista de `date`.
+        self.assertEqual((tabela.kinds['data'], [str(d) for d in tabela['data']]), ('date', ['2024-01-01', '2024-01-02']))
+        self.assertEqual((tabela.kinds['valor'], list(tabela['valor'])), ('decimal', [Decimal('0.04'), Decimal('0.05')]))
+        _, kwargs = mock_get.call_args
+        self.assertEqual(kwargs['params']['formato'], 'csv')
+
+    @patch('requests.get')
+    def test_bacen_ptax_colunar(self, mock_get):
+        valor = [{'cotacaoCompra': 5.1, 'dataHoraCotacao': '2024-01-02'}]
+        mock_get.return_value = MagicMock(ok=True, content=json.dumps({'value': valor}).encode())
+        tabela = BacenClient().ptax('CotacaoDolarDia', colunar=True)
+        self.assertEqual(tabela.kinds['cotacaoCompra'], 'float64')
+        self.assertEqual(tabela.to_records(), valor)
+
+
+if __name__ == '__main__':
+    unittest.main()
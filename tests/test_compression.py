@@ -0,0 +1,66 @@
+import gzip
+import io
+import json
+import unittest
+from unittest.mock import patch
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3 import HTTPResponse
+
+from src.components.core import Transport, accept_encoding, available_encodings
+
+
+CORPO = json.dumps([{'lotacao': 'SECRETARIA', 'cargo': 'ANALISTA', 'valor': i} for i in range(500)]).encode()
+
+
+def resposta_gzip(url='https://adm.senado.gov.br/x', stream=False):
+    raw = HTTPResponse(
+        body=io.BytesIO(gzip.compress(CORPO)),
+        headers={'Content-Encoding': 'gzip', 'Content-Type': 'application/json'},
+        status=200,
+        preload_content=False,
+        decode_content=True,
+    )
+    request = requests.Request('GET', url).prepare()
+    response = HTTPAdapter().build_response(request, raw)
+    if not stream:
+        response.content
+    return response
+
+
+class TestCompression(unittest.TestCase):
+    def test_accept_encoding_inclui_gzip(self):
+        self.assertEqual(available_encodings()[-2:], ['gzip', 'deflate'])
+        self.assertTrue(accept_encoding().endswith('gzip, deflate'))
+
+    @patch('requests.get')
+    def test_negocia_e_mede_razao_de_compressao(self, mock_get):
+        mock_get.return_value = resposta_gzip()
+        transport = Transport()
+
+        response = transport.get('https://adm.senado.gov.br/x')
+        self.assertEqual(response.json()[1]['valor'], 1)
+        _, kwargs = mock_get.call_args
+        self.assertEqual(kwargs['headers']['Accept-Encoding'], accept_encoding())
+
+        metricas = transport.metrics.host('adm.senado.gov.br')
+        self.assertEqual(metricas.decoded_bytes, len(CORPO))
+        self.assertLess(metricas.wire_bytes, len(CORPO) / 5)
+        self.assertGreater(metricas.compression_ratio, 5)
+        self.assertEqual(metricas.encodings, {'gzip': 1})
+
+    @patch('requests.get')
+    def test_descompressao_incremental(self, mock_get):
+        mock_get.return_value = resposta_gzip(stream=True)
+        transport = Transport()
+
+        response = transport.get('https://adm.senado.gov.br/x', stream=True)
+        blocos = list(transport.iter_content(response, chunk_size=1024))
+        self.assertGreater(len(blocos), 1)
+        self.assertEqual(b''.join(blocos), CORPO)
+        self.assertEqual(transport.metrics.host('adm.senado.gov.br').decoded_bytes, len(CORPO))
+
+
+if __name__ == '__main__':
+    unittest.main()
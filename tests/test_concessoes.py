@@ -0,0 +1,59 @@
+import json
+import unittest
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+from src.components.senado import SupridosSenadoClient
+
+CORPOS = {
+    'supridos/2024': [
+        {'numeroAtoConcessao': '12/2024', 'cpf': '***.111.222-**', 'nome': 'Ana', 'valorConcedido': 1000},
+        {'numeroAtoConcessao': '13/2024', 'cpf': '***.333.444-**', 'nome': 'Bruno', 'valorConcedido': 500},
+    ],
+    'supridos/atosConcessao/2024': [{'numeroAtoConcessao': '12/2024', 'cpf': '***.111.222-**', 'valorConcedido': '1.000,00'}],
+    'supridos/transacoes/2024': [
+        {'numeroAtoConcessao': '12/2024', 'valor': '150.25'},
+        {'numeroAtoConcessao': '12/2024', 'valor': 49.75},
+        {'numeroAtoConcessao': '13/2024', 'valor': 500},
+    ],
+    'supridos/movimentacoes/2024': [{'numeroAtoConcessao': '12/2024', 'valorDevolvido': 300}],
+    'supridos/empenhos/2024': [{'numeroAtoConcessao': '12/2024', 'numero': '2024NE000123'}, {'numero': 'sem ato'}],
+    'supridos/2023': [{'numeroAtoConcessao': '12/2024', 'nome': 'Carla', 'valorConcedido': 10}],
+    'supridos/atosConcessao/2023': [{'numeroAtoConcessao': '7/2023', 'valorConcedido': '1.500', 'valorUtilizado': '1.234'}],
+    'supridos/transacoes/2023': [{'numeroAtoConcessao': '7/2023', 'valor': 1000}],
+    'supridos/movimentacoes/2023': [],
+    'supridos/empenhos/2023': [],
+}
+
+
+def _resposta(url, **kwargs):
+    corpo = json.dumps(CORPOS[url.split('/v1/', 1)[1]]).encode()
+    return MagicMock(ok=True, status_code=200, content=corpo, headers={'Content-Type': 'application/json'})
+
+
+class TestSupridosRelacional(unittest.TestCase):
+    @patch('requests.get', side_effect=_resposta)
+    def test_atos_ligados_e_totalizados(self, mock_get):
+        visao = SupridosSenadoClient().relacional([2023, 2024])
+
+        self.assertEqual(mock_get.call_count, 10)
+        self.assertEqual(len(visao), 4)
+        ato = visao.ato('12/2024', 2024)
+        self.assertEqual((len(ato.supridos), len(ato.transacoes), len(ato.movimentacoes), len(ato.empenhos)), (1, 2, 1, 1))
+        self.assertEqual((ato.concedido, ato.gasto, ato.devolvido, ato.saldo),
+                         (Decimal('1000.00'), Decimal('200.00'), Decimal(300), Decimal('500.00')))
+        self.assertEqual(visao.ato('13/2024').concedido, Decimal(500))
+        self.assertEqual(visao.ato('12/2024', 2023).supridos[0]['nome'], 'Carla')
+        self.assertEqual([a.numero for a in visao.pessoa('***.111.222-**')], ['12/2024'])
+        self.assertEqual(visao.sem_ato, [{'numero': 'sem ato'}])
+        self.assertEqual(visao.totais()['gasto'], Decimal('1934.00'))
+
+    @patch('requests.get', side_effect=_resposta)
+    def test_valores_do_ato_prevalecem(self, _):
+        # Pontos de milhar sem vírgula: '1.500' é mil e quinhentos.
+        ato = SupridosSenadoClient().relacional([2023]).ato('7/2023')
+        self.assertEqual((ato.concedido, ato.gasto, ato.saldo), (Decimal(1500), Decimal(1234), Decimal(266)))
+
+
+if __name__ == '__main__':
+    unittest.main()
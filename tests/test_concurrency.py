@@ -0,0 +1,192 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.components.bacen.client import BacenClient
+from src.components.core import AdaptiveLimiter, HedgeBudget, Hedger, LatencyTracker, Transport, route_key
+
+
+def _resposta(corpo=None, status=200):
+    return MagicMock(
+        ok=status < 400, status_code=status, content=json.dumps(corpo).encode(),
+        headers={'Content-Type': 'application/json'},
+    )
+
+
+def _hedger(url, latencia):
+    tracker = LatencyTracker(minimo=5)
+    for _ in range(5):
+        tracker.record(route_key(url), latencia)
+    return Hedger(0.9, HedgeBudget(razao=1), tracker)
+
+
+def _rodada(limitador: AdaptiveLimiter, rtt: float) -> None:
+    """Ocupa todas as vagas e as libera com o mesmo RTT."""
+    n = limitador.limit
+    for _ in range(n):
+        limitador.acquire()
+    for _ in range(n):
+        limitador.release(rtt)
+
+
+class TestAdaptiveLimiter(unittest.TestCase):
+    def test_cresce_enquanto_a_latencia_nao_sobe(self):
+        limitador = AdaptiveLimiter(inicial=4, maximo=32)
+        for _ in range(20):
+            _rodada(limitador, 0.1)
+        self.assertEqual(limitador.limit, 32)
+
+    def test_encolhe_quando_forma_fila(self):
+        limitador = AdaptiveLimiter(inicial=20)
+        _rodada(limitador, 0.1)
+        antes = limitador.limit
+        for _ in range(10):
+            _rodada(limitador, 0.4)
+        self.assertLess(limitador.limit, antes / 2)
+
+    def test_erros_reduzem_ate_o_minimo(self):
+        limitador = AdaptiveLimiter(inicial=10, minimo=2, recuo=0.5)
+        for _ in range(2):
+            limitador.acquire()
+            limitador.release(None, erro=True)
+        self.assertEqual(limitador.limit, 2)
+        for _ in range(5):
+            limitador.acquire()
+            limitador.release(None, erro=True)
+        self.assertEqual(limitador.limit, 2)
+
+    def test_nao_cresce_sem_demanda(self):
+        limitador = AdaptiveLimiter(inicial=8)
+        for _ in range(50):
+            limitador.acquire()
+            limitador.release(0.1)
+        self.assertEqual(limitador.limit, 8)
+        limitador.acquire()
+        limitador.release(None, erro=True)
+        self.assertEqual((limitador.limit, limitador.in_flight), (7, 0))
+
+    def test_espera_por_vaga(self):
+        limitador = AdaptiveLimiter(inicial=1)
+        self.assertTrue(limitador.acquire())
+        self.assertFalse(limitador.acquire(timeout=0.05))
+        threading.Timer(0.05, limitador.release, (0.01,)).start()
+        self.assertTrue(limitador.acquire(timeout=2))
+        self.assertEqual(limitador.in_flight, 1)
+
+
+class TestTransportAdaptativo(unittest.TestCase):
+    def test_concorrencia_acompanha_a_capacidade(self):
+        # Servidor com 4 vagas: acima disso, cada requisição espera na fila.
+        em_voo = pico = 0
+        lock = threading.Lock()
+
+        def servidor(url, **kwargs):
+            nonlocal em_voo, pico
+            with lock:
+                em_voo += 1
+                pico = max(pico, em_voo)
+                n = em_voo
+            time.sleep(0.01 * max(1, n / 4))
+            with lock:
+                em_voo -= 1
+            return _resposta([])
+
+        transporte = Transport(coalesce=False, adaptive=True)
+        with patch('requests.get', side_effect=servidor):
+            def baixar(i):
+                for j in range(25):
+                    transporte.get(f'https://adm.senado.gov.br/api/v1/x/{i}/{j}')
+
+            threads = [threading.Thread(target=baixar, args=(i,)) for i in range(24)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join(30)
+        limite = transporte.metrics.host('adm.senado.gov.br').concurrency_limit
+        self.assertEqual(limite, transporte.limiter('adm.senado.gov.br').limit)
+        self.assertLessEqual(pico, 16)
+        self.assertLessEqual(limite, 16)
+
+    @patch('requests.get', return_value=_resposta([], status=503))
+    def test_sobrecarga_reduz_o_limite(self, _):
+        transporte = Transport(adaptive=lambda: AdaptiveLimiter(inicial=16))
+        for i in range(10):
+            transporte.get(f'https://olinda.bcb.gov.br/x/{i}')
+        self.assertLess(transporte.metrics.host('olinda.bcb.gov.br').concurrency_limit, 8)
+        self.assertIsNone(Transport().limiter('olinda.bcb.gov.br'))
+
+    @patch('requests.get')
+    def test_hedge_so_sai_com_vaga_livre(self, mock_get):
+        url = 'https://olinda.bcb.gov.br/x/1'
+
+        def servidor(url, **kwargs):
+            time.sleep(0.2)
+            return _resposta([])
+
+        mock_get.side_effect = servidor
+        transporte = Transport(hedge=_hedger(url, 0.01), adaptive=lambda: AdaptiveLimiter(inicial=1, maximo=1))
+        self.addCleanup(transporte.close)
+        transporte.get(url)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(transporte.metrics.host('olinda.bcb.gov.br').hedged_requests, 0)
+        self.assertEqual(transporte.limiter('olinda.bcb.gov.br').in_flight, 0)
+
+    @patch('requests.get', return_value=_resposta([]))
+    def test_espera_por_vaga_nao_conta_para_o_hedge(self, mock_get):
+        url = 'https://olinda.bcb.gov.br/x/1'
+        transporte = Transport(hedge=_hedger(url, 0.05), adaptive=lambda: AdaptiveLimiter(inicial=2, maximo=2))
+        self.addCleanup(transporte.close)
+        limitador = transporte.limiter('olinda.bcb.gov.br')
+        # As duas vagas estão ocupadas por 0,3 s; a requisição em si é imediata.
+        limitador.acquire()
+        limitador.acquire()
+        threading.Timer(0.3, lambda: (limitador.release(None), limitador.release(None))).start()
+        transporte.get(url)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(transporte.metrics.host('olinda.bcb.gov.br').hedged_requests, 0)
+        self.assertEqual(limitador.in_flight, 0)
+
+
+class TestODataPages(unittest.TestCase):
+    @patch('requests.get')
+    def test_paginas_ate_a_incompleta(self, mock_get):
+        def responder(url, params=None, **kwargs):
+            skip, top = params['$skip'], params['$top']
+            return _resposta({'value': [{'i': i} for i in range(skip, min(skip + top, 2500))]})
+
+        mock_get.side_effect = responder
+        cliente = BacenClient()
+        cliente._transport = Transport()
+        registros = cliente.odata_pages(cliente.expectativas, 'ExpectativasMercadoAnuais', top=1000, workers=2, filter="Indicador eq 'IPCA'")
+        self.assertEqual([r['i'] for r in registros], list(range(2500)))
+        # Depois da página incompleta, só a que já estava em andamento na janela.
+        skips = sorted(c.kwargs['params']['$skip'] for c in mock_get.call_args_list)
+        self.assertIn(skips, ([0, 1000, 2000], [0, 1000, 2000, 3000]))
+        self.assertTrue(all(c.kwargs['params']['$filter'] == "Indicador eq 'IPCA'" for c in mock_get.call_args_list))
+
+    @patch('requests.get')
+    def test_pagina_lenta_nao_segura_as_demais(self, mock_get):
+        liberar = threading.Event()
+
+        def responder(url, params=None, **kwargs):
+            skip, top = params['$skip'], params['$top']
+            if skip == 0:
+                liberar.wait(5)
+            elif skip >= 50:
+                liberar.set()
+            return _resposta({'value': [{'i': i} for i in range(skip, min(skip + top, 50))]})
+
+        mock_get.side_effect = responder
+        cliente = BacenClient()
+        cliente._transport = Transport()
+        inicio = time.monotonic()
+        registros = cliente.odata_pages(cliente.expectativas, 'ExpectativasMercadoAnuais', top=10, workers=2)
+        self.assertLess(time.monotonic() - inicio, 2)
+        self.assertEqual([r['i'] for r in registros], list(range(50)))
+        self.assertEqual(sorted(c.kwargs['params']['$skip'] for c in mock_get.call_args_list), [0, 10, 20, 30, 40, 50])
+
+
+if __name__ == '__main__':
+    unittest.main()
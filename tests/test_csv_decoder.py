@@ -0,0 +1,97 @@
+import unittest
+from datetime import date
+from decimal import Decimal
+from unittest.mock import patch, MagicMock
+
+from src.components.bacen.client import BacenClient
+from src.components.core import TipoColuna, decode_csv, infer_type, parse_decimal, to_records
+from src.components.senado import SenadoresSenadoClient, TipoRetorno
+
+
+CSV_SGS = '"data";"valor"\n"02/01/2024";"11,65"\n"03/01/2024";"1.234,50"\n'
+
+CSV_CEAPS = (
+    'ano;mes;cpfCnpj;fornecedor;data;valorReembolsado;detalhamento\n'
+    '2024;1;00123456000199;EMPRESA A;05/01/2024;1.234,56;Passagem\n'
+    '2024;2;12345678901;;10/02/2024;99,90;\n'
+)
+
+
+class TestCsvDecoder(unittest.TestCase):
+    def test_formato_brasileiro_com_schema(self):
+        colunas = decode_csv(CSV_SGS, {'data': TipoColuna.DATA, 'valor': TipoColuna.DECIMAL}, use_numpy=False)
+        self.assertEqual(colunas['data'], [date(2024, 1, 2), date(2024, 1, 3)])
+        self.assertEqual(colunas['valor'], [Decimal('11.65'), Decimal('1234.50')])
+
+    def test_inferencia_e_nulos(self):
+        colunas = decode_csv(CSV_CEAPS, use_numpy=False)
+        self.assertEqual(colunas['ano'], [2024, 2024])
+        self.assertEqual(colunas['cpfCnpj'], ['00123456000199', '12345678901'])
+        self.assertEqual(colunas['fornecedor'], ['EMPRESA A', None])
+        self.assertEqual(colunas['valorReembolsado'], [1234.56, 99.9])
+        self.assertEqual(colunas['detalhamento'], ['Passagem', None])
+        self.assertEqual(to_records(colunas)[1]['data'], date(2024, 2, 10))
+
+    def test_infer_type(self):
+        self.assertEqual(infer_type(['1', '', '-3']), TipoColuna.INTEIRO)
+        self.assertEqual(infer_type(['007', '1']), TipoColuna.TEXTO)
+        self.assertEqual(infer_type(['1.000,5', '2,0']), TipoColuna.REAL)
+        self.assertEqual(infer_type(['', '']), TipoColuna.TEXTO)
+        self.assertEqual(infer_type(['1234567890', '-5']), TipoColuna.INTEIRO)
+        # CPFs: 11 dígitos são texto, com ou sem zero à esquerda em alguma linha.
+        self.assertEqual(decode_csv('a;b\n12345678901;x\n98765432100;y\n')['a'], ['12345678901', '98765432100'])
+
+    def test_celula_invalida_nomeia_coluna_e_valor(self):
+        texto = 'valor;quantidade\n1;1\n2,x;2\n'
+        with self.assertRaisesRegex(ValueError, r"Coluna 'valor': '2,x' não é um valor decimal válido \(linha 2"):
+            decode_csv(texto, {'valor': TipoColuna.DECIMAL}, use_numpy=False)
+        for use_numpy in (False, None):
+            with self.subTest(use_numpy=use_numpy):
+                with self.assertRaisesRegex(ValueError, r"Coluna 'valor': '2,x' não é um valor int válido"):
+                    decode_csv(texto, {'valor': TipoColuna.INTEIRO}, use_numpy=use_numpy)
+
+    def test_milhar_sem_virgula_na_coluna(self):
+        texto = 'valor;quantidade\n1.500;1.000\n2.750;12\n'
+        colunas = decode_csv(texto, {'valor': TipoColuna.DECIMAL, 'quantidade': TipoColuna.INTEIRO}, use_numpy=False)
+        self.assertEqual(colunas['valor'], [Decimal('1500'), Decimal('2750')])
+        self.assertEqual(colunas['quantidade'], [1000, 12])
+
+    def test_parse_decimal(self):
+        casos = {
+            '1.234,56': Decimal('1234.56'), '1.500': Decimal(1500), '1.234.567': Decimal(1234567),
+            '-2.000': Decimal(-2000), '150.25': Decimal('150.25'), '0,5': Decimal('0.5'), ' 12 ': Decimal(12),
+            1.234: Decimal('1.234'), 7: Decimal(7), '': None, None: None, 'abc': None, 'NaN': None, '1,2,3': None,
+        }
+        for valor, esperado in casos.items():
+            with self.subTest(valor=valor):
+                self.assertEqual(parse_decimal(valor), esperado)
+
+    def test_linhas_incompletas_nao_desalinham(self):
+        colunas = decode_csv('a;b;c\n1;2;3\n4\n', use_numpy=False)
+        self.assertEqual(colunas, {'a': [1, 4], 'b': [2, None], 'c': [3, None]})
+
+    @patch('requests.get')
+    def test_sgs_tipado(self, mock_get):
+        mock_get.return_value = MagicMock(ok=True, text=CSV_SGS)
+        colunas = BacenClient().sgs(1, formato='csv', tipado=True)
+        self.assertEqual(colunas['valor'][1], Decimal('1234.50'))
+
+    @patch('requests.get')
+    def test_senado_csv_tipado_usa_schema_do_endpoint(self, mock_get):
+        mock_get.return_value = MagicMock(ok=True, text=CSV_CEAPS, headers={'Content-Type': 'text/csv'})
+        colunas = SenadoresSenadoClient().despesas_ceaps(2024, TipoRetorno.CSV_TIPADO)
+        args, _ = mock_get.call_args
+        self.assertTrue(args[0].endswith('/senadores/despesas_ceaps/2024/csv'))
+        self.assertEqual(colunas['valorReembolsado'], [Decimal('1234.56'), Decimal('99.90')])
+
+    @patch('requests.get')
+    def test_tipo_retorno_como_string(self, mock_get):
+        mock_get.return_value = MagicMock(ok=True, text=CSV_CEAPS, headers={'Content-Type': 'text/csv'})
+        self.assertEqual(SenadoresSenadoClient().despesas_ceaps(2024, 'csv'), CSV_CEAPS)
+        self.assertTrue(mock_get.call_args.args[0].endswith('/senadores/despesas_ceaps/2024/csv'))
+        colunas = SenadoresSenadoClient().despesas_ceaps(2024, 'csv_tipado')
+        self.assertEqual(colunas['valorReembolsado'][1], Decimal('99.90'))
+
+
+if __name__ == '__main__':
+    unittest.main()
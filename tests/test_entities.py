@@ -0,0 +1,84 @@
+import json
+import sqlite3
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.components.senado import DatasetSpec, EntityIndex, EntityRef, Warehouse, normalize_documento
+
+EMPRESAS = [{'id': 1, 'nome': 'ACME', 'cnpjCpf': '00.000.000/0001-91'}]
+CONTRATOS = [
+    {'id': 10, 'cnpjCpf': '00000000000191', 'objetoDescricao': 'Limpeza'},
+    {'id': 11, 'cnpjCpf': '11222333000181', 'objetoDescricao': 'Vigilância'},
+]
+TERCEIRIZADOS = [
+    {'id': 5, 'nome': 'Ana', 'cpf': '***.456.789-**', 'cnpjEmpresa': '00000000000191'},
+]
+
+
+def _resposta(corpo):
+    return MagicMock(ok=True, status_code=200, content=json.dumps(corpo).encode(), headers={'Content-Type': 'application/json'})
+
+
+class TestEntityIndex(unittest.TestCase):
+    def setUp(self):
+        datasets = {
+            nome: DatasetSpec(nome, f'contratacoes/{nome}', chave=('id',))
+            for nome in ('empresas', 'contratos', 'terceirizados')
+        }
+        self.warehouse = Warehouse(':memory:', datasets=datasets)
+        self.addCleanup(self.warehouse.close)
+        self.corpos = {'empresas': EMPRESAS, 'contratos': CONTRATOS, 'terceirizados': TERCEIRIZADOS}
+
+    def _sync(self, *nomes):
+        with patch('requests.get', side_effect=lambda url, **kw: _resposta(self.corpos[url.rsplit('/', 1)[1]])):
+            self.warehouse.sync(nomes or None, force=True)
+
+    def test_normalize_documento(self):
+        self.assertEqual(normalize_documento('123.456.789-09'), '12345678909')
+        self.assertEqual(normalize_documento(191, 'cnpj_cpf'), None)
+        self.assertEqual(normalize_documento(191, 'cnpj_empresa'), '00000000000191')
+        self.assertIsNone(normalize_documento('***.456.789-**'))
+        self.assertIsNone(normalize_documento('12345'))
+
+    def test_perfil_e_atualizacao_incremental(self):
+        self._sync('empresas')
+        indice = EntityIndex(self.warehouse)  # indexa o que já foi sincronizado
+        self._sync('contratos', 'terceirizados')
+
+        self.assertEqual(indice.references('00000000000191'), [
+            EntityRef('contratos', '10', 'cnpj_cpf'),
+            EntityRef('empresas', '1', 'cnpj_cpf'),
+            EntityRef('terceirizados', '5', 'cnpj_empresa'),
+        ])
+        perfil = indice.profile('00.000.000/0001-91')
+        self.assertEqual(perfil, {'contratos': [CONTRATOS[0]], 'empresas': EMPRESAS, 'terceirizados': TERCEIRIZADOS})
+
+        self.corpos['contratos'] = [{'id': 10, 'cnpjCpf': '11222333000181', 'objetoDescricao': 'Limpeza'}, CONTRATOS[1]]
+        self._sync('contratos')
+        self.assertEqual([r.dataset for r in indice.references('00000000000191')], ['empresas', 'terceirizados'])
+        self.assertEqual([r.chave for r in indice.references('11.222.333/0001-81')], ['10', '11'])
+        self.assertEqual(indice.rebuild(), 4)
+
+    def test_gravacao_le_apenas_as_chaves_afetadas(self):
+        self._sync()
+        indice = EntityIndex(self.warehouse)
+        comandos = []
+        self.warehouse._conn.set_trace_callback(comandos.append)
+        self.addCleanup(self.warehouse._conn.set_trace_callback, None)
+        self.corpos['contratos'] = [{'id': 10, 'cnpjCpf': '11222333000181'}]
+        self._sync('contratos')
+        (leitura,) = [c for c in comandos if c.startswith('SELECT') and '_entidades' in c]
+        self.assertIn("chave IN ('10', '11')", leitura)
+        self.assertEqual([r.chave for r in indice.references('11222333000181')], ['10'])
+
+    def test_perfil_com_mais_chaves_que_o_limite_de_parametros(self):
+        self.corpos['contratos'] = [{'id': i, 'cnpjCpf': '00000000000191'} for i in range(2500)]
+        self._sync('contratos')
+        # Limite padrão do SQLite anterior à 3.32, como em `warehouse._MAX_PARAMS`.
+        self.warehouse._conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        perfil = EntityIndex(self.warehouse).profile('00000000000191')
+        self.assertEqual([registro['id'] for registro in perfil['contratos']], list(range(2500)))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,173 @@
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+from src.components.core import LazyRows, ShardedExporter, Table, iter_rows, periods
+from src.components.core.export import pa
+
+
+def _ler(pasta: str) -> tuple[dict, list[dict]]:
+    with open(os.path.join(pasta, 'manifest.json'), encoding='utf-8') as arquivo:
+        manifesto = json.load(arquivo)
+    linhas = []
+    for item in manifesto['arquivos']:
+        caminho = os.path.join(pasta, item['arquivo'])
+        with open(caminho, 'rb') as arquivo:
+            bruto = arquivo.read()
+        assert hashlib.sha256(bruto).hexdigest() == item['sha256']
+        assert len(bruto) == item['bytes']
+        conteudo = gzip.decompress(bruto).splitlines()
+        assert len(conteudo) == item['linhas']
+        linhas += [json.loads(linha) for linha in conteudo]
+    return manifesto, linhas
+
+
+class TestShardedExporter(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+
+    def test_periodos(self):
+        self.assertEqual(periods(2022, 2024), [(2022,), (2023,), (2024,)])
+        self.assertEqual(periods((2023, 11), (2024, 2)), [(2023, 11), (2023, 12), (2024, 1), (2024, 2)])
+
+    def test_rotacao_manifesto_e_checksums(self):
+        exportador = ShardedExporter(self.pasta, formato='ndjson', shards=3, linhas_por_arquivo=250, lote=40)
+        manifesto = exportador.export(({'id': i, 'valor': Decimal('1.10')} for i in range(1000)), fonte='teste')
+        salvo, linhas = _ler(self.pasta)
+        self.assertEqual(manifesto.linhas, 1000)
+        self.assertEqual(salvo['linhas'], 1000)
+        self.assertEqual(salvo['fonte'], 'teste')
+        self.assertEqual(sorted(linha['id'] for linha in linhas), list(range(1000)))
+        self.assertEqual(linhas[0]['valor'], '1.10')
+        self.assertTrue(all(item['linhas'] <= 250 for item in salvo['arquivos']))
+        self.assertEqual({item['shard'] for item in salvo['arquivos']}, {0, 1, 2})
+        self.assertFalse([n for n in os.listdir(self.pasta) if n.endswith('.tmp')])
+
+    def test_fan_out_por_periodo(self):
+        chamadas = []
+
+        def remuneracoes(ano, mes, tipo_retorno=None):
+            chamadas.append((ano, mes, tipo_retorno))
+            return [{'ano': ano, 'mes': mes, 'seq': i} for i in range(10)]
+
+        exportador = ShardedExporter(self.pasta, formato='ndjson', shards=2, lote=3)
+        manifesto = exportador.export_periods(remuneracoes, periods((2024, 1), (2024, 12)), workers=3, tipo_retorno='json')
+        self.assertEqual(manifesto.linhas, 120)
+        self.assertEqual(sorted(chamadas), [(2024, m, 'json') for m in range(1, 13)])
+        _, linhas = _ler(self.pasta)
+        self.assertEqual(len({(l['mes'], l['seq']) for l in linhas}), 120)
+
+    def test_retornos_de_cliente(self):
+        self.assertEqual(list(iter_rows({'value': [{'a': 1}]})), [{'a': 1}])
+        self.assertEqual(list(iter_rows(Table({'a': [1, 2], 'b': ['x', 'y']}))), [{'a': 1, 'b': 'x'}, {'a': 2, 'b': 'y'}])
+        self.assertEqual(list(iter_rows(LazyRows(b'[{"a": 1}]'))), [{'a': 1}])
+        with self.assertRaises(TypeError):
+            list(iter_rows('a;b\n1;2'))
+
+    def test_contrapressao(self):
+        produzidas = []
+        liberar = threading.Event()
+
+        class Lenta(ShardedExporter):
+            def _writer(self, caminho):
+                writer = super()._writer(caminho)
+                escrever = writer.write
+
+                def write(linhas):
+                    liberar.wait(5)
+                    escrever(linhas)
+
+                writer.write = write
+                return writer
+
+        def linhas():
+            for i in range(200):
+                produzidas.append(i)
+                yield {'id': i}
+
+        exportador = Lenta(self.pasta, formato='ndjson', shards=1, lote=10, fila=2)
+        thread = threading.Thread(target=exportador.export, args=(linhas(),))
+        thread.start()
+        time.sleep(0.3)
+        # Escritora parada: um lote em escrita, dois na fila e um aguardando espaço.
+        self.assertLessEqual(len(produzidas), 40)
+        liberar.set()
+        thread.join(5)
+        self.assertEqual(len(produzidas), 200)
+
+    def test_falha_na_fonte_interrompe(self):
+        def remuneracoes(ano):
+            if ano == 2021:
+                raise RuntimeError('falha no período')
+            return [{'ano': ano}]
+
+        exportador = ShardedExporter(self.pasta, formato='ndjson', shards=2)
+        with self.assertRaises(RuntimeError):
+            exportador.export_periods(remuneracoes, periods(2019, 2023), workers=2)
+        self.assertFalse(os.path.exists(os.path.join(self.pasta, 'manifest.json')))
+
+    def test_falha_na_escrita_remove_o_temporario(self):
+        class Quebrada(ShardedExporter):
+            def _writer(self, caminho):
+                writer = super()._writer(caminho)
+                escrever = writer.write
+
+                def write(linhas):
+                    if linhas[0]['id'] >= 50:
+                        raise OSError('disco cheio')
+                    escrever(linhas)
+
+                writer.write = write
+                return writer
+
+        exportador = Quebrada(self.pasta, formato='ndjson', shards=1, lote=10)
+        with self.assertRaises(OSError):
+            exportador.export({'id': i} for i in range(100))
+        self.assertEqual(os.listdir(self.pasta), [])
+
+    def test_falha_da_escritora_com_a_fila_cheia_nao_trava(self):
+        class Quebrada(ShardedExporter):
+            def _writer(self, caminho):
+                writer = super()._writer(caminho)
+                writer.write = MagicMock(side_effect=OSError('disco cheio'))
+                return writer
+
+        exportador = Quebrada(self.pasta, formato='ndjson', shards=1, fila=2, lote=1)
+        erros = []
+
+        def exportar():
+            try:
+                exportador.export({'id': i} for i in range(100))
+            except OSError as e:
+                erros.append(e)
+
+        thread = threading.Thread(target=exportar, daemon=True)
+        thread.start()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual([str(e) for e in erros], ['disco cheio'])
+        self.assertEqual(os.listdir(self.pasta), [])
+
+    @unittest.skipIf(pa is None, 'pyarrow não instalado')
+    def test_parquet_rejeita_campos_novos(self):
+        import pyarrow.parquet as pq
+
+        exportador = ShardedExporter(self.pasta, formato='parquet', shards=1, lote=2)
+        with self.assertRaisesRegex(ValueError, r"\['extra'\]"):
+            exportador.export([{'id': 1}, {'id': 2}, {'id': 3, 'extra': 'x'}])
+        self.assertEqual(os.listdir(self.pasta), [])
+
+        manifesto = exportador.export([{'id': 1, 'nome': 'a'}, {'id': 2, 'nome': 'b'}, {'id': 3}])
+        tabela = pq.read_table(os.path.join(self.pasta, manifesto.arquivos[0].arquivo))
+        self.assertEqual(tabela.to_pylist(), [{'id': 1, 'nome': 'a'}, {'id': 2, 'nome': 'b'}, {'id': 3, 'nome': None}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+import json
+import unittest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+from src.components.core import FormatSelector, normalize_csv_columns, normalize_json_records, decode_csv
+from src.components.senado import SenadoresSenadoClient, TipoRetorno
+
+
+REGISTROS_JSON = [
+    {'codSenador': 1, 'cpfCnpj': '00123456000199', 'data': '2024-01-05', 'valorReembolsado': 1234.56, 'detalhamento': ''},
+    {'codSenador': 2, 'cpfCnpj': '12345678901', 'data': '2024-02-10', 'valorReembolsado': 99.9, 'detalhamento': 'Táxi'},
+]
+CSV = (
+    'codSenador;cpfCnpj;data;valorReembolsado;detalhamento\n'
+    '1;00123456000199;05/01/2024;1.234,56;\n'
+    '2;12345678901;10/02/2024;99,90;Táxi\n'
+)
+ESPERADO = [
+    {'cod_senador': 1, 'cpf_cnpj': '00123456000199', 'data': date(2024, 1, 5), 'valor_reembolsado': 1234.56, 'detalhamento': None},
+    {'cod_senador': 2, 'cpf_cnpj': '12345678901', 'data': date(2024, 2, 10), 'valor_reembolsado': 99.9, 'detalhamento': 'Táxi'},
+]
+
+
+def _resposta(url, *args, **kwargs):
+    if url.endswith('/csv'):
+        return MagicMock(ok=True, text=CSV, content=CSV.encode(), headers={'Content-Type': 'text/csv'})
+    # JSON propositalmente maior, como nas respostas reais.
+    corpo = json.dumps(REGISTROS_JSON, indent=4).encode()
+    return MagicMock(ok=True, content=corpo, headers={'Content-Type': 'application/json'})
+
+
+class TestFormatSelector(unittest.TestCase):
+    def test_mede_os_dois_formatos_e_escolhe_o_mais_barato(self):
+        seletor = FormatSelector(bandwidth=1000, explore_every=5)
+        self.assertEqual(seletor.choose('x'), 'json')
+        seletor.record('x', 'json', 10_000, 0.001)
+        self.assertEqual(seletor.choose('x'), 'csv')
+        seletor.record('x', 'csv', 2_000, 0.004)
+        escolhas = [seletor.choose('x') for _ in range(5)]
+        self.assertEqual(escolhas.count('csv'), 4)
+        self.assertEqual(escolhas.count('json'), 1)
+
+    def test_registros_normalizados_iguais_nos_dois_formatos(self):
+        self.assertEqual(normalize_json_records(REGISTROS_JSON), ESPERADO)
+        self.assertEqual(normalize_csv_columns(decode_csv(CSV, use_numpy=False)), ESPERADO)
+
+    @patch('requests.get', side_effect=_resposta)
+    def test_cliente_auto(self, mock_get):
+        cliente = SenadoresSenadoClient()
+        cliente._format_selector = FormatSelector(bandwidth=1)
+
+        resultados = [cliente.despesas_ceaps(2024, TipoRetorno.AUTO) for _ in range(3)]
+        urls = [args[0] for args, _ in mock_get.call_args_list]
+        self.assertFalse(urls[0].endswith('/csv'))
+        self.assertTrue(urls[1].endswith('/csv'))
+        self.assertTrue(urls[2].endswith('/csv'))
+        self.assertEqual(resultados, [ESPERADO] * 3)
+        self.assertIn('senadores/despesas_ceaps', cliente._format_selector.snapshot())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+import json
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.components.core import DeadlineExceeded, HedgeBudget, Hedger, LatencyTracker, Transport, deadline, remaining, route_key
+from src.components.senado.clients import ContratacoesSenadoClient
+
+URL = 'https://adm.senado.gov.br/adm-dadosabertos/api/v1/contratacoes/contratos/7/pagamentos'
+
+
+def _resposta(corpo=None):
+    return MagicMock(ok=True, status_code=200, content=json.dumps(corpo).encode(), headers={'Content-Type': 'application/json'})
+
+
+def _hedger(rota=route_key(URL), latencias=(0.01,) * 5, **kwargs):
+    tracker = LatencyTracker(minimo=5)
+    for segundos in latencias:
+        tracker.record(rota, segundos)
+    return Hedger(0.9, tracker=tracker, **kwargs)
+
+
+class TestHedging(unittest.TestCase):
+    def test_rota_e_percentil(self):
+        self.assertEqual(route_key(URL), 'adm.senado.gov.br/adm-dadosabertos/api/v1/contratacoes/contratos/pagamentos')
+        tracker = LatencyTracker(minimo=10)
+        for i in range(9):
+            tracker.record('r', i / 100)
+        self.assertIsNone(tracker.percentile('r', 0.5))
+        tracker.record('r', 1.0)
+        self.assertEqual(tracker.percentile('r', 0.5), 0.05)
+        self.assertEqual(tracker.percentile('r', 0.99), 1.0)
+
+    def test_orcamento(self):
+        orcamento = HedgeBudget(razao=0.5, rajada=2)
+        self.assertFalse(orcamento.take())
+        for _ in range(10):
+            orcamento.deposit()
+        self.assertEqual([orcamento.take() for _ in range(3)], [True, True, False])
+
+    @patch('requests.get')
+    def test_hedge_vence_requisicao_lenta(self, mock_get):
+        lenta = _resposta(['lenta'])
+        liberar = threading.Event()
+
+        def responder(url, **kwargs):
+            if mock_get.call_count == 1:
+                liberar.wait(5)
+                return lenta
+            return _resposta(['hedge'])
+
+        mock_get.side_effect = responder
+        transporte = Transport(hedge=_hedger(orcamento=HedgeBudget(razao=1)))
+        inicio = time.monotonic()
+        response = transporte.get(URL)
+        self.assertLess(time.monotonic() - inicio, 1)
+        self.assertEqual(response.content, b'["hedge"]')
+        metricas = transporte.metrics.host('adm.senado.gov.br')
+        self.assertEqual((metricas.upstream_requests, metricas.hedged_requests, metricas.hedge_wins), (1, 1, 1))
+        # A perdedora é fechada quando termina.
+        liberar.set()
+        for _ in range(50):
+            if lenta.close.called:
+                break
+            time.sleep(0.01)
+        lenta.close.assert_called_once()
+
+    @patch('requests.get')
+    def test_sem_orcamento_nao_ha_hedge(self, mock_get):
+        def responder(url, **kwargs):
+            time.sleep(0.1)
+            return _resposta([])
+
+        mock_get.side_effect = responder
+        transporte = Transport(hedge=_hedger(orcamento=HedgeBudget(razao=0.01)))
+        transporte.get(URL)
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(transporte.metrics.host('adm.senado.gov.br').hedged_requests, 0)
+
+    @patch('requests.get')
+    def test_falha_da_original_espera_o_hedge(self, mock_get):
+        def responder(url, **kwargs):
+            if mock_get.call_count == 1:
+                time.sleep(0.1)
+                raise ConnectionError('reset')
+            time.sleep(0.2)
+            return _resposta(['hedge'])
+
+        mock_get.side_effect = responder
+        transporte = Transport(hedge=_hedger(orcamento=HedgeBudget(razao=1)))
+        self.assertEqual(transporte.get(URL).content, b'["hedge"]')
+
+    def test_atraso_conta_do_inicio_da_chamada(self):
+        hedger = _hedger(latencias=(0.1,) * 5, orcamento=HedgeBudget(razao=1), max_workers=1)
+        self.addCleanup(hedger.close)
+        hedges = []
+        # A única thread está ocupada: a primária espera 0,3 s na fila antes de começar.
+        hedger._pool().submit(time.sleep, 0.3)
+
+        def chamada():
+            time.sleep(0.05)
+            return 'ok'
+
+        resultado = hedger.call(route_key(URL), chamada, on_hedge=lambda: hedges.append(1))
+        self.assertEqual(resultado, ('ok', False))
+        self.assertEqual(hedges, [])
+
+    @patch('requests.get', return_value=_resposta([]))
+    def test_close_encerra_as_threads(self, _):
+        with Transport(hedge=_hedger()) as transporte:
+            transporte.get(URL)
+            executor = transporte.hedger._executor
+            self.assertIsNotNone(executor)
+        self.assertIsNone(transporte.hedger._executor)
+        self.assertTrue(executor._shutdown)
+        # Fechado, o hedger volta a criar as threads se for usado de novo.
+        self.assertEqual(transporte.get(URL + '/1').status_code, 200)
+        transporte.close()
+
+
+class TestDeadlines(unittest.TestCase):
+    @patch('requests.get', return_value=_resposta([]))
+    def test_timeout_reduzido_ao_prazo(self, mock_get):
+        transporte = Transport(timeout=10)
+        transporte.get(URL)
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], 10)
+        self.assertIsNone(remaining())
+        with deadline(5):
+            with deadline(60):
+                transporte.get(URL + '/1')
+        self.assertLessEqual(mock_get.call_args.kwargs['timeout'], 5)
+        self.assertIsNone(remaining())
+
+    @patch('requests.get')
+    def test_prazo_vencido_nao_envia_nem_repete(self, mock_get):
+        mock_get.return_value = _resposta([])
+        mock_get.return_value.status_code = 503
+        transporte = Transport(retries=5, backoff=0.05)
+        with deadline(0.08):
+            with self.assertRaises(DeadlineExceeded):
+                transporte.get(URL)
+            self.assertLessEqual(mock_get.call_count, 3)
+            mock_get.reset_mock()
+            with self.assertRaises(DeadlineExceeded):
+                transporte.get(URL + '/1')
+        mock_get.assert_not_called()
+
+    def test_prazo_vale_nas_threads_do_hedge(self):
+        with deadline(3):
+            resultado, _ = _hedger().call(route_key(URL), remaining)
+        self.assertIsNotNone(resultado)
+        self.assertLessEqual(resultado, 3)
+
+    @patch('requests.get', return_value=_resposta([]))
+    def test_timeout_do_cliente_senado(self, mock_get):
+        cliente = ContratacoesSenadoClient()
+        cliente._transport = Transport(timeout=30)
+        cliente.contratos()
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], 10)
+        cliente.timeout = None
+        cliente.pagamentos('contratos', 1)
+        self.assertEqual(mock_get.call_args.kwargs['timeout'], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from src.components.core import hash_join
+from src.components.senado import join_relation
+
+CONTRATOS = [
+    {'id': 1, 'cnpjCpf': '00.000.000/0001-91', 'valor': 10},
+    {'id': 2, 'cnpjCpf': '11222333000181', 'valor': 20},
+    {'id': 3, 'cnpjCpf': None, 'valor': 30},
+    {'id': 4, 'cnpjCpf': '00000000000191', 'valor': 40},
+]
+EMPRESAS = [
+    {'id': 7, 'cnpjCpf': '00000000000191', 'nome': 'ACME'},
+    {'id': 8, 'cnpjCpf': '99999999000199', 'nome': 'Outra'},
+]
+
+
+class TestHashJoin(unittest.TestCase):
+    def test_inner_e_left(self):
+        inner = list(hash_join(CONTRATOS, EMPRESAS, 'cnpjCpf', sufixo='_empresa'))
+        self.assertEqual([linha['id'] for linha in inner], [4])
+        self.assertEqual(inner[0], {'id': 4, 'cnpjCpf': '00000000000191', 'valor': 40, 'id_empresa': 7,
+                                    'cnpjCpf_empresa': '00000000000191', 'nome': 'ACME'})
+
+        left = list(hash_join(CONTRATOS, EMPRESAS, 'cnpjCpf', how='left'))
+        self.assertEqual([linha['id'] for linha in left], [1, 2, 3, 4])
+        self.assertEqual([linha.get('nome') for linha in left], [None, None, None, 'ACME'])
+
+    def test_lado_construido_e_chave_composta(self):
+        esquerda = [{'a': 1, 'b': 'x'}, {'a': 1, 'b': 'y'}]
+        direita = ({'a': a, 'b': b, 'v': i} for i, (a, b) in enumerate([(1, 'y'), (1, 'y'), (2, 'x')]))
+        linhas = list(hash_join(esquerda, direita, ('a', 'b'), how='left', construir='esquerda'))
+        self.assertEqual([(linha['b'], linha.get('v')) for linha in linhas], [('y', 0), ('y', 1), ('x', None)])
+        with self.assertRaises(ValueError):
+            list(hash_join([], [], 'a', how='outer'))
+
+    def test_relacao_normaliza_documentos(self):
+        linhas = list(join_relation('contratos_empresas', CONTRATOS, EMPRESAS, how='left'))
+        self.assertEqual([linha.get('nome') for linha in linhas], ['ACME', None, None, 'ACME'])
+        self.assertEqual(linhas[0]['id_empresa'], 7)
+
+        terceirizados = [{'nome': 'Ana', 'cnpjEmpresa': '00000000000191'}]
+        linha, = join_relation('terceirizados_empresas', terceirizados, EMPRESAS)
+        self.assertEqual(linha['nome_empresa'], 'ACME')
+
+
+if __name__ == '__main__':
+    unittest.main()
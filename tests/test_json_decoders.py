@@ -0,0 +1,55 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.components.bacen.client import BacenClient
+from src.components.core import (
+    available_backends,
+    decode_json,
+    get_default_backend,
+    set_default_backend,
+)
+
+
+DOCUMENTO = {'value': [{'Indicador': 'IPCA', 'Media': 3.5, 'Data': '2024-01-05'}], 'ok': True}
+
+
+class TestJsonDecoders(unittest.TestCase):
+    def tearDown(self):
+        set_default_backend('auto')
+
+    def test_backends_disponiveis_decodificam_igual(self):
+        conteudo = json.dumps(DOCUMENTO).encode()
+        self.assertIn('json', available_backends())
+        for backend in available_backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(decode_json(conteudo, backend), DOCUMENTO)
+                self.assertEqual(decode_json(memoryview(conteudo), backend), DOCUMENTO)
+
+    def test_backend_desconhecido(self):
+        with self.assertRaises(ValueError):
+            decode_json(b'{}', 'ujson2')
+        with self.assertRaises(ValueError):
+            set_default_backend('ujson2')
+
+    def test_backend_global_e_por_cliente(self):
+        set_default_backend('json')
+        self.assertEqual(get_default_backend(), 'json')
+
+        resposta = MagicMock()
+        resposta.ok = True
+        resposta.content = json.dumps(DOCUMENTO).encode()
+        cliente = BacenClient()
+        with patch('src.components.core.json_decoders._BACKENDS', {'json': MagicMock(return_value=DOCUMENTO)}) as backends, \
+                patch('requests.get', return_value=resposta):
+            self.assertEqual(cliente.ptax('Moedas'), DOCUMENTO['value'])
+            backends['json'].assert_called_once_with(resposta.content)
+
+        cliente.json_backend = 'json'
+        set_default_backend('auto')
+        with patch('requests.get', return_value=resposta):
+            self.assertEqual(cliente.ptax('Moedas'), DOCUMENTO['value'])
+
+
+if __name__ == '__main__':
+    unittest.main()
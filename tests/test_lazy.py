@@ -0,0 +1,68 @@
+import json
+import mmap
+import os
+import tempfile
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.components.core import LazyRows
+from src.components.senado import SenadoresSenadoClient, TipoRetorno
+
+
+DESPESAS = [
+    {'cpfCnpj': '00000000000191', 'fornecedor': 'A {[ LTDA', 'valorReembolsado': 10.5},
+    {'cpfCnpj': '00000000000272', 'fornecedor': 'B "}" LTDA', 'valorReembolsado': 2},
+]
+
+
+class TestLazyRows(unittest.TestCase):
+    def test_linhas_e_campos(self):
+        linhas = LazyRows(json.dumps(DESPESAS).encode())
+        self.assertEqual(len(linhas), 2)
+        self.assertEqual(linhas[1]['fornecedor'], 'B "}" LTDA')
+        self.assertEqual(dict(linhas[0]), DESPESAS[0])
+        self.assertEqual(linhas[1].to_dict(), DESPESAS[1])
+        self.assertEqual(bytes(linhas[0].raw('valorReembolsado')), b'10.5')
+        self.assertEqual(sum(linhas.column('valorReembolsado')), 12.5)
+
+    def test_envelope_odata_e_valores_aninhados(self):
+        documento = {'@odata.context': 'x', 'value': [{'a': {'b': [1, {'c': 2}]}, 'd': 1}, {'d': 2}]}
+        for buffer in (json.dumps(documento).encode(), memoryview(json.dumps(documento).encode())):
+            linhas = LazyRows(buffer)
+            self.assertEqual(len(linhas), 2)
+            self.assertEqual(linhas[0]['a'], {'b': [1, {'c': 2}]})
+            self.assertEqual(linhas.column('a', default=0), [{'b': [1, {'c': 2}]}, 0])
+            self.assertEqual(linhas.column('d'), [1, 2])
+
+    def test_envelope_vazio(self):
+        for buffer in (b'{"@odata.context": "x", "value": []}', b'{"value" : [ ]}', memoryview(b'{"value":[]}')):
+            self.assertEqual(len(LazyRows(buffer)), 0)
+        # Um objeto com uma lista vazia aninhada continua sendo uma linha.
+        linhas = LazyRows(b'{"id": 1, "dados": {"value": []}}')
+        self.assertEqual(len(linhas), 1)
+        self.assertEqual(linhas[0]['id'], 1)
+
+    def test_arquivo_mapeado(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False) as arquivo:
+            json.dump(DESPESAS, arquivo, ensure_ascii=False)
+        try:
+            with LazyRows.open(arquivo.name) as linhas:
+                self.assertIsInstance(linhas._buffer, mmap.mmap)
+                self.assertEqual(linhas.column('cpfCnpj'), ['00000000000191', '00000000000272'])
+                self.assertEqual(linhas[1]['fornecedor'], 'B "}" LTDA')
+            self.assertTrue(linhas._buffer.closed)
+        finally:
+            os.unlink(arquivo.name)
+
+    @patch('requests.get')
+    def test_cliente_visoes(self, mock_get):
+        mock_get.return_value = MagicMock(
+            ok=True, content=json.dumps(DESPESAS).encode(), headers={'Content-Type': 'application/json'}
+        )
+        linhas = SenadoresSenadoClient().despesas_ceaps(2024, TipoRetorno.VISOES)
+        self.assertIsInstance(linhas, LazyRows)
+        self.assertEqual(linhas[0]['cpfCnpj'], '00000000000191')
+
+
+if __name__ == '__main__':
+    unittest.main()
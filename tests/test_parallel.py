@@ -0,0 +1,55 @@
+import json
+import unittest
+
+from src.components.core import TipoColuna, decode_csv, decode_json
+from src.components.core.parallel import ParsePool, _fim_de_linha
+
+
+class TestParsePool(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.pool = ParsePool(processos=2, min_bytes=1_000)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.pool.close()
+
+    def test_json_raiz_e_envelope_odata(self):
+        registros = [{'id': i, 'nome': f'linha {i} [x] {{y}}', 'itens': [{'v': i}]} for i in range(500)]
+        raiz = json.dumps(registros).encode()
+        self.assertEqual(self.pool.decode_json(raiz), registros)
+
+        envelope = json.dumps({'@odata.context': 'ctx', 'value': registros, 'proximo': [1, 2]}, indent=1).encode()
+        self.assertEqual(self.pool.decode_json(envelope), decode_json(envelope))
+        self.assertEqual(self.pool.decode_json(b'{"a": 1}'), {'a': 1})
+
+    def test_csv_com_aspas_e_tipos_divergentes(self):
+        linhas = ['id;valor;obs;vazia']
+        for i in range(400):
+            valor = str(i) if i < 200 else f'{i},5'
+            obs = f'"texto; com\nquebra {i}"' if i % 7 == 0 else f'obs {i}'
+            linhas.append(f'{i};{valor};{obs};')
+        content = ('﻿' + '\n'.join(linhas) + '\n').encode()
+        esperado = decode_csv(content, use_numpy=False)
+        colunas = self.pool.decode_csv(content, use_numpy=False)
+        self.assertEqual(colunas, esperado)
+        self.assertEqual(colunas['valor'][:2], ['0', '1'])
+        self.assertEqual(colunas['id'][-1], 399)
+        self.assertEqual(colunas['obs'][7], 'texto; com\nquebra 7')
+
+    def test_csv_milhar_independe_dos_trechos(self):
+        # Só o fim do arquivo tem vírgulas: os trechos iniciais não podem ler '1.500' como 1,5.
+        linhas = ['valor'] + ['1.500'] * 300 + ['2,25'] * 100
+        content = ('\n'.join(linhas) + '\n').encode()
+        schema = {'valor': TipoColuna.DECIMAL}
+        colunas = self.pool.decode_csv(content, schema, use_numpy=False)
+        self.assertEqual(colunas, decode_csv(content, schema, use_numpy=False))
+        self.assertEqual(str(colunas['valor'][0]), '1500')
+
+    def test_fim_de_linha_ignora_quebras_entre_aspas(self):
+        content = b'a;b\n1;"x\ny"\n2;z\n'
+        self.assertEqual(_fim_de_linha(content, 5, 4), len(b'a;b\n1;"x\ny"\n'))
+
+
+if __name__ == '__main__':
+    unittest.main()
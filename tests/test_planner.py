@@ -0,0 +1,66 @@
+import json
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.components.senado import (
+    ContratacoesSenadoClient, DatasetSpec, LocalPlanner, ServidoresSenadoClient, TipoVinculo, Warehouse,
+)
+
+CONTRATOS = [
+    {'id': 1, 'cnpjCpf': '00000000000191', 'nomeFornecedor': 'Construtora Ávila LTDA', 'ano': 2024, 'maoDeObra': True},
+    {'id': 2, 'cnpjCpf': '00000000000272', 'nomeFornecedor': 'ACME Serviços', 'ano': 2023, 'maoDeObra': False},
+    {'id': 3, 'cnpjCpf': '00000000000191', 'nomeFornecedor': 'Construtora Ávila LTDA', 'ano': 2023, 'maoDeObra': False},
+]
+SERVIDORES = [
+    {'id': 10, 'nome': 'Ana', 'tipoVinculo': 'EFETIVO', 'lotacao': 'GABINETE'},
+    {'id': 11, 'nome': 'Bruno', 'tipoVinculo': 'COMISSIONADO', 'lotacao': 'GABINETE'},
+]
+
+
+def _resposta(corpo):
+    return MagicMock(ok=True, status_code=200, content=json.dumps(corpo).encode(), headers={'Content-Type': 'application/json'})
+
+
+class TestLocalPlanner(unittest.TestCase):
+    def setUp(self):
+        datasets = {
+            'contratos': DatasetSpec('contratos', 'contratacoes/contratos', chave=('id',), indices=('cnpj_cpf',)),
+            'servidores': DatasetSpec('servidores', 'servidores/servidores', chave=('id',)),
+        }
+        self.warehouse = Warehouse(':memory:', datasets=datasets)
+        self.addCleanup(self.warehouse.close)
+        corpos = {'contratacoes/contratos': CONTRATOS, 'servidores/servidores': SERVIDORES}
+        with patch('requests.get', side_effect=lambda url, **kw: _resposta(corpos[url.split('/v1/', 1)[1]])):
+            self.warehouse.sync()
+        self.planner = LocalPlanner(self.warehouse)
+        self.contratacoes = ContratacoesSenadoClient()
+        self.contratacoes.planner = self.planner
+
+    @patch('requests.get')
+    def test_filtros_respondidos_localmente(self, mock_get):
+        self.assertEqual(self.contratacoes.contratos(cnpj_cpf='00000000000191', ano=2023), [CONTRATOS[2]])
+        self.assertEqual(self.contratacoes.contratos(nome_fornecedor='ávila', mao_de_obra=True), [CONTRATOS[0]])
+        self.assertEqual(self.contratacoes.contratos(), CONTRATOS)
+
+        servidores = ServidoresSenadoClient()
+        servidores.planner = self.planner
+        self.assertEqual(servidores.servidores(tipo_vinculo=TipoVinculo.EFETIVO, lotacao='GABINETE'), [SERVIDORES[0]])
+        mock_get.assert_not_called()
+        self.assertEqual(self.planner.stats(), {'local': 4, 'remoto': 0})
+
+    @patch('requests.get')
+    def test_recorre_a_api(self, mock_get):
+        mock_get.return_value = _resposta([CONTRATOS[0]])
+        # Paginação não é reproduzida localmente.
+        self.contratacoes.empresas(pagina=2)
+        # Campo que não existe na cópia local.
+        self.contratacoes.contratos(sigla_sub_especie='CT')
+        # Cópia desatualizada.
+        self.planner.max_age = 0
+        self.assertEqual(self.contratacoes.contratos(cnpj_cpf='00000000000191'), [CONTRATOS[0]])
+        self.assertEqual(mock_get.call_count, 3)
+        self.assertEqual(self.planner.stats(), {'local': 0, 'remoto': 3})
+
+
+if __name__ == '__main__':
+    unittest.main()
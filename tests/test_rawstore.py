@@ -0,0 +1,143 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import MagicMock, patch
+
+from src.components.core import LazyRows, RawStore, StoredResponse, Transport, decode_json, response_body
+from src.components.senado import ServidoresSenadoClient
+
+REGISTROS = [{'nome': 'Ana', 'lotacao': 'SGM'}, {'nome': 'Bruno', 'lotacao': 'DGER'}]
+
+
+def _ler_em_outro_processo(pasta: str, url: str) -> list:
+    with RawStore(pasta).open(url) as response:
+        return decode_json(response.buffer)
+
+
+class TestRawStore(unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+        self.store = RawStore(self.pasta)
+        self.url = 'https://adm.senado.gov.br/adm-dadosabertos/api/v1/servidores/servidores/ativos'
+
+    def test_releitura_sem_copia(self):
+        corpo = json.dumps(REGISTROS).encode()
+        self.store.put(self.url, None, corpo, {'Content-Type': 'application/json', 'Content-Encoding': 'gzip'})
+        response = self.store.open(self.url)
+        self.assertIsInstance(response, StoredResponse)
+        self.assertIsInstance(response_body(response), memoryview)
+        self.assertEqual(response.buffer, corpo)
+        self.assertEqual(decode_json(response.buffer), REGISTROS)
+        self.assertEqual(response.headers['content-type'], 'application/json')
+        self.assertNotIn('Content-Encoding', response.headers)  # o corpo guardado já está descomprimido
+        with LazyRows(response.buffer) as linhas:
+            self.assertEqual(linhas.column('nome'), ['Ana', 'Bruno'])
+        response.close()
+
+    def test_chave_pelos_parametros(self):
+        self.store.put(self.url, {'ano': 2024, 'mes': None}, b'[1]')
+        self.assertIsNotNone(self.store.open(self.url + '/', {'ano': '2024'}))
+        self.assertIsNone(self.store.open(self.url, {'ano': 2023}))
+        self.store.invalidate(self.url, {'ano': 2024})
+        self.assertIsNone(self.store.open(self.url, {'ano': 2024}))
+
+    def test_substituicao_preserva_leitores(self):
+        self.store.put(self.url, None, b'[1]')
+        antiga = self.store.open(self.url)
+        self.store.put(self.url, None, b'[2, 3]')
+        self.assertEqual(bytes(antiga.buffer), b'[1]')
+        self.assertEqual(self.store.open(self.url).content, b'[2, 3]')
+        antiga.close()
+
+    def test_corpo_vazio(self):
+        self.store.put(self.url, None, b'')
+        self.assertEqual(self.store.open(self.url).content, b'')
+
+    def test_ttl(self):
+        store = RawStore(self.pasta, ttl=60)
+        caminho = store.put(self.url, None, b'[]')
+        self.assertIsNotNone(store.open(self.url))
+        antigo = time.time() - 120
+        os.utime(caminho, (antigo, antigo))
+        self.assertIsNone(store.open(self.url))
+
+    def test_outro_processo_le_o_mesmo_arquivo(self):
+        self.store.put(self.url, None, json.dumps(REGISTROS).encode())
+        with ProcessPoolExecutor(1) as pool:
+            self.assertEqual(pool.submit(_ler_em_outro_processo, self.pasta, self.url).result(), REGISTROS)
+
+
+class TestTransportStore(unittest.TestCase):
+    def _resposta(self, registros):
+        resposta = MagicMock(ok=True, status_code=200, content=json.dumps(registros).encode())
+        resposta.headers = {'Content-Type': 'application/json'}
+        return resposta
+
+    @patch('requests.get')
+    def test_releitura_servida_pelo_store(self, mock_get):
+        mock_get.return_value = self._resposta(REGISTROS)
+        cliente = ServidoresSenadoClient()
+        cliente._transport = Transport(store=RawStore(tempfile.mkdtemp(), ttl=60))
+        self.assertEqual(cliente.servidores_ativos(), REGISTROS)
+        self.assertEqual(cliente.servidores_ativos(), REGISTROS)
+        self.assertEqual(mock_get.call_count, 1)
+        metricas = cliente._transport.metrics.host('adm.senado.gov.br')
+        self.assertEqual((metricas.requests, metricas.upstream_requests, metricas.cache_hits), (2, 1, 1))
+        self.assertEqual(metricas.coalesced_requests, 0)
+
+    @patch('requests.get')
+    def test_condicionais_e_erros_nao_sao_guardados(self, mock_get):
+        transporte = Transport(store=RawStore(tempfile.mkdtemp()))
+        url = 'https://adm.senado.gov.br/adm-dadosabertos/api/v1/contratacoes/terceirizados'
+        mock_get.return_value = MagicMock(ok=False, status_code=500, content=b'erro', headers={})
+        transporte.get(url)
+        mock_get.return_value = self._resposta(REGISTROS)
+        transporte.get(url, headers={'If-None-Match': '"v1"'})
+        self.assertIsNone(transporte.store.open(url))
+        transporte.get(url)
+        transporte.get(url, headers={'If-None-Match': '"v1"'})
+        self.assertEqual(mock_get.call_count, 4)
+
+    @patch('requests.get')
+    def test_vencida_e_revalidada(self, mock_get):
+        transporte = Transport(store=RawStore(tempfile.mkdtemp()))  # sem ttl: revalida a cada uso
+        url = 'https://adm.senado.gov.br/adm-dadosabertos/api/v1/contratacoes/terceirizados'
+        original = self._resposta(REGISTROS)
+        original.headers['ETag'] = '"v1"'
+        mock_get.return_value = original
+        transporte.get(url)
+
+        mock_get.return_value = MagicMock(ok=True, status_code=304, content=b'', headers={})
+        response = transporte.get(url)
+        self.assertIsInstance(response, StoredResponse)
+        self.assertEqual(decode_json(response.buffer), REGISTROS)
+        self.assertEqual(mock_get.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+
+        mock_get.return_value = self._resposta([{'nome': 'Caio'}])
+        self.assertEqual(transporte.get(url).content, b'[{"nome": "Caio"}]')
+        self.assertEqual(transporte.store.open(url).content, b'[{"nome": "Caio"}]')
+        metricas = transporte.metrics.host('adm.senado.gov.br')
+        self.assertEqual((metricas.upstream_requests, metricas.cache_hits, metricas.revalidations), (3, 0, 1))
+
+    @patch('requests.get')
+    def test_cache_control(self, mock_get):
+        store = RawStore(tempfile.mkdtemp(), ttl=3600)
+        transporte = Transport(store=store)
+        url = 'https://olinda.bcb.gov.br/x'
+        for cache_control, chamadas in (('max-age=0', 2), ('no-cache', 2), ('max-age=600', 1), ('no-store', 2)):
+            resposta = self._resposta([])
+            resposta.headers['Cache-Control'] = cache_control
+            mock_get.reset_mock(return_value=True)
+            mock_get.return_value = resposta
+            store.invalidate(url)
+            transporte.get(url)
+            transporte.get(url)
+            self.assertEqual(mock_get.call_count, chamadas, cache_control)
+        self.assertIsNone(store.open(url))
+
+
+if __name__ == '__main__':
+    unittest.main()
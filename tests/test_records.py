@@ -0,0 +1,52 @@
+import json
+import unittest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+from src.components.core import RecordFactory, decode_json_records, records_from_columns
+from src.components.senado import ServidoresSenadoClient, TipoRetorno, TipoVinculo, Situacao
+
+
+REMUNERACOES = [
+    {'nome': 'A', 'lotacao': 'SECRETARIA DE GESTAO', 'tipoVinculo': 'EFETIVO', 'situacao': 'ATIVO', 'valor': 10.5},
+    {'nome': 'B', 'lotacao': 'SECRETARIA DE GESTAO', 'tipoVinculo': 'OUTRO', 'situacao': 'ATIVO', 'valor': 20.0},
+]
+
+
+class TestRecords(unittest.TestCase):
+    def setUp(self):
+        self.factory = RecordFactory('Remuneracao', ['lotacao'], {'tipoVinculo': TipoVinculo, 'situacao': Situacao})
+
+    def test_registros_compactos_e_categoricos_internados(self):
+        # Constrói o JSON em tempo de execução para que as strings não sejam constantes compartilhadas.
+        content = json.dumps(REMUNERACOES).encode()
+        a, b = decode_json_records(content, self.factory)
+
+        self.assertFalse(hasattr(a, '__dict__'))
+        self.assertEqual((a.nome, a.valor), ('A', 10.5))
+        self.assertIs(a.lotacao, b.lotacao)
+        self.assertIs(a.tipoVinculo, TipoVinculo.EFETIVO)
+        self.assertEqual(b.tipoVinculo, 'OUTRO')
+        self.assertIs(b.situacao, Situacao.ATIVO)
+        self.assertIs(type(a), type(b))
+
+    def test_registros_a_partir_de_colunas(self):
+        colunas = {'data': [date(2024, 1, 1)], 'lotacao': ['GABINETE'], 'tipo-vinculo': ['EFETIVO']}
+        (registro,) = records_from_columns(colunas, self.factory)
+        self.assertEqual(registro.data, date(2024, 1, 1))
+        self.assertIs(registro.tipo_vinculo, TipoVinculo.EFETIVO)
+
+    @patch('requests.get')
+    def test_cliente_registros(self, mock_get):
+        mock_get.return_value = MagicMock(
+            ok=True, content=json.dumps(REMUNERACOES).encode(), headers={'Content-Type': 'application/json'}
+        )
+        registros = ServidoresSenadoClient().remuneracoes(2024, 1, TipoRetorno.REGISTROS)
+        self.assertEqual(type(registros[0]).__name__, 'Remuneracao')
+        self.assertIs(registros[0].lotacao, registros[1].lotacao)
+        args, _ = mock_get.call_args
+        self.assertTrue(args[0].endswith('/servidores/remuneracoes/2024/1'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,97 @@
+import json
+import sqlite3
+import unittest
+from unittest.mock import patch, MagicMock
+
+from src.components.senado import DatasetSpec, TextIndex, Warehouse
+from src.components.senado.search import fts_query
+
+CONTRATOS = [
+    {'id': 1, 'objetoDescricao': 'Manutenção preventiva de elevadores'},
+    {'id': 2, 'objetoDescricao': 'Serviço de limpeza e conservação predial'},
+    {'id': 3, 'objetoDescricao': 'Limpeza de vidros e fachadas'},
+]
+LICITACOES = [{'id': 7, 'objeto': 'Manutenção de ar condicionado'}]
+
+
+def _resposta(corpo):
+    return MagicMock(ok=True, status_code=200, content=json.dumps(corpo).encode(), headers={'Content-Type': 'application/json'})
+
+
+class TestTextIndex(unittest.TestCase):
+    def setUp(self):
+        datasets = {
+            'contratos': DatasetSpec('contratos', 'contratacoes/contratos', chave=('id',)),
+            'licitacoes': DatasetSpec('licitacoes', 'contratacoes/licitacoes', chave=('id',)),
+        }
+        self.warehouse = Warehouse(':memory:', datasets=datasets)
+        self.addCleanup(self.warehouse.close)
+        self.corpos = {'contratacoes/contratos': CONTRATOS, 'contratacoes/licitacoes': LICITACOES}
+        self._sync()
+        self.indice = TextIndex(self.warehouse)
+
+    def _sync(self):
+        with patch('requests.get', side_effect=lambda url, **kw: _resposta(self.corpos[url.split('/v1/', 1)[1]])):
+            self.warehouse.sync(force=True)
+
+    def _chaves(self, hits):
+        return sorted((hit.dataset, hit.chave) for hit in hits)
+
+    def test_consulta_fts(self):
+        self.assertEqual(fts_query('manut* AND NOT "Ar Condicionado"'), '"manut"* NOT "ar condicionado"')
+        self.assertEqual(fts_query('pré-moldado'), '"pre-moldado"')
+        self.assertEqual(fts_query('(a OR b) c'), '( "a" OR "b" ) "c"')
+        self.assertEqual(fts_query(''), '')
+
+    def test_consulta_invalida(self):
+        for consulta in ('NOT a', 'a OR NOT b', 'x AND', '(x', 'x)', '() x', 'a (OR b)'):
+            with self.subTest(consulta=consulta), self.assertRaises(ValueError):
+                fts_query(consulta)
+        with self.assertRaises(ValueError):
+            self.indice.search('manutencao AND')
+
+    def test_palavras_prefixos_e_operadores(self):
+        self.assertEqual(self._chaves(self.indice.search('MANUTENCAO')), [('contratos', '1'), ('licitacoes', '7')])
+        self.assertEqual(self._chaves(self.indice.search('limp* NOT vidros')), [('contratos', '2')])
+        self.assertEqual(self._chaves(self.indice.search('elevador* OR fachadas', datasets=['contratos'])), [('contratos', '1'), ('contratos', '3')])
+        (hit,) = self.indice.search('conservação')
+        self.assertEqual(hit.registro, CONTRATOS[1])
+
+    def test_trechos(self):
+        self.assertEqual(self._chaves(self.indice.substring('UTENÇ')), [('contratos', '1'), ('licitacoes', '7')])
+        self.assertEqual(self._chaves(self.indice.substring('ad')), [('contratos', '1'), ('contratos', '3'), ('licitacoes', '7')])
+
+    def test_atualizacao_incremental(self):
+        self.corpos['contratacoes/contratos'] = [
+            {'id': 1, 'objetoDescricao': 'Manutenção preventiva de escadas rolantes'},
+            CONTRATOS[1],
+        ]
+        self._sync()
+        self.assertEqual(self.indice.search('elevadores'), [])
+        self.assertEqual(self._chaves(self.indice.search('escadas')), [('contratos', '1')])
+        self.assertEqual(self.indice.search('fachadas'), [])
+        docs = self.warehouse.query('SELECT COUNT(*) AS n FROM _fts_docs')[0]['n']
+        self.assertEqual(docs, 3)
+
+    def test_atualizacao_le_apenas_as_chaves_gravadas(self):
+        comandos = []
+        self.warehouse._conn.set_trace_callback(comandos.append)
+        self.addCleanup(self.warehouse._conn.set_trace_callback, None)
+        self.indice._atualizar('contratos', [('2', {'objeto_descricao': 'Limpeza predial'})], ['3'])
+        (leitura,) = [c for c in comandos if c.startswith('SELECT') and '_fts_docs' in c]
+        self.assertIn("chave IN ('2', '3')", leitura)
+        self.assertEqual(self._chaves(self.indice.search('limpeza')), [('contratos', '2')])
+        self.assertEqual(self._chaves(self.indice.search('elevadores')), [('contratos', '1')])
+
+    def test_muitos_resultados_com_registros(self):
+        self.corpos['contratacoes/contratos'] = [{'id': i, 'objetoDescricao': f'Limpeza lote {i}'} for i in range(2500)]
+        self._sync()
+        # Limite padrão do SQLite anterior à 3.32, como em `warehouse._MAX_PARAMS`.
+        self.warehouse._conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+        hits = self.indice.search('limpeza', limite=3000)
+        self.assertEqual(len(hits), 2500)
+        self.assertTrue(all(hit.registro['id'] == int(hit.chave) for hit in hits))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch, MagicMock
+
+from src.components.core import SingleFlight, Transport, request_key
+from src.components.senado import ServidoresSenadoClient
+
+
+class TestSingleFlight(unittest.TestCase):
+    def setUp(self):
+        self.grupo = SingleFlight()
+        self.chamadas = 0
+
+    def _lenta(self, valor):
+        self.chamadas += 1
+        time.sleep(0.1)
+        return valor
+
+    def test_threads_compartilham_resultado(self):
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            resultados = list(pool.map(lambda _: self.grupo.do('k', self._lenta, 42), range(8)))
+        self.assertEqual(resultados, [42] * 8)
+        self.assertEqual(self.chamadas, 1)
+        self.assertEqual(self.grupo.em_andamento(), 0)
+
+    def test_excecao_propagada_para_todos(self):
+        def falha():
+            self.chamadas += 1
+            time.sleep(0.1)
+            raise ValueError('erro upstream')
+
+        erros = []
+
+        def chamar():
+            try:
+                self.grupo.do('k', falha)
+            except ValueError as erro:
+                erros.append(erro)
+
+        threads = [threading.Thread(target=chamar) for _ in range(5)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.assertEqual(len(erros), 5)
+        self.assertEqual(self.chamadas, 1)
+
+    def test_tarefas_asyncio_e_threads(self):
+        async def principal():
+            tarefas = [self.grupo.do_async('k', self._lenta, 'ok') for _ in range(5)]
+            tarefas.append(asyncio.to_thread(self.grupo.do, 'k', self._lenta, 'ok'))
+            return await asyncio.gather(*tarefas)
+
+        self.assertEqual(asyncio.run(principal()), ['ok'] * 6)
+        self.assertEqual(self.chamadas, 1)
+
+    def test_lider_cancelado_nao_afeta_os_demais(self):
+        async def principal():
+            lider = asyncio.create_task(self.grupo.do_async('k', self._lenta, 'ok'))
+            await asyncio.sleep(0.01)
+            seguidora = asyncio.create_task(self.grupo.do_async('k', self._lenta, 'ok'))
+            thread = asyncio.create_task(asyncio.to_thread(self.grupo.do, 'k', self._lenta, 'ok'))
+            await asyncio.sleep(0.01)
+            lider.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await lider
+            return await asyncio.gather(seguidora, thread)
+
+        self.assertEqual(asyncio.run(principal()), ['ok', 'ok'])
+        self.assertEqual(self.chamadas, 1)
+        self.assertEqual(self.grupo.em_andamento(), 0)
+
+    def test_chamadas_sequenciais_nao_coalescem(self):
+        self.grupo.do('k', self._lenta, 1)
+        self.grupo.do('k', self._lenta, 2)
+        self.assertEqual(self.chamadas, 2)
+
+
+class TestTransportCoalescing(unittest.TestCase):
+    def test_request_key_normaliza_parametros(self):
+        self.assertEqual(
+            request_key('http://x/a/', {'b': 1, 'a': None, 'c': 'z'}),
+            request_key('http://x/a', {'c': 'z', 'b': '1'}),
+        )
+
+    @patch('requests.get')
+    def test_cliente_senado_coalesce_chamadas_concorrentes(self, mock_get):
+        resposta = MagicMock()
+        resposta.ok = True
+        resposta.headers = {'Content-Type': 'application/json'}
+        resposta.content = json.dumps([{'nome': 'X'}]).encode()
+
+        def lento(*args, **kwargs):
+            time.sleep(0.1)
+            return resposta
+
+        mock_get.side_effect = lento
+        cliente = ServidoresSenadoClient()
+        cliente._transport = Transport()
+        with ThreadPoolExecutor(max_workers=6) as pool:
+            resultados = list(pool.map(lambda _: cliente.servidores_ativos(), range(6)))
+        self.assertEqual(resultados, [[{'nome': 'X'}]] * 6)
+        self.assertEqual(mock_get.call_count, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
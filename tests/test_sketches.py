@@ -0,0 +1,105 @@
+import random
+import unittest
+
+from src.components.core.sketches import CountMinSketch, HyperLogLog, SpaceSaving, TDigest, feed_sketches, load_sketch
+
+
+class TestSketches(unittest.TestCase):
+    def test_hyperloglog_combina_e_serializa(self):
+        a, b = HyperLogLog(), HyperLogLog()
+        a.extend(f'{i:014d}' for i in range(30_000))
+        b.extend(f'{i:014d}' for i in range(20_000, 50_000))
+        self.assertAlmostEqual(a.count() / 30_000, 1, delta=0.03)
+        combinado = load_sketch(a.to_bytes()).merge(b)
+        self.assertAlmostEqual(combinado.count() / 50_000, 1, delta=0.03)
+        pequeno = HyperLogLog()
+        pequeno.extend(['a', 'b', 'a', 'c'])
+        self.assertEqual(pequeno.count(), 3)
+        with self.assertRaises(ValueError):
+            a.merge(HyperLogLog(10))
+
+    def test_frequencias_e_top_k(self):
+        gerador = random.Random(7)
+        valores = [f'fornecedor-{min(int(gerador.paretovariate(1.2)), 500)}' for _ in range(20_000)]
+        exato: dict[str, int] = {}
+        for valor in valores:
+            exato[valor] = exato.get(valor, 0) + 1
+        melhores = sorted(exato, key=exato.get, reverse=True)[:5]
+
+        metades = []
+        for parte in (valores[:10_000], valores[10_000:]):
+            cms, topk = CountMinSketch(), SpaceSaving(50)
+            cms.extend(parte)
+            topk.extend(parte)
+            metades.append((cms, topk))
+        cms = CountMinSketch.from_bytes(metades[0][0].to_bytes()).merge(metades[1][0])
+        topk = SpaceSaving.from_bytes(metades[0][1].to_bytes()).merge(metades[1][1])
+        for valor in melhores:
+            self.assertGreaterEqual(cms[valor], exato[valor])
+            self.assertLessEqual(cms[valor], exato[valor] + 0.01 * len(valores))
+        self.assertEqual([valor for valor, _, _ in topk.top(5)], melhores)
+        for valor, contagem, erro in topk.top(5):
+            self.assertLessEqual(contagem - erro, exato[valor])
+            self.assertGreaterEqual(contagem, exato[valor])
+
+    def test_space_saving_substitui_sempre_o_menor(self):
+        # Referência com a busca linear pelo menor; pesos aleatórios evitam empates.
+        gerador = random.Random(5)
+        topk, contagens = SpaceSaving(20), {}
+        for _ in range(5_000):
+            valor, peso = gerador.randrange(200), gerador.random()
+            topk.add(valor, peso)
+            if valor in contagens:
+                contagens[valor] += peso
+            elif len(contagens) < 20:
+                contagens[valor] = peso
+            else:
+                menor = min(contagens, key=contagens.__getitem__)
+                contagens[valor] = contagens.pop(menor) + peso
+        self.assertEqual(topk.contagens, contagens)
+        self.assertLessEqual(len(topk._heap), 4 * 20 + 64)
+
+    def test_space_saving_chaves_compostas(self):
+        topk = SpaceSaving(5)
+        topk.extend([('A', 2024), ('A', 2024), ('B', (1, None)), 'C', 7])
+        copia = SpaceSaving.from_bytes(topk.to_bytes())
+        self.assertEqual(copia.top(), topk.top())
+        self.assertEqual(copia.top(1), [(('A', 2024), 2, 0.0)])
+        copia.add(('B', (1, None)))
+        self.assertEqual(copia.contagens[('B', (1, None))], 2)
+        topk.add(frozenset({'x'}))
+        with self.assertRaises(TypeError):
+            topk.to_bytes()
+
+    def test_tdigest_quantis(self):
+        gerador = random.Random(3)
+        valores = [gerador.lognormvariate(9, 0.6) for _ in range(40_000)]
+        partes = [TDigest(), TDigest()]
+        partes[0].extend(valores[::2])
+        partes[1].extend(valores[1::2])
+        digest = load_sketch(partes[0].to_bytes()).merge(partes[1])
+        ordenados = sorted(valores)
+        for q in (0.01, 0.5, 0.9, 0.99):
+            exato = ordenados[int(q * len(ordenados))]
+            self.assertAlmostEqual(digest.quantile(q) / exato, 1, delta=0.02, msg=q)
+            self.assertAlmostEqual(digest.cdf(exato), q, delta=0.005)
+        self.assertEqual((digest.quantile(0), digest.quantile(1)), (ordenados[0], ordenados[-1]))
+        self.assertLess(len(digest.medias), 200)
+
+    def test_feed(self):
+        linhas = [
+            {'cnpjCpf': '1', 'fornecedor': 'A', 'valorReembolsado': 10.0},
+            {'cnpjCpf': '2', 'fornecedor': 'B', 'valorReembolsado': 5.0},
+            {'cnpjCpf': '1', 'fornecedor': 'A', 'valorReembolsado': None},
+            {'cnpjCpf': None, 'fornecedor': 'B', 'valorReembolsado': 7.5},
+        ]
+        distintos, gasto, valores = HyperLogLog(), SpaceSaving(10), TDigest()
+        n = feed_sketches(iter(linhas), [(distintos, 'cnpjCpf'), (gasto, 'fornecedor', 'valorReembolsado'), (valores, 'valorReembolsado')])
+        self.assertEqual(n, 4)
+        self.assertEqual(distintos.count(), 2)
+        self.assertEqual(gasto.top(), [('B', 12.5, 0.0), ('A', 10.0, 0.0)])
+        self.assertEqual(valores.contagem, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import json
+import unittest
+from datetime import date
+from unittest.mock import patch, MagicMock
+
+from src.components.senado import DatasetSpec, Warehouse
+
+
+def _resposta(corpo, status=200, etag=None):
+    headers = {'Content-Type': 'application/json'}
+    if etag:
+        headers['ETag'] = etag
+    return MagicMock(ok=status < 400, status_code=status, content=json.dumps(corpo).encode(), headers=headers)
+
+
+CONTRATOS = DatasetSpec('contratos', 'contratacoes/contratos', chave=('id',), indices=('id', 'cnpj_cpf'))
+CEAPS = DatasetSpec('despesas_ceaps', 'senadores/despesas_ceaps/{ano}', 'ano', indices=('cpf_cnpj',))
+
+
+class TestWarehouse(unittest.TestCase):
+    def setUp(self):
+        self.warehouse = Warehouse(':memory:', datasets={'contratos': CONTRATOS, 'despesas_ceaps': CEAPS})
+        self.respostas = {}
+        patcher = patch('requests.get', side_effect=lambda url, **kwargs: self.respostas[url.rsplit('/v1/', 1)[1]](kwargs))
+        self.mock_get = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.warehouse.close)
+
+    def test_upsert_idempotente_e_remocao(self):
+        self.respostas['contratacoes/contratos'] = lambda kw: _resposta([
+            {'id': 1, 'cnpjCpf': '00000000000191', 'valorGlobal': 10.0, 'inicioVigencia': '2024-01-02'},
+            {'id': 2, 'cnpjCpf': '00000000000272', 'valorGlobal': 20.0},
+        ])
+        resultado = self.warehouse.sync_dataset('contratos')
+        self.assertEqual((resultado.baixadas, resultado.linhas), ([''], 2))
+        self.assertEqual(self.warehouse.sync_dataset('contratos', force=True).inalteradas, [''])
+
+        self.respostas['contratacoes/contratos'] = lambda kw: _resposta([
+            {'id': 2, 'cnpjCpf': '00000000000272', 'valorGlobal': 25.0},
+        ])
+        self.warehouse.sync_dataset('contratos', force=True)
+        linhas = self.warehouse.query('SELECT id, cnpj_cpf, valor_global FROM contratos')
+        self.assertEqual(linhas, [{'id': 2, 'cnpj_cpf': '00000000000272', 'valor_global': 25.0}])
+        indices = {r['name'] for r in self.warehouse.query("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        self.assertTrue({'ix_contratos_id', 'ix_contratos_cnpj_cpf', 'ix_contratos__periodo'} <= indices)
+
+    def test_periodos_encerrados_nao_sao_baixados_de_novo(self):
+        for ano in (2022, 2023, 2024):
+            self.respostas[f'senadores/despesas_ceaps/{ano}'] = lambda kw, ano=ano: _resposta(
+                [{'ano': ano, 'cpfCnpj': '1', 'valorReembolsado': 1.5}], etag=f'"{ano}"'
+            )
+        resultado = self.warehouse.sync_dataset('despesas_ceaps', desde=2022, ate=date(2024, 6, 1))
+        self.assertEqual(resultado.baixadas, ['2022', '2023', '2024'])
+        self.assertEqual(self.warehouse.watermark('despesas_ceaps'), '2024')
+
+        self.mock_get.reset_mock()
+        self.respostas['senadores/despesas_ceaps/2025'] = lambda kw: _resposta([], status=404)
+        self.respostas['senadores/despesas_ceaps/2024'] = lambda kw: (
+            _resposta(None, status=304) if kw['headers'].get('If-None-Match') == '"2024"' else None
+        )
+        spec = DatasetSpec('despesas_ceaps', 'senadores/despesas_ceaps/{ano}', 'ano', ttl=0)
+        resultado = self.warehouse.sync_dataset(spec, desde=2022, ate=date(2025, 1, 1))
+        self.assertEqual(resultado.inalteradas, ['2024'])
+        self.assertIn('2025', resultado.erros)
+        urls = [args[0] for args, _ in self.mock_get.call_args_list]
+        self.assertEqual(len(urls), 2)
+        contagem = self.warehouse.query('SELECT _periodo, COUNT(*) AS n FROM despesas_ceaps GROUP BY _periodo')
+        self.assertEqual([r['n'] for r in contagem], [1, 1, 1])
+
+    def test_conjunto_paginado_e_gravado_completo(self):
+        spec = DatasetSpec('empresas', 'contratacoes/empresas', chave=('id',), paginado=True)
+        paginas = {1: [{'id': 1}, {'id': 2}], 2: [{'id': 3}], 3: []}
+        self.respostas['contratacoes/empresas'] = lambda kw: _resposta(paginas[kw['params']['pagina']])
+        resultado = self.warehouse.sync_dataset(spec)
+        self.assertEqual((resultado.baixadas, resultado.linhas), ([''], 3))
+        self.assertEqual([args[1]['params']['pagina'] for args in self.mock_get.call_args_list], [1, 2, 3])
+        self.assertEqual(self.warehouse.sync_dataset(spec, force=True).inalteradas, [''])
+
+        # Uma fonte que ignora `pagina` devolve sempre a mesma página: a coleta para na repetição.
+        self.respostas['contratacoes/empresas'] = lambda kw: _resposta([{'id': 1}, {'id': 4}])
+        self.warehouse.sync_dataset(spec, force=True)
+        self.assertEqual(self.warehouse.query('SELECT id FROM empresas ORDER BY id'), [{'id': 1}, {'id': 4}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,350 @@
+import json
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from src.components.core import RedisQueue, SQLiteQueue, WorkQueue, Worker, method_handler, task_key
+from src.components.senado import crawl_handlers, seed_tasks
+
+
+class FakePipeline:
+    """Pipeline do `FakeRedis`: executa na hora até `multi()`, depois enfileira até `execute()`."""
+
+    def __init__(self, redis):
+        self._redis = redis
+        self._fila = None
+
+    def multi(self):
+        self._fila = []
+
+    def execute(self):
+        fila, self._fila = self._fila or [], None
+        return [metodo(*args, **kwargs) for metodo, args, kwargs in fila]
+
+    def __getattr__(self, nome):
+        metodo = getattr(self._redis, nome)
+        if self._fila is None:
+            return metodo
+        return lambda *args, **kwargs: self._fila.append((metodo, args, kwargs))
+
+
+class FakeRedis:
+    """Subconjunto do redis-py usado pela `RedisQueue`, em memória; devolve bytes como o cliente real.
+
+    As transações seguram o lock do começo ao fim, como se nenhuma chave
+    observada mudasse antes do `EXEC`.
+    """
+
+    def __init__(self):
+        self._dados = {}
+        self._lock = threading.RLock()
+        self.transacoes = 0
+
+    def transaction(self, func, *observadas, value_from_callable=False):
+        with self._lock:
+            self.transacoes += 1
+            pipe = FakePipeline(self)
+            valor = func(pipe)
+            resultados = pipe.execute()
+        return valor if value_from_callable else resultados
+
+    @staticmethod
+    def _b(valor):
+        return valor if isinstance(valor, bytes) else str(valor).encode()
+
+    def sadd(self, chave, *membros):
+        with self._lock:
+            conjunto = self._dados.setdefault(chave, set())
+            novos = {self._b(membro) for membro in membros} - conjunto
+            conjunto |= novos
+            return len(novos)
+
+    def sismember(self, chave, membro):
+        with self._lock:
+            return self._b(membro) in self._dados.get(chave, set())
+
+    def smismember(self, chave, membros):
+        with self._lock:
+            return [int(self._b(membro) in self._dados.get(chave, set())) for membro in membros]
+
+    def scard(self, chave):
+        with self._lock:
+            return len(self._dados.get(chave, ()))
+
+    def hset(self, chave, campo=None, valor=None, mapping=None):
+        with self._lock:
+            hash_ = self._dados.setdefault(chave, {})
+            for k, v in ({campo: valor} if mapping is None else mapping).items():
+                hash_[self._b(k)] = self._b(v)
+
+    def hget(self, chave, campo):
+        with self._lock:
+            return self._dados.get(chave, {}).get(self._b(campo))
+
+    def hmget(self, chave, *campos):
+        with self._lock:
+            return [self._dados.get(chave, {}).get(self._b(campo)) for campo in campos]
+
+    def hgetall(self, chave):
+        with self._lock:
+            return dict(self._dados.get(chave, {}))
+
+    def hincrby(self, chave, campo, n):
+        with self._lock:
+            hash_ = self._dados.setdefault(chave, {})
+            hash_[self._b(campo)] = self._b(int(hash_.get(self._b(campo), 0)) + n)
+            return int(hash_[self._b(campo)])
+
+    def zadd(self, chave, mapping):
+        with self._lock:
+            zset = self._dados.setdefault(chave, {})
+            for membro, score in mapping.items():
+                zset[self._b(membro)] = float(score)
+
+    def zrem(self, chave, membro):
+        with self._lock:
+            return int(self._dados.get(chave, {}).pop(self._b(membro), None) is not None)
+
+    def zscore(self, chave, membro):
+        with self._lock:
+            return self._dados.get(chave, {}).get(self._b(membro))
+
+    def zcard(self, chave):
+        with self._lock:
+            return len(self._dados.get(chave, ()))
+
+    def zrangebyscore(self, chave, minimo, maximo, start=None, num=None):
+        with self._lock:
+            itens = sorted(self._dados.get(chave, {}).items(), key=lambda item: item[1])
+        membros = [m for m, score in itens if float(minimo) <= score <= float(maximo)]
+        return membros[start:start + num] if num is not None else membros
+
+
+class _Contrato:
+    """Cenário de árvore de tarefas: 3 contratos, 2 pagamentos cada, empenhos por pagamento."""
+
+    def __init__(self):
+        self.chamadas = []
+        self._lock = threading.Lock()
+
+    def _registrar(self, *chamada):
+        with self._lock:
+            self.chamadas.append(chamada)
+
+    def contratos(self, ano=None):
+        self._registrar('contratos', ano)
+        return [{'id': i} for i in range(3)]
+
+    def pagamentos(self, id_contratacao):
+        self._registrar('pagamentos', id_contratacao)
+        return [{'id': id_contratacao * 10 + j} for j in range(2)]
+
+    def empenhos(self, id_contratacao, id_pagamento):
+        self._registrar('empenhos', id_pagamento)
+        return [{'id_pagamento': id_pagamento}]
+
+    def handlers(self):
+        return {
+            'contratos': method_handler(self.contratos, lambda p, l: [('pagamentos', {'id_contratacao': l['id']})]),
+            'pagamentos': method_handler(self.pagamentos, lambda p, l: [('empenhos', {**p, 'id_pagamento': l['id']})]),
+            'empenhos': method_handler(self.empenhos),
+        }
+
+
+class _Casos:
+    def fila(self, **kwargs):
+        raise NotImplementedError
+
+    def test_interface_abstrata(self):
+        with self.assertRaises(TypeError):
+            WorkQueue()
+
+    def test_chave_de_deduplicacao(self):
+        fila = self.fila()
+        self.assertEqual(task_key('x', {'a': 1, 'b': None}), task_key('x', {'a': 1}))
+        self.assertEqual(fila.push([('x', {'a': 1, 'b': 2}), ('x', {'b': 2, 'a': 1}), ('y', {})]), 2)
+        self.assertEqual(fila.push([('x', {'a': 1, 'b': 2})]), 0)
+        self.assertEqual(fila.stats(), {'pendente': 2})
+
+    def test_concessao_vencida_volta_para_a_fila(self):
+        fila = self.fila()
+        fila.push([('x', {})])
+        primeira, = fila.lease('a', prazo=0.05)
+        self.assertEqual(fila.lease('b'), [])
+        time.sleep(0.1)
+        segunda, = fila.lease('b')
+        self.assertNotEqual(primeira.token, segunda.token)
+        # O primeiro worker perdeu a concessão: nem conclui nem devolve.
+        self.assertFalse(fila.complete(primeira, [('filha', {})]))
+        self.assertFalse(fila.fail(primeira, 'tarde'))
+        self.assertTrue(fila.complete(segunda, [('filha', {})]))
+        self.assertFalse(fila.complete(segunda, [('outra', {})]))
+        self.assertEqual(fila.stats(), {'concluida': 1, 'pendente': 1})
+        filha, = fila.lease('c')
+        self.assertEqual((filha.endpoint, filha.pai), ('filha', segunda.id))
+
+    def test_concessao_vencida_sem_novo_dono_ainda_conclui(self):
+        fila = self.fila()
+        fila.push([('x', {})])
+        tarefa, = fila.lease('a', prazo=0.01)
+        time.sleep(0.05)
+        fila.lease('b', n=0)  # devolve as concessões vencidas
+        self.assertTrue(fila.complete(tarefa))
+        self.assertEqual(fila.lease('b'), [])
+        self.assertTrue(fila.drained())
+
+    def test_falhas_com_espera_ate_desistir(self):
+        fila = self.fila(max_tentativas=3, backoff=0.02)
+        fila.push([('x', {})])
+        for tentativa in range(1, 3):
+            tarefa, = fila.lease('a')
+            self.assertTrue(fila.fail(tarefa, 'erro'))
+            self.assertEqual(fila.lease('a'), [])  # ainda em espera
+            time.sleep(0.02 * 2 ** (tentativa - 1) + 0.03)
+        tarefa, = fila.lease('a')
+        fila.fail(tarefa, 'erro final')
+        salva = fila.get(tarefa.id)
+        self.assertEqual((salva.estado, salva.tentativas, salva.erro), ('falhou', 3, 'erro final'))
+        self.assertTrue(fila.drained())
+
+    def test_worker_percorre_a_arvore(self):
+        fila = self.fila()
+        cenario = _Contrato()
+        gravados = []
+        fila.push([('contratos', {'ano': 2024})])
+        contagem = Worker(fila, cenario.handlers(), sink=lambda t, r: gravados.append(t.endpoint)).run(espera=0.01)
+        self.assertEqual(contagem, {'concluidas': 1 + 3 + 6, 'falhas': 0, 'descartadas': 0})
+        self.assertEqual(sorted(c[1] for c in cenario.chamadas if c[0] == 'empenhos'), [0, 1, 10, 11, 20, 21])
+        self.assertEqual(gravados.count('empenhos'), 6)
+        self.assertEqual(fila.stats(), {'concluida': 10})
+
+    def test_varios_workers_concluem_cada_tarefa_uma_vez(self):
+        fila = self.fila()
+        fila.push([('x', {'i': i}) for i in range(60)])
+        concluidas = []
+        lock = threading.Lock()
+
+        def sink(tarefa, resultado):
+            with lock:
+                concluidas.append(tarefa.params['i'])
+
+        handlers = {'x': lambda params: ([params], [])}
+        workers = [Worker(fila, handlers, nome=f'w{i}', lote=4, sink=sink) for i in range(3)]
+        threads = [threading.Thread(target=w.run, kwargs={'espera': 0.01, 'threads': 2}) for w in workers]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(10)
+        self.assertEqual(sorted(concluidas), list(range(60)))
+        self.assertEqual(sum(w.contagem['concluidas'] for w in workers), 60)
+
+    def test_max_tarefas_e_handler_ausente(self):
+        fila = self.fila(max_tentativas=1)
+        fila.push([('x', {'i': i}) for i in range(5)] + [('desconhecido', {})])
+        worker = Worker(fila, {'x': lambda params: (None, [])}, lote=2)
+        self.assertEqual(worker.run(max_tarefas=3)['concluidas'], 3)
+        contagem = worker.run(espera=0.01)
+        self.assertEqual((contagem['concluidas'], contagem['falhas']), (5, 1))
+        self.assertEqual(fila.stats(), {'concluida': 5, 'falhou': 1})
+
+
+class TestSQLiteQueue(_Casos, unittest.TestCase):
+    def setUp(self):
+        self.pasta = tempfile.mkdtemp()
+
+    def fila(self, **kwargs):
+        fila = SQLiteQueue(os.path.join(self.pasta, 'crawl.db'), **kwargs)
+        self.addCleanup(fila.close)
+        return fila
+
+    def test_conexoes_distintas_compartilham_a_fila(self):
+        fila = self.fila()
+        outra = self.fila()
+        fila.push([('x', {})])
+        self.assertEqual(outra.push([('x', {})]), 0)
+        tarefa, = outra.lease('b')
+        self.assertEqual(fila.lease('a'), [])
+        self.assertTrue(fila.complete(tarefa))
+
+
+class TestRedisQueue(_Casos, unittest.TestCase):
+    def fila(self, **kwargs):
+        if not hasattr(self, 'redis'):
+            self.redis = FakeRedis()
+        return RedisQueue(self.redis, **kwargs)
+
+    def test_conclusao_e_filhas_na_mesma_transacao(self):
+        fila = self.fila()
+        fila.push([('x', {})])
+        tarefa, = fila.lease('a')
+        with patch.object(FakePipeline, 'execute', side_effect=ConnectionError('caiu')):
+            with self.assertRaises(ConnectionError):
+                fila.complete(tarefa, [('y', {}), ('z', {})])
+        self.assertEqual(fila.stats(), {'em_execucao': 1})
+        self.assertIsNone(fila.get(task_key('y', {})))
+
+        antes = self.redis.transacoes
+        self.assertTrue(fila.complete(tarefa, [('y', {}), ('z', {})]))
+        self.assertEqual(self.redis.transacoes, antes + 1)
+        self.assertEqual(fila.stats(), {'pendente': 2, 'concluida': 1})
+        self.assertEqual(fila.get(task_key('y', {})).pai, tarefa.id)
+
+    def test_concessao_interrompida_nao_perde_a_tarefa(self):
+        fila = self.fila()
+        fila.push([('x', {})])
+        with patch.object(FakePipeline, 'execute', side_effect=ConnectionError('caiu')):
+            with self.assertRaises(ConnectionError):
+                fila.lease('a')
+        self.assertEqual(fila.stats(), {'pendente': 1})
+        self.assertEqual(fila.get(task_key('x', {})).estado, 'pendente')
+
+        tarefa, = fila.lease('a', prazo=-1)
+        # A devolução da concessão vencida também é interrompida: a tarefa continua concedida.
+        with patch.object(FakePipeline, 'execute', side_effect=ConnectionError('caiu')):
+            with self.assertRaises(ConnectionError):
+                fila.lease('b')
+        self.assertEqual(fila.stats(), {'em_execucao': 1})
+        outra, = fila.lease('b')
+        self.assertEqual((outra.id, outra.estado), (tarefa.id, 'em_execucao'))
+        self.assertFalse(fila.complete(tarefa))
+        self.assertTrue(fila.complete(outra))
+        self.assertTrue(fila.drained())
+
+
+def _resposta(corpo):
+    return MagicMock(ok=True, status_code=200, content=json.dumps(corpo).encode(), headers={'Content-Type': 'application/json'})
+
+
+class TestCrawlSenado(unittest.TestCase):
+    @patch('requests.get')
+    def test_contratos_pagamentos_empenhos(self, mock_get):
+        def responder(url, **kwargs):
+            caminho = url.rsplit('/v1/contratacoes/', 1)[1].split('/')
+            if caminho == ['contratos']:
+                return _resposta([{'id': 7}])
+            if caminho[2:] == ['pagamentos']:
+                return _resposta([{'id': 70}, {'id': 71}])
+            return _resposta([{'idPagamento': int(caminho[3])}])
+
+        mock_get.side_effect = responder
+        fila = SQLiteQueue(os.path.join(tempfile.mkdtemp(), 'crawl.db'))
+        self.addCleanup(fila.close)
+        fila.push(seed_tasks(['contratacoes/contratos'], ano=2024))
+        resultados = {}
+        Worker(fila, crawl_handlers(), sink=lambda t, r: resultados.setdefault(t.endpoint, []).extend(r)).run()
+        self.assertEqual(resultados['contratacoes/empenhos'], [{'idPagamento': 70}, {'idPagamento': 71}])
+        self.assertEqual(len(resultados['contratacoes/documentos_fiscais']), 2)
+        urls = {c.args[0].rsplit('/v1/', 1)[1] for c in mock_get.call_args_list}
+        self.assertIn('contratacoes/contratos/7/pagamentos/71/documentos_fiscais', urls)
+        self.assertEqual(len(urls), 6)
+
+    def test_seed_desconhecido(self):
+        with self.assertRaises(ValueError):
+            seed_tasks(['contratacoes/empenhos'])
+
+
+if __name__ == '__main__':
+    unittest.main()